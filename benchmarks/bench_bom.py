@@ -0,0 +1,86 @@
+"""
+bench_bom.py — Бенчмарк спецификации ведомости болтов
+
+Сравнивает построчный расчёт (validate_parameters + get_bolt_mass и состав
+сборки на каждую строку, накопление в словарях) с пакетным
+BomService.compute (группировка NumPy по столбцам каталога).
+
+Запуск:
+    python benchmarks/bench_bom.py [количество_строк]
+"""
+
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+import numpy as np  # noqa: E402
+from services.bom_service import ASSEMBLY_COMPOSITION, BomService  # noqa: E402
+
+from data import AVAILABLE_LENGTHS, get_bolt_mass, validate_parameters  # noqa: E402
+
+MATERIALS = ["09Г2С", "ВСт3пс2", "10Г2"]
+
+
+def make_rows(count):
+    """Ведомость из допустимых комбинаций типа, диаметра и длины"""
+    rng = np.random.default_rng(0)
+    combinations = [
+        (t, d, length) for (t, d), lengths in AVAILABLE_LENGTHS.items() for length in lengths
+    ]
+    picks = rng.integers(0, len(combinations), count).tolist()
+    materials = rng.integers(0, len(MATERIALS), count).tolist()
+    return [
+        {
+            "bolt_type": combinations[pick][0],
+            "diameter": combinations[pick][1],
+            "length": combinations[pick][2],
+            "material": MATERIALS[material],
+        }
+        for pick, material in zip(picks, materials)
+    ]
+
+
+def per_row(rows):
+    """Построчный расчёт: количества по позициям и масса шпилек"""
+    studs = Counter()
+    components = Counter()
+    stud_mass = 0.0
+    for row in rows:
+        validate_parameters(**row)
+        bolt_type, diameter = row["bolt_type"], row["diameter"]
+        studs[(bolt_type, diameter, row["length"], row["material"])] += 1
+        stud_mass += get_bolt_mass(diameter, row["length"], bolt_type)
+        for component, quantity in ASSEMBLY_COMPOSITION[bolt_type].items():
+            if component != "stud" and quantity:
+                components[(component, diameter, row["material"])] += quantity
+    return studs, components, stud_mass
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = make_rows(count)
+
+    start = time.perf_counter()
+    studs, components, stud_mass = per_row(rows)
+    row_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bom = BomService.compute(rows)
+    batch_time = time.perf_counter() - start
+
+    batch_studs = [i for i in bom["items"] if i["component"] == "stud"]
+    assert len(batch_studs) == len(studs)
+    assert abs(sum(i["mass"] for i in batch_studs) - stud_mass) < 1e-6 * stud_mass
+
+    print(f"Строк: {count}, позиций спецификации: {len(bom['items'])}")
+    print(f"Масса: {bom['total_mass']:.1f} кг")
+    print(f"{'построчно':>12} {row_time * 1000:>8.1f} мс")
+    print(f"{'BomService':>12} {batch_time * 1000:>8.1f} мс")
+    print(f"Ускорение: {row_time / batch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+bench_catalog.py — Бенчмарк генерации всего каталога ГОСТ в один документ
+
+Все допустимые сочетания (тип болта, диаметр, длина) из AVAILABLE_LENGTHS
+генерируются ведомостью в один документ. Каждая строка создаёт новые типы и
+RepresentationMap, поэтому связывание представления с типом
+(GeometryBuilder.associate_representation) выполняется сотни раз.
+
+Сравнивается поиск существующей карты по обратной ссылке с прежним перебором
+by_type('IfcRepresentationMap'): время на болт при росте каталога должно
+оставаться постоянным (линейное масштабирование).
+
+Запуск:
+    python benchmarks/bench_catalog.py [доля_каталога ...]
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+import geometry_builder  # noqa: E402
+from data.validation import AVAILABLE_LENGTHS  # noqa: E402
+from instance_factory import generate_bolt_schedule  # noqa: E402
+from main import initialize_base_document, reset_doc_manager  # noqa: E402
+
+FRACTIONS = [0.25, 0.5, 1.0]
+
+
+def catalog_rows():
+    """Все строки каталога: (params, placement, tag)"""
+    rows = []
+    for (bolt_type, diameter), lengths in sorted(AVAILABLE_LENGTHS.items()):
+        for length in lengths:
+            i = len(rows)
+            params = {
+                "bolt_type": bolt_type,
+                "diameter": diameter,
+                "length": length,
+                "material": "09Г2С",
+            }
+            rows.append((params, (1000.0 * (i % 20), 1000.0 * (i // 20), 0.0), f"Б{i + 1}"))
+    return rows
+
+
+def _scan_associate(self, product_type, shape_rep):
+    """Прежняя реализация: перебор всех IfcRepresentationMap документа"""
+    rep_maps = [
+        m for m in self.ifc.by_type("IfcRepresentationMap") if m.MappedRepresentation == shape_rep
+    ]
+    if not rep_maps:
+        rep_map = self.ifc.create_entity(
+            "IfcRepresentationMap",
+            MappingOrigin=geometry_builder.get_interner(self.ifc).axis2placement3d(),
+            MappedRepresentation=shape_rep,
+        )
+        product_type.RepresentationMaps = list(product_type.RepresentationMaps or ()) + [rep_map]
+
+
+@contextmanager
+def timed_associate(implementation=None):
+    """Подмена associate_representation с подсчётом суммарного времени"""
+    original = geometry_builder.GeometryBuilder.associate_representation
+    target = implementation or original
+    spent = [0.0]
+
+    def wrapper(self, product_type, shape_rep):
+        start = time.perf_counter()
+        target(self, product_type, shape_rep)
+        spent[0] += time.perf_counter() - start
+
+    geometry_builder.GeometryBuilder.associate_representation = wrapper
+    try:
+        yield spent
+    finally:
+        geometry_builder.GeometryBuilder.associate_representation = original
+
+
+def run(rows, implementation=None):
+    with timed_associate(implementation) as spent:
+        start = time.perf_counter()
+        generate_bolt_schedule(rows, include_mesh=False)
+        total = time.perf_counter() - start
+    return total, spent[0]
+
+
+def main():
+    fractions = [float(v) for v in sys.argv[1:]] or FRACTIONS
+    rows = catalog_rows()
+
+    reset_doc_manager()
+    initialize_base_document("bench")
+
+    print(f"Строк каталога: {len(rows)}")
+    print(
+        f"{'болтов':>7} {'всего, с':>9} {'мс/болт':>8} {'связывание, мс':>15} "
+        f"{'перебор: всего, с':>18} {'связывание, мс':>15}"
+    )
+    for fraction in fractions:
+        part = rows[: max(1, int(len(rows) * fraction))]
+        total, associate = run(part)
+        scan_total, scan_associate = run(part, _scan_associate)
+        print(
+            f"{len(part):>7} {total:>9.2f} {total / len(part) * 1000:>8.1f} "
+            f"{associate * 1000:>15.1f} {scan_total:>18.2f} {scan_associate * 1000:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
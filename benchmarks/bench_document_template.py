@@ -0,0 +1,49 @@
+"""
+bench_document_template.py — Бенчмарк создания документа из шаблона
+
+Сравнивает построение базовой структуры с нуля (ifcopenshell.api,
+setup_units_and_contexts, CRS) с клонированием из DocumentTemplate.
+
+Запуск:
+    python benchmarks/bench_document_template.py [повторов]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+from document_manager import IFCDocumentManager  # noqa: E402
+from document_template import get_document_template  # noqa: E402
+
+
+def timeit(func, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats * 1000.0
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    manager = IFCDocumentManager()
+
+    template = get_document_template("IFC4", manager._build_base_document)
+    counter = iter(range(10**9))
+
+    rows = [
+        ("Построение с нуля", lambda: manager._build_base_document("IFC4"), max(repeats // 20, 5)),
+        ("DocumentTemplate.instantiate", template.instantiate, repeats),
+        (
+            "IFCDocumentManager.create_document",
+            lambda: manager.create_document(f"doc-{next(counter)}"),
+            repeats,
+        ),
+    ]
+    for label, func, count in rows:
+        print(f"{label:40s} {timeit(func, count):8.3f} мс")
+
+
+if __name__ == "__main__":
+    main()
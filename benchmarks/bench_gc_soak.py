@@ -0,0 +1,58 @@
+"""
+bench_gc_soak.py — Soak-тест утечек сущностей при повторной генерации
+
+Болт перегенерируется 1000 раз в один и тот же doc_id (как в длительной
+сессии браузера). Количество сущностей после каждой генерации должно
+оставаться постоянным, а сборщик мусора не должен находить сирот.
+
+Запуск:
+    python benchmarks/bench_gc_soak.py [итераций]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+from garbage_collector import find_orphans  # noqa: E402
+from instance_factory import generate_bolt_assembly  # noqa: E402
+from main import get_doc_manager, get_leak_metrics, initialize_base_document  # noqa: E402
+
+ITERATIONS = 1000
+MODES = [
+    ("separate", "solid"),
+    ("separate", "faceted"),
+    ("unified", "faceted"),
+]
+PARAMS = {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"}
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else ITERATIONS
+    initialize_base_document("soak")
+
+    print(f"{'режим':>20} {'итераций':>9} {'мин':>6} {'макс':>6} {'сирот':>6} {'мс/итер':>8}")
+    leaked = False
+    for assembly_mode, geometry_type in MODES:
+        counts = []
+        start = time.perf_counter()
+        for _ in range(iterations):
+            generate_bolt_assembly(PARAMS, assembly_mode=assembly_mode, geometry_type=geometry_type)
+            counts.append(get_leak_metrics("soak")["entity_count"])
+        elapsed = time.perf_counter() - start
+
+        orphans = len(find_orphans(get_doc_manager().get_document("soak")))
+        leaked |= min(counts) != max(counts) or orphans > 0
+        print(
+            f"{assembly_mode + '/' + geometry_type:>20} {iterations:>9} {min(counts):>6} "
+            f"{max(counts):>6} {orphans:>6} {elapsed / iterations * 1000.0:>8.2f}"
+        )
+
+    print(f"\nМетрики документа: {get_leak_metrics('soak')}")
+    print("Количество сущностей стабильно" if not leaked else "ОБНАРУЖЕН РОСТ СУЩНОСТЕЙ")
+    return 1 if leaked else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
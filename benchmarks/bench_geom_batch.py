@@ -0,0 +1,70 @@
+"""
+bench_geom_batch.py — Бенчмарк пакетного извлечения сеток ifcopenshell.geom
+
+Сравнивает поэлементную конвертацию (convert_ifc_to_mesh на каждый компонент)
+с одним проходом ifcopenshell.geom.iterator по всем компонентам ведомости
+(convert_elements_batch) при разном количестве потоков.
+
+Запуск:
+    python benchmarks/bench_geom_batch.py [количество_болтов]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+from geometry_converter import convert_elements_batch, convert_ifc_to_mesh  # noqa: E402
+from instance_factory import InstanceFactory  # noqa: E402
+from main import initialize_base_document, reset_doc_manager  # noqa: E402
+
+SPECS = [
+    ("1.1", 20, 800, "09Г2С"),
+    ("1.1", 24, 1000, "09Г2С"),
+    ("2.1", 30, 1000, "ВСт3пс2"),
+    ("5", 20, 800, "09Г2С"),
+]
+
+
+def build_components(count):
+    """Компоненты ведомости из count болтов (без mesh данных)"""
+    reset_doc_manager()
+    doc = initialize_base_document("bench")
+    factory = InstanceFactory(doc)
+    components = []
+    for i in range(count):
+        result = factory.create_bolt_assembly(
+            *SPECS[i % len(SPECS)], placement=(1000.0 * i, 0.0, 0.0), include_mesh=False
+        )
+        components.extend(result["components"])
+    return doc, components
+
+
+def bench_serial(doc, components):
+    start = time.perf_counter()
+    failures = sum(1 for c in components if convert_ifc_to_mesh(doc, c) is None)
+    return time.perf_counter() - start, failures
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    doc, components = build_components(count)
+    print(f"Болтов: {count}, компонентов: {len(components)}, CPU: {os.cpu_count()}")
+
+    elapsed, failures = bench_serial(doc, components)
+    print(f"Поэлементно:          {elapsed:8.3f} с  (ошибок {failures})")
+
+    for num_threads in (1, 2, 4):
+        batch = convert_elements_batch(doc, components, num_threads=num_threads)
+        timings = sorted(batch["timings"].values())
+        median = timings[len(timings) // 2] if timings else 0.0
+        print(
+            f"Пакет, потоков {num_threads}:   {batch['total_time']:8.3f} с  "
+            f"(ошибок {len(batch['failures'])}, медиана {median * 1000:.2f} мс/элемент, "
+            f"максимум {timings[-1] * 1000 if timings else 0.0:.2f} мс)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+bench_gost_lookup.py — Бенчмарк запросов к каталогу болтов ГОСТ
+
+Сравнивает прежний поиск по строковому ключу BOLT_DIM_DATA
+(f"{диаметр}_{длина}" и позиционный индекс) с записями скомпилированного
+каталога (BOLT_CATALOG.get) и векторным запросом по столбцам NumPy
+(BOLT_CATALOG.rows) для длины резьбы и массы болта.
+
+Запуск:
+    python benchmarks/bench_gost_lookup.py [количество_запросов]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+import numpy as np  # noqa: E402
+from data.catalog import MASS_TYPES  # noqa: E402
+
+from data import (  # noqa: E402
+    BOLT_CATALOG,
+    BOLT_DIM_DATA,
+    MASS_INDICES,
+    get_bolt_mass,
+    get_thread_length,
+)
+
+REPEATS = 5
+
+
+def legacy_thread_length(diameter, length):
+    """Прежний get_thread_length"""
+    key = f"{diameter}_{length}"
+    if key in BOLT_DIM_DATA:
+        return BOLT_DIM_DATA[key][4]
+    return None
+
+
+def legacy_mass(diameter, length, bolt_type):
+    """Прежний get_bolt_mass"""
+    key = f"{diameter}_{length}"
+    if key not in BOLT_DIM_DATA:
+        return None
+    data = BOLT_DIM_DATA[key]
+    mass_idx = MASS_INDICES.get(bolt_type)
+    if mass_idx is None or mass_idx >= len(data):
+        return None
+    return data[mass_idx]
+
+
+def make_queries(count):
+    """Запросы по существующим строкам каталога с типами по кругу"""
+    rng = np.random.default_rng(0)
+    rows = rng.integers(0, len(BOLT_CATALOG), count)
+    diameters = BOLT_CATALOG.diameter[rows].tolist()
+    lengths = BOLT_CATALOG.length[rows].tolist()
+    types = [MASS_TYPES[i % len(MASS_TYPES)] for i in range(count)]
+    return diameters, lengths, types
+
+
+def best_of(func):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    diameters, lengths, types = make_queries(count)
+    queries = list(zip(diameters, lengths, types))
+    type_columns = np.array([MASS_TYPES.index(t) for t in types])
+
+    def vectorized():
+        rows = BOLT_CATALOG.rows(diameters, lengths)
+        return BOLT_CATALOG.thread_length[rows], BOLT_CATALOG.mass[rows, type_columns]
+
+    results = {
+        "строковый ключ": best_of(
+            lambda: [(legacy_thread_length(d, l), legacy_mass(d, l, t)) for d, l, t in queries]
+        ),
+        "get_thread_length/get_bolt_mass": best_of(
+            lambda: [(get_thread_length(d, l), get_bolt_mass(d, l, t)) for d, l, t in queries]
+        ),
+        "BOLT_CATALOG.get": best_of(
+            lambda: [
+                (r.thread_length, r.mass(t))
+                for r, t in ((BOLT_CATALOG.get(d, l), t) for d, l, t in queries)
+            ]
+        ),
+        "столбцы NumPy": best_of(vectorized),
+    }
+
+    print(f"Запросов: {count} (длина резьбы + масса)")
+    baseline = results["строковый ключ"]
+    for name, elapsed in results.items():
+        print(f"{name:>34} {elapsed * 1e9 / count:>8.0f} нс/запрос {baseline / elapsed:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+bench_ifc_io.py — Бенчмарк экспорта/импорта IFC: временный файл против памяти
+
+Сравнивает прежний путь (NamedTemporaryFile → write/open → unlink)
+с ifc_io.to_string / ifc_io.from_string, а также сжатие gzip/IFCZIP.
+
+Запуск:
+    python benchmarks/bench_ifc_io.py [количество_болтов] [повторов]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+import ifc_io  # noqa: E402
+import ifcopenshell  # noqa: E402
+from document_manager import IFCDocumentManager  # noqa: E402
+from instance_factory import InstanceFactory  # noqa: E402
+
+
+def export_via_tempfile(ifc_doc):
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".ifc", delete=False) as tmp:
+        tmp_path = tmp.name
+    ifc_doc.write(tmp_path)
+    with open(tmp_path, "r") as f:
+        content = f.read()
+    os.unlink(tmp_path)
+    return content
+
+
+def import_via_tempfile(content):
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".ifc", delete=False) as tmp:
+        tmp.write(content)
+        tmp_path = tmp.name
+    doc = ifcopenshell.open(tmp_path)
+    os.unlink(tmp_path)
+    return doc
+
+
+def timeit(func, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats * 1000.0
+
+
+def build_document(bolt_count):
+    doc = IFCDocumentManager().create_document("bench")
+    factory = InstanceFactory(doc)
+    for i in range(bolt_count):
+        factory.create_bolt_assembly(
+            "1.1", 20, 800, "09Г2С", placement=(i * 500.0, 0.0, 0.0), include_mesh=False
+        )
+    return doc
+
+
+def main():
+    bolt_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    header_doc = IFCDocumentManager()._open_header_document("IFC4")
+    header = ifc_io.to_string(header_doc)
+    doc = build_document(bolt_count)
+    content = ifc_io.to_string(doc)
+    print(f"Документ: {bolt_count} болтов, {len(content) / 1024:.1f} КБ SPF")
+
+    rows = [
+        ("Инициализация (заголовок), temp file", lambda: import_via_tempfile(header)),
+        ("Инициализация (заголовок), память", lambda: ifc_io.from_string(header)),
+        ("Экспорт, temp file", lambda: export_via_tempfile(doc)),
+        ("Экспорт, память", lambda: ifc_io.to_string(doc)),
+        ("Импорт, temp file", lambda: import_via_tempfile(content)),
+        ("Импорт, память", lambda: ifc_io.from_string(content)),
+        ("Экспорт gzip", lambda: ifc_io.to_bytes(doc, "gzip")),
+        ("Экспорт IFCZIP", lambda: ifc_io.to_bytes(doc, "ifczip")),
+    ]
+    for label, func in rows:
+        print(f"{label:40s} {timeit(func, repeats):8.3f} мс")
+
+    for compression in ("gzip", "ifczip"):
+        size = len(ifc_io.to_bytes(doc, compression))
+        print(f"Размер {compression:6s}: {size / 1024:.1f} КБ ({size / len(content):.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+bench_interning.py — Бенчмарк интернирования геометрических ресурсов
+
+Генерирует ведомости разного размера с интернированием (entity_interner) и без
+него (каждый вызов создаёт новую сущность, как раньше) и сравнивает количество
+сущностей и размер SPF — всего и в пересчёте на болт.
+
+Запуск:
+    python benchmarks/bench_interning.py [размер1 размер2 ...]
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+import entity_interner  # noqa: E402
+from instance_factory import generate_bolt_schedule  # noqa: E402
+from main import get_doc_manager, initialize_base_document, reset_doc_manager  # noqa: E402
+
+SIZES = [1, 10, 50, 200]
+
+SPECS = [
+    {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"},
+    {"bolt_type": "1.2", "diameter": 24, "length": 800, "material": "09Г2С"},
+    {"bolt_type": "2.1", "diameter": 30, "length": 1000, "material": "ВСт3пс2"},
+    {"bolt_type": "5", "diameter": 20, "length": 800, "material": "09Г2С"},
+]
+
+
+def make_rows(count):
+    """Ведомость: болты по сетке 1 м с повторяющимися спецификациями"""
+    return [
+        (SPECS[i % len(SPECS)], (1000.0 * (i % 10), 1000.0 * (i // 10), 0.0), f"Б{i + 1}")
+        for i in range(count)
+    ]
+
+
+@contextmanager
+def no_interning():
+    """Отключение интернирования: каждый запрос создаёт новую сущность"""
+    lookup = entity_interner.EntityInterner._lookup
+    entity_interner.EntityInterner._lookup = lambda self, key: None
+    try:
+        yield
+    finally:
+        entity_interner.EntityInterner._lookup = lookup
+
+
+def measure(rows):
+    ifc_str, _ = generate_bolt_schedule(rows, include_mesh=False)
+    doc = get_doc_manager().get_document()
+    return sum(1 for _ in doc), len(ifc_str.encode("utf-8"))
+
+
+def main():
+    sizes = [int(v) for v in sys.argv[1:]] or SIZES
+
+    reset_doc_manager()
+    initialize_base_document("bench")
+    empty_entities, empty_bytes = measure([])
+
+    print(
+        f"{'болтов':>7} {'сущн. без':>10} {'сущн. с':>9} {'на болт':>15} "
+        f"{'SPF без, КБ':>12} {'SPF с, КБ':>10} {'на болт, КБ':>15}"
+    )
+    for size in sizes:
+        rows = make_rows(size)
+        with no_interning():
+            plain_entities, plain_bytes = measure(rows)
+        interned_entities, interned_bytes = measure(rows)
+
+        per_bolt = (
+            f"{(plain_entities - empty_entities) / size:.0f}"
+            f"→{(interned_entities - empty_entities) / size:.0f}"
+        )
+        per_bolt_kb = (
+            f"{(plain_bytes - empty_bytes) / size / 1024:.1f}"
+            f"→{(interned_bytes - empty_bytes) / size / 1024:.1f}"
+        )
+        print(
+            f"{size:>7} {plain_entities:>10} {interned_entities:>9} {per_bolt:>15} "
+            f"{plain_bytes / 1024:>12.1f} {interned_bytes / 1024:>10.1f} {per_bolt_kb:>15}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+bench_mesh_payload.py — Бенчмарк бинарного mesh payload
+
+Сравнивает списочный формат mesh данных (mesh_format='lists') с бинарным
+(mesh_format='binary', mesh_payload.pack_mesh_data):
+- размер: JSON списков против буферов + JSON метаданных
+- время построения mesh данных в generate_bolt_schedule
+- время «передачи»: сериализация JSON списков (поэлементный обход, как при
+  конвертации PyProxy) против копирования буферов одним блоком
+
+Запуск:
+    python benchmarks/bench_mesh_payload.py [количество_болтов]
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+from instance_factory import generate_bolt_schedule  # noqa: E402
+from main import initialize_base_document, reset_doc_manager  # noqa: E402
+from mesh_payload import payload_nbytes  # noqa: E402
+
+SPECS = [
+    {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"},
+    {"bolt_type": "1.2", "diameter": 24, "length": 1000, "material": "09Г2С"},
+    {"bolt_type": "2.1", "diameter": 30, "length": 1000, "material": "ВСт3пс2"},
+    {"bolt_type": "5", "diameter": 20, "length": 800, "material": "09Г2С"},
+]
+
+BUFFER_KEYS = ("positions", "normals", "indices")
+
+
+def make_rows(count):
+    return [(SPECS[i % len(SPECS)], (1000.0 * i, 0.0, 0.0), f"Б{i + 1}") for i in range(count)]
+
+
+def build(rows, mesh_format, tessellator):
+    start = time.perf_counter()
+    _, schedule = generate_bolt_schedule(rows, tessellator=tessellator, mesh_format=mesh_format)
+    return time.perf_counter() - start, [bolt["mesh_data"] for bolt in schedule["bolts"]]
+
+
+def transfer_lists(mesh_datas):
+    start = time.perf_counter()
+    size = sum(len(json.dumps(mesh_data).encode("utf-8")) for mesh_data in mesh_datas)
+    return time.perf_counter() - start, size
+
+
+def transfer_binary(payloads):
+    start = time.perf_counter()
+    size = 0
+    for payload in payloads:
+        metadata = {k: v for k, v in payload.items() if k not in BUFFER_KEYS}
+        size += len(json.dumps(metadata).encode("utf-8"))
+        size += sum(len(bytes(payload[key])) for key in BUFFER_KEYS)
+    return time.perf_counter() - start, size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    rows = make_rows(count)
+
+    reset_doc_manager()
+    initialize_base_document("bench")
+
+    print(f"Болтов: {count}")
+    for tessellator in ("geom", "analytic"):
+        lists_time, lists = build(rows, "lists", tessellator)
+        binary_time, payloads = build(rows, "binary", tessellator)
+        lists_transfer, lists_size = transfer_lists(lists)
+        binary_transfer, binary_size = transfer_binary(payloads)
+        buffers = sum(payload_nbytes(payload) for payload in payloads)
+
+        print(f"[{tessellator}]")
+        print(f"  Построение:  списки {lists_time:7.3f} с   бинарный {binary_time:7.3f} с")
+        print(
+            f"  Размер:      списки {lists_size / 1024:9.1f} КБ  бинарный {binary_size / 1024:9.1f} КБ"
+            f"  (буферы {buffers / 1024:.1f} КБ, в {lists_size / binary_size:.1f} раза меньше)"
+        )
+        print(
+            f"  Передача:    списки {lists_transfer * 1000:7.1f} мс  "
+            f"бинарный {binary_transfer * 1000:7.1f} мс"
+            f"  (в {lists_transfer / binary_transfer:.0f} раз быстрее)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+bench_property_views.py — Бенчмарк запроса свойств элемента по GlobalId
+
+Сравнивает прежний путь (обход всех сущностей документа и извлечение
+наборов свойств на каждый запрос) с индексом GlobalId и кэшем
+PropertyViews на документе с ведомостью болтов.
+
+Запуск:
+    python benchmarks/bench_property_views.py [количество_болтов]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+from document_manager import IFCDocumentManager  # noqa: E402
+from instance_factory import InstanceFactory  # noqa: E402
+from property_views import PropertyViews, extract_properties  # noqa: E402
+
+DIAMETERS = [16, 20, 24, 30]
+QUERIES = 3
+
+
+def scan(ifc_doc, global_id):
+    """Прежний путь: обход документа и извлечение всех наборов свойств"""
+    element = next((e for e in ifc_doc if hasattr(e, "GlobalId") and e.GlobalId == global_id), None)
+    if element is None:
+        return None
+    property_sets = []
+    for rel in element.IsDefinedBy or ():
+        if rel.is_a("IfcRelDefinesByProperties"):
+            properties = extract_properties(rel.RelatingPropertyDefinition)
+            if properties:
+                property_sets.append(properties)
+    for rel in element.IsTypedBy or ():
+        for pset in rel.RelatingType.HasPropertySets or ():
+            properties = extract_properties(pset)
+            if properties:
+                property_sets.append(properties)
+    return property_sets
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    ifc_doc = IFCDocumentManager().create_document("bench")
+    factory = InstanceFactory(ifc_doc)
+    global_ids = [
+        factory.create_bolt_assembly(
+            "1.1", DIAMETERS[i % len(DIAMETERS)], 800, "09Г2С", include_mesh=False
+        )["assembly"].GlobalId
+        for i in range(count)
+    ]
+    # Запросы к последним элементам — худший случай для обхода
+    targets = global_ids[-20:]
+
+    start = time.perf_counter()
+    for _ in range(QUERIES):
+        for global_id in targets:
+            scan(ifc_doc, global_id)
+    scan_time = (time.perf_counter() - start) / (QUERIES * len(targets))
+
+    views = PropertyViews(ifc_doc)
+    start = time.perf_counter()
+    for global_id in targets:
+        views.get(global_id)
+    cold_time = (time.perf_counter() - start) / len(targets)
+
+    start = time.perf_counter()
+    for _ in range(QUERIES):
+        for global_id in targets:
+            views.get(global_id)
+    warm_time = (time.perf_counter() - start) / (QUERIES * len(targets))
+
+    print(f"Болтов: {count}, сущностей: {len(list(ifc_doc))}")
+    print(f"{'обход':>16} {scan_time * 1e6:>10.1f} мкс")
+    print(f"{'индекс, холодный':>16} {cold_time * 1e6:>10.1f} мкс")
+    print(f"{'индекс, кэш':>16} {warm_time * 1e6:>10.1f} мкс")
+    print(f"Ускорение: {scan_time / warm_time:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+bench_pset_writer.py — Бенчмарк создания наборов свойств типов
+
+Сравнивает создание Pset_MechanicalFastenerAnchorBolt и «Маркировка» через
+ifcopenshell.api (pset.add_pset + pset.edit_pset) с прямой записью по
+шаблонам (pset_writer.write_pset). Выводится время на тип и количество
+созданных сущностей.
+
+Запуск:
+    python benchmarks/bench_pset_writer.py [количество_типов]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+import ifcopenshell.api  # noqa: E402
+import ifcopenshell.guid  # noqa: E402
+from document_manager import IFCDocumentManager  # noqa: E402
+from pset_writer import write_pset  # noqa: E402
+
+
+def anchor_bolt_values(i):
+    return {
+        "AnchorBoltDiameter": 20.0,
+        "AnchorBoltLength": 300.0 + i,
+        "AnchorBoltProtrusionLength": 60.0,
+        "AnchorBoltThreadLength": 60.0,
+    }
+
+
+def marking_values(i):
+    return {"Позиция": "-", "Обозначение": "ГОСТ 24379.1-2012", "Наименование": f"Тип {i}"}
+
+
+def api_path(doc, product_type, i):
+    """Наборы свойств через ifcopenshell.api"""
+    for name, values in (
+        ("Pset_MechanicalFastenerAnchorBolt", anchor_bolt_values(i)),
+        ("Маркировка", {k: doc.create_entity("IfcText", v) for k, v in marking_values(i).items()}),
+    ):
+        pset = ifcopenshell.api.run("pset.add_pset", doc, product=product_type, name=name)
+        ifcopenshell.api.run("pset.edit_pset", doc, pset=pset, properties=values)
+
+
+def fast_path(doc, product_type, i):
+    """Наборы свойств по шаблонам pset_writer"""
+    write_pset(doc, product_type, "Pset_MechanicalFastenerAnchorBolt", anchor_bolt_values(i))
+    write_pset(doc, product_type, "Маркировка", marking_values(i))
+
+
+def measure(write, count):
+    doc = IFCDocumentManager().create_document("bench")
+    types = [
+        doc.create_entity(
+            "IfcMechanicalFastenerType",
+            GlobalId=ifcopenshell.guid.new(),
+            Name=f"Тип {i}",
+            PredefinedType="ANCHORBOLT",
+        )
+        for i in range(count)
+    ]
+    entities = sum(1 for _ in doc)
+
+    start = time.perf_counter()
+    for i, product_type in enumerate(types):
+        write(doc, product_type, i)
+    elapsed = time.perf_counter() - start
+    return elapsed / count, (sum(1 for _ in doc) - entities) / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    # Прогрев: импорт модулей API и компиляция шаблонов
+    measure(api_path, 5)
+    measure(fast_path, 5)
+
+    api = measure(api_path, count)
+    fast = measure(fast_path, count)
+
+    print(f"Типов: {count} (2 набора свойств на тип)")
+    print(f"{'':>24} {'api':>10} {'шаблоны':>10}")
+    print(f"{'мкс на тип':>24} {api[0] * 1e6:>10.1f} {fast[0] * 1e6:>10.1f}")
+    print(f"{'сущностей на тип':>24} {api[1]:>10.1f} {fast[1]:>10.1f}")
+    print(f"Ускорение: {api[0] / fast[0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
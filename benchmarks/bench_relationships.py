@@ -0,0 +1,91 @@
+"""
+bench_relationships.py — Бенчмарк сводных отношений IFC
+
+Сравнивает ведомость со сводными отношениями (relationship_builder: одно
+IfcRelDefinesByType на тип, одно IfcRelContainedInSpatialStructure на этаж,
+одно IfcRelAssociatesMaterial на материал) с прежней схемой — новое
+отношение на каждый вызов. Выводится количество отношений и сущностей,
+размер SPF и время экспорта.
+
+Запуск:
+    python benchmarks/bench_relationships.py [количество_болтов]
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+import ifc_io  # noqa: E402
+import relationship_builder  # noqa: E402
+from instance_factory import generate_bolt_schedule  # noqa: E402
+from main import get_doc_manager, initialize_base_document, reset_doc_manager  # noqa: E402
+
+SPECS = [
+    {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"},
+    {"bolt_type": "1.2", "diameter": 24, "length": 800, "material": "09Г2С"},
+    {"bolt_type": "2.1", "diameter": 30, "length": 1000, "material": "ВСт3пс2"},
+    {"bolt_type": "5", "diameter": 20, "length": 800, "material": "09Г2С"},
+]
+
+RELATIONSHIPS = tuple(relationship_builder.RELATIONSHIP_ATTRIBUTES)
+EXPORT_REPEATS = 10
+
+
+def make_rows(count):
+    """Ведомость: болты по сетке 1 м с повторяющимися спецификациями"""
+    return [
+        (SPECS[i % len(SPECS)], (1000.0 * (i % 10), 1000.0 * (i // 10), 0.0), f"Б{i + 1}")
+        for i in range(count)
+    ]
+
+
+@contextmanager
+def per_call_relationships():
+    """Прежняя схема: новое отношение на каждый вызов, без накопления"""
+    cls = relationship_builder.RelationshipBuilder
+    existing, deferring = cls._existing, cls.deferring
+    cls._existing = lambda self, key: None
+    cls.deferring = lambda self: nullcontext(self)
+    try:
+        yield
+    finally:
+        cls._existing, cls.deferring = existing, deferring
+
+
+def measure(rows):
+    generate_bolt_schedule(rows, include_mesh=False)
+    doc = get_doc_manager().get_document()
+    relationships = {name: len(doc.by_type(name)) for name in RELATIONSHIPS}
+
+    start = time.perf_counter()
+    for _ in range(EXPORT_REPEATS):
+        spf = ifc_io.to_string(doc)
+    export_time = (time.perf_counter() - start) / EXPORT_REPEATS
+    return relationships, sum(1 for _ in doc), len(spf.encode("utf-8")), export_time
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rows = make_rows(count)
+
+    reset_doc_manager()
+    initialize_base_document("bench")
+
+    with per_call_relationships():
+        before = measure(rows)
+    after = measure(rows)
+
+    print(f"Болтов: {count}")
+    print(f"{'':>36} {'было':>10} {'стало':>10}")
+    for name in RELATIONSHIPS:
+        print(f"{name:>36} {before[0][name]:>10} {after[0][name]:>10}")
+    print(f"{'сущностей':>36} {before[1]:>10} {after[1]:>10}")
+    print(f"{'SPF, КБ':>36} {before[2] / 1024:>10.1f} {after[2] / 1024:>10.1f}")
+    print(f"{'экспорт, мс':>36} {before[3] * 1000:>10.1f} {after[3] * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
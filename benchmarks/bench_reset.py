@@ -0,0 +1,49 @@
+"""
+bench_reset.py — Бенчмарк сброса документа
+
+Время reset_document должно оставаться постоянным независимо от того,
+сколько болтов было сгенерировано в документе до сброса.
+
+Запуск:
+    python benchmarks/bench_reset.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+from document_manager import IFCDocumentManager  # noqa: E402
+from instance_factory import InstanceFactory  # noqa: E402
+
+BOLT_COUNTS = [0, 10, 100, 500]
+REPEATS = 5
+
+
+def main():
+    manager = IFCDocumentManager()
+    manager.create_document("bench")
+
+    print(f"{'болтов до сброса':>18} {'сущностей':>10} {'reset, мс':>10}")
+    for bolt_count in BOLT_COUNTS:
+        total = 0.0
+        entity_count = 0
+        for _ in range(REPEATS):
+            doc = manager.get_document("bench")
+            factory = InstanceFactory(doc)
+            for i in range(bolt_count):
+                factory.create_bolt_assembly(
+                    "1.1", 20, 800, "09Г2С", placement=(i * 500.0, 0.0, 0.0), include_mesh=False
+                )
+            entity_count = len(list(doc))
+
+            start = time.perf_counter()
+            manager.reset_document("bench")
+            total += time.perf_counter() - start
+
+        print(f"{bolt_count:>18} {entity_count:>10} {total / REPEATS * 1000.0:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+bench_schedule.py — Бенчмарк пакетной генерации ведомости болтов
+
+Сравнивает генерацию N болтов по одному (generate_bolt_assembly на каждый болт)
+с пакетной генерацией ведомости в один документ (generate_bolt_schedule).
+
+Запуск:
+    python benchmarks/bench_schedule.py [количество_болтов]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+from instance_factory import generate_bolt_assembly, generate_bolt_schedule  # noqa: E402
+from main import initialize_base_document, reset_doc_manager  # noqa: E402
+
+SPECS = [
+    {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"},
+    {"bolt_type": "1.1", "diameter": 24, "length": 1000, "material": "09Г2С"},
+    {"bolt_type": "2.1", "diameter": 30, "length": 1000, "material": "ВСт3пс2"},
+    {"bolt_type": "5", "diameter": 20, "length": 800, "material": "09Г2С"},
+]
+
+
+def make_rows(count):
+    """Ведомость: болты по сетке 1 м с повторяющимися спецификациями"""
+    return [
+        (SPECS[i % len(SPECS)], (1000.0 * (i % 10), 1000.0 * (i // 10), 0.0), f"Б{i + 1}")
+        for i in range(count)
+    ]
+
+
+def bench_per_bolt(rows):
+    start = time.perf_counter()
+    for params, _, _ in rows:
+        generate_bolt_assembly(params)
+    return time.perf_counter() - start
+
+
+def bench_schedule(rows, include_mesh):
+    start = time.perf_counter()
+    _, schedule = generate_bolt_schedule(rows, include_mesh=include_mesh)
+    return time.perf_counter() - start, schedule["stats"]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    rows = make_rows(count)
+
+    reset_doc_manager()
+    initialize_base_document("bench")
+
+    per_bolt = bench_per_bolt(rows)
+    print(f"По одному болту:      {per_bolt:8.3f} с  ({count / per_bolt:8.1f} болт/с)")
+
+    for include_mesh in (True, False):
+        elapsed, stats = bench_schedule(rows, include_mesh)
+        label = "с mesh" if include_mesh else "без mesh"
+        print(
+            f"Ведомость ({label:8s}): {elapsed:8.3f} с  ({stats['bolts_per_second']:8.1f} болт/с,"
+            f" генерация {stats['generation_time']:.3f} с, экспорт {stats['export_time']:.3f} с)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+bench_summary.py — Бенчмарк сводки документа (IFCGenerator.get_summary)
+
+Сравнивает прежний полный пересчёт (обход всех сущностей с is_a() и
+запросы by_type) с инкрементальными счётчиками document_stats на документе
+с ведомостью болтов.
+
+Запуск:
+    python benchmarks/bench_summary.py [количество_болтов]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+from document_stats import count_entities, get_document_stats  # noqa: E402
+from ifc_generator import IFCGenerator  # noqa: E402
+from instance_factory import generate_bolt_schedule  # noqa: E402
+from main import get_ifc_document, initialize_base_document  # noqa: E402
+
+REPEATS = 5
+
+
+def best_of(func):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    initialize_base_document("bench")
+    params = {"bolt_type": "2.1", "diameter": 24, "length": 1000, "material": "09Г2С"}
+    rows = [(params, (i * 500.0, 0.0, 0.0), f"Б{i}") for i in range(count)]
+
+    start = time.perf_counter()
+    generate_bolt_schedule(rows, include_mesh=False)
+    generation_time = time.perf_counter() - start
+
+    ifc_doc = get_ifc_document()
+    generator = IFCGenerator(ifc_doc)
+    assert get_document_stats(ifc_doc).verify() == []
+
+    scan_time = best_of(lambda: count_entities(ifc_doc))
+    summary_time = best_of(generator.get_summary)
+
+    summary = generator.get_summary()
+    print(f"Болтов: {count}, сущностей: {summary['entities_count']}")
+    print(f"{'генерация':>20} {generation_time * 1000:>8.1f} мс")
+    print(f"{'полный пересчёт':>20} {scan_time * 1000:>8.2f} мс")
+    print(f"{'get_summary':>20} {summary_time * 1000:>8.2f} мс")
+    print(f"Ускорение: {scan_time / summary_time:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+bench_tessellation_cache.py — Бенчмарк кэша тесселяции faceted типов
+
+Создание всех faceted типов болта в новом документе:
+- cold: пустой кэш, тесселяция через ifcopenshell.geom (OpenCascade)
+- memory: кэш в памяти заполнен предыдущим документом
+- disk: новый процесс (пустая память) с заполненным каталогом .npz
+
+Запуск:
+    python benchmarks/bench_tessellation_cache.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+from document_manager import IFCDocumentManager  # noqa: E402
+from instance_factory import InstanceFactory  # noqa: E402, F401 (прогрев импортов)
+from tessellation_cache import configure_tessellation_cache  # noqa: E402
+from type_factory import TypeFactory  # noqa: E402
+
+BOLTS = [("1.1", 20, 800), ("1.2", 24, 1000), ("2.1", 30, 1250), ("5", 36, 1400)]
+
+
+def _create_types(manager, doc_id):
+    doc = manager.create_document(doc_id)
+    factory = TypeFactory(doc, geometry_type="faceted")
+    start = time.perf_counter()
+    for bolt_type, diameter, length in BOLTS:
+        factory.get_or_create_stud_type(bolt_type, diameter, length, "09Г2С")
+        factory.get_or_create_nut_type(diameter, "09Г2С")
+        factory.get_or_create_washer_type(diameter, "09Г2С")
+        factory.get_or_create_plate_type(diameter, "09Г2С")
+    return time.perf_counter() - start
+
+
+def main():
+    manager = IFCDocumentManager()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = configure_tessellation_cache(cache_dir=cache_dir)
+        cold = _create_types(manager, "cold")
+        memory = _create_types(manager, "memory")
+        memory_stats = cache.get_stats()
+
+        # Новый кэш с тем же каталогом имитирует следующий процесс
+        cache = configure_tessellation_cache(cache_dir=cache_dir)
+        disk = _create_types(manager, "disk")
+        disk_stats = cache.get_stats()
+
+    print(f"{'режим':>8} {'мс':>9} {'ускорение':>10}")
+    for name, elapsed in (("cold", cold), ("memory", memory), ("disk", disk)):
+        print(f"{name:>8} {elapsed * 1000.0:>9.1f} {cold / elapsed:>9.1f}x")
+    print(f"\nПамять: {memory_stats}")
+    print(f"Диск:   {disk_stats}")
+
+
+if __name__ == "__main__":
+    main()
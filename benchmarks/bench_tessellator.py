@@ -0,0 +1,114 @@
+"""
+bench_tessellator.py — Аналитическая тесселяция против ifcopenshell.geom
+
+Сравнивается:
+- тесселяция отдельных компонентов: solid + ifcopenshell.geom.create_shape
+  против GeometryBuilder.tessellate_component
+- генерация болта с mesh_data (tessellator='geom' и 'analytic')
+- создание faceted типов (OpenCascade без кэша против аналитической сетки)
+
+Запуск:
+    python benchmarks/bench_tessellator.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+import ifcopenshell.geom  # noqa: E402
+from document_manager import IFCDocumentManager  # noqa: E402
+from geometry_builder import GeometryBuilder  # noqa: E402
+from gost_data import get_nut_dimensions, get_washer_dimensions  # noqa: E402
+from instance_factory import InstanceFactory  # noqa: E402
+from tessellation_cache import reset_tessellation_cache  # noqa: E402
+
+REPEATS = 20
+BOLTS = [("1.1", 20, 800), ("1.2", 24, 1000), ("2.1", 30, 1250), ("5", 36, 1120)]
+
+
+def _best(func, repeats=REPEATS):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_components(doc):
+    builder = GeometryBuilder(doc)
+    settings = ifcopenshell.geom.settings()
+    nut = get_nut_dimensions(24)
+    washer = get_washer_dimensions(24)
+
+    solids = {
+        ("nut", 24): lambda: builder.create_nut_solid(24, nut["height"]),
+        ("washer", 24): lambda: builder.create_washer_solid(
+            24, washer["outer_diameter"], washer["thickness"]
+        ),
+        ("stud", "1.1", 24, 1000): lambda: builder.create_bent_stud_solid("1.1", 24, 1000),
+        ("stud", "1.2", 24, 1000): lambda: builder.create_bent_stud_solid("1.2", 24, 1000),
+        ("stud", "5", 24, 1000): lambda: builder.create_straight_stud_solid(24, 1000),
+    }
+
+    print(f"{'компонент':>24} {'geom, мс':>9} {'analytic, мс':>13} {'ускорение':>10}")
+    for geom_key, build_solid in solids.items():
+        item = build_solid().Items[0]
+        geom_time = _best(lambda: ifcopenshell.geom.create_shape(settings, item))
+        analytic_time = _best(lambda: builder.tessellate_component(geom_key))
+        print(
+            f"{str(geom_key):>24} {geom_time * 1000:>9.3f} {analytic_time * 1000:>13.3f} "
+            f"{geom_time / analytic_time:>9.1f}x"
+        )
+
+
+def bench_mesh_data(manager):
+    print(f"\n{'болт':>14} {'geom, мс':>9} {'analytic, мс':>13} {'ускорение':>10}")
+    for bolt in BOLTS:
+        times = {}
+        for tessellator in ("geom", "analytic"):
+            doc = manager.create_document(f"mesh_{tessellator}_{bolt[0]}")
+            factory = InstanceFactory(doc, tessellator=tessellator)
+            factory.create_bolt_assembly(*bolt, "09Г2С")  # Прогрев кэша типов
+            times[tessellator] = _best(
+                lambda: factory.create_bolt_assembly(*bolt, "09Г2С"), repeats=5
+            )
+        print(
+            f"{str(bolt):>14} {times['geom'] * 1000:>9.2f} {times['analytic'] * 1000:>13.2f} "
+            f"{times['geom'] / times['analytic']:>9.1f}x"
+        )
+
+
+def bench_faceted_types(manager):
+    print(f"\n{'faceted типы':>14} {'geom, мс':>9} {'analytic, мс':>13} {'ускорение':>10}")
+    for bolt in BOLTS:
+        times = {}
+        for tessellator in ("geom", "analytic"):
+            best = float("inf")
+            for attempt in range(3):
+                reset_tessellation_cache()
+                doc = manager.create_document(f"faceted_{tessellator}_{bolt[0]}_{attempt}")
+                factory = InstanceFactory(doc, geometry_type="faceted", tessellator=tessellator)
+                start = time.perf_counter()
+                factory.create_bolt_assembly(
+                    *bolt, "09Г2С", geometry_type="faceted", include_mesh=False
+                )
+                best = min(best, time.perf_counter() - start)
+            times[tessellator] = best
+        print(
+            f"{str(bolt):>14} {times['geom'] * 1000:>9.2f} {times['analytic'] * 1000:>13.2f} "
+            f"{times['geom'] / times['analytic']:>9.1f}x"
+        )
+
+
+def main():
+    manager = IFCDocumentManager()
+    bench_components(manager.create_document("components"))
+    bench_mesh_data(manager)
+    bench_faceted_types(manager)
+
+
+if __name__ == "__main__":
+    main()
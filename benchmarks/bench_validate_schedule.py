@@ -0,0 +1,82 @@
+"""
+bench_validate_schedule.py — Бенчмарк валидации ведомости болтов
+
+Сравнивает построчную validate_parameters (исключение на каждой невалидной
+строке) с пакетной validate_schedule для ведомости с долей невалидных строк.
+
+Запуск:
+    python benchmarks/bench_validate_schedule.py [количество_строк] [доля_невалидных]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+import numpy as np  # noqa: E402
+
+from data import AVAILABLE_LENGTHS, validate_parameters, validate_schedule  # noqa: E402
+
+REPEATS = 3
+
+
+def make_rows(count, invalid_share):
+    """Ведомость из допустимых комбинаций; часть строк с недоступной длиной"""
+    rng = np.random.default_rng(0)
+    combinations = [
+        (t, d, length) for (t, d), lengths in AVAILABLE_LENGTHS.items() for length in lengths
+    ]
+    picks = rng.integers(0, len(combinations), count)
+    invalid = rng.random(count) < invalid_share
+    rows = []
+    for pick, bad in zip(picks.tolist(), invalid.tolist()):
+        bolt_type, diameter, length = combinations[pick]
+        rows.append(
+            {
+                "bolt_type": bolt_type,
+                "diameter": diameter,
+                "length": length + 1 if bad else length,
+                "material": "09Г2С",
+            }
+        )
+    return rows
+
+
+def per_row(rows):
+    """Прежний путь: validate_parameters на каждую строку"""
+    errors = []
+    for index, row in enumerate(rows):
+        try:
+            validate_parameters(**row)
+        except ValueError as e:
+            errors.append((index, str(e)))
+    return errors
+
+
+def best_of(func, rows):
+    best, result = float("inf"), None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = func(rows)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    invalid_share = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    rows = make_rows(count, invalid_share)
+
+    row_time, row_errors = best_of(per_row, rows)
+    batch_time, report = best_of(validate_schedule, rows)
+    assert [index for index, _ in row_errors] == [e["row"] for e in report["errors"]]
+
+    print(f"Строк: {count}, невалидных: {len(report['errors'])}")
+    print(f"{'validate_parameters':>22} {row_time * 1000:>8.1f} мс")
+    print(f"{'validate_schedule':>22} {batch_time * 1000:>8.1f} мс")
+    print(f"Ускорение: {row_time / batch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+bench_weld.py — Бенчмарк сварки вершин (mesh_utils.weld_vertices)
+
+Сетка с дублированными вершинами (как после булевых операций ifcopenshell.geom):
+каждая вершина встречается дважды с шумом меньше допуска. Для малых сеток
+дополнительно измеряется прежний последовательный O(n²) алгоритм.
+
+Запуск:
+    python benchmarks/bench_weld.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+from mesh_utils import weld_vertices  # noqa: E402
+
+TOLERANCE = 0.01
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+SEQUENTIAL_LIMIT = 10_000
+
+
+def make_mesh(vertex_count, seed=0):
+    """Случайная сетка из vertex_count вершин, половина — почти дубликаты"""
+    rng = np.random.default_rng(seed)
+    base = rng.uniform(0, 1000.0, (vertex_count // 2, 3))
+    noisy = base + rng.uniform(-0.002, 0.002, base.shape)
+    points = np.concatenate([base, noisy])
+    faces = rng.integers(0, len(points), (vertex_count, 3))
+    return points, faces
+
+
+def weld_sequential(verts, faces, tolerance):
+    """Прежний алгоритм: сравнение с каждой найденной уникальной вершиной"""
+    vertex_map = {}
+    unique_verts = []
+    for i, vert in enumerate(verts):
+        for j, unique_vert in enumerate(unique_verts):
+            if np.linalg.norm(vert - unique_vert) < tolerance:
+                vertex_map[i] = j
+                break
+        else:
+            vertex_map[i] = len(unique_verts)
+            unique_verts.append(vert)
+    return unique_verts, [vertex_map[v] for v in faces.ravel()]
+
+
+def main():
+    print(f"{'вершин':>10} {'spatial hash, с':>16} {'мкс/вершина':>12} {'O(n²), с':>10}")
+    for size in SIZES:
+        points, faces = make_mesh(size)
+
+        start = time.perf_counter()
+        new_verts, _ = weld_vertices(points, faces, TOLERANCE)
+        elapsed = time.perf_counter() - start
+        assert len(new_verts) == size // 2
+
+        sequential = "-"
+        if size <= SEQUENTIAL_LIMIT:
+            start = time.perf_counter()
+            weld_sequential(points, faces, TOLERANCE)
+            sequential = f"{time.perf_counter() - start:.3f}"
+
+        print(f"{size:>10} {elapsed:>16.3f} {elapsed / size * 1e6:>12.2f} {sequential:>10}")
+
+
+if __name__ == "__main__":
+    main()
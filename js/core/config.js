@@ -18,6 +18,8 @@ export const APP_CONFIG = Object.freeze({
     PYTHON_MODULES: [
         'python/main.py',
         'python/document_manager.py',
+        'python/document_template.py',
+        'python/garbage_collector.py',
         'python/protocols.py',
         'python/container.py',
         'python/material_manager.py',
@@ -25,16 +27,29 @@ export const APP_CONFIG = Object.freeze({
         'python/type_factory.py',
         'python/gost_data.py',
         'python/geometry_builder.py',
+        'python/document_stats.py',
+        'python/profiling.py',
         'python/ifc_generator.py',
+        'python/property_views.py',
         'python/geometry_converter.py',
+        'python/ifc_io.py',
+        'python/tessellation_cache.py',
+        'python/mesh_utils.py',
+        'python/mesh_payload.py',
+        'python/entity_interner.py',
+        'python/relationship_builder.py',
+        'python/shared_psets.py',
+        'python/pset_writer.py',
         'python/utils.py',
         'python/validate_utils.py',
         'python/data/__init__.py',
         'python/data/bolt_dimensions.py',
+        'python/data/catalog.py',
         'python/data/fastener_dimensions.py',
         'python/data/materials.py',
         'python/data/validation.py',
         'python/services/__init__.py',
+        'python/services/bom_service.py',
         'python/services/dimension_service.py'
     ],
 
@@ -3,12 +3,33 @@
  */
 
 import UI from './ui.js';
+import {
+    MESH_PAYLOAD_BUFFERS,
+    decodeMeshPayload,
+    payloadByteLength
+} from './utils/meshPayload.js';
+import { resolvePropertyTable } from './utils/propertyTable.js';
+import { logProfile } from './utils/profileReport.js';
 
 class IFCBridge {
     constructor(pyodide) {
         this.pyodide = pyodide;
         this.ifc_main = null;
         this.currentIFCData = null;
+        // Таблица наборов свойств текущего документа (из результата генерации)
+        this.propertyTable = null;
+        // Профилирование этапов генерации и отчёт последней генерации
+        this.profilingEnabled = false;
+        this.lastProfile = null;
+    }
+
+    /**
+     * Включение профилирования этапов генерации
+     * (отчёт выводится в консоль и доступен в lastProfile)
+     * @param {boolean} enabled
+     */
+    setProfiling(enabled) {
+        this.profilingEnabled = Boolean(enabled);
     }
 
     /**
@@ -76,6 +97,41 @@ class IFCBridge {
         return result;
     }
 
+    /**
+     * Чтение бинарного mesh payload (python/mesh_payload.py)
+     * Буферы читаются через getBuffer() одним блоком, без поэлементной конвертации,
+     * и копируются из памяти WASM: представление кучи становится недействительным
+     * при её росте. Метаданные сеток конвертируются через toJs.
+     * @param {PyProxy} proxy - Pyodide Proxy словаря payload
+     * @returns {object} - mesh данные для viewer
+     */
+    convertMeshPayload(proxy) {
+        const started = performance.now();
+        const payload = {};
+        for (const key of proxy.keys()) {
+            const value = proxy.get(key);
+            if (MESH_PAYLOAD_BUFFERS.includes(key)) {
+                const buffer = value.getBuffer();
+                try {
+                    payload[key] = buffer.data.slice();
+                } finally {
+                    buffer.release();
+                    value.destroy();
+                }
+            } else if (value && typeof value.toJs === 'function') {
+                payload[key] = value.toJs({ dict_converter: Object.fromEntries });
+                value.destroy();
+            } else {
+                payload[key] = value;
+            }
+        }
+
+        const elapsed = performance.now() - started;
+        const kilobytes = payloadByteLength(payload) / 1024;
+        console.log(`Mesh payload: ${kilobytes.toFixed(1)} КБ за ${elapsed.toFixed(1)} мс`);
+        return decodeMeshPayload(payload);
+    }
+
     async initialize() {
         try {
             UI.showStatus('Загрузка Python модулей...', 'info');
@@ -242,6 +298,8 @@ class IFCBridge {
     }
 
     async generateBolt(params, exportSettings) {
+        // Документ пересоздаётся: таблица свойств прошлой генерации недействительна
+        this.propertyTable = null;
         try {
             const paramsJson = JSON.stringify(params)
                 .replace(/false/g, 'False')
@@ -278,15 +336,30 @@ class IFCBridge {
                     settings.get('assembly_mode', 'separate'),
                     settings.get('geometry_type', 'solid'),
                     settings.get('add_standard_pset', True),
-                    settings.get('pset_expertise', 'none')
+                    settings.get('pset_expertise', 'none'),
+                    mesh_format='binary',
+                    mesh_mode=settings.get('mesh_mode', 'world'),
+                    include_properties=True,
+                    profile=${this.profilingEnabled ? 'True' : 'False'}
                 )
                 (ifc_str, mesh_data)
             `);
 
             this.currentIFCData = result[0];
 
-            // Конвертация Proxy объектов Pyodide в JavaScript объекты
-            const meshData = this.convertPyodideObject(result[1]);
+            // Бинарный mesh payload: буферы копируются целиком, без обхода списков
+            const meshProxy = result[1];
+            const meshData = this.convertMeshPayload(meshProxy);
+            meshProxy.destroy();
+
+            // Свойства элементов приходят вместе с сетками: выбор элемента без запроса к Python
+            this.propertyTable = meshData.properties || null;
+            delete meshData.properties;
+
+            // Разбивка по этапам (только при включённом профилировании)
+            this.lastProfile = meshData.profile || null;
+            delete meshData.profile;
+            logProfile(this.lastProfile);
 
             return {
                 ifcData: result[0],
@@ -308,10 +381,16 @@ class IFCBridge {
 
     /**
      * Получение PropertySet элемента по GlobalId
+     * Сначала из таблицы свойств последней генерации, иначе запросом к Python
      * @param {string} globalId - GlobalId элемента
      * @returns {Promise<object|null>} - Данные о свойствах или null
      */
     async getElementProperties(globalId) {
+        const cached = resolvePropertyTable(this.propertyTable, globalId);
+        if (cached) {
+            return cached;
+        }
+
         try {
             const result = await this.pyodide.runPythonAsync(`
                 from ifc_generator import IFCGenerator
@@ -0,0 +1,120 @@
+/**
+ * Тесты для meshPayload.js
+ */
+
+import {
+    MESH_PAYLOAD_FORMAT,
+    isMeshPayload,
+    decodeMeshPayload,
+    payloadByteLength
+} from '../utils/meshPayload.js';
+
+function makePayload() {
+    return {
+        format: MESH_PAYLOAD_FORMAT,
+        positions: new Float32Array([0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 1, 1, 1]),
+        normals: new Float32Array(15),
+        indices: new Uint16Array([0, 1, 2, 0, 1]),
+        index_type: 'uint16',
+        meshes: [
+            {
+                id: 10,
+                name: 'Stud',
+                color: 0x8b8b8b,
+                metadata: { Type: 'STUD' },
+                vertex_offset: 0,
+                vertex_count: 3,
+                index_offset: 0,
+                index_count: 3
+            },
+            {
+                id: 11,
+                name: 'Nut',
+                color: 0x696969,
+                metadata: { Type: 'NUT' },
+                vertex_offset: 3,
+                vertex_count: 2,
+                index_offset: 3,
+                index_count: 2
+            }
+        ],
+        assembly_info: { name: 'bolt' }
+    };
+}
+
+describe('meshPayload', () => {
+    describe('isMeshPayload', () => {
+        test('должен распознавать payload по format', () => {
+            expect(isMeshPayload(makePayload())).toBe(true);
+        });
+
+        test('должен возвращать false для списочных mesh данных', () => {
+            expect(isMeshPayload({ meshes: [] })).toBe(false);
+            expect(isMeshPayload(null)).toBe(false);
+        });
+    });
+
+    describe('decodeMeshPayload', () => {
+        test('должен разбивать буферы на сетки по смещениям', () => {
+            const meshData = decodeMeshPayload(makePayload());
+
+            expect(meshData.meshes).toHaveLength(2);
+            expect(Array.from(meshData.meshes[1].vertices)).toEqual([0, 0, 1, 1, 1, 1]);
+            expect(Array.from(meshData.meshes[1].indices)).toEqual([0, 1]);
+            expect(meshData.meshes[0].normals).toHaveLength(9);
+        });
+
+        test('должен сохранять метаданные без смещений', () => {
+            const meshData = decodeMeshPayload(makePayload());
+
+            expect(meshData.meshes[0]).toMatchObject({ id: 10, name: 'Stud', color: 0x8b8b8b });
+            expect(meshData.meshes[0].vertex_offset).toBeUndefined();
+            expect(meshData.assembly_info).toEqual({ name: 'bolt' });
+            expect(meshData.format).toBeUndefined();
+        });
+
+        test('должен возвращать представления без копирования', () => {
+            const payload = makePayload();
+            const meshData = decodeMeshPayload(payload);
+
+            expect(meshData.meshes[0].vertices.buffer).toBe(payload.positions.buffer);
+            expect(meshData.meshes[1].indices).toBeInstanceOf(Uint16Array);
+        });
+    });
+
+    describe('instanced payload', () => {
+        function makeInstancedPayload() {
+            const payload = makePayload();
+            payload.transforms = new Float32Array(16 * 3).map((_, i) => i);
+            payload.colors = new Uint32Array([1, 2, 3]);
+            payload.meshes[0].instance_offset = 0;
+            payload.meshes[0].instance_count = 1;
+            payload.meshes[1].instance_offset = 1;
+            payload.meshes[1].instance_count = 2;
+            return payload;
+        }
+
+        test('должен разбивать матрицы и цвета экземпляров по сеткам', () => {
+            const meshData = decodeMeshPayload(makeInstancedPayload());
+
+            expect(meshData.meshes[0].transforms).toHaveLength(16);
+            expect(meshData.meshes[1].transforms).toHaveLength(32);
+            expect(meshData.meshes[1].transforms[0]).toBe(16);
+            expect(Array.from(meshData.meshes[1].colors)).toEqual([2, 3]);
+            expect(meshData.meshes[1].instance_count).toBe(2);
+            expect(meshData.meshes[1].instance_offset).toBeUndefined();
+        });
+
+        test('должен учитывать буферы экземпляров в размере', () => {
+            expect(payloadByteLength(makeInstancedPayload())).toBe(
+                15 * 4 * 2 + 5 * 2 + 16 * 3 * 4 + 3 * 4
+            );
+        });
+    });
+
+    describe('payloadByteLength', () => {
+        test('должен суммировать размер буферов', () => {
+            expect(payloadByteLength(makePayload())).toBe(15 * 4 * 2 + 5 * 2);
+        });
+    });
+});
@@ -0,0 +1,43 @@
+/**
+ * Тесты для profileReport.js
+ */
+
+import { profileRows } from '../utils/profileReport.js';
+
+function makeProfile() {
+    return {
+        total_ms: 10,
+        stages: [
+            { name: 'assembly/types', calls: 1, total_ms: 4, self_ms: 4, share: 0.4 },
+            { name: 'export', calls: 1, total_ms: 2, self_ms: 2, share: 0.2 },
+            { name: 'assembly', calls: 1, total_ms: 6.123, self_ms: 2.123, share: 0.6123 }
+        ],
+        counters: { entities_created: 120 }
+    };
+}
+
+describe('profileReport', () => {
+    describe('profileRows', () => {
+        test('вложенные этапы идут после родителя с отступом', () => {
+            const rows = profileRows(makeProfile());
+
+            expect(rows.map((row) => row.stage)).toEqual(['assembly', '  types', 'export']);
+        });
+
+        test('время округляется, доля в процентах', () => {
+            const [assembly] = profileRows(makeProfile());
+
+            expect(assembly).toEqual({
+                stage: 'assembly',
+                calls: 1,
+                total_ms: 6.12,
+                self_ms: 2.12,
+                share: '61.2%'
+            });
+        });
+
+        test('пустой список без отчёта', () => {
+            expect(profileRows(null)).toEqual([]);
+        });
+    });
+});
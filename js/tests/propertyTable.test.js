@@ -0,0 +1,46 @@
+/**
+ * Тесты для propertyTable.js
+ */
+
+import { resolvePropertyTable } from '../utils/propertyTable.js';
+
+const TYPE_PSET = { name: 'Pset_MechanicalFastenerAnchorBolt', properties: [] };
+const INSTANCE_PSET = { name: 'Test_Pset', properties: [{ name: 'Марка', value: 'Ф1' }] };
+
+function makeTable() {
+    return {
+        types: { TYPE: [TYPE_PSET] },
+        elements: {
+            BOLT: {
+                name: 'Болт',
+                ifc_type: 'IfcMechanicalFastener',
+                property_sets: [INSTANCE_PSET],
+                types: ['TYPE']
+            },
+            STOREY: { name: 'Этаж', ifc_type: 'IfcBuildingStorey', property_sets: [], types: [] }
+        }
+    };
+}
+
+describe('propertyTable', () => {
+    describe('resolvePropertyTable', () => {
+        test('наборы экземпляра идут перед наборами типа', () => {
+            const props = resolvePropertyTable(makeTable(), 'BOLT');
+
+            expect(props).toEqual({
+                name: 'Болт',
+                ifc_type: 'IfcMechanicalFastener',
+                property_sets: [INSTANCE_PSET, TYPE_PSET]
+            });
+        });
+
+        test('элемент без типа', () => {
+            expect(resolvePropertyTable(makeTable(), 'STOREY').property_sets).toEqual([]);
+        });
+
+        test('null для отсутствующего элемента или таблицы', () => {
+            expect(resolvePropertyTable(makeTable(), 'MISSING')).toBeNull();
+            expect(resolvePropertyTable(null, 'BOLT')).toBeNull();
+        });
+    });
+});
@@ -0,0 +1,72 @@
+/**
+ * meshPayload.js — Декодирование бинарного mesh payload (python/mesh_payload.py)
+ *
+ * Payload содержит непрерывные буферы (positions/normals — Float32Array,
+ * indices — Uint16Array или Uint32Array; для инстансированных данных ещё
+ * transforms — Float32Array по 16 чисел на экземпляр и colors — Uint32Array)
+ * и метаданные сеток со смещениями.
+ * Декодирование не копирует данные: сетки получают subarray общих буферов.
+ */
+
+/** Идентификатор формата (PAYLOAD_FORMAT в mesh_payload.py) */
+export const MESH_PAYLOAD_FORMAT = 'abg-mesh/1';
+
+/** Ключи буферов payload (transforms и colors — только у инстансированных данных) */
+export const MESH_PAYLOAD_BUFFERS = ['positions', 'normals', 'indices', 'transforms', 'colors'];
+
+/**
+ * Проверить, что данные — бинарный mesh payload
+ * @param {*} data - Данные
+ * @returns {boolean}
+ */
+export function isMeshPayload(data) {
+    return Boolean(data) && data.format === MESH_PAYLOAD_FORMAT;
+}
+
+/**
+ * Преобразовать payload в формат mesh данных viewer ({meshes: [...], ...})
+ * @param {object} payload - Payload с типизированными массивами
+ * @returns {object} - mesh данные; vertices/normals/indices — subarray буферов
+ */
+export function decodeMeshPayload(payload) {
+    const { positions, normals, indices, transforms, colors } = payload;
+    const rest = { ...payload };
+    for (const key of [...MESH_PAYLOAD_BUFFERS, 'meshes', 'format', 'index_type']) {
+        delete rest[key];
+    }
+
+    return {
+        ...rest,
+        meshes: payload.meshes.map((record) => {
+            const { vertex_offset, vertex_count, index_offset, index_count, ...meta } = record;
+            const start = vertex_offset * 3;
+            const end = start + vertex_count * 3;
+            const mesh = {
+                ...meta,
+                vertices: positions.subarray(start, end),
+                normals: normals.subarray(start, end),
+                indices: indices.subarray(index_offset, index_offset + index_count)
+            };
+            if (transforms) {
+                const first = meta.instance_offset;
+                const last = first + meta.instance_count;
+                delete mesh.instance_offset;
+                mesh.transforms = transforms.subarray(first * 16, last * 16);
+                mesh.colors = colors.subarray(first, last);
+            }
+            return mesh;
+        })
+    };
+}
+
+/**
+ * Суммарный размер буферов payload в байтах
+ * @param {object} payload - Payload с типизированными массивами
+ * @returns {number}
+ */
+export function payloadByteLength(payload) {
+    return MESH_PAYLOAD_BUFFERS.reduce(
+        (total, key) => total + (payload[key] ? payload[key].byteLength : 0),
+        0
+    );
+}
@@ -0,0 +1,46 @@
+/**
+ * profileReport.js — Отчёт профилирования генерации
+ * (Profiler.report в python/profiling.py)
+ *
+ * Этапы приходят путями через "/" ("assembly/types/geometry") с полным и
+ * собственным временем. Строки таблицы для console.table выводятся с
+ * отступом по глубине вложенности.
+ */
+
+/**
+ * Строки таблицы этапов, отсортированные по дереву этапов
+ * @param {object|null} profile - {total_ms, stages: [...], counters: {...}}
+ * @returns {Array<object>} - [{stage, calls, total_ms, self_ms, share}]
+ */
+export function profileRows(profile) {
+    if (!profile?.stages) {
+        return [];
+    }
+    return [...profile.stages]
+        .sort((a, b) => (a.name < b.name ? -1 : a.name > b.name ? 1 : 0))
+        .map((stage) => {
+            const parts = stage.name.split('/');
+            return {
+                stage: '  '.repeat(parts.length - 1) + parts[parts.length - 1],
+                calls: stage.calls,
+                total_ms: Number(stage.total_ms.toFixed(2)),
+                self_ms: Number(stage.self_ms.toFixed(2)),
+                share: `${(stage.share * 100).toFixed(1)}%`
+            };
+        });
+}
+
+/**
+ * Вывод отчёта профилирования в консоль браузера
+ * @param {object|null} profile - Отчёт профилирования
+ * @param {string} title - Заголовок группы
+ */
+export function logProfile(profile, title = 'Профиль генерации') {
+    if (!profile) {
+        return;
+    }
+    console.groupCollapsed(`${title}: ${profile.total_ms.toFixed(1)} мс`);
+    console.table(profileRows(profile));
+    console.table(profile.counters);
+    console.groupEnd();
+}
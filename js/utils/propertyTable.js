@@ -0,0 +1,29 @@
+/**
+ * propertyTable.js — Таблица наборов свойств из результата генерации
+ * (PropertyViews.table в python/property_views.py)
+ *
+ * Наборы свойств типа хранятся в таблице один раз на тип, элементы
+ * ссылаются на свои типы по GlobalId. Представление элемента собирается
+ * без обращения к Python.
+ */
+
+/**
+ * Представление свойств элемента из таблицы
+ * @param {object|null} table - {types: {...}, elements: {...}}
+ * @param {string} globalId - GlobalId элемента
+ * @returns {object|null} - {name, ifc_type, property_sets} или null, если элемента нет в таблице
+ */
+export function resolvePropertyTable(table, globalId) {
+    const entry = table?.elements?.[globalId];
+    if (!entry) {
+        return null;
+    }
+    return {
+        name: entry.name,
+        ifc_type: entry.ifc_type,
+        property_sets: [
+            ...entry.property_sets,
+            ...entry.types.flatMap((typeId) => table.types[typeId] || [])
+        ]
+    };
+}
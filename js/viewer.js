@@ -233,30 +233,39 @@ class IFCViewer {
             const geometry = new THREE.BufferGeometry();
             const transformedVertices = this.transformVerticesForThreeJS(data.vertices);
 
-            geometry.setAttribute(
-                'position',
-                new THREE.BufferAttribute(new Float32Array(transformedVertices), 3)
-            );
-            geometry.setIndex(new THREE.BufferAttribute(new Uint32Array(data.indices), 1));
+            geometry.setAttribute('position', new THREE.BufferAttribute(transformedVertices, 3));
+            // Индексы бинарного payload (Uint16Array/Uint32Array) используются как есть
+            const indices = ArrayBuffer.isView(data.indices)
+                ? data.indices
+                : new Uint32Array(data.indices);
+            geometry.setIndex(new THREE.BufferAttribute(indices, 1));
 
             // Используем готовые нормали если есть, иначе вычисляем
             if (data.normals && data.normals.length > 0) {
                 geometry.setAttribute(
                     'normal',
-                    new THREE.BufferAttribute(new Float32Array(data.normals), 3)
+                    new THREE.BufferAttribute(
+                        data.normals instanceof Float32Array
+                            ? data.normals
+                            : new Float32Array(data.normals),
+                        3
+                    )
                 );
             } else {
                 geometry.computeVertexNormals();
             }
 
+            // Цвет экземпляров задаётся через instanceColor (умножается на цвет материала)
             const material = new THREE.MeshPhongMaterial({
-                color: data.color || 0x2563eb,
+                color: data.transforms ? 0xffffff : data.color || 0x2563eb,
                 side: THREE.DoubleSide,
                 shininess: 30,
                 flatShading: true
             });
 
-            const mesh = new THREE.Mesh(geometry, material);
+            const mesh = data.transforms
+                ? this.createInstancedMesh(geometry, material, data)
+                : new THREE.Mesh(geometry, material);
             mesh.castShadow = true;
             mesh.receiveShadow = true;
             this.scene.add(mesh);
@@ -265,7 +274,8 @@ class IFCViewer {
                 mesh,
                 id: data.id || `mesh_${index}`,
                 name: data.name || `Component ${index}`,
-                metadata: data.metadata || {}
+                metadata: data.metadata || {},
+                instances: data.instances || null
             });
         });
 
@@ -323,24 +333,59 @@ class IFCViewer {
 
     /**
      * Трансформация вершин из IFC (Z-up, метры) в Three.js (Y-up, миллиметры)
-     * @param {number[]} vertices
-     * @returns {number[]}
+     * @param {number[]|Float32Array} vertices
+     * @returns {Float32Array}
      */
     transformVerticesForThreeJS(vertices) {
-        const transformed = [];
+        const transformed = new Float32Array(vertices.length);
         for (let i = 0; i < vertices.length; i += 3) {
             // Конвертация метров в миллиметры + трансформация осей
             // IFC: Z - вертикаль, Three.js: Y - вертикаль
             // Инверсия Z для правильного вида сверху
-            transformed.push(
-                vertices[i] * 1000, // x (м → мм)
-                -vertices[i + 2] * 1000, // -z -> y (инверсия для вида сверху)
-                -vertices[i + 1] * 1000 // -y -> z (м → мм)
-            );
+            transformed[i] = vertices[i] * 1000; // x (м → мм)
+            transformed[i + 1] = -vertices[i + 2] * 1000; // -z -> y (инверсия для вида сверху)
+            transformed[i + 2] = -vertices[i + 1] * 1000; // -y -> z (м → мм)
         }
         return transformed;
     }
 
+    /**
+     * Создание InstancedMesh по матрицам экземпляров (IFC Z-up, метры, по столбцам)
+     * Матрица переводится в систему координат Three.js так же, как вершины
+     * в transformVerticesForThreeJS: M' = B · M · B⁻¹
+     * @param {THREE.BufferGeometry} geometry - Общая геометрия RepresentationMap
+     * @param {THREE.Material} material - Материал
+     * @param {object} data - Сетка с transforms и colors
+     * @returns {THREE.InstancedMesh}
+     */
+    createInstancedMesh(geometry, material, data) {
+        const count = data.transforms.length / 16;
+        const mesh = new THREE.InstancedMesh(geometry, material, count);
+        // prettier-ignore
+        const basis = new THREE.Matrix4().set(
+            1000, 0, 0, 0,
+            0, 0, -1000, 0,
+            0, -1000, 0, 0,
+            0, 0, 0, 1
+        );
+        const basisInverse = basis.clone().invert();
+        const matrix = new THREE.Matrix4();
+        const color = new THREE.Color();
+
+        for (let i = 0; i < count; i++) {
+            matrix.fromArray(data.transforms, i * 16).premultiply(basis).multiply(basisInverse);
+            mesh.setMatrixAt(i, matrix);
+            if (data.colors) {
+                mesh.setColorAt(i, color.setHex(data.colors[i]));
+            }
+        }
+        mesh.instanceMatrix.needsUpdate = true;
+        if (mesh.instanceColor) {
+            mesh.instanceColor.needsUpdate = true;
+        }
+        return mesh;
+    }
+
     /**
      * Обработка клика по сцене
      */
@@ -354,10 +399,25 @@ class IFCViewer {
 
         if (intersects.length > 0) {
             // Клик на элементе
-            const meshItem = this.meshes.find((item) => item.mesh === intersects[0].object);
+            const hit = intersects[0];
+            const groupItem = this.meshes.find((item) => item.mesh === hit.object);
+            // Для InstancedMesh — данные конкретного экземпляра
+            const instance =
+                groupItem?.instances && hit.instanceId !== undefined
+                    ? groupItem.instances[hit.instanceId]
+                    : null;
+            const meshItem = instance
+                ? {
+                      ...groupItem,
+                      id: instance.id,
+                      instanceId: hit.instanceId,
+                      name: instance.name,
+                      metadata: { ...groupItem.metadata, GlobalId: instance.GlobalId }
+                  }
+                : groupItem;
             if (meshItem) {
                 this.selectMesh(meshItem);
-                const boundingBox = new THREE.Box3().setFromObject(meshItem.mesh);
+                const boundingBox = this.getItemBoundingBox(meshItem);
                 const center = new THREE.Vector3();
                 boundingBox.getCenter(center);
                 this.focusPoint.copy(center);
@@ -407,12 +467,31 @@ class IFCViewer {
         meshItem.mesh.material.emissive.setHex(0xffff00);
         meshItem.mesh.material.emissiveIntensity = 0.3;
 
-        const boundingBox = new THREE.Box3().setFromObject(meshItem.mesh);
+        const boundingBox = this.getItemBoundingBox(meshItem);
         const center = new THREE.Vector3();
         boundingBox.getCenter(center);
         this.focusPoint.copy(center);
     }
 
+    /**
+     * Габариты элемента сцены (для экземпляра InstancedMesh — только его)
+     * @param {object} meshItem - Элемент из this.meshes (с instanceId для экземпляра)
+     * @returns {THREE.Box3}
+     */
+    getItemBoundingBox(meshItem) {
+        if (meshItem.instanceId === undefined) {
+            return new THREE.Box3().setFromObject(meshItem.mesh);
+        }
+        const matrix = new THREE.Matrix4();
+        meshItem.mesh.getMatrixAt(meshItem.instanceId, matrix);
+        matrix.premultiply(meshItem.mesh.matrixWorld);
+        const geometry = meshItem.mesh.geometry;
+        if (!geometry.boundingBox) {
+            geometry.computeBoundingBox();
+        }
+        return geometry.boundingBox.clone().applyMatrix4(matrix);
+    }
+
     deselectMesh() {
         if (this.selectedMesh) {
             this.selectedMesh.mesh.material.emissive.setHex(0x000000);
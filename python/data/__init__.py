@@ -3,10 +3,11 @@ python/data/ — Модуль данных ГОСТ для анкерных бо
 
 Содержит:
 - BOLT_DIM_DATA: данные размеров болтов
+- BOLT_CATALOG: скомпилированный каталог болтов (записи и столбцы NumPy)
 - NUT_DIM_DATA, WASHER_DIM_DATA: размеры гаек и шайб
 - MATERIALS: данные о материалах
 - BOLT_TYPES, AVAILABLE_DIAMETERS, AVAILABLE_LENGTHS: константы
-- validate_parameters: функция валидации
+- validate_parameters, validate_schedule: валидация болта и ведомости
 """
 
 from .bolt_dimensions import (
@@ -15,6 +16,7 @@ from .bolt_dimensions import (
     DIAMETER_LIMITS,
     get_bolt_dimensions,
 )
+from .catalog import BOLT_CATALOG, BoltCatalog, BoltRecord
 from .fastener_dimensions import (
     NUT_DIM_DATA,
     PLATE_DIM_DATA,
@@ -33,6 +35,7 @@ from .validation import (
     get_bolt_mass,
     get_thread_length,
     validate_parameters,
+    validate_schedule,
 )
 
 __all__ = [
@@ -48,6 +51,9 @@ __all__ = [
     "NUT_DIM_DATA",
     "WASHER_DIM_DATA",
     "PLATE_DIM_DATA",
+    "BOLT_CATALOG",
+    "BoltCatalog",
+    "BoltRecord",
     # Functions
     "get_bolt_dimensions",
     "get_nut_dimensions",
@@ -56,6 +62,7 @@ __all__ = [
     "get_material_name",
     "get_material_properties",
     "validate_parameters",
+    "validate_schedule",
     "get_bolt_hook_length",
     "get_bolt_bend_radius",
     "get_thread_length",
@@ -0,0 +1,161 @@
+"""
+catalog.py — Скомпилированный каталог болтов ГОСТ 24379.1-2012
+
+BOLT_DIM_DATA хранит строки по строковому ключу "{диаметр}_{длина}" с
+позиционными столбцами. Каталог компилируется из него один раз при импорте:
+- записи BoltRecord (__slots__) по ключу (диаметр, длина) для скалярных
+  запросов — без форматирования строки ключа и индексов столбцов;
+- столбцы NumPy (диаметр, длина, размеры, массы по типам) для векторных
+  запросов по всей ведомости.
+
+Пример использования:
+    record = BOLT_CATALOG.get(20, 800)
+    record.thread_length, record.mass("1.1")
+
+    rows = BOLT_CATALOG.rows([20, 24], [800, 1000])  # -1 — нет в каталоге
+    BOLT_CATALOG.thread_length[rows]
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .bolt_dimensions import BOLT_DIM_DATA
+
+# Индексы масс по типам болтов в строках BOLT_DIM_DATA
+MASS_INDICES: Dict[str, int] = {"1.1": 5, "1.2": 6, "2.1": 7, "5": 8}
+
+# Порядок столбцов масс в BoltCatalog.mass
+MASS_TYPES: Tuple[str, ...] = tuple(MASS_INDICES)
+
+# Множитель составного ключа строки: диаметр * KEY_BASE + длина. Ключ только
+# упорядочивает поиск: значения вне [0, KEY_BASE) дают совпадающие ключи, поэтому
+# найденная строка сверяется со столбцами диаметра и длины
+KEY_BASE = 10000
+
+
+class BoltRecord:
+    """Размеры болта одного диаметра и длины"""
+
+    __slots__ = (
+        "diameter",
+        "length",
+        "hook_length",
+        "bend_radius",
+        "rod_diameter",
+        "thread_length",
+        "l1",
+        "l2",
+        "l3",
+        "r",
+        "masses",
+    )
+
+    def __init__(self, diameter: int, row: List):
+        self.diameter = diameter
+        self.length = row[0]  # L
+        self.hook_length = row[1]  # l — вылет крюка
+        self.bend_radius = row[2]  # R — радиус загиба
+        self.rod_diameter = row[3]  # d
+        self.thread_length = row[4]  # l0 — длина резьбы
+        self.l1 = row[9]
+        self.l2 = row[10]
+        self.l3 = row[11]
+        self.r = row[12]
+        # Массы по типам в порядке MASS_TYPES (None — болт типа не существует)
+        self.masses: Tuple[Optional[float], ...] = tuple(row[i] for i in MASS_INDICES.values())
+
+    def mass(self, bolt_type: str) -> Optional[float]:
+        """Масса болта типа bolt_type (кг) или None"""
+        try:
+            return self.masses[MASS_TYPES.index(bolt_type)]
+        except ValueError:
+            return None
+
+    def as_dict(self) -> Dict:
+        """Размеры в формате get_bolt_dimensions"""
+        dims = {
+            "L": self.length,
+            "l": self.hook_length,
+            "R": self.bend_radius,
+            "d": self.rod_diameter,
+            "l0": self.thread_length,
+        }
+        dims.update({f"mass_{t}": m for t, m in zip(MASS_TYPES, self.masses)})
+        dims.update({"l1": self.l1, "l2": self.l2, "l3": self.l3, "r": self.r})
+        return dims
+
+    def __repr__(self) -> str:
+        return f"BoltRecord(М{self.diameter}×{self.length})"
+
+
+class BoltCatalog:
+    """
+    Каталог болтов: записи по (диаметр, длина) и столбцы NumPy
+
+    Строки столбцов упорядочены по (диаметр, длина); отсутствующая масса — NaN.
+    """
+
+    def __init__(self, data: Mapping[str, List]):
+        records = sorted(
+            (BoltRecord(int(key.split("_")[0]), row) for key, row in data.items()),
+            key=lambda record: (record.diameter, record.length),
+        )
+        self.records: Dict[Tuple[int, int], BoltRecord] = {
+            (record.diameter, record.length): record for record in records
+        }
+
+        def column(attr: str) -> np.ndarray:
+            return np.array([getattr(record, attr) for record in records], dtype=np.int64)
+
+        self.diameter = column("diameter")
+        self.length = column("length")
+        self.hook_length = column("hook_length")
+        self.bend_radius = column("bend_radius")
+        self.thread_length = column("thread_length")
+        self.l1 = column("l1")
+        self.l2 = column("l2")
+        self.l3 = column("l3")
+        self.mass = np.array(
+            [[np.nan if m is None else m for m in record.masses] for record in records],
+            dtype=np.float64,
+        )
+        self.keys = self.diameter * KEY_BASE + self.length
+
+        for array in (
+            self.diameter,
+            self.length,
+            self.hook_length,
+            self.bend_radius,
+            self.thread_length,
+            self.l1,
+            self.l2,
+            self.l3,
+            self.mass,
+            self.keys,
+        ):
+            array.setflags(write=False)
+
+    def get(self, diameter: int, length: int) -> Optional[BoltRecord]:
+        """Запись болта или None"""
+        return self.records.get((diameter, length))
+
+    def rows(self, diameters: Iterable, lengths: Iterable) -> np.ndarray:
+        """
+        Индексы строк столбцов для пар (диаметр, длина)
+
+        Returns:
+            Массив индексов; -1 — пары нет в каталоге
+        """
+        diameters = np.asarray(diameters, dtype=np.int64)
+        lengths = np.asarray(lengths, dtype=np.int64)
+        rows = np.searchsorted(self.keys, diameters * KEY_BASE + lengths)
+        rows = np.minimum(rows, len(self.keys) - 1)
+        found = (self.diameter[rows] == diameters) & (self.length[rows] == lengths)
+        return np.where(found, rows, -1)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+BOLT_CATALOG = BoltCatalog(BOLT_DIM_DATA)
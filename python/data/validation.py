@@ -4,65 +4,67 @@ validation.py — Валидация параметров болтов и дос
 Based on ГОСТ 24379.1-2012
 """
 
-from typing import Dict, List, Literal, Optional, Set, Tuple
+from itertools import repeat
+from numbers import Real
+from typing import Any, Dict, List, Literal, Mapping, Optional, Sequence, Set, Tuple
 
-from .bolt_dimensions import AVAILABLE_DIAMETERS, BOLT_DIM_DATA, DIAMETER_LIMITS
+import numpy as np
+
+from .bolt_dimensions import AVAILABLE_DIAMETERS, DIAMETER_LIMITS
+from .catalog import BOLT_CATALOG, KEY_BASE, MASS_INDICES, MASS_TYPES
 from .fastener_dimensions import NUT_DIM_DATA, WASHER_DIM_DATA
 from .materials import MATERIALS
 
 # Типы болтов (допустимые значения)
 BOLT_TYPES: Set[str] = {"1.1", "1.2", "2.1", "5"}
 
-# Индексы масс по типам болтов
-MASS_INDICES: Dict[str, int] = {"1.1": 5, "1.2": 6, "2.1": 7, "5": 8}
-
 # Доступные длины для каждой комбинации типа и диаметра
-# Генерируется автоматически из BOLT_DIM_DATA на основе наличия массы
+# Генерируется из каталога на основе наличия массы (записи упорядочены по длине)
 AVAILABLE_LENGTHS: Dict[Tuple[str, int], List[int]] = {}
+for record in BOLT_CATALOG.records.values():
+    for bolt_type, mass in zip(MASS_INDICES, record.masses):
+        if mass is not None and bolt_type in BOLT_TYPES:
+            AVAILABLE_LENGTHS.setdefault((bolt_type, record.diameter), []).append(record.length)
+
+# Битовая маска ошибок строки ведомости (validate_schedule)
+ERROR_BOLT_TYPE = 1  # Неизвестный тип болта
+ERROR_DIAMETER = 2  # Неподдерживаемый диаметр
+ERROR_DIAMETER_RANGE = 4  # Диаметр вне диапазона типа
+ERROR_MATERIAL = 8  # Неизвестный материал
+ERROR_COMBINATION = 16  # Нет комбинации типа и диаметра
+ERROR_LENGTH = 32  # Длина недоступна (нет массы болта типа)
+
+# Столбец типа болта: индекс в MASS_TYPES
+_TYPE_INDEX: Dict[str, int] = {t: i for i, t in enumerate(MASS_TYPES) if t in BOLT_TYPES}
 
-# Автогенерация AVAILABLE_LENGTHS из BOLT_DIM_DATA на основе наличия массы
-for key, data in BOLT_DIM_DATA.items():
-    diameter = int(key.split("_")[0])
-    length = int(data[0])
+# Коды материалов
+_MATERIAL_INDEX: Dict[str, int] = {m: i for i, m in enumerate(MATERIALS)}
 
-    for bolt_type, mass_idx in MASS_INDICES.items():
-        # Проверяем, что масса существует (не None)
-        if mass_idx < len(data) and data[mass_idx] is not None:
-            # Для каждого типа добавляем длины
-            if bolt_type in BOLT_TYPES:
-                type_key = (bolt_type, diameter)
-                if type_key not in AVAILABLE_LENGTHS:
-                    AVAILABLE_LENGTHS[type_key] = []
-                if length not in AVAILABLE_LENGTHS[type_key]:
-                    AVAILABLE_LENGTHS[type_key].append(length)
+# Диапазоны диаметров по индексу типа
+_DIAMETER_RANGES = np.array([DIAMETER_LIMITS[t] for t in MASS_TYPES], dtype=np.float64)
 
-# Сортировка длин
-for type_key in AVAILABLE_LENGTHS:
-    AVAILABLE_LENGTHS[type_key].sort()
+# Ключи комбинаций AVAILABLE_LENGTHS: индекс_типа * KEY_BASE + диаметр
+_COMBINATION_KEYS = np.array(
+    sorted(_TYPE_INDEX[t] * KEY_BASE + d for t, d in AVAILABLE_LENGTHS), dtype=np.int64
+)
 
 
 def get_bolt_hook_length(diameter: int, length: int) -> Optional[int]:
     """Получить вылет крюка для болта данного диаметра и длины"""
-    key = f"{diameter}_{length}"
-    if key in BOLT_DIM_DATA:
-        return BOLT_DIM_DATA[key][1]  # вылет крюка
-    return None
+    record = BOLT_CATALOG.get(diameter, length)
+    return record.hook_length if record else None
 
 
 def get_bolt_bend_radius(diameter: int, length: int) -> int:
     """Получить радиус загиба для болта данного диаметра и длины"""
-    key = f"{diameter}_{length}"
-    if key in BOLT_DIM_DATA:
-        return BOLT_DIM_DATA[key][2]  # радиус загиба
-    return diameter
+    record = BOLT_CATALOG.get(diameter, length)
+    return record.bend_radius if record else diameter
 
 
 def get_thread_length(diameter: int, length: int) -> Optional[int]:
     """Получить длину резьбы для болта данного диаметра и длины"""
-    key = f"{diameter}_{length}"
-    if key in BOLT_DIM_DATA:
-        return BOLT_DIM_DATA[key][4]  # длина резьбы
-    return None
+    record = BOLT_CATALOG.get(diameter, length)
+    return record.thread_length if record else None
 
 
 def get_bolt_mass(diameter: int, length: int, bolt_type: str) -> Optional[float]:
@@ -77,35 +79,12 @@ def get_bolt_mass(diameter: int, length: int, bolt_type: str) -> Optional[float]
     Returns:
         Масса в кг или None, если болт такого типа не существует
     """
-    key = f"{diameter}_{length}"
-    if key not in BOLT_DIM_DATA:
-        return None
-
-    data = BOLT_DIM_DATA[key]
-    mass_idx = MASS_INDICES.get(bolt_type)
-
-    if mass_idx is None or mass_idx >= len(data):
-        return None
-
-    return data[mass_idx]
-
-
-def validate_parameters(bolt_type: str, diameter: int, length: int, material: str) -> bool:
-    """
-    Валидация параметров болта согласно ГОСТ.
-
-    Args:
-        bolt_type: Тип болта ('1.1', '1.2', '2.1', '5')
-        diameter: Диаметр болта (мм)
-        length: Длина болта (мм)
-        material: Материал болта
+    record = BOLT_CATALOG.get(diameter, length)
+    return record.mass(bolt_type) if record else None
 
-    Returns:
-        True если параметры валидны
 
-    Raises:
-        ValueError: Если параметры невалидны
-    """
+def _parameter_errors(bolt_type: str, diameter: int, length: int, material: str) -> List[str]:
+    """Сообщения об ошибках параметров болта (пустой список — параметры валидны)"""
     errors = []
 
     # Validate bolt type
@@ -117,7 +96,7 @@ def validate_parameters(bolt_type: str, diameter: int, length: int, material: st
         errors.append(f"Неподдерживаемый диаметр: М{diameter}")
 
     # Validate diameter limits for bolt type
-    if bolt_type in DIAMETER_LIMITS:
+    if bolt_type in DIAMETER_LIMITS and isinstance(diameter, Real):
         min_d, max_d = DIAMETER_LIMITS[bolt_type]  # type: ignore[index]
         if diameter < min_d or diameter > max_d:
             errors.append(
@@ -134,18 +113,140 @@ def validate_parameters(bolt_type: str, diameter: int, length: int, material: st
         key = (bolt_type, diameter)
         if key not in AVAILABLE_LENGTHS:
             errors.append(f"Комбинация типа {bolt_type} и диаметра М{diameter} не существует")
-        elif length not in AVAILABLE_LENGTHS[key]:
-            available = AVAILABLE_LENGTHS[key]
-            errors.append(f"Длина {length} недоступна. Доступные длины: {available}")
         else:
-            # Дополнительная проверка: масса для данного типа должна существовать
-            mass = get_bolt_mass(diameter, length, bolt_type)
-            if mass is None:
-                errors.append(
-                    f"Болт типа {bolt_type} с параметрами М{diameter}×{length} не существует (нет массы)"
-                )
+            # Длина доступна, если в каталоге есть масса болта данного типа
+            record = BOLT_CATALOG.get(diameter, length)
+            if record is None or record.mass(bolt_type) is None:
+                available = AVAILABLE_LENGTHS[key]
+                errors.append(f"Длина {length} недоступна. Доступные длины: {available}")
+
+    return errors
+
+
+def validate_parameters(bolt_type: str, diameter: int, length: int, material: str) -> bool:
+    """
+    Валидация параметров болта согласно ГОСТ.
+
+    Args:
+        bolt_type: Тип болта ('1.1', '1.2', '2.1', '5')
+        diameter: Диаметр болта (мм)
+        length: Длина болта (мм)
+        material: Материал болта
+
+    Returns:
+        True если параметры валидны
 
+    Raises:
+        ValueError: Если параметры невалидны
+    """
+    errors = _parameter_errors(bolt_type, diameter, length, material)
     if errors:
         raise ValueError("\n".join(errors))
 
     return True
+
+
+def _numeric_column(values: List[Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Числовой столбец ведомости
+
+    Returns:
+        (значения float с NaN для нечисловых, маска числовых, целые значения —
+        0 для нечисловых и дробных)
+    """
+    column = np.asarray(values) if values else np.zeros(0)
+    if column.dtype.kind in "biuf":
+        # Все значения числовые — преобразование без цикла Python
+        numeric = np.ones(len(values), dtype=bool)
+        floats = column.astype(np.float64)
+    else:
+        numeric = np.fromiter((isinstance(v, Real) for v in values), dtype=bool, count=len(values))
+        floats = np.array([v if ok else np.nan for v, ok in zip(values, numeric)], dtype=np.float64)
+    integral = numeric & np.isfinite(floats)
+    integral[integral] = floats[integral] == np.floor(floats[integral])
+    return floats, numeric, np.where(integral, floats, 0).astype(np.int64)
+
+
+def _category_column(values: List[Any], codes: Mapping[Any, int]) -> np.ndarray:
+    """Коды значений столбца (-1 — значения нет в codes)"""
+    return np.fromiter(map(codes.get, values, repeat(-1)), dtype=np.int64, count=len(values))
+
+
+def validate_schedule(rows: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+    """
+    Пакетная валидация ведомости болтов
+
+    Проверки validate_parameters (тип, диаметр и его диапазон для типа,
+    материал, наличие длины в AVAILABLE_LENGTHS и массы болта типа) выполняются
+    для всех строк сразу операциями над столбцами NumPy и каталогом
+    BOLT_CATALOG. Вместо исключения на первой ошибке возвращается таблица
+    ошибок по строкам; сообщения формируются только для невалидных строк.
+
+    Args:
+        rows: Параметры болтов (dict с bolt_type, diameter, length, material)
+
+    Returns:
+        Словарь:
+            - valid: bool[n] — строка валидна
+            - flags: uint8[n] — битовая маска ошибок ERROR_*
+            - errors: [{'row', 'flags', 'messages'}] для невалидных строк
+            - columns: столбцы ведомости для пакетных расчётов — bolt_type
+              (индекс в MASS_TYPES), diameter, length, material (индекс в
+              MATERIALS); int64[n], в невалидных строках значения не определены
+    """
+    count = len(rows)
+    bolt_types, diameter_values, length_values, materials = (
+        [row.get(name) for row in rows] for name in ("bolt_type", "diameter", "length", "material")
+    )
+    type_index = _category_column(bolt_types, _TYPE_INDEX)
+    material_index = _category_column(materials, _MATERIAL_INDEX)
+    material_ok = material_index >= 0
+    diameters, diameter_numeric, diameter_int = _numeric_column(diameter_values)
+    lengths, _, length_int = _numeric_column(length_values)
+    diameter_exact = diameters == diameter_int
+
+    type_ok = type_index >= 0
+    type_column = np.where(type_ok, type_index, 0)
+    min_d, max_d = _DIAMETER_RANGES[type_column].T
+
+    # Комбинация типа и диаметра есть в AVAILABLE_LENGTHS (диаметры вне
+    # [0, KEY_BASE) дали бы ключ другой комбинации)
+    combination_ok = (
+        type_ok
+        & diameter_exact
+        & (diameter_int >= 0)
+        & (diameter_int < KEY_BASE)
+        & np.isin(type_column * KEY_BASE + diameter_int, _COMBINATION_KEYS)
+    )
+    # Длина есть в каталоге и для типа болта задана масса (rows сверяет
+    # найденную строку со столбцами диаметра и длины каталога)
+    catalog_rows = BOLT_CATALOG.rows(diameter_int, length_int)
+    found = (catalog_rows >= 0) & (lengths == length_int)
+    mass = BOLT_CATALOG.mass[np.where(found, catalog_rows, 0), type_column]
+    length_ok = found & ~np.isnan(mass)
+
+    flags = np.zeros(count, dtype=np.uint8)
+    flags[~type_ok] |= ERROR_BOLT_TYPE
+    flags[~(diameter_exact & np.isin(diameter_int, AVAILABLE_DIAMETERS))] |= ERROR_DIAMETER
+    flags[
+        type_ok & diameter_numeric & ((diameters < min_d) | (diameters > max_d))
+    ] |= ERROR_DIAMETER_RANGE
+    flags[~material_ok] |= ERROR_MATERIAL
+    flags[type_ok & ~combination_ok] |= ERROR_COMBINATION
+    flags[combination_ok & ~length_ok] |= ERROR_LENGTH
+
+    errors = []
+    for index in np.flatnonzero(flags).tolist():
+        row = rows[index]
+        messages = _parameter_errors(
+            row.get("bolt_type"), row.get("diameter"), row.get("length"), row.get("material")
+        )
+        errors.append({"row": index, "flags": int(flags[index]), "messages": messages})
+
+    columns = {
+        "bolt_type": type_index,
+        "diameter": diameter_int,
+        "length": length_int,
+        "material": material_index,
+    }
+    return {"valid": flags == 0, "flags": flags, "errors": errors, "columns": columns}
@@ -7,18 +7,23 @@ document_manager.py — Менеджер IFC документов
 - Поддержка тестирования через временные документы
 """
 
-import os
-import tempfile
 import time
 from typing import Any, Dict, Optional
 
-import ifcopenshell
+import ifc_io
 import numpy as np
+from document_template import get_document_template
+from garbage_collector import collect_garbage
 from ifcopenshell.api import run
 from material_manager import MaterialManager
 from utils import get_ifcopenshell
 
 
+def _count_entities(doc: Any) -> int:
+    """Количество сущностей в документе"""
+    return sum(1 for _ in doc)
+
+
 class IFCDocumentManager:
     """
     Менеджер IFC документов с поддержкой множественных документов
@@ -34,6 +39,7 @@ class IFCDocumentManager:
         """Инициализация менеджера"""
         self._documents: Dict[str, Any] = {}
         self._material_managers: Dict[str, MaterialManager] = {}
+        self._leak_metrics: Dict[str, Dict[str, Any]] = {}
         self._current_id: Optional[str] = None
 
     def create_document(self, doc_id: str, schema: str = "IFC4") -> Any:
@@ -53,6 +59,13 @@ class IFCDocumentManager:
         doc = self._initialize_document(schema)
         self._documents[doc_id] = doc
         self._material_managers[doc_id] = MaterialManager(doc)
+        self._leak_metrics[doc_id] = {
+            "base_entity_count": _count_entities(doc),
+            "resets": 0,
+            "collections": 0,
+            "entities_reclaimed": 0,
+            "bytes_reclaimed": 0,
+        }
         self._current_id = doc_id
 
         return doc
@@ -80,7 +93,39 @@ class IFCDocumentManager:
                 "ifcopenshell не доступен. Убедитесь, что он установлен через micropip."
             )
 
+        # Базовая структура строится один раз на схему и клонируется из шаблона
+        return get_document_template(schema, self._build_base_document).instantiate()
+
+    def _build_base_document(self, schema: str) -> Any:
+        """
+        Построение базового документа с нуля (источник шаблона)
+
+        Args:
+            schema: IFC схема
+
+        Returns:
+            IFC документ
+        """
         # Создаём базовый файл с IfcOwnerHistory на ID #1 через SPF
+        doc = self._open_header_document(schema)
+
+        # Сохраняем ссылку на OwnerHistory
+        doc.owner_history = doc.by_id(1)
+
+        self._create_base_structure(doc)
+
+        return doc
+
+    def _open_header_document(self, schema: str) -> Any:
+        """
+        Открытие документа с заголовком и IfcOwnerHistory на ID #1
+
+        Args:
+            schema: IFC схема
+
+        Returns:
+            IFC документ
+        """
         timestamp = int(time.time())
 
         # Согласно buildingSMART IFC Header Policy:
@@ -106,20 +151,8 @@ ENDSEC;
 END-ISO-10303-21;
 """
 
-        # Сохраняем во временный файл и открываем
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".ifc", delete=False) as tmp:
-            tmp.write(spf_content)
-            tmp_path = tmp.name
-
-        doc = ifcopenshell.open(tmp_path)
-        os.unlink(tmp_path)
-
-        # Сохраняем ссылку на OwnerHistory
-        doc.owner_history = doc.by_id(1)
-
-        self._create_base_structure(doc)
-
-        return doc
+        # Открываем из строки в памяти, без временного файла
+        return ifc_io.from_string(spf_content)
 
     def _create_base_structure(self, doc: Any) -> None:
         """
@@ -294,13 +327,20 @@ END-ISO-10303-21;
             del self._documents[doc_id]
         if doc_id in self._material_managers:
             del self._material_managers[doc_id]
+        self._leak_metrics.pop(doc_id, None)
 
         if self._current_id == doc_id:
             self._current_id = next(iter(self._documents.keys()), None)
 
     def reset_document(self, doc_id: Optional[str] = None) -> Any:
         """
-        Сброс документа: удаление всех болтов и создание нового
+        Сброс документа: замена на новый документ из базового шаблона
+
+        Время сброса не зависит от содержимого предыдущего документа:
+        старый документ не обходится и не чистится поэлементно, а целиком
+        заменяется клоном базового снимка (document_template). Вместе с
+        документом заменяется MaterialManager — материалы создаются заново
+        (со стандартными PSet) при следующей генерации.
 
         Args:
             doc_id: Идентификатор документа (по умолчанию текущий)
@@ -314,107 +354,73 @@ END-ISO-10303-21;
         if doc_id is None or doc_id not in self._documents:
             raise ValueError(f"Документ '{doc_id}' не найден")
 
-        doc = self._documents[doc_id]
-        ifc = get_ifcopenshell()
-
-        # Сохраняем базовые структуры
-        projects = doc.by_type("IfcProject")
-        project = projects[0] if projects else None
-
-        sites = doc.by_type("IfcSite")
-        site = sites[0] if sites else None
+        schema = getattr(self._documents[doc_id], "schema", None) or "IFC4"
+        new_doc = self._initialize_document(schema)
 
-        buildings = doc.by_type("IfcBuilding")
-        building = buildings[0] if buildings else None
+        self._documents[doc_id] = new_doc
+        self._material_managers[doc_id] = MaterialManager(new_doc)
 
-        storeys = doc.by_type("IfcBuildingStorey")
-        storey = storeys[0] if storeys else None
+        # Старый документ освобождается целиком вместе с возможными сиротами,
+        # поэтому отдельная сборка мусора при сбросе не нужна
+        metrics = self._leak_metrics.setdefault(doc_id, {})
+        metrics["base_entity_count"] = _count_entities(new_doc)
+        metrics["resets"] = metrics.get("resets", 0) + 1
 
-        # Сохраняем имена материалов для восстановления
-        material_names = []
-        if doc_id in self._material_managers:
-            for name in self._material_managers[doc_id].materials_cache.keys():
-                material_names.append(name)
-
-        # Удаляем все MechanicalFastener и связанные сущности
-        fasteners = doc.by_type("IfcMechanicalFastener")
-        fastener_types = doc.by_type("IfcMechanicalFastenerType")
-        rel_defines = doc.by_type("IfcRelDefinesByType")
-        rel_aggregates = doc.by_type("IfcRelAggregates")
-        rel_connects = doc.by_type("IfcRelConnectsElements")
-        rel_contained = doc.by_type("IfcRelContainedInSpatialStructure")
-        rel_associates = doc.by_type("IfcRelAssociatesMaterial")
-        material_lists = doc.by_type("IfcMaterialList")
-
-        # Удаляем отношения
-        for entity in rel_defines + rel_aggregates + rel_connects + rel_contained + rel_associates:
-            try:
-                doc.remove(entity)
-            except Exception:
-                pass
-
-        # Удаляем болты и их типы
-        for entity in fasteners + fastener_types:
-            try:
-                doc.remove(entity)
-            except Exception:
-                pass
-
-        # Удаляем материалы и списки материалов
-        for entity in material_lists:
-            try:
-                doc.remove(entity)
-            except Exception:
-                pass
-
-        # Пересоздаём базовую структуру с IfcOwnerHistory на ID #1
-        timestamp = int(time.time())
+        return new_doc
 
-        # Согласно buildingSMART IFC Header Policy:
-        # - FILE_DESCRIPTION: ViewDefinition для IFC4 — ReferenceView_V1.2
-        # - FILE_NAME: name, time_stamp (ISO 8601), author, organization,
-        #              preprocessor_version, originating_system, authorization
-        # - originating_system формат: "Company - Application - Version"
+    def collect_garbage(
+        self, doc_id: Optional[str] = None, dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Удаление осиротевших сущностей документа (garbage_collector)
 
-        spf_content = f"""ISO-10303-21;
-HEADER;
-FILE_DESCRIPTION(('ViewDefinition [ReferenceView_V1.2]'),'2;1');
-FILE_NAME('anchor_bolt.ifc','{time.strftime('%Y-%m-%dT%H:%M:%S')}',('Anchor Bolt Generator'),('ABG'),'Anchor Bolt Generator 1.0','ABG - Anchor Bolt Generator - 1.0','none');
-FILE_SCHEMA(('IFC4'));
-ENDSEC;
-DATA;
-#1=IFCOWNERHISTORY(#4,#6,$,$,$,$,$,{timestamp});
-#2=IFCPERSON('abg-user',$,$,$,$,$,$,$);
-#3=IFCORGANIZATION('ABG','ABG',$,$,$);
-#4=IFCPERSONANDORGANIZATION(#2,#3,$);
-#5=IFCORGANIZATION('ABG','ABG',$,$,$);
-#6=IFCAPPLICATION(#5,'1.0','Anchor Bolt Generator','ABG');
-ENDSEC;
-END-ISO-10303-21;
-"""
+        Args:
+            doc_id: Идентификатор документа (по умолчанию текущий)
+            dry_run: Только подсчитать, ничего не удалять
 
-        # Сохраняем во временный файл и открываем
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".ifc", delete=False) as tmp:
-            tmp.write(spf_content)
-            tmp_path = tmp.name
+        Returns:
+            Статистика сборки (см. garbage_collector.collect_garbage)
+        """
+        if doc_id is None:
+            doc_id = self._current_id
+        doc = self.get_document(doc_id)
 
-        new_doc = ifcopenshell.open(tmp_path)
-        os.unlink(tmp_path)
+        stats = collect_garbage(doc, dry_run=dry_run)
 
-        # Сохраняем ссылку на OwnerHistory
-        new_doc.owner_history = new_doc.by_id(1)
+        if not dry_run:
+            metrics = self._leak_metrics.setdefault(doc_id, {})
+            metrics["collections"] = metrics.get("collections", 0) + 1
+            metrics["entities_reclaimed"] = (
+                metrics.get("entities_reclaimed", 0) + stats["entities_removed"]
+            )
+            metrics["bytes_reclaimed"] = (
+                metrics.get("bytes_reclaimed", 0) + stats["bytes_reclaimed"]
+            )
+        return stats
 
-        self._create_base_structure(new_doc)
+    def get_leak_metrics(self, doc_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Метрики утечек документа для длительных сессий
 
-        # Восстанавливаем material_manager
-        self._documents[doc_id] = new_doc
-        self._material_managers[doc_id] = MaterialManager(new_doc)
+        Args:
+            doc_id: Идентификатор документа (по умолчанию текущий)
 
-        # Восстанавливаем материалы
-        for mat_name in material_names:
-            self._material_managers[doc_id].create_material(mat_name, category="Steel")
+        Returns:
+            Словарь:
+                - entity_count: текущее количество сущностей
+                - base_entity_count: количество сущностей после создания/сброса
+                - growth: прирост относительно базового документа
+                - resets, collections: количество сбросов и сборок мусора
+                - entities_reclaimed, bytes_reclaimed: итог всех сборок мусора
+        """
+        if doc_id is None:
+            doc_id = self._current_id
+        doc = self.get_document(doc_id)
 
-        return new_doc
+        metrics = dict(self._leak_metrics.get(doc_id, {}))
+        metrics["entity_count"] = _count_entities(doc)
+        metrics["growth"] = metrics["entity_count"] - metrics.get("base_entity_count", 0)
+        return metrics
 
     def list_documents(self) -> list:
         """
@@ -438,6 +444,7 @@ END-ISO-10303-21;
         """Очистка всех документов"""
         self._documents.clear()
         self._material_managers.clear()
+        self._leak_metrics.clear()
         self._current_id = None
 
 
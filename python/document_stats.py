@@ -0,0 +1,212 @@
+"""
+document_stats.py — Инкрементальная статистика IFC документа
+
+Сводка документа (IFCGenerator.get_summary) раньше обходила все сущности и
+вызывала is_a() для каждой, а болты и материалы запрашивала через by_type.
+Здесь счётчики ведутся инкрементально:
+- идентификаторы сущностей выдаются по возрастанию и не переиспользуются,
+  поэтому sync() учитывает только сущности с id больше последнего
+  учтённого (get_max_id) — каждая сущность обходится один раз;
+- сущности, созданные и удалённые между синхронизациями (временные тела
+  faceted/unified режима, remove_deep2), не учитываются вовсе;
+- удаление уже учтённых сущностей сборщиком мусора вычитается через
+  discard().
+
+Фабрики синхронизируют статистику после каждой сборки
+(InstanceFactory.create_bolt_assembly), поэтому сводка читает готовые
+счётчики. Удаление учтённых сущностей в обход discard() и изменение
+ObjectType болтов после синхронизации не отслеживаются — verify()
+сверяет счётчики с полным пересчётом (отладочная проверка, см. VERIFY).
+
+Пример использования:
+    stats = get_document_stats(ifc_doc)
+    stats.sync()
+    summary = stats.summary()
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils import document_cache
+
+# Сверять счётчики с полным пересчётом в IFCGenerator.get_summary (отладка)
+VERIFY = False
+
+
+def max_entity_id(ifc_doc: Any) -> Optional[int]:
+    """Наибольший выданный id сущности или None, если документ его не сообщает"""
+    get_max_id = getattr(ifc_doc, "get_max_id", None)
+    if get_max_id is not None:
+        return get_max_id()
+    wrapped_data = getattr(ifc_doc, "wrapped_data", None)
+    if wrapped_data is not None:
+        return wrapped_data.getMaxId()
+    return None
+
+
+def _fastener_type(entity: Any) -> str:
+    return entity.ObjectType or "Unknown"
+
+
+def _material_info(entity: Any) -> Dict[str, Any]:
+    return {"name": entity.Name, "description": entity.Description}
+
+
+def count_entities(ifc_doc: Any) -> Dict[str, Any]:
+    """
+    Полный пересчёт статистики обходом документа
+
+    Returns:
+        Словарь в формате DocumentStats.summary()
+    """
+    entity_types: Dict[str, int] = {}
+    total = 0
+    for entity in ifc_doc:
+        entity_type = entity.is_a()
+        entity_types[entity_type] = entity_types.get(entity_type, 0) + 1
+        total += 1
+
+    fasteners = ifc_doc.by_type("IfcMechanicalFastener")
+    by_type: Dict[str, int] = {}
+    for fastener in fasteners:
+        by_type[_fastener_type(fastener)] = by_type.get(_fastener_type(fastener), 0) + 1
+
+    materials = ifc_doc.by_type("IfcMaterial")
+    return {
+        "entities_count": total,
+        "entity_types": entity_types,
+        "mechanical_fasteners": {"total": len(fasteners), "by_type": by_type},
+        "materials": {
+            "total": len(materials),
+            "materials": [_material_info(m) for m in materials],
+        },
+    }
+
+
+class DocumentStats:
+    """Инкрементальные счётчики сущностей одного IFC документа"""
+
+    def __init__(self, ifc_doc: Any):
+        """
+        Args:
+            ifc_doc: IFC документ
+        """
+        self.ifc = ifc_doc
+        self.entity_types: Dict[str, int] = {}
+        self.total = 0
+        self.fastener_types: Dict[str, int] = {}
+        # id -> тип болта (ObjectType) / описание материала для вычитания при удалении
+        self._fasteners: Dict[int, str] = {}
+        self._materials: Dict[int, Dict[str, Any]] = {}
+        self._synced_id = 0
+
+    def _count(self, entity_type: str, sign: int) -> None:
+        count = self.entity_types.get(entity_type, 0) + sign
+        if count:
+            self.entity_types[entity_type] = count
+        else:
+            del self.entity_types[entity_type]
+
+    def _count_fastener(self, fastener_type: str, sign: int) -> None:
+        count = self.fastener_types.get(fastener_type, 0) + sign
+        if count:
+            self.fastener_types[fastener_type] = count
+        else:
+            del self.fastener_types[fastener_type]
+
+    def sync(self) -> int:
+        """
+        Учёт сущностей, созданных после предыдущей синхронизации
+
+        Returns:
+            Количество учтённых сущностей
+        """
+        max_id = max_entity_id(self.ifc)
+        if max_id is None or max_id <= self._synced_id:
+            return 0
+
+        by_id = self.ifc.by_id
+        entity_types = self.entity_types
+        added = 0
+        for entity_id in range(self._synced_id + 1, max_id + 1):
+            try:
+                entity = by_id(entity_id)
+            except RuntimeError:
+                # Сущность удалена до синхронизации
+                continue
+            entity_type = entity.is_a()
+            entity_types[entity_type] = entity_types.get(entity_type, 0) + 1
+            added += 1
+            # У IfcMechanicalFastener и IfcMaterial нет подтипов — достаточно имени класса
+            if entity_type == "IfcMechanicalFastener":
+                fastener_type = _fastener_type(entity)
+                self._fasteners[entity_id] = fastener_type
+                self._count_fastener(fastener_type, 1)
+            elif entity_type == "IfcMaterial":
+                self._materials[entity_id] = _material_info(entity)
+        self.total += added
+        self._synced_id = max_id
+        return added
+
+    def discard(self, entities: Iterable[Any]) -> None:
+        """Вычитание сущностей перед их удалением из документа"""
+        for entity in entities:
+            entity_id = entity.id()
+            # Сущности после последней синхронизации ещё не учтены
+            if entity_id > self._synced_id:
+                continue
+            entity_type = entity.is_a()
+            self._count(entity_type, -1)
+            self.total -= 1
+            if entity_id in self._fasteners:
+                self._count_fastener(self._fasteners.pop(entity_id), -1)
+            self._materials.pop(entity_id, None)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Статистика документа (после синхронизации)
+
+        Returns:
+            Словарь:
+                - entities_count: количество сущностей
+                - entity_types: количество сущностей по классам
+                - mechanical_fasteners: {'total', 'by_type'} по ObjectType
+                - materials: {'total', 'materials': [{'name', 'description'}]}
+        """
+        self.sync()
+        return {
+            "entities_count": self.total,
+            "entity_types": dict(self.entity_types),
+            "mechanical_fasteners": {
+                "total": len(self._fasteners),
+                "by_type": dict(self.fastener_types),
+            },
+            "materials": {
+                "total": len(self._materials),
+                "materials": list(self._materials.values()),
+            },
+        }
+
+    def verify(self) -> List[str]:
+        """
+        Сверка счётчиков с полным пересчётом документа
+
+        Returns:
+            Список расхождений (пустой, если счётчики верны)
+        """
+        actual = count_entities(self.ifc)
+        expected = self.summary()
+        errors = []
+        for key, value in actual.items():
+            if key == "materials":
+                value = sorted(value["materials"], key=repr)
+                counted = sorted(expected[key]["materials"], key=repr)
+            else:
+                counted = expected[key]
+            if counted != value:
+                errors.append(f"{key}: учтено {counted}, в документе {value}")
+        return errors
+
+
+def get_document_stats(ifc_doc: Any) -> DocumentStats:
+    """Статистика документа (создаётся при первом обращении)"""
+    return document_cache(ifc_doc, "document_stats", DocumentStats)
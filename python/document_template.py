@@ -0,0 +1,148 @@
+"""
+document_template.py — Кэш шаблонов базового IFC документа
+
+Базовая структура (Project/Site/Building/Storey, единицы, контексты,
+IfcProjectedCRS, IfcMapConversion) одинакова для всех документов.
+Она строится один раз на схему и сериализуется в SPF; новый документ
+создаётся разбором этой строки с выдачей свежих GlobalId и временных меток.
+
+Шаблон — обычная SPF строка, поэтому его можно сохранить в файл
+(DocumentTemplate.save) и загрузить в другом процессе (DocumentTemplate.load).
+"""
+
+import re
+import time
+from typing import Any, Callable, Dict, Optional
+
+import ifc_io
+from utils import get_ifcopenshell
+
+_SCHEMA_PATTERN = re.compile(r"FILE_SCHEMA\s*\(\s*\(\s*'([^']+)'")
+
+
+class DocumentTemplate:
+    """
+    Шаблон базового IFC документа
+
+    Пример использования:
+        template = DocumentTemplate.build("IFC4", builder)
+        doc = template.instantiate()  # Новый документ за доли миллисекунды
+    """
+
+    def __init__(self, schema: str, spf_content: str):
+        """
+        Args:
+            schema: IFC схема шаблона
+            spf_content: Сериализованный базовый документ
+        """
+        self.schema = schema
+        self.spf_content = spf_content
+
+    @classmethod
+    def build(cls, schema: str, builder: Callable[[str], Any]) -> "DocumentTemplate":
+        """
+        Построение шаблона из документа, созданного builder
+
+        Args:
+            schema: IFC схема
+            builder: Функция, создающая базовый документ для схемы
+
+        Returns:
+            DocumentTemplate
+        """
+        return cls(schema, ifc_io.to_string(builder(schema)))
+
+    @classmethod
+    def from_string(cls, spf_content: str) -> "DocumentTemplate":
+        """
+        Шаблон из SPF строки (схема читается из FILE_SCHEMA заголовка)
+
+        Raises:
+            ValueError: Если в заголовке нет FILE_SCHEMA
+        """
+        match = _SCHEMA_PATTERN.search(spf_content)
+        if not match:
+            raise ValueError("Шаблон документа не содержит FILE_SCHEMA")
+        return cls(match.group(1), spf_content)
+
+    @classmethod
+    def load(cls, path: str) -> "DocumentTemplate":
+        """Загрузка шаблона, сохранённого DocumentTemplate.save"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_string(f.read())
+
+    def save(self, path: str) -> str:
+        """Сохранение шаблона в файл для использования в других процессах"""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.spf_content)
+        return path
+
+    def instantiate(self) -> Any:
+        """
+        Создание нового документа из шаблона
+
+        Каждый документ получает свежие GlobalId всех IfcRoot сущностей,
+        текущие временные метки в IfcOwnerHistory и в заголовке FILE_NAME.
+
+        Returns:
+            IFC документ с атрибутом owner_history (#1)
+        """
+        doc = ifc_io.from_string(self.spf_content)
+        _refresh_identity(doc)
+        doc.owner_history = doc.by_id(1)
+        return doc
+
+
+def _refresh_identity(doc: Any) -> None:
+    """Свежие GlobalId и временные метки для документа, созданного из шаблона"""
+    ifc = get_ifcopenshell()
+    timestamp = int(time.time())
+
+    for entity in doc.by_type("IfcRoot"):
+        entity.GlobalId = ifc.guid.new()
+
+    for history in doc.by_type("IfcOwnerHistory"):
+        history.CreationDate = timestamp
+        if history.LastModifiedDate is not None:
+            history.LastModifiedDate = timestamp
+
+    doc.header.file_name.time_stamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+# Глобальный кэш шаблонов по схеме (общий для всех менеджеров документов)
+_templates: Dict[str, DocumentTemplate] = {}
+
+
+def get_document_template(
+    schema: str, builder: Optional[Callable[[str], Any]] = None
+) -> DocumentTemplate:
+    """
+    Получение шаблона для схемы (строится при первом обращении)
+
+    Args:
+        schema: IFC схема
+        builder: Функция построения базового документа (нужна при промахе кэша)
+
+    Returns:
+        DocumentTemplate
+
+    Raises:
+        KeyError: Если шаблона нет в кэше и builder не указан
+    """
+    template = _templates.get(schema)
+    if template is None:
+        if builder is None:
+            raise KeyError(f"Шаблон документа для схемы '{schema}' не зарегистрирован")
+        template = DocumentTemplate.build(schema, builder)
+        _templates[schema] = template
+    return template
+
+
+def register_document_template(template: DocumentTemplate) -> None:
+    """Регистрация готового шаблона (например, загруженного из файла)"""
+    _templates[template.schema] = template
+
+
+def reset_document_templates() -> None:
+    """Очистка кэша шаблонов"""
+    _templates.clear()
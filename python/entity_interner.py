@@ -0,0 +1,170 @@
+"""
+entity_interner.py — Интернирование неизменяемых геометрических ресурсов IFC
+
+Направления, точки, IfcAxis2Placement3D и операторы преобразования одинаковы
+у всех компонентов всех болтов: (0,0,1), (1,0,0), начало координат, единичный
+оператор IfcMappedItem. Вместо новой сущности на каждый компонент документ
+хранит одну сущность на каждое уникальное значение — количество сущностей и
+размер SPF на болт заметно уменьшаются.
+
+Интернируются только ресурсы без собственной идентичности (IfcRepresentationItem,
+IfcPlacement и т.п.). IfcLocalPlacement не интернируется: это размещение
+конкретного продукта, на него ссылаются PlacementRelTo и инструменты редактирования.
+
+Кэш один на документ (utils.document_cache). Сущности, удалённые из
+документа (remove_deep2, сборщик мусора), отбрасываются при следующем обращении.
+
+Пример использования:
+    interner = get_interner(ifc_doc)
+    axis = interner.direction((0.0, 0.0, 1.0))
+    placement = interner.axis2placement3d((0.0, 0.0, 100.0), axis=(0.0, 0.0, -1.0))
+"""
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from profiling import count
+from utils import document_cache, entity_by_id
+
+# Количество знаков после запятой в ключе кэша (значения в мм, точность контекста 1e-5)
+KEY_DIGITS = 9
+
+Key = Tuple[Any, ...]
+
+
+def _values(values: Sequence[float]) -> Tuple[float, ...]:
+    """Ключ значений: округление и замена -0.0 на 0.0"""
+    return tuple(round(float(v), KEY_DIGITS) + 0.0 for v in values)
+
+
+class EntityInterner:
+    """
+    Кэш неизменяемых геометрических ресурсов одного IFC документа
+
+    Возвращаемые сущности общие — изменять их атрибуты нельзя.
+    """
+
+    def __init__(self, ifc_doc: Any):
+        """
+        Args:
+            ifc_doc: IFC документ
+        """
+        self.ifc = ifc_doc
+        self._entities: Dict[Key, int] = {}
+        self.stats = {"hits": 0, "misses": 0}
+
+    def _lookup(self, key: Key) -> Optional[Any]:
+        entity_id = self._entities.get(key)
+        if entity_id is None:
+            return None
+        entity = entity_by_id(self.ifc, entity_id)
+        if entity is None:
+            # Сущность удалена из документа
+            del self._entities[key]
+            return None
+        self.stats["hits"] += 1
+        count("interner.hits")
+        return entity
+
+    def _store(self, key: Key, entity: Any) -> Any:
+        self._entities[key] = entity.id()
+        self.stats["misses"] += 1
+        count("interner.misses")
+        return entity
+
+    def direction(self, ratios: Sequence[float]) -> Any:
+        """IfcDirection с заданными DirectionRatios"""
+        values = _values(ratios)
+        key = ("IfcDirection", values)
+        entity = self._lookup(key)
+        if entity is None:
+            entity = self._store(
+                key, self.ifc.create_entity("IfcDirection", DirectionRatios=values)
+            )
+        return entity
+
+    def point(self, coordinates: Sequence[float]) -> Any:
+        """IfcCartesianPoint с заданными Coordinates"""
+        values = _values(coordinates)
+        key = ("IfcCartesianPoint", values)
+        entity = self._lookup(key)
+        if entity is None:
+            entity = self._store(
+                key, self.ifc.create_entity("IfcCartesianPoint", Coordinates=values)
+            )
+        return entity
+
+    def axis2placement3d(
+        self,
+        location: Sequence[float] = (0.0, 0.0, 0.0),
+        axis: Optional[Sequence[float]] = None,
+        ref_direction: Optional[Sequence[float]] = None,
+    ) -> Any:
+        """
+        IfcAxis2Placement3D
+
+        Args:
+            location: Координаты начала
+            axis: Направление оси Z (None — не задаётся)
+            ref_direction: Направление оси X (None — не задаётся)
+        """
+        key = (
+            "IfcAxis2Placement3D",
+            _values(location),
+            _values(axis) if axis is not None else None,
+            _values(ref_direction) if ref_direction is not None else None,
+        )
+        entity = self._lookup(key)
+        if entity is None:
+            entity = self._store(
+                key,
+                self.ifc.create_entity(
+                    "IfcAxis2Placement3D",
+                    Location=self.point(location),
+                    Axis=self.direction(axis) if axis is not None else None,
+                    RefDirection=(
+                        self.direction(ref_direction) if ref_direction is not None else None
+                    ),
+                ),
+            )
+        return entity
+
+    def transformation_operator(
+        self,
+        axis1: Sequence[float] = (1.0, 0.0, 0.0),
+        axis2: Sequence[float] = (0.0, 1.0, 0.0),
+        local_origin: Sequence[float] = (0.0, 0.0, 0.0),
+        scale: float = 1.0,
+    ) -> Any:
+        """IfcCartesianTransformationOperator3D (по умолчанию — единичный)"""
+        key = (
+            "IfcCartesianTransformationOperator3D",
+            _values(axis1),
+            _values(axis2),
+            _values(local_origin),
+            _values((scale,)),
+        )
+        entity = self._lookup(key)
+        if entity is None:
+            entity = self._store(
+                key,
+                self.ifc.create_entity(
+                    "IfcCartesianTransformationOperator3D",
+                    Axis1=self.direction(axis1),
+                    Axis2=self.direction(axis2),
+                    LocalOrigin=self.point(local_origin),
+                    Scale=float(scale),
+                ),
+            )
+        return entity
+
+    def clear(self) -> None:
+        """Очистка кэша (сущности в документе остаются)"""
+        self._entities.clear()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+
+def get_interner(ifc_doc: Any) -> EntityInterner:
+    """Кэш интернирования документа (создаётся при первом обращении)"""
+    return document_cache(ifc_doc, "entity_interner", EntityInterner)
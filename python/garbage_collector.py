@@ -0,0 +1,140 @@
+"""
+garbage_collector.py — Сборка «осиротевших» сущностей IFC документа
+
+Сборка по принципу mark-and-sweep:
+- mark: обход прямых ссылок от корней (проект, продукты, типы, отношения,
+  контексты, материалы и прочие ресурсы, на которые никто не ссылается
+  по определению схемы)
+- sweep: пакетное удаление всех недостижимых сущностей
+
+Осиротевшие сущности оставляют faceted-пути (_create_faceted_representation,
+_apply_unified_mode с remove_deep2): точки, профили, IfcShapeRepresentation,
+PropertySet без отношений. Они увеличивают размер файла и нарушают IFC105.
+"""
+
+from typing import Any, Dict, List
+
+from document_stats import get_document_stats
+
+# Корневые классы: сущности, которые живы сами по себе
+ROOT_CLASSES = (
+    "IfcProject",
+    "IfcProduct",
+    "IfcTypeObject",
+    "IfcRelationship",
+    "IfcOwnerHistory",
+    "IfcRepresentationContext",
+    "IfcMaterialDefinition",
+    "IfcMaterialProperties",
+    "IfcCoordinateOperation",
+    "IfcPresentationLayerAssignment",
+    "IfcStyledItem",
+)
+
+
+def _roots(ifc_doc: Any) -> List[Any]:
+    """Корневые сущности документа (by_type выполняется на стороне C++)"""
+    roots = []
+    for cls in ROOT_CLASSES:
+        try:
+            roots.extend(ifc_doc.by_type(cls))
+        except RuntimeError:
+            # Класс отсутствует в схеме документа
+            continue
+    return roots
+
+
+def _entity_count(ifc_doc: Any) -> int:
+    return sum(1 for _ in ifc_doc)
+
+
+def _collect_references(value: Any, out: List[Any]) -> None:
+    """Сущности из значения атрибута (включая вложенные агрегаты)"""
+    if isinstance(value, tuple):
+        for item in value:
+            _collect_references(item, out)
+    elif hasattr(value, "id") and callable(value.id):
+        out.append(value)
+
+
+def find_orphans(ifc_doc: Any) -> List[Any]:
+    """
+    Поиск сущностей, недостижимых от корней документа
+
+    Args:
+        ifc_doc: IFC документ
+
+    Returns:
+        Список недостижимых сущностей
+    """
+    marked = set()
+    stack = []
+
+    for entity in _roots(ifc_doc):
+        if entity.id() not in marked:
+            marked.add(entity.id())
+            stack.append(entity)
+
+    while stack:
+        entity = stack.pop()
+        references: List[Any] = []
+        for index in range(len(entity)):
+            _collect_references(entity[index], references)
+        for referenced in references:
+            entity_id = referenced.id()
+            # id() == 0 у встроенных значений (type-wrapped select), их не отслеживаем
+            if entity_id and entity_id not in marked:
+                marked.add(entity_id)
+                stack.append(referenced)
+
+    return [entity for entity in ifc_doc if entity.id() not in marked]
+
+
+def collect_garbage(ifc_doc: Any, dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Удаление недостижимых сущностей из документа
+
+    Args:
+        ifc_doc: IFC документ
+        dry_run: Только подсчитать, ничего не удалять
+
+    Returns:
+        Статистика сборки:
+            - entities_before / entities_after: количество сущностей
+            - entities_removed: количество удалённых сущностей
+            - bytes_reclaimed: размер удалённых сущностей в SPF (байт)
+            - removed_by_type: количество удалённых сущностей по классам
+    """
+    orphans = find_orphans(ifc_doc)
+    entities_before = _entity_count(ifc_doc)
+
+    removed_by_type: Dict[str, int] = {}
+    bytes_reclaimed = 0
+    for entity in orphans:
+        entity_type = entity.is_a()
+        removed_by_type[entity_type] = removed_by_type.get(entity_type, 0) + 1
+        # Строка SPF: "#id=" + представление сущности + ";\n"
+        bytes_reclaimed += len(str(entity)) + 2
+
+    if orphans and not dry_run:
+        # Удаляемые сущности вычитаются из статистики документа (get_summary)
+        get_document_stats(ifc_doc).discard(orphans)
+        batch = getattr(ifc_doc, "batch", None)
+        if batch is not None:
+            batch()
+        try:
+            for entity in orphans:
+                ifc_doc.remove(entity)
+        finally:
+            if batch is not None:
+                ifc_doc.unbatch()
+
+    entities_removed = len(orphans)
+    return {
+        "entities_before": entities_before,
+        "entities_after": entities_before - (0 if dry_run else entities_removed),
+        "entities_removed": entities_removed,
+        "bytes_reclaimed": bytes_reclaimed,
+        "removed_by_type": removed_by_type,
+        "dry_run": dry_run,
+    }
@@ -5,14 +5,275 @@ geometry_builder.py — Построение IFC геометрии
 Согласно документации IfcOpenShell:
 - ShapeBuilder предоставляет стандартное API для построения геометрии
 - V — функция для создания векторов координат
+
+Аналитическая тесселяция (tessellate_*) строит замкнутые треугольные сетки
+компонентов напрямую по размерам ГОСТ средствами NumPy, без OpenCascade:
+призмы с отверстием (гайка, шайба, плита) и трубки вдоль оси шпильки.
 """
 
 import math
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Sequence, Tuple
 
+import numpy as np
+from entity_interner import get_interner
 from ifcopenshell.util.representation import get_context
 from ifcopenshell.util.shape_builder import ShapeBuilder, V
 
+# Количество сегментов окружности при аналитической тесселяции по умолчанию
+DEFAULT_CIRCLE_SEGMENTS = 24
+
+Mesh = Tuple[np.ndarray, np.ndarray]
+
+
+def _circle_angles(segments: int) -> np.ndarray:
+    return np.arange(segments, dtype=np.float64) * (2.0 * math.pi / segments)
+
+
+def _polygon_ring(corners: np.ndarray, hole_radius: float) -> np.ndarray:
+    """
+    Внешний контур призмы для триангуляции «молнией» вокруг отверстия
+
+    Стороны выпуклого многоугольника делятся на равные части так, чтобы отрезок
+    от любой точки контура до соседних по углу точек отверстия не пересекал
+    отверстие (угловой шаг меньше arccos(r / апофема стороны)).
+
+    Args:
+        corners: Вершины (K, 2) против часовой стрелки
+        hole_radius: Радиус отверстия
+
+    Returns:
+        Точки контура (M, 2) против часовой стрелки
+    """
+    start = corners
+    end = np.roll(corners, -1, axis=0)
+    along = end - start
+    apothem = np.abs(start[:, 0] * along[:, 1] - start[:, 1] * along[:, 0]) / np.linalg.norm(
+        along, axis=1
+    )
+    edge_angle = np.mod(
+        np.arctan2(end[:, 1], end[:, 0]) - np.arctan2(start[:, 1], start[:, 0]), 2.0 * math.pi
+    )
+    max_step = 0.9 * np.arccos(np.clip(hole_radius / apothem, 0.0, 1.0))
+    parts = np.maximum(1, np.ceil(edge_angle / max_step)).astype(np.int64)
+
+    edge = np.repeat(np.arange(len(corners)), parts)
+    fraction = (np.arange(parts.sum()) - np.repeat(np.cumsum(parts) - parts, parts)) / np.repeat(
+        parts, parts
+    )
+    return start[edge] + along[edge] * fraction[:, None]
+
+
+def _annulus_cap(outer: np.ndarray, inner: np.ndarray) -> np.ndarray:
+    """
+    Триангуляция кольцевой области между двумя звёздными контурами «молнией»
+
+    Вершины обоих контуров обходятся по возрастанию угла; каждая вершина
+    добавляет один треугольник (текущая внутренняя, текущая внешняя, новая).
+
+    Args:
+        outer: Внешний контур (K, 2) против часовой стрелки
+        inner: Внутренний контур (N, 2) против часовой стрелки
+
+    Returns:
+        Треугольники (K + N, 3) против часовой стрелки при взгляде с +Z;
+        индексы: внешний контур 0..K-1, внутренний K..K+N-1
+    """
+    n_outer, n_inner = len(outer), len(inner)
+    angles = np.mod(
+        np.arctan2(
+            np.concatenate([outer[:, 1], inner[:, 1]]), np.concatenate([outer[:, 0], inner[:, 0]])
+        ),
+        2.0 * math.pi,
+    )
+    is_inner = np.concatenate([np.zeros(n_outer, dtype=bool), np.ones(n_inner, dtype=bool)])
+    order = np.lexsort((~is_inner, angles))
+
+    event_inner = is_inner[order]
+    # Текущие вершины до события: последние пройденные (до первого события — последние в контуре)
+    outer_before = np.cumsum(~event_inner) - (~event_inner)
+    inner_before = np.cumsum(event_inner) - event_inner
+    current_outer = order[~event_inner][(outer_before - 1) % n_outer]
+    current_inner = order[event_inner][(inner_before - 1) % n_inner]
+
+    return np.column_stack([current_inner, current_outer, order])
+
+
+def _ring_band(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Полоса четырёхугольников между двумя кольцами одинаковой длины
+
+    Нормали направлены наружу, если кольца обходятся против часовой стрелки
+    при взгляде с конца оси (second лежит дальше по оси, чем first).
+    """
+    next_first = np.roll(first, -1)
+    next_second = np.roll(second, -1)
+    return np.vstack(
+        [
+            np.column_stack([first, next_first, next_second]),
+            np.column_stack([first, next_second, second]),
+        ]
+    )
+
+
+def tessellate_prism_with_hole(
+    outer: np.ndarray, hole_radius: float, height: float, segments: int = DEFAULT_CIRCLE_SEGMENTS
+) -> Mesh:
+    """
+    Замкнутая сетка призмы с круглым отверстием (экструзия от Z=0 до Z=height)
+
+    Args:
+        outer: Вершины внешнего выпуклого контура (K, 2) против часовой стрелки,
+               начало координат внутри контура
+        hole_radius: Радиус отверстия
+        height: Высота экструзии
+        segments: Количество сегментов окружности отверстия
+
+    Returns:
+        Кортеж (vertices (N, 3), triangles (M, 3)) с нормалями наружу
+    """
+    angles = _circle_angles(segments)
+    outer_ring = _polygon_ring(np.asarray(outer, dtype=np.float64), hole_radius)
+    inner_ring = hole_radius * np.column_stack([np.cos(angles), np.sin(angles)])
+
+    profile = np.vstack([outer_ring, inner_ring])
+    count = len(profile)
+    vertices = np.vstack(
+        [
+            np.column_stack([profile, np.zeros(count)]),
+            np.column_stack([profile, np.full(count, float(height))]),
+        ]
+    )
+
+    cap = _annulus_cap(outer_ring, inner_ring)
+    outer_ids = np.arange(len(outer_ring))
+    inner_ids = np.arange(len(outer_ring), count)
+    triangles = np.vstack(
+        [
+            cap[:, ::-1],  # Низ: нормаль -Z
+            cap + count,  # Верх: нормаль +Z
+            _ring_band(outer_ids, outer_ids + count),
+            _ring_band(inner_ids + count, inner_ids),  # Отверстие: нормали к оси
+        ]
+    )
+    return vertices, triangles
+
+
+def _arc_points(start, middle, end, segments: int) -> np.ndarray:
+    """Точки дуги окружности через три точки (без начальной), плоскость XZ"""
+    (x1, z1), (x2, z2), (x3, z3) = (start[0], start[2]), (middle[0], middle[2]), (end[0], end[2])
+    d = 2.0 * (x1 * (z2 - z3) + x2 * (z3 - z1) + x3 * (z1 - z2))
+    cx = (
+        (x1**2 + z1**2) * (z2 - z3) + (x2**2 + z2**2) * (z3 - z1) + (x3**2 + z3**2) * (z1 - z2)
+    ) / d
+    cz = (
+        (x1**2 + z1**2) * (x3 - x2) + (x2**2 + z2**2) * (x1 - x3) + (x3**2 + z3**2) * (x2 - x1)
+    ) / d
+    radius = math.hypot(x1 - cx, z1 - cz)
+
+    a1 = math.atan2(z1 - cz, x1 - cx)
+    a2 = math.atan2(z2 - cz, x2 - cx)
+    a3 = math.atan2(z3 - cz, x3 - cx)
+    # Направление обхода выбирается так, чтобы дуга проходила через среднюю точку
+    sweep = (a3 - a1) % (2.0 * math.pi)
+    if (a2 - a1) % (2.0 * math.pi) > sweep:
+        sweep -= 2.0 * math.pi
+
+    count = max(1, int(math.ceil(segments * abs(sweep) / (2.0 * math.pi))))
+    angles = a1 + sweep * np.arange(1, count + 1) / count
+    return np.column_stack(
+        [cx + radius * np.cos(angles), np.full(count, start[1]), cz + radius * np.sin(angles)]
+    )
+
+
+def sample_polyline_axis(
+    points: Sequence[Sequence[float]],
+    arc_points: Sequence[int] = (),
+    segments: int = DEFAULT_CIRCLE_SEGMENTS,
+) -> np.ndarray:
+    """
+    Дискретизация оси в формате shape_builder.polyline (дуги через среднюю точку)
+
+    Args:
+        points: Точки оси [[x, y, z], ...] (дуги лежат в плоскости XZ)
+        arc_points: Индексы средних точек дуг
+        segments: Количество сегментов на полную окружность
+
+    Returns:
+        Точки ломаной (M, 3)
+    """
+    samples = [np.asarray(points[0], dtype=np.float64)[None, :]]
+    index = 1
+    while index < len(points):
+        if index in arc_points:
+            samples.append(
+                _arc_points(points[index - 1], points[index], points[index + 1], segments)
+            )
+            index += 2
+        else:
+            samples.append(np.asarray(points[index], dtype=np.float64)[None, :])
+            index += 1
+    return np.vstack(samples)
+
+
+def tessellate_tube(
+    axis: np.ndarray, radius: float, segments: int = DEFAULT_CIRCLE_SEGMENTS
+) -> Mesh:
+    """
+    Замкнутая сетка трубки (IfcSweptDiskSolid) вдоль плоской ломаной
+
+    Кольца лежат в биссекторных плоскостях изломов; радиус в плоскости изгиба
+    увеличивается на 1/cos(α/2), чтобы стенки соседних участков сохраняли радиус.
+
+    Args:
+        axis: Точки оси (M, 3), лежащие в плоскости, содержащей ось Y или XZ
+        radius: Радиус трубки
+        segments: Количество сегментов окружности
+
+    Returns:
+        Кортеж (vertices (N, 3), triangles (K, 3)) с нормалями наружу
+    """
+    axis = np.asarray(axis, dtype=np.float64)
+    directions = np.diff(axis, axis=0)
+    directions /= np.linalg.norm(directions, axis=1)[:, None]
+
+    # Касательные в узлах: биссектрисы соседних участков
+    tangents = np.vstack([directions[:1], directions[:-1] + directions[1:], directions[-1:]])
+    tangents /= np.linalg.norm(tangents, axis=1)[:, None]
+    cos_half = np.ones(len(axis))
+    cos_half[1:-1] = np.einsum("ij,ij->i", tangents[1:-1], directions[1:])
+
+    # Плоская ось: бинормаль постоянна (Y для осей в плоскости XZ)
+    binormal = np.cross(directions[0], directions[-1])
+    if np.linalg.norm(binormal) < 1e-9:
+        helper = (
+            np.array([1.0, 0.0, 0.0]) if abs(directions[0][0]) < 0.9 else np.array([0.0, 1.0, 0.0])
+        )
+        binormal = np.cross(directions[0], helper)
+    binormal /= np.linalg.norm(binormal)
+    normals = np.cross(tangents, binormal)
+
+    angles = _circle_angles(segments)
+    cos_a, sin_a = np.cos(angles), np.sin(angles)
+    rings = (
+        axis[:, None, :]
+        + radius * cos_a[None, :, None] * binormal[None, None, :]
+        + radius * (sin_a[None, :, None] / cos_half[:, None, None]) * normals[:, None, :]
+    )
+
+    ring_count = len(axis)
+    vertices = np.vstack([rings.reshape(-1, 3), axis[0], axis[-1]])
+    start_center = ring_count * segments
+    end_center = start_center + 1
+
+    ids = np.arange(ring_count * segments).reshape(ring_count, segments)
+    bands = [_ring_band(ids[i], ids[i + 1]) for i in range(ring_count - 1)]
+    first, last = ids[0], ids[-1]
+    caps = [
+        np.column_stack([np.full(segments, start_center), np.roll(first, -1), first]),
+        np.column_stack([np.full(segments, end_center), last, np.roll(last, -1)]),
+    ]
+    return vertices, np.vstack(bands + caps)
+
 
 class GeometryBuilder:
     """Построитель IFC геометрии с использованием shape_builder"""
@@ -229,6 +490,27 @@ class GeometryBuilder:
         - Низ шпильки: Z = -(L - l0)
         - Общая длина: l0 + (L - l0) = L
         """
+        axis = self.get_stud_axis_points(bolt_type, diameter, length, position)
+        if axis is None:
+            return None
+
+        points, arc_points = axis
+        return self.builder.polyline([V(*p) for p in points], arc_points=arc_points)
+
+    def get_stud_axis_points(self, bolt_type, diameter, length, position=None):
+        """
+        Точки оси шпильки (общие для IfcIndexedPolyCurve и аналитической тесселяции)
+
+        Args:
+            bolt_type: Тип болта ('1.1', '1.2', '2.1', '5')
+            diameter: Диаметр (мм)
+            length: Длина (мм)
+            position: Смещение (x, y, z), используется только z
+
+        Returns:
+            Кортеж (points, arc_points): точки [[x, y, z], ...] и индексы средних
+            точек дуг (как в shape_builder.polyline) или None для неизвестного типа
+        """
         from gost_data import (
             get_bolt_bend_radius,
             get_bolt_hook_length,
@@ -255,9 +537,8 @@ class GeometryBuilder:
             p4 = [r, 0.0, -Ll + z_offset]
             p5 = [r + L2, 0.0, -Ll + z_offset]
 
-            # shape_builder.polyline с arc_points=[2] (индекс средней точки дуги)
-            points = [V(*p1), V(*p2), V(*p3), V(*p4), V(*p5)]
-            return self.builder.polyline(points, arc_points=[2])
+            # arc_points=[2] (индекс средней точки дуги)
+            return [p1, p2, p3, p4, p5], [2]
 
         # Для типа 1.2 используем точный алгоритм
         if bolt_type == "1.2":
@@ -273,32 +554,19 @@ class GeometryBuilder:
             # Смещаем все точки на z_offset
             points = [[p[0], p[1], p[2] + z_offset] for p in points]
 
-            # shape_builder.polyline с arc_points=[3] (индекс средней точки дуги p4)
-            points_v = [V(*p) for p in points]
-            return self.builder.polyline(points_v, arc_points=[3])
+            # arc_points=[3] (индекс средней точки дуги p4)
+            return points, [3]
 
         # Для типов 2.1, 5 - прямая шпилька
         # Тип 2.1: прямая шпилька длиной L с резьбой по всей длине
-        # Верх шпильки (начало резьбы) в Z=0, низ в Z=-L
-        if bolt_type == "2.1":
-            # Тип 2.1: прямая шпилька длиной L
-            # Верх шпильки: Z = 0
-            # Низ шпильки: Z = -length
-            p1 = V(0.0, 0.0, 0.0 + z_offset)
-            p2 = V(0.0, 0.0, float(-length) + z_offset)
-
-            return self.builder.polyline([p1, p2])
-
         # Тип 5: прямая шпилька с резьбой по всей длине
-        # Верх шпильки в Z=0, низ в Z=-L
-        if bolt_type == "5":
-            # Тип 5: прямая шпилька длиной L
-            # Верх шпильки: Z = 0
-            # Низ шпильки: Z = -length
-            p1 = V(0.0, 0.0, 0.0 + z_offset)
-            p2 = V(0.0, 0.0, float(-length) + z_offset)
+        # Верх шпильки: Z = 0, низ шпильки: Z = -length
+        if bolt_type in ("2.1", "5"):
+            p1 = [0.0, 0.0, 0.0 + z_offset]
+            p2 = [0.0, 0.0, float(-length) + z_offset]
+            return [p1, p2], []
 
-            return self.builder.polyline([p1, p2])
+        return None
 
     def create_swept_disk_solid(self, axis_curve, radius):
         """Создание IfcSweptDiskSolid через shape_builder"""
@@ -508,6 +776,114 @@ class GeometryBuilder:
 
         return self._create_shape_representation(context, swept_area)
 
+    def tessellate_nut(self, diameter, height, segments=DEFAULT_CIRCLE_SEGMENTS) -> Mesh:
+        """Сетка гайки: шестиугольник S с отверстием d/2 + 0.5 (как create_nut_solid)"""
+        from gost_data import get_nut_dimensions
+
+        nut_dim = get_nut_dimensions(diameter)
+        s_width = nut_dim["s_width"] if nut_dim else diameter * 1.5
+
+        # Радиус описанной окружности (до вершин): R = S / √3
+        outer_radius = s_width / math.sqrt(3)
+        angles = np.arange(6) * (math.pi / 3)
+        hexagon = outer_radius * np.column_stack([np.cos(angles), np.sin(angles)])
+        return tessellate_prism_with_hole(hexagon, diameter / 2.0 + 0.5, height, segments)
+
+    def tessellate_washer(
+        self, inner_diameter, outer_diameter, thickness, segments=DEFAULT_CIRCLE_SEGMENTS
+    ) -> Mesh:
+        """Сетка шайбы: кольцо (как create_washer_solid)"""
+        angles = _circle_angles(segments)
+        circle = (outer_diameter / 2.0) * np.column_stack([np.cos(angles), np.sin(angles)])
+        return tessellate_prism_with_hole(circle, inner_diameter / 2.0 + 0.5, thickness, segments)
+
+    def tessellate_plate(self, width, thickness, hole_d, segments=DEFAULT_CIRCLE_SEGMENTS) -> Mesh:
+        """Сетка плиты: квадрат с отверстием (как create_plate_solid)"""
+        half = width / 2.0
+        square = np.array([[half, half], [-half, half], [-half, -half], [half, -half]])
+        return tessellate_prism_with_hole(square, hole_d / 2.0, thickness, segments)
+
+    def tessellate_stud(
+        self, bolt_type, diameter, length, segments=DEFAULT_CIRCLE_SEGMENTS
+    ) -> Mesh:
+        """
+        Сетка шпильки в системе координат типа
+
+        Изогнутые шпильки (1.1, 1.2) — трубка вдоль оси create_composite_curve_stud,
+        прямые (2.1, 5) — цилиндр от Z=0 до Z=+length (как create_straight_stud_solid).
+        """
+        if bolt_type in ("1.1", "1.2"):
+            points, arc_points = self.get_stud_axis_points(bolt_type, diameter, length)
+            axis = sample_polyline_axis(points, arc_points, segments)
+        else:
+            axis = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, float(length)]])
+        return tessellate_tube(axis, diameter / 2.0, segments)
+
+    def tessellate_component(self, geom_key: tuple, segments=DEFAULT_CIRCLE_SEGMENTS) -> Mesh:
+        """
+        Аналитическая сетка компонента по ключу геометрии TypeFactory
+
+        Args:
+            geom_key: ("stud", bolt_type, d, L), ("nut", d), ("washer", d) или ("plate", d)
+            segments: Количество сегментов окружности
+
+        Returns:
+            Кортеж (vertices (N, 3) в мм, triangles (M, 3))
+
+        Raises:
+            ValueError: Для неизвестного компонента или отсутствующих размеров плиты
+        """
+        from gost_data import get_nut_dimensions, get_washer_dimensions
+
+        component = geom_key[0]
+        if component == "stud":
+            _, bolt_type, diameter, length = geom_key
+            return self.tessellate_stud(bolt_type, diameter, length, segments)
+
+        diameter = geom_key[1]
+        if component == "nut":
+            nut_dim = get_nut_dimensions(diameter)
+            height = nut_dim["height"] if nut_dim else 10
+            return self.tessellate_nut(diameter, height, segments)
+        if component == "washer":
+            washer_dim = get_washer_dimensions(diameter)
+            outer_d = washer_dim["outer_diameter"] if washer_dim else diameter + 10
+            thickness = washer_dim["thickness"] if washer_dim else 3
+            return self.tessellate_washer(diameter, outer_d, thickness, segments)
+        if component == "plate":
+            from data import get_plate_dimensions
+
+            plate_dim = get_plate_dimensions(diameter)
+            if not plate_dim:
+                raise ValueError(f"Размеры плиты для M{diameter} не найдены")
+            return self.tessellate_plate(
+                plate_dim["width"], plate_dim["thickness"], plate_dim["hole_d"], segments
+            )
+
+        raise ValueError(f"Неизвестный компонент для тесселяции: {component}")
+
+    def create_representation_from_mesh(self, vertices, triangles, geometry_type="faceted"):
+        """
+        IfcShapeRepresentation из треугольной сетки
+
+        Args:
+            vertices: Вершины (N, 3) в мм
+            triangles: Треугольники (M, 3), индексы с 0
+            geometry_type: 'faceted' — IfcFacetedBrep, 'triangulated' — IfcTriangulatedFaceSet
+
+        Returns:
+            IfcShapeRepresentation
+        """
+        points = [tuple(point) for point in np.asarray(vertices).tolist()]
+        faces = np.asarray(triangles).tolist()
+
+        if geometry_type == "triangulated":
+            face_set = self.create_triangulated_face_set(points, faces)
+            return self.create_shape_representation_from_face_set(face_set)
+
+        faceted_brep = self.builder.faceted_brep(points, faces)
+        return self.create_shape_representation_from_brep(faceted_brep)
+
     def _create_shape_representation(self, context, swept_area):
         """Создание IfcShapeRepresentation"""
         # Создаём IfcShapeRepresentation с обязательным RepresentationIdentifier
@@ -524,22 +900,19 @@ class GeometryBuilder:
         return shape_rep
 
     def associate_representation(self, product_type, shape_rep):
-        """Ассоциация представления с типом продукта через RepresentationMap"""
-        rep_maps = [
-            m
-            for m in self.ifc.by_type("IfcRepresentationMap")
-            if m.MappedRepresentation == shape_rep
-        ]
+        """
+        Ассоциация представления с типом продукта через RepresentationMap
+
+        Уже отображённое представление находится по обратной ссылке
+        IfcShapeRepresentation.RepresentationMap (индекс ifcopenshell, O(1))
+        без перебора всех IfcRepresentationMap документа.
+        """
+        rep_maps = getattr(shape_rep, "RepresentationMap", None)
 
         if not rep_maps:
             rep_map = self.ifc.create_entity(
                 "IfcRepresentationMap",
-                MappingOrigin=self.ifc.create_entity(
-                    "IfcAxis2Placement3D",
-                    Location=self.ifc.create_entity(
-                        "IfcCartesianPoint", Coordinates=[0.0, 0.0, 0.0]
-                    ),
-                ),
+                MappingOrigin=get_interner(self.ifc).axis2placement3d(),
                 MappedRepresentation=shape_rep,
             )
 
@@ -1,11 +1,33 @@
 """
 geometry_converter.py — Конвертация IFC геометрии в Three.js mesh
 Использует ifcopenshell.geom для извлечения вершин и индексов
+
+Пакетный режим (convert_elements_batch) обрабатывает список элементов за один
+проход ifcopenshell.geom.iterator с общими настройками и несколькими потоками;
+ошибка одного элемента не отменяет результаты остальных.
+
+Инстансированный режим (convert_assembly_to_instanced_meshes) отдаёт одну сетку
+на IfcRepresentationMap типа и матрицы 4x4 и цвета экземпляров.
 """
 
+import os
+import sys
+import time
+
 import numpy as np
+from mesh_payload import pack_mesh_data
+from profiling import count
 from utils import get_ifcopenshell
 
+# Потоков iterator по умолчанию (в Pyodide потоков нет)
+DEFAULT_NUM_THREADS = 1 if sys.platform == "emscripten" else max(1, min(4, os.cpu_count() or 1))
+
+# Цвета компонентов сборки по ObjectType
+COMPONENT_COLORS = {"STUD": 0x8B8B8B, "WASHER": 0xA9A9A9, "NUT": 0x696969, "ANCHORBOLT": 0x4F4F4F}
+
+# Общие объекты настроек ifcopenshell.geom по значению weld_vertices
+_settings_cache = {}
+
 
 def _get_ifcopenshell_geom():
     """Ленивый импорт ifcopenshell.geom"""
@@ -20,7 +42,168 @@ def _get_ifcopenshell_geom():
         return None
 
 
-def convert_ifc_to_mesh(ifc_file, element, weld_vertices=True):
+def get_geom_settings(weld_vertices=True):
+    """
+    Общий объект настроек ifcopenshell.geom (создаётся один раз на процесс)
+
+    Args:
+        weld_vertices: Сваривать ли вершины
+
+    Returns:
+        ifcopenshell.geom.settings или None, если geom недоступен
+    """
+    settings = _settings_cache.get(weld_vertices)
+    if settings is None:
+        geom = _get_ifcopenshell_geom()
+        if geom is None:
+            return None
+        settings = geom.settings()
+        settings.set(settings.WELD_VERTICES, weld_vertices)
+        settings.set(settings.USE_WORLD_COORDS, True)
+        _settings_cache[weld_vertices] = settings
+    return settings
+
+
+def _shape_to_mesh(shape, binary=False):
+    """
+    vertices/indices/normals из формы ifcopenshell.geom (None — пустая)
+
+    binary=False — плоские списки Python, True — массивы NumPy для mesh_payload
+    """
+    return _geometry_to_mesh(shape.geometry, binary)
+
+
+def _geometry_to_mesh(geometry, binary=False):
+    """vertices/indices/normals из триангуляции ifcopenshell.geom (None — пустая)"""
+    if not geometry or len(geometry.verts) == 0:
+        return None
+    count("mesh_triangles", len(geometry.faces) // 3)
+    if binary:
+        return {
+            "vertices": np.asarray(geometry.verts, dtype=np.float32),
+            "indices": np.asarray(geometry.faces, dtype=np.uint32),
+            "normals": np.asarray(geometry.normals, dtype=np.float32),
+        }
+    return {
+        "vertices": np.asarray(geometry.verts, dtype=np.float64).tolist(),
+        "indices": np.asarray(geometry.faces).tolist(),
+        "normals": np.asarray(geometry.normals, dtype=np.float64).tolist(),
+    }
+
+
+def _failure(element, error):
+    return {
+        "id": element.id(),
+        "GlobalId": element.GlobalId,
+        "name": f"{element.ObjectType} ({element.Name})",
+        "error": error,
+    }
+
+
+def convert_elements_batch(ifc_file, elements, num_threads=None, weld_vertices=True, binary=False):
+    """
+    Пакетная конвертация элементов за один проход ifcopenshell.geom.iterator
+
+    Все элементы (например, компоненты всей ведомости) обрабатываются одним
+    итератором с общими настройками. Ошибка отдельного элемента попадает в
+    failures и не отменяет результаты остальных.
+
+    Args:
+        ifc_file: IFC документ
+        elements: Список IfcProduct
+        num_threads: Количество потоков iterator (None — DEFAULT_NUM_THREADS)
+        weld_vertices: Сваривать ли вершины
+        binary: Массивы NumPy вместо списков Python (для mesh_payload)
+
+    Returns:
+        dict:
+            - meshes: {id элемента: {vertices, indices, normals}}
+            - failures: [{id, GlobalId, name, error}] для элементов без геометрии
+            - timings: {id элемента: секунды} — время ожидания элемента от итератора
+              (при нескольких потоках — время с выдачи предыдущего элемента)
+            - total_time: Общее время прохода (с)
+            - num_threads: Фактическое количество потоков
+    """
+    num_threads = num_threads or DEFAULT_NUM_THREADS
+    started = time.perf_counter()
+    meshes = {}
+    failures = []
+    timings = {}
+
+    pending = {}
+    for element in elements:
+        if not getattr(element, "Representation", None):
+            failures.append(_failure(element, "нет представления"))
+        else:
+            pending[element.id()] = element
+
+    geom = _get_ifcopenshell_geom()
+    if geom is None and pending:
+        failures.extend(_failure(e, "ifcopenshell.geom недоступен") for e in pending.values())
+        pending = {}
+
+    if pending:
+        settings = get_geom_settings(weld_vertices)
+        if hasattr(geom, "iterator"):
+            _iterate(
+                geom, settings, ifc_file, pending, num_threads, binary, meshes, failures, timings
+            )
+        else:
+            # Сборки без iterator: последовательно, но с общими настройками
+            num_threads = 1
+            for element_id, element in pending.items():
+                element_started = time.perf_counter()
+                error = "пустая геометрия"
+                try:
+                    mesh = _shape_to_mesh(geom.create_shape(settings, element), binary)
+                except Exception as e:
+                    mesh, error = None, str(e)
+                timings[element_id] = time.perf_counter() - element_started
+                if mesh is None:
+                    failures.append(_failure(element, error))
+                else:
+                    meshes[element_id] = mesh
+            pending = {}
+
+    # Элементы, которые iterator так и не выдал
+    failures.extend(_failure(e, "геометрия не получена") for e in pending.values())
+
+    return {
+        "meshes": meshes,
+        "failures": failures,
+        "timings": timings,
+        "total_time": time.perf_counter() - started,
+        "num_threads": num_threads,
+    }
+
+
+def _iterate(geom, settings, ifc_file, pending, num_threads, binary, meshes, failures, timings):
+    """Проход iterator по pending; обработанные элементы удаляются из pending"""
+    iterator = geom.iterator(settings, ifc_file, num_threads, include=list(pending.values()))
+    last = time.perf_counter()
+    try:
+        if not iterator.initialize():
+            return
+        while True:
+            shape = iterator.get()
+            now = time.perf_counter()
+            element = pending.pop(shape.id, None)
+            if element is not None:
+                timings[shape.id] = now - last
+                mesh = _shape_to_mesh(shape, binary)
+                if mesh is None:
+                    failures.append(_failure(element, "пустая геометрия"))
+                else:
+                    meshes[shape.id] = mesh
+            last = now
+            if not iterator.next():
+                break
+    except RuntimeError as e:
+        # Сбой ядра итератора: необработанные элементы остаются в pending
+        print(f"Warning: ifcopenshell.geom.iterator stopped: {e}")
+
+
+def convert_ifc_to_mesh(ifc_file, element, weld_vertices=True, binary=False):
     """
     Конвертация IFC элемента в Three.js mesh данные
 
@@ -28,6 +211,7 @@ def convert_ifc_to_mesh(ifc_file, element, weld_vertices=True):
         ifc_file: IFC документ
         element: IfcEntity (IfcMechanicalFastener или другой)
         weld_vertices: Сваривать ли вершины (уменьшает количество вершин)
+        binary: Массивы NumPy вместо списков Python (для mesh_payload)
 
     Returns:
         dict с vertices, indices, normals или None если геометрия не извлечена
@@ -38,10 +222,7 @@ def convert_ifc_to_mesh(ifc_file, element, weld_vertices=True):
         return None
 
     try:
-        # Настройка параметров
-        settings = geom.settings()
-        settings.set(settings.WELD_VERTICES, weld_vertices)
-        settings.set(settings.USE_WORLD_COORDS, True)
+        settings = get_geom_settings(weld_vertices)
 
         # Проверка наличия геометрии у элемента
         if not hasattr(element, "Representation") or not element.Representation:
@@ -51,24 +232,11 @@ def convert_ifc_to_mesh(ifc_file, element, weld_vertices=True):
         # Создание формы
         shape = geom.create_shape(settings, element)
 
-        # Проверка геометрии
-        if not shape.geometry or len(shape.geometry.verts) == 0:
-            print(f"Warning: Element {element.GlobalId} has empty geometry")
-            return None
-
         # Извлечение геометрии
-        verts = np.array(shape.geometry.verts)
-        faces = np.array(shape.geometry.faces)
-        normals = np.array(shape.geometry.normals)
-
-        # Преобразование индексов граней в плоский список
-        indices = faces.flatten()
-
-        return {
-            "vertices": verts.tolist(),
-            "indices": indices.tolist(),
-            "normals": normals.tolist(),
-        }
+        mesh = _shape_to_mesh(shape, binary)
+        if mesh is None:
+            print(f"Warning: Element {element.GlobalId} has empty geometry")
+        return mesh
 
     except Exception as e:
         print(f"Warning: Could not convert element {element.GlobalId} ({element.ObjectType}): {e}")
@@ -78,29 +246,55 @@ def convert_ifc_to_mesh(ifc_file, element, weld_vertices=True):
         return None
 
 
-def convert_assembly_to_meshes(ifc_file, components, color_map=None, assembly_info=None):
+def convert_assembly_to_meshes(
+    ifc_file,
+    components,
+    color_map=None,
+    assembly_info=None,
+    num_threads=None,
+    batch=None,
+    binary=False,
+):
     """
     Конвертация сборки болта в список Three.js mesh
 
+    Компоненты конвертируются одним проходом convert_elements_batch. Компоненты,
+    геометрию которых получить не удалось, пропускаются и перечисляются в failures.
+
     Args:
         ifc_file: IFC документ
         components: список компонентов (IfcMechanicalFastener)
         color_map: dict {ObjectType: color} для раскраски
         assembly_info: dict с информацией о сборке (bolt_type, diameter, length, material)
+        num_threads: Количество потоков iterator (None — по умолчанию)
+        batch: Готовый результат convert_elements_batch, содержащий компоненты
+               (например, для всей ведомости); None — конвертировать здесь
+        binary: Вернуть бинарный payload (mesh_payload.pack_mesh_data)
 
     Returns:
-        dict с meshes и assembly_info для Three.js
+        dict с meshes, assembly_info, timings ({id: секунды}) и failures
+        (только если есть ошибки) для Three.js
     """
     if color_map is None:
-        color_map = {"STUD": 0x8B8B8B, "WASHER": 0xA9A9A9, "NUT": 0x696969, "ANCHORBOLT": 0x4F4F4F}
+        color_map = COMPONENT_COLORS
 
-    meshes = []
-    geom_failures = []
+    if batch is None:
+        batch = convert_elements_batch(ifc_file, components, num_threads=num_threads, binary=binary)
+    failed_ids = {failure["id"] for failure in batch["failures"]}
 
+    meshes = []
+    timings = {}
+    failures = []
     for component in components:
-        mesh_data = convert_ifc_to_mesh(ifc_file, component)
+        component_id = component.id()
+        mesh_data = batch["meshes"].get(component_id)
+        if component_id in batch["timings"]:
+            timings[component_id] = batch["timings"][component_id]
         if mesh_data is None:
-            geom_failures.append(f"{component.ObjectType} ({component.Name})")
+            if component_id in failed_ids:
+                failures.extend(f for f in batch["failures"] if f["id"] == component_id)
+            else:
+                failures.append(_failure(component, "нет в результате пакетной конвертации"))
             continue
 
         comp_type = component.ObjectType or "UNKNOWN"
@@ -108,8 +302,8 @@ def convert_assembly_to_meshes(ifc_file, components, color_map=None, assembly_in
 
         meshes.append(
             {
-                "id": component.id(),
-                "name": component.Name or f"Component_{component.id()}",
+                "id": component_id,
+                "name": component.Name or f"Component_{component_id}",
                 "vertices": mesh_data["vertices"],
                 "indices": mesh_data["indices"],
                 "normals": mesh_data["normals"],
@@ -118,13 +312,256 @@ def convert_assembly_to_meshes(ifc_file, components, color_map=None, assembly_in
             }
         )
 
-    if geom_failures:
-        print(f"Warning: ifcopenshell.geom failed for: {geom_failures}")
-        print("  Falling back to manual mesh generation")
-        return None  # Возвращаем None для использования fallback
+    result = {"meshes": meshes, "timings": timings}
+    if failures:
+        print(f"Warning: ifcopenshell.geom failed for: {[f['name'] for f in failures]}")
+        result["failures"] = failures
+    if assembly_info:
+        result["assembly_info"] = assembly_info
+
+    return pack_mesh_data(result) if binary else result
+
+
+def convert_assembly_to_meshes_analytic(
+    ifc_file,
+    components,
+    geom_keys,
+    color_map=None,
+    assembly_info=None,
+    segments=None,
+    binary=False,
+):
+    """
+    Конвертация сборки в Three.js mesh через аналитическую тесселяцию (без ifcopenshell.geom)
+
+    Сетка каждого компонента строится GeometryBuilder.tessellate_component по ключу
+    геометрии его типа и переносится в мировые координаты по ObjectPlacement.
+    Формат результата совпадает с convert_assembly_to_meshes.
+
+    Args:
+        ifc_file: IFC документ
+        components: список компонентов (IfcMechanicalFastener)
+        geom_keys: ключи геометрии компонентов (как в TypeFactory.representation_maps)
+        color_map: dict {ObjectType: color} для раскраски
+        assembly_info: dict с информацией о сборке
+        segments: Количество сегментов окружности (None — по умолчанию)
+        binary: Вернуть бинарный payload (mesh_payload.pack_mesh_data)
+
+    Returns:
+        dict с meshes и assembly_info для Three.js
+    """
+    import ifcopenshell.util.placement
+    import ifcopenshell.util.unit
+    from geometry_builder import DEFAULT_CIRCLE_SEGMENTS, GeometryBuilder
+    from mesh_utils import split_vertex_normals
+
+    if color_map is None:
+        color_map = COMPONENT_COLORS
+
+    builder = GeometryBuilder(ifc_file)
+    segments = segments or DEFAULT_CIRCLE_SEGMENTS
+    # Координаты mesh в метрах, как у ifcopenshell.geom
+    unit_scale = ifcopenshell.util.unit.calculate_unit_scale(ifc_file)
+
+    # Одна тесселяция на ключ геометрии (гайки сборки одинаковые)
+    render_meshes = {}
+    meshes = []
+    for component, geom_key in zip(components, geom_keys):
+        if geom_key not in render_meshes:
+            vertices, triangles = builder.tessellate_component(geom_key, segments)
+            render_meshes[geom_key] = split_vertex_normals(vertices, triangles)
+        positions, normals, triangles = render_meshes[geom_key]
+        count("mesh_triangles", len(triangles))
+
+        matrix = ifcopenshell.util.placement.get_local_placement(component.ObjectPlacement)
+        rotation = matrix[:3, :3]
+        world = (positions @ rotation.T + matrix[:3, 3]) * unit_scale
+        world_normals = normals @ rotation.T
+
+        comp_type = component.ObjectType or "UNKNOWN"
+        meshes.append(
+            {
+                "id": component.id(),
+                "name": component.Name or f"Component_{component.id()}",
+                "vertices": world.ravel() if binary else world.ravel().tolist(),
+                "indices": triangles.ravel() if binary else triangles.ravel().tolist(),
+                "normals": world_normals.ravel() if binary else world_normals.ravel().tolist(),
+                "color": color_map.get(comp_type, 0xCCCCCC),
+                "metadata": {"Type": comp_type, "GlobalId": component.GlobalId},
+            }
+        )
 
     result = {"meshes": meshes}
     if assembly_info:
         result["assembly_info"] = assembly_info
 
-    return result
+    return pack_mesh_data(result) if binary else result
+
+
+def _mapped_item(element):
+    """Единственный IfcMappedItem представления элемента или None"""
+    representation = getattr(element, "Representation", None)
+    if not representation:
+        return None
+    items = [
+        item
+        for shape_rep in representation.Representations
+        for item in shape_rep.Items
+        if item.is_a("IfcMappedItem")
+    ]
+    return items[0] if len(items) == 1 else None
+
+
+def convert_assembly_to_instanced_meshes(
+    ifc_file,
+    components,
+    color_map=None,
+    assembly_info=None,
+    geom_keys=None,
+    segments=None,
+    binary=False,
+):
+    """
+    Конвертация компонентов в инстансированные mesh: одна сетка на RepresentationMap
+
+    Компоненты separate режима ссылаются на RepresentationMap своего типа через
+    IfcMappedItem. Геометрия каждой RepresentationMap тесселируется один раз
+    (в координатах представления), а для каждого экземпляра передаются только
+    матрица 4x4 и цвет — ведомость из 1000 болтов даёт несколько уникальных сеток.
+    Компоненты без единственного IfcMappedItem передаются как отдельные сетки
+    в мировых координатах с единичной матрицей.
+
+    Args:
+        ifc_file: IFC документ
+        components: список компонентов (IfcMechanicalFastener)
+        color_map: dict {ObjectType: color} для раскраски
+        assembly_info: dict с информацией о сборке
+        geom_keys: ключи геометрии компонентов для аналитической тесселяции
+                   (None — тесселяция RepresentationMap через ifcopenshell.geom)
+        segments: Количество сегментов окружности аналитической тесселяции
+        binary: Вернуть бинарный payload (mesh_payload.pack_mesh_data)
+
+    Returns:
+        dict для Three.js InstancedMesh:
+            - meshes: сетки с vertices/indices/normals (метры, координаты
+              представления), instance_count, transforms (по 16 чисел на экземпляр,
+              матрица по столбцам, как Matrix4.fromArray в Three.js, метры),
+              colors (цвет каждого экземпляра) и instances ({id, name, GlobalId})
+            - instanced: True
+            - instance_count: общее количество экземпляров
+            - failures: компоненты без геометрии (только если есть)
+            - assembly_info
+    """
+    import ifcopenshell.util.placement
+    import ifcopenshell.util.unit
+
+    if color_map is None:
+        color_map = COMPONENT_COLORS
+
+    unit_scale = ifcopenshell.util.unit.calculate_unit_scale(ifc_file)
+    geom_keys = list(geom_keys) if geom_keys is not None else [None] * len(components)
+
+    # Группировка экземпляров по RepresentationMap (порядок первого появления)
+    groups = {}
+    for component, geom_key in zip(components, geom_keys):
+        item = _mapped_item(component)
+        if item is not None:
+            key = item.MappingSource.id()
+            matrix = ifcopenshell.util.placement.get_local_placement(
+                component.ObjectPlacement
+            ) @ ifcopenshell.util.placement.get_mappeditem_transformation(item)
+        else:
+            key = ("element", component.id())
+            matrix = np.eye(4)
+        group = groups.setdefault(
+            key, {"item": item, "geom_key": geom_key, "components": [], "matrices": []}
+        )
+        group["components"].append(component)
+        group["matrices"].append(matrix)
+
+    meshes = []
+    failures = []
+    for key, group in groups.items():
+        first = group["components"][0]
+        try:
+            mesh = _instanced_source_mesh(ifc_file, group, unit_scale, segments, binary)
+        except Exception as e:
+            mesh, error = None, str(e)
+        else:
+            error = "пустая геометрия"
+        if mesh is None:
+            failures.extend(_failure(c, error) for c in group["components"])
+            continue
+
+        # Перевод переноса в метры: координаты сетки уже в метрах
+        matrices = np.array(group["matrices"], dtype=np.float64)
+        matrices[:, :3, 3] *= unit_scale
+        transforms = matrices.transpose(0, 2, 1).reshape(-1)
+        colors = [color_map.get(c.ObjectType or "UNKNOWN", 0xCCCCCC) for c in group["components"]]
+        comp_type = first.ObjectType or "UNKNOWN"
+        rep_map_id = group["item"].MappingSource.id() if group["item"] else None
+
+        meshes.append(
+            {
+                "id": rep_map_id or first.id(),
+                "name": first.Name or f"Component_{first.id()}",
+                **mesh,
+                "color": colors[0],
+                "metadata": {"Type": comp_type, "RepresentationMap": rep_map_id},
+                "instance_count": len(group["components"]),
+                "transforms": transforms.astype(np.float32) if binary else transforms.tolist(),
+                "colors": colors,
+                "instances": [
+                    {
+                        "id": c.id(),
+                        "name": c.Name or f"Component_{c.id()}",
+                        "GlobalId": c.GlobalId,
+                    }
+                    for c in group["components"]
+                ],
+            }
+        )
+
+    result = {
+        "meshes": meshes,
+        "instanced": True,
+        "instance_count": sum(mesh["instance_count"] for mesh in meshes),
+    }
+    if failures:
+        print(f"Warning: instanced mesh failed for: {[f['name'] for f in failures]}")
+        result["failures"] = failures
+    if assembly_info:
+        result["assembly_info"] = assembly_info
+
+    return pack_mesh_data(result) if binary else result
+
+
+def _instanced_source_mesh(ifc_file, group, unit_scale, segments, binary):
+    """Сетка группы экземпляров в координатах представления (метры)"""
+    item = group["item"]
+    if item is None:
+        # Без IfcMappedItem: сетка элемента в мировых координатах
+        return convert_ifc_to_mesh(ifc_file, group["components"][0], binary=binary)
+
+    if group["geom_key"] is not None:
+        from geometry_builder import DEFAULT_CIRCLE_SEGMENTS, GeometryBuilder
+        from mesh_utils import split_vertex_normals
+
+        vertices, triangles = GeometryBuilder(ifc_file).tessellate_component(
+            group["geom_key"], segments or DEFAULT_CIRCLE_SEGMENTS
+        )
+        positions, normals, triangles = split_vertex_normals(vertices, triangles)
+        count("mesh_triangles", len(triangles))
+        mesh = {
+            "vertices": (positions * unit_scale).ravel(),
+            "indices": triangles.ravel(),
+            "normals": normals.ravel(),
+        }
+        return mesh if binary else {key: array.tolist() for key, array in mesh.items()}
+
+    geom = _get_ifcopenshell_geom()
+    if geom is None:
+        return None
+    # Триангуляция IfcShapeRepresentation без размещения — в координатах представления
+    geometry = geom.create_shape(get_geom_settings(), item.MappingSource.MappedRepresentation)
+    return _geometry_to_mesh(geometry, binary)
@@ -14,6 +14,7 @@ from data.bolt_dimensions import (
     DIAMETER_LIMITS,
     get_bolt_dimensions,
 )
+from data.catalog import BOLT_CATALOG
 from data.fastener_dimensions import (
     NUT_DIM_DATA,
     WASHER_DIM_DATA,
@@ -30,26 +31,27 @@ from data.validation import (
     get_bolt_mass,
     get_thread_length,
     validate_parameters,
+    validate_schedule,
 )
 
 
 # Дополнительные функции для обратной совместимости
 def get_bolt_l1(diameter: int, length: int) -> int:
     """Получить l1 (длина верхнего участка) для болта"""
-    dims = get_bolt_dimensions(diameter, length)
-    return dims["l1"] if dims else None
+    record = BOLT_CATALOG.get(diameter, length)
+    return record.l1 if record else None
 
 
 def get_bolt_l2(diameter: int, length: int) -> int:
     """Получить l2 (длина нижнего горизонтального участка) для болта"""
-    dims = get_bolt_dimensions(diameter, length)
-    return dims["l2"] if dims else None
+    record = BOLT_CATALOG.get(diameter, length)
+    return record.l2 if record else None
 
 
 def get_bolt_l3(diameter: int, length: int) -> int:
     """Получить l3 (длина нижнего участка) для болта"""
-    dims = get_bolt_dimensions(diameter, length)
-    return dims["l3"] if dims else None
+    record = BOLT_CATALOG.get(diameter, length)
+    return record.l3 if record else None
 
 
 __all__ = [
@@ -71,6 +73,7 @@ __all__ = [
     "get_material_name",
     "get_material_properties",
     "validate_parameters",
+    "validate_schedule",
     "get_bolt_hook_length",
     "get_bolt_bend_radius",
     "get_thread_length",
@@ -2,6 +2,11 @@
 ifc_generator.py — Генерация и экспорт IFC файлов
 """
 
+import document_stats
+import ifc_io
+from document_stats import get_document_stats
+from property_views import extract_properties, get_property_views
+
 
 class IFCGenerator:
     """Генератор IFC файлов"""
@@ -65,23 +70,45 @@ class IFCGenerator:
         project.RepresentationContexts = [geometric_context]
 
     def export_to_string(self):
-        """Экспорт в строку"""
-        return self.ifc.write()
+        """Экспорт в строку (в памяти, без временного файла)"""
+        return ifc_io.to_string(self.ifc)
+
+    def export_to_bytes(self, compression=None):
+        """
+        Экспорт в байтовый буфер
+
+        Args:
+            compression: None, 'gzip' или 'ifczip'
+        """
+        return ifc_io.to_bytes(self.ifc, compression=compression)
 
     def export_to_file(self, filepath):
         """Экспорт в файл"""
         self.ifc.write(filepath)
         return filepath
 
-    def get_summary(self):
-        """Получение сводки по документу"""
-        return {
-            "project": self._get_project_info(),
-            "entities_count": len(self.ifc),
-            "entity_types": self._count_entity_types(),
-            "mechanical_fasteners": self._count_fasteners(),
-            "materials": self._count_materials(),
-        }
+    def get_summary(self, verify=None):
+        """
+        Получение сводки по документу
+
+        Счётчики сущностей, болтов и материалов ведутся инкрементально
+        (document_stats) — сводка не обходит документ.
+
+        Args:
+            verify: Сверить счётчики с полным пересчётом документа
+                    (по умолчанию document_stats.VERIFY)
+
+        Raises:
+            RuntimeError: Счётчики расходятся с документом (только при verify)
+        """
+        stats = get_document_stats(self.ifc)
+        if document_stats.VERIFY if verify is None else verify:
+            errors = stats.verify()
+            if errors:
+                raise RuntimeError(
+                    "Статистика документа расходится с содержимым:\n" + "\n".join(errors)
+                )
+        return {"project": self._get_project_info(), **stats.summary()}
 
     def _get_project_info(self):
         """Информация о проекте"""
@@ -97,28 +124,15 @@ class IFCGenerator:
 
     def _count_entity_types(self):
         """Подсчёт типов сущностей"""
-        types = {}
-        for entity in self.ifc:
-            entity_type = entity.is_a()
-            types[entity_type] = types.get(entity_type, 0) + 1
-        return types
+        return get_document_stats(self.ifc).summary()["entity_types"]
 
     def _count_fasteners(self):
         """Подсчёт болтов"""
-        fasteners = self.ifc.by_type("IfcMechanicalFastener")
-        grouped = {}
-        for f in fasteners:
-            ftype = f.ObjectType or "Unknown"
-            grouped[ftype] = grouped.get(ftype, 0) + 1
-        return {"total": len(fasteners), "by_type": grouped}
+        return get_document_stats(self.ifc).summary()["mechanical_fasteners"]
 
     def _count_materials(self):
         """Подсчёт материалов"""
-        materials = self.ifc.by_type("IfcMaterial")
-        return {
-            "total": len(materials),
-            "materials": [{"name": m.Name, "description": m.Description} for m in materials],
-        }
+        return get_document_stats(self.ifc).summary()["materials"]
 
     def validate(self):
         """Базовая валидация документа"""
@@ -143,6 +157,9 @@ class IFCGenerator:
         """
         Извлечение PropertySet для элемента по GlobalId
 
+        Элемент ищется по индексу GlobalId документа, представление
+        кэшируется (property_views.PropertyViews).
+
         Args:
             global_id: GlobalId элемента (строка)
 
@@ -161,125 +178,8 @@ class IFCGenerator:
                 ]
             }
         """
-        # Поиск элемента по GlobalId
-        element = None
-        for entity in self.ifc:
-            if hasattr(entity, "GlobalId") and entity.GlobalId == global_id:
-                element = entity
-                break
-
-        if element is None:
-            return None
-
-        # Получаем IFC тип элемента (конвертируем в строку)
-        ifc_type = str(element.is_a()) if hasattr(element, "is_a") else "Unknown"
-
-        property_sets = []
-
-        # 1. Получение PropertySet через IsDefinedBy (прямые Pset на экземпляре)
-        is_defined_by = getattr(element, "IsDefinedBy", None)
-        if is_defined_by:
-            for rel in is_defined_by:
-                if rel.is_a("IfcRelDefinesByProperties"):
-                    pset = rel.RelatingPropertyDefinition
-                    properties = self._extract_properties(pset)
-                    if properties:
-                        property_sets.append({"name": pset.Name, "properties": properties})
-
-        # 2. Получение PropertySet из типа (через IsTypedBy)
-        # Элементы связаны с типом через IfcRelDefinesByType
-        is_typed_by = getattr(element, "IsTypedBy", None)
-        if is_typed_by:
-            for rel in is_typed_by:
-                if rel.is_a("IfcRelDefinesByType"):
-                    related_type = rel.RelatingType
-
-                    # Получение PropertySet через HasPropertySets на типе
-                    # Это включает и Pset созданные через IfcRelDefinesByProperties
-                    has_property_sets = getattr(related_type, "HasPropertySets", None)
-                    if has_property_sets:
-                        # Конвертируем кортеж в список, если нужно
-                        if isinstance(has_property_sets, tuple):
-                            has_property_sets = list(has_property_sets)
-
-                        # Сначала добавляем PSet экспертиз (начинаются с "МОГЭ_", "СПБ_ГАУ_", "ExpCheck_")
-                        # Затем стандартные PSet (начинаются с "Pset_")
-                        expertise_psets = []
-                        standard_psets = []
-                        other_psets = []
-
-                        for pset in has_property_sets:
-                            properties = self._extract_properties(pset)
-                            if properties:
-                                pset_data = {"name": pset.Name, "properties": properties}
-                                if pset.Name.startswith(("МОГЭ_", "СПБ_ГАУ_", "ExpCheck_")):
-                                    expertise_psets.append(pset_data)
-                                elif pset.Name.startswith("Pset_"):
-                                    standard_psets.append(pset_data)
-                                else:
-                                    other_psets.append(pset_data)
-
-                        # Добавляем в порядке: экспертиза, другие, стандартные
-                        property_sets.extend(expertise_psets)
-                        property_sets.extend(other_psets)
-                        property_sets.extend(standard_psets)
-
-        return {
-            "name": element.Name or element.ObjectType or "Unnamed",
-            "ifc_type": ifc_type,
-            "property_sets": property_sets,
-        }
+        return get_property_views(self.ifc).get(global_id)
 
     def _extract_properties(self, pset):
         """Извлечение свойств из PropertySet"""
-        properties = []
-        has_properties = getattr(pset, "HasProperties", None)
-        if has_properties:
-            for prop in has_properties:
-                value = None
-                prop_type = None
-
-                # Проверяем IfcPropertyEnumeratedValue
-                if prop.is_a("IfcPropertyEnumeratedValue"):
-                    enum_values = getattr(prop, "EnumerationValues", None)
-                    if enum_values and len(enum_values) > 0:
-                        # Берём первое значение из enumeration
-                        first_val = enum_values[0]
-                        if hasattr(first_val, "value"):
-                            value = first_val.value
-                        elif hasattr(first_val, "wrappedValue"):
-                            value = first_val.wrappedValue
-                        else:
-                            value = str(first_val)
-                        prop_type = "IfcPropertyEnumeratedValue"
-                else:
-                    # IfcPropertySingleValue и другие
-                    prop_value = getattr(prop, "NominalValue", None)
-                    if prop_value is not None:
-                        try:
-                            # Пытаемся получить .value для оберток
-                            value = prop_value.value
-                            prop_type = prop_value.is_a()
-                        except (AttributeError, TypeError):
-                            # Если это entity_instance (IfcLengthMeasure и т.д.)
-                            # Конвертируем в float через обёртку
-                            if hasattr(prop_value, "wrappedValue"):
-                                value = prop_value.wrappedValue
-                                prop_type = prop_value.is_a()
-                            else:
-                                # Для простых типов
-                                value = (
-                                    float(prop_value)
-                                    if isinstance(prop_value, (int, float))
-                                    else str(prop_value)
-                                )
-                                prop_type = type(prop_value).__name__
-
-                properties.append(
-                    {
-                        "name": prop.Name,
-                        "value": value,
-                        "type": prop_type,
-                    }
-                )
-        return properties
+        return extract_properties(pset)
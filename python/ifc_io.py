@@ -0,0 +1,142 @@
+"""
+ifc_io.py — Экспорт и импорт IFC документов в памяти
+
+Сериализация без временных файлов (важно для Pyodide и серверных воркеров):
+- to_string / from_string: STEP Physical File (SPF) в виде строки
+- to_bytes / from_bytes: байтовый буфер, опционально gzip или IFCZIP
+
+Для сборок ifcopenshell без file.to_string/file.from_string используется
+запасной путь через временный файл.
+"""
+
+import gzip
+import io
+import os
+import tempfile
+import zipfile
+from typing import Any, Optional
+
+from utils import get_ifcopenshell
+
+# Поддерживаемые режимы сжатия для to_bytes
+COMPRESSION_NONE = None
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_IFCZIP = "ifczip"
+
+# Имя файла модели внутри IFCZIP архива
+IFCZIP_MEMBER_NAME = "anchor_bolt.ifc"
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZIP_MAGIC = b"PK\x03\x04"
+
+
+def _require_ifcopenshell():
+    ifc = get_ifcopenshell()
+    if ifc is None:
+        raise RuntimeError("ifcopenshell не доступен. Убедитесь, что он установлен через micropip.")
+    return ifc
+
+
+def to_string(ifc_doc: Any) -> str:
+    """
+    Сериализация документа в строку SPF без обращения к файловой системе
+
+    Args:
+        ifc_doc: IFC документ (ifcopenshell.file)
+
+    Returns:
+        Содержимое IFC файла
+    """
+    to_string_method = getattr(type(ifc_doc), "to_string", None)
+    if to_string_method is not None:
+        return ifc_doc.to_string()
+
+    # Запасной путь для старых сборок ifcopenshell
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".ifc", delete=False) as tmp:
+        tmp_path = tmp.name
+    try:
+        ifc_doc.write(tmp_path)
+        with open(tmp_path, "r", encoding="utf-8") as f:
+            return f.read()
+    finally:
+        os.unlink(tmp_path)
+
+
+def from_string(spf_content: str) -> Any:
+    """
+    Открытие документа из строки SPF без обращения к файловой системе
+
+    Args:
+        spf_content: Содержимое IFC файла
+
+    Returns:
+        IFC документ (ifcopenshell.file)
+    """
+    ifc = _require_ifcopenshell()
+    from_string_method = getattr(ifc.file, "from_string", None)
+    if from_string_method is not None:
+        return from_string_method(spf_content)
+
+    # Запасной путь для старых сборок ifcopenshell
+    with tempfile.NamedTemporaryFile(
+        mode="w", suffix=".ifc", delete=False, encoding="utf-8"
+    ) as tmp:
+        tmp.write(spf_content)
+        tmp_path = tmp.name
+    try:
+        return ifc.open(tmp_path)
+    finally:
+        os.unlink(tmp_path)
+
+
+def to_bytes(ifc_doc: Any, compression: Optional[str] = COMPRESSION_NONE) -> bytes:
+    """
+    Сериализация документа в байтовый буфер
+
+    Args:
+        ifc_doc: IFC документ
+        compression: None — SPF как есть, 'gzip' — gzip поток,
+                     'ifczip' — ZIP архив с одним .ifc файлом (IFCZIP)
+
+    Returns:
+        Байты IFC файла
+    """
+    data = to_string(ifc_doc).encode("utf-8")
+
+    if compression is COMPRESSION_NONE:
+        return data
+    if compression == COMPRESSION_GZIP:
+        return gzip.compress(data, compresslevel=6)
+    if compression == COMPRESSION_IFCZIP:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(IFCZIP_MEMBER_NAME, data)
+        return buffer.getvalue()
+
+    raise ValueError(f"Неизвестный режим сжатия: {compression}. Доступны: None, 'gzip', 'ifczip'")
+
+
+def from_bytes(data: bytes) -> Any:
+    """
+    Открытие документа из байтового буфера
+
+    Формат определяется по сигнатуре: gzip, IFCZIP (ZIP) или SPF.
+
+    Args:
+        data: Байты IFC файла (bytes, bytearray или memoryview)
+
+    Returns:
+        IFC документ (ifcopenshell.file)
+    """
+    data = bytes(data)
+
+    if data.startswith(_GZIP_MAGIC):
+        data = gzip.decompress(data)
+    elif data.startswith(_ZIP_MAGIC):
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            members = [name for name in archive.namelist() if name.lower().endswith(".ifc")]
+            if not members:
+                raise ValueError("IFCZIP архив не содержит .ifc файла")
+            data = archive.read(members[0])
+
+    return from_string(data.decode("utf-8"))
@@ -2,16 +2,25 @@
 instance_factory.py — Создание инстансов болтов и сборок
 """
 
-from typing import Any, Dict, Optional, Tuple
+import math
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import ifc_io
+from document_stats import get_document_stats, max_entity_id
+from entity_interner import get_interner
 from gost_data import (
     get_material_name,
     get_nut_dimensions,
     get_washer_dimensions,
     validate_parameters,
+    validate_schedule,
 )
 from material_manager import MaterialManager
+from profiling import count, profiling, span
+from property_views import get_property_views
 from protocols import IfcDocumentProtocol, TypeFactoryProtocol
+from relationship_builder import get_relationships
 from type_factory import TypeFactory
 from utils import get_ifcopenshell
 
@@ -26,6 +35,10 @@ class InstanceFactory:
         geometry_type: str = "solid",
         add_standard_pset: bool = True,
         pset_expertise: str = "none",
+        tessellator: str = "geom",
+        geom_threads: Optional[int] = None,
+        mesh_format: str = "lists",
+        mesh_mode: str = "world",
     ):
         self.ifc: IfcDocumentProtocol = ifc_doc
         self.type_factory: TypeFactoryProtocol = type_factory or TypeFactory(
@@ -33,7 +46,17 @@ class InstanceFactory:
             geometry_type=geometry_type,
             add_standard_pset=add_standard_pset,
             pset_expertise=pset_expertise,
+            tessellator=tessellator,
         )
+        # Источник mesh данных: "geom" (ifcopenshell.geom) или "analytic" (NumPy)
+        self.tessellator = tessellator
+        # Потоков ifcopenshell.geom.iterator (None — по умолчанию geometry_converter)
+        self.geom_threads = geom_threads
+        # Формат mesh данных: "lists" (списки Python) или "binary" (mesh_payload)
+        self.mesh_format = mesh_format
+        # Раскладка mesh данных: "world" (сетка на экземпляр) или "instanced"
+        # (сетка на RepresentationMap + матрицы экземпляров)
+        self.mesh_mode = mesh_mode
         self.material_manager = MaterialManager(ifc_doc)
 
     def create_bolt_assembly(
@@ -47,6 +70,9 @@ class InstanceFactory:
         geometry_type="solid",
         add_standard_pset=True,
         pset_expertise="none",
+        placement=None,
+        tag=None,
+        include_mesh=True,
     ):
         """
         Создание полной сборки анкерного болта
@@ -55,6 +81,10 @@ class InstanceFactory:
             assembly_class: Класс сборки ("IfcMechanicalFastener" или "IfcElementAssembly")
             assembly_mode: Режим сборки ("separate" или "unified")
             geometry_type: Тип геометрии ("solid" или "mesh")
+            placement: Положение сборки (x, y, z) или (x, y, z, угол_поворота_град)
+                       в мировой СК, по умолчанию начало координат
+            tag: Марка болта по ведомости (записывается в IfcElement.Tag)
+            include_mesh: Генерировать mesh данные (None в результате если False)
 
         Состав сборки по умолчанию:
         - Типы 1.1, 1.2, 5: шпилька + верхняя шайба + 2 верхних гайки
@@ -66,7 +96,8 @@ class InstanceFactory:
         ifc = get_ifcopenshell()
 
         # Валидация параметров
-        validate_parameters(bolt_type, diameter, length, material)
+        with span("validation"):
+            validate_parameters(bolt_type, diameter, length, material)
 
         # Получение размеров компонентов
         nut_dim = get_nut_dimensions(diameter)
@@ -97,18 +128,19 @@ class InstanceFactory:
         washer_type = None
         plate_type = None
 
-        if assembly_mode == "separate":
-            stud_type = self.type_factory.get_or_create_stud_type(
-                bolt_type, diameter, length, material
-            )
-            nut_type = self.type_factory.get_or_create_nut_type(diameter, material)
-            washer_type = self.type_factory.get_or_create_washer_type(diameter, material)
-            if has_plate:
-                plate_type = self.type_factory.get_or_create_plate_type(diameter, material)
+        with span("types"):
+            if assembly_mode == "separate":
+                stud_type = self.type_factory.get_or_create_stud_type(
+                    bolt_type, diameter, length, material
+                )
+                nut_type = self.type_factory.get_or_create_nut_type(diameter, material)
+                washer_type = self.type_factory.get_or_create_washer_type(diameter, material)
+                if has_plate:
+                    plate_type = self.type_factory.get_or_create_plate_type(diameter, material)
 
-        assembly_type = self.type_factory.get_or_create_assembly_type(
-            bolt_type, diameter, length, material, assembly_class
-        )
+            assembly_type = self.type_factory.get_or_create_assembly_type(
+                bolt_type, diameter, length, material, assembly_class
+            )
 
         # Получение storey для размещения
         storeys = self.ifc.by_type("IfcBuildingStorey")
@@ -119,18 +151,7 @@ class InstanceFactory:
         owner_history = owner_histories[0] if owner_histories else None
 
         # Создание assembly с OwnerHistory
-        assembly_placement = self.ifc.create_entity(
-            "IfcLocalPlacement",
-            PlacementRelTo=None,
-            RelativePlacement=self.ifc.create_entity(
-                "IfcAxis2Placement3D",
-                Location=self.ifc.create_entity("IfcCartesianPoint", Coordinates=[0.0, 0.0, 0.0]),
-                Axis=self.ifc.create_entity("IfcDirection", DirectionRatios=[0.0, 0.0, 1.0]),
-                RefDirection=self.ifc.create_entity(
-                    "IfcDirection", DirectionRatios=[1.0, 0.0, 0.0]
-                ),
-            ),
-        )
+        assembly_placement = self._create_assembly_placement(placement)
 
         # Согласно правилу OJT001: если экземпляр связан с типом через IfcRelDefinesByType
         # и у типа PredefinedType != NOTDEFINED, то PredefinedType у экземпляра должен быть пустым
@@ -143,6 +164,7 @@ class InstanceFactory:
                 Name=assembly_type.Name,
                 ObjectType="ANCHORBOLT",
                 ObjectPlacement=assembly_placement,
+                Tag=tag,
             )
         else:
             assembly = self.ifc.create_entity(
@@ -151,6 +173,7 @@ class InstanceFactory:
                 OwnerHistory=owner_history,
                 Name=assembly_type.Name,
                 ObjectPlacement=assembly_placement,
+                Tag=tag,
                 NominalDiameter=diameter,
                 NominalLength=length,
             )
@@ -170,17 +193,19 @@ class InstanceFactory:
         plate_instances = []
 
         if assembly_mode == "separate":
+            from gost_data import get_thread_length
+
+            # Длина резьбы — одно обращение к каталогу на сборку
+            thread_length = get_thread_length(diameter, length)
+            l0 = thread_length or length
+            stud_bottom = -(length - l0)
+
             # Шпилька
             stud_offset = 0.0
             stud_axis_down = False
             if bolt_type in ("1.1", "1.2"):
-                from gost_data import get_thread_length
-
-                stud_offset = get_thread_length(diameter, length) or 0
+                stud_offset = thread_length or 0
             elif bolt_type in ("2.1", "5"):
-                from gost_data import get_thread_length
-
-                l0 = get_thread_length(diameter, length) or length
                 stud_offset = l0
                 stud_axis_down = True
             stud_placement = self._create_placement(
@@ -240,10 +265,6 @@ class InstanceFactory:
 
             # Нижняя гайка 2
             if has_bottom_nut2:
-                from gost_data import get_thread_length
-
-                l0 = get_thread_length(diameter, length) or length
-                stud_bottom = -(length - l0)
                 nut_bottom2 = self._create_component(
                     "Nut",
                     (0, 0, stud_bottom + 18),
@@ -257,10 +278,6 @@ class InstanceFactory:
 
             # Плита
             if has_plate and plate_type:
-                from gost_data import get_thread_length
-
-                l0 = get_thread_length(diameter, length) or length
-                stud_bottom = -(length - l0)
                 # Плита лежит НА нижней гайке 2: центр на Z = stud_bottom + 18 + nut_height/2 + plate_thickness/2
                 plate_center_z = stud_bottom + 18 + nut_height / 2 + plate_thickness / 2
                 plate = self._create_component(
@@ -276,10 +293,6 @@ class InstanceFactory:
 
             # Нижняя гайка 1
             if has_bottom_nut:
-                from gost_data import get_thread_length
-
-                l0 = get_thread_length(diameter, length) or length
-                stud_bottom = -(length - l0)
                 # Нижняя гайка 1 лежит НА плите: центр на Z = stud_bottom + 18 + nut_height/2 + plate_thickness + nut_height/2
                 nut_bottom_z = stud_bottom + 18 + nut_height / 2 + plate_thickness + nut_height / 2
                 nut_bottom = self._create_component(
@@ -293,60 +306,20 @@ class InstanceFactory:
                 )
                 components.append(nut_bottom)
 
-        # IfcRelDefinesByType
-        self.ifc.create_entity(
-            "IfcRelDefinesByType",
-            GlobalId=ifc.guid.new(),
-            OwnerHistory=owner_history,
-            RelatingType=assembly_type,
-            RelatedObjects=[assembly],
-        )
-        if stud_instances:
-            self.ifc.create_entity(
-                "IfcRelDefinesByType",
-                GlobalId=ifc.guid.new(),
-                OwnerHistory=owner_history,
-                RelatingType=stud_type,
-                RelatedObjects=stud_instances,
-            )
-        if nut_instances:
-            self.ifc.create_entity(
-                "IfcRelDefinesByType",
-                GlobalId=ifc.guid.new(),
-                OwnerHistory=owner_history,
-                RelatingType=nut_type,
-                RelatedObjects=nut_instances,
-            )
-        if washer_instances:
-            self.ifc.create_entity(
-                "IfcRelDefinesByType",
-                GlobalId=ifc.guid.new(),
-                OwnerHistory=owner_history,
-                RelatingType=washer_type,
-                RelatedObjects=washer_instances,
-            )
-        if plate_instances:
-            self.ifc.create_entity(
-                "IfcRelDefinesByType",
-                GlobalId=ifc.guid.new(),
-                OwnerHistory=owner_history,
-                RelatingType=plate_type,
-                RelatedObjects=plate_instances,
-            )
+        # IfcRelDefinesByType и IfcRelContainedInSpatialStructure — сводные отношения
+        # документа: по одному на тип и на этаж (relationship_builder)
+        relationships = get_relationships(self.ifc)
+        relationships.add_type(assembly_type, [assembly])
+        relationships.add_type(stud_type, stud_instances)
+        relationships.add_type(nut_type, nut_instances)
+        relationships.add_type(washer_type, washer_instances)
+        relationships.add_type(plate_type, plate_instances)
 
-        # IfcRelContainedInSpatialStructure
         # Согласно правилам SPS003, SPS005, SPS007:
         # Компоненты сборки (IfcRelAggregates) не должны быть в пространственной структуре.
         # Только главный элемент сборки помещается в IfcRelContainedInSpatialStructure.
         if storey:
-            elements = [assembly]  # Только assembly, без компонентов
-            self.ifc.create_entity(
-                "IfcRelContainedInSpatialStructure",
-                GlobalId=ifc.guid.new(),
-                OwnerHistory=owner_history,
-                RelatingStructure=storey,
-                RelatedElements=elements,
-            )
+            relationships.add_containment(storey, [assembly])
 
         # IfcRelAggregates и IfcRelConnectsElements - ТОЛЬКО для separate
         if assembly_mode == "separate":
@@ -368,26 +341,79 @@ class InstanceFactory:
 
         # Unified mode - булева геометрия
         if assembly_mode == "unified":
-            self._apply_unified_mode(assembly, geometry_type, bolt_type, diameter, length)
+            with span("unified"):
+                self._apply_unified_mode(assembly, geometry_type, bolt_type, diameter, length)
+
+        # Ключи геометрии компонентов (как в TypeFactory.representation_maps)
+        keys_by_id = {
+            **{c.id(): ("stud", bolt_type, diameter, length) for c in stud_instances},
+            **{c.id(): ("washer", diameter) for c in washer_instances},
+            **{c.id(): ("nut", diameter) for c in nut_instances},
+            **{c.id(): ("plate", diameter) for c in plate_instances},
+        }
+        geom_keys = [keys_by_id.get(c.id()) for c in components]
 
         # Mesh data
-        if assembly_mode == "unified":
-            mesh_data = self._generate_mesh_data_unified(
-                assembly, bolt_type, diameter, length, material, assembly.Name
-            )
-        else:
-            mesh_data = self._generate_mesh_data_with_assembly_id(
-                components, bolt_type, diameter, length, material, assembly, assembly.Name
-            )
+        with span("mesh"):
+            if not include_mesh:
+                mesh_data = None
+            elif assembly_mode == "unified":
+                mesh_data = self._generate_mesh_data_unified(
+                    assembly, bolt_type, diameter, length, material, assembly.Name
+                )
+            elif self.mesh_mode == "instanced":
+                mesh_data = self._generate_mesh_data_instanced(
+                    components, geom_keys, bolt_type, diameter, length, material, assembly
+                )
+            elif self.tessellator == "analytic":
+                mesh_data = self._generate_mesh_data_analytic(
+                    components,
+                    geom_keys,
+                    bolt_type,
+                    diameter,
+                    length,
+                    material,
+                    assembly,
+                )
+            else:
+                mesh_data = self._generate_mesh_data_with_assembly_id(
+                    components, bolt_type, diameter, length, material, assembly, assembly.Name
+                )
+
+        # Учёт созданных сущностей в статистике документа (get_summary)
+        get_document_stats(self.ifc).sync()
 
         return {
             "assembly": assembly,
             "stud": stud if assembly_mode == "separate" else None,
             "components": components,
+            "geom_keys": geom_keys,
             "mesh_data": mesh_data,
             "ifc_doc": self.ifc,
         }
 
+    def _create_assembly_placement(self, placement=None):
+        """Создание абсолютного размещения сборки
+
+        Args:
+            placement: (x, y, z) или (x, y, z, угол_поворота_град) вокруг оси Z;
+                       None — начало координат без поворота
+        """
+        coords = [0.0, 0.0, 0.0]
+        ref_direction = [1.0, 0.0, 0.0]
+        if placement is not None:
+            coords = [float(v) for v in placement[:3]]
+            if len(placement) > 3 and placement[3]:
+                angle = math.radians(float(placement[3]))
+                ref_direction = [math.cos(angle), math.sin(angle), 0.0]
+        return self.ifc.create_entity(
+            "IfcLocalPlacement",
+            PlacementRelTo=None,
+            RelativePlacement=get_interner(self.ifc).axis2placement3d(
+                coords, axis=(0.0, 0.0, 1.0), ref_direction=ref_direction
+            ),
+        )
+
     def _create_placement(self, location, axis_down=False, rel_to=None):
         """Создание 3D размещения
 
@@ -407,13 +433,8 @@ class InstanceFactory:
         return self.ifc.create_entity(
             "IfcLocalPlacement",
             PlacementRelTo=rel_to,
-            RelativePlacement=self.ifc.create_entity(
-                "IfcAxis2Placement3D",
-                Location=self.ifc.create_entity("IfcCartesianPoint", Coordinates=coords),
-                Axis=self.ifc.create_entity("IfcDirection", DirectionRatios=[0.0, 0.0, axis_z]),
-                RefDirection=self.ifc.create_entity(
-                    "IfcDirection", DirectionRatios=[1.0, 0.0, 0.0]
-                ),
+            RelativePlacement=get_interner(self.ifc).axis2placement3d(
+                coords, axis=(0.0, 0.0, axis_z), ref_direction=(1.0, 0.0, 0.0)
             ),
         )
 
@@ -477,15 +498,7 @@ class InstanceFactory:
             mapped_item = self.ifc.create_entity(
                 "IfcMappedItem",
                 MappingSource=rep_map,
-                MappingTarget=self.ifc.create_entity(
-                    "IfcCartesianTransformationOperator3D",
-                    Axis1=self.ifc.create_entity("IfcDirection", DirectionRatios=[1.0, 0.0, 0.0]),
-                    Axis2=self.ifc.create_entity("IfcDirection", DirectionRatios=[0.0, 1.0, 0.0]),
-                    LocalOrigin=self.ifc.create_entity(
-                        "IfcCartesianPoint", Coordinates=[0.0, 0.0, 0.0]
-                    ),
-                    Scale=1.0,
-                ),
+                MappingTarget=get_interner(self.ifc).transformation_operator(),
             )
             mapped_items.append(mapped_item)
 
@@ -548,6 +561,7 @@ class InstanceFactory:
         Нужно для BRP002: IfcClosedShell должен быть связным.
         Булевы операции создают вершины в местах касания компонентов,
         но они не имеют одинаковых координат из-за погрешностей вычислений.
+        Поиск соседей выполняется через пространственный хэш (mesh_utils.weld_vertices).
 
         Args:
             verts: Плоский список координат [x1, y1, z1, x2, y2, z2, ...]
@@ -560,42 +574,9 @@ class InstanceFactory:
         if not verts or not faces:
             return verts, faces
 
-        import numpy as np
-
-        # Преобразуем в numpy array для удобства
-        verts_array = np.array(verts).reshape(-1, 3)
+        from mesh_utils import to_flat_lists, weld_vertices
 
-        # Словарь для маппинга вершин: старый индекс -> новый индекс
-        vertex_map = {}
-        # Список представительных вершин
-        unique_verts = []
-
-        for i, vert in enumerate(verts_array):
-            # Ищем ближайшую представительную вершину
-            found = False
-            for j, unique_vert in enumerate(unique_verts):
-                if np.linalg.norm(vert - unique_vert) < tolerance:
-                    vertex_map[i] = j
-                    found = True
-                    break
-
-            if not found:
-                # Добавляем новую представительную вершину
-                vertex_map[i] = len(unique_verts)
-                unique_verts.append(vert)
-
-        # Обновляем грани
-        new_faces = []
-        for i in range(0, len(faces), 3):
-            v0, v1, v2 = faces[i], faces[i + 1], faces[i + 2]
-            new_faces.extend([vertex_map[v0], vertex_map[v1], vertex_map[v2]])
-
-        # Возвращаем плоский список координат представительных вершин
-        new_verts = []
-        for vert in unique_verts:
-            new_verts.extend(vert.tolist())
-
-        return new_verts, new_faces
+        return to_flat_lists(*weld_vertices(verts, faces, tolerance))
 
     def _fix_triangle_orientation(self, verts, faces):
         """
@@ -605,10 +586,9 @@ class InstanceFactory:
         нормали были направлены наружу. Это обеспечивает, что каждое ребро
         используется ровно 1 раз с правильной ориентацией.
 
-        Алгоритм:
-        1. Вычисляем центр масс всех вершин
-        2. Для каждого треугольника вычисляем нормаль
-        3. Если нормаль направлена внутрь (к центру), инвертируем треугольник
+        Ориентация согласуется обходом по общим рёбрам, направление наружу
+        выбирается по знаку объёма (mesh_utils.orient_triangles), поэтому
+        невыпуклые тела (крюк шпильки, отверстие гайки) не портятся.
 
         Args:
             verts: Плоский список координат [x1, y1, z1, ...]
@@ -620,50 +600,15 @@ class InstanceFactory:
         if not verts or not faces:
             return verts, faces
 
-        import numpy as np
-
-        verts_array = np.array(verts).reshape(-1, 3)
+        from mesh_utils import orient_triangles
 
-        # Вычисляем центр масс
-        center = np.mean(verts_array, axis=0)
-
-        new_faces = []
-        for i in range(0, len(faces), 3):
-            v0, v1, v2 = faces[i], faces[i + 1], faces[i + 2]
-
-            p0 = verts_array[v0]
-            p1 = verts_array[v1]
-            p2 = verts_array[v2]
-
-            # Вычисляем нормаль треугольника (правое правило)
-            edge1 = p1 - p0
-            edge2 = p2 - p0
-            normal = np.cross(edge1, edge2)
-
-            # Вектор от центра к треугольнику
-            to_triangle = p0 - center
-
-            # Если нормаль направлена внутрь (скалярное произведение < 0), инвертируем
-            if np.dot(normal, to_triangle) < 0:
-                # Инвертируем порядок вершин
-                new_faces.extend([v0, v2, v1])
-            else:
-                new_faces.extend([v0, v1, v2])
-
-        return verts, new_faces
+        return verts, orient_triangles(verts, faces).ravel().tolist()
 
     def _generate_mesh_data(
-        self, components, bolt_type, diameter, length, material, assembly_name=None
+        self, components, bolt_type, diameter, length, material, assembly_name=None, batch=None
     ):
         """Генерация mesh данных через ifcopenshell.geom"""
-        from geometry_converter import convert_assembly_to_meshes
-
-        color_map = {
-            "STUD": 0x8B8B8B,
-            "WASHER": 0xA9A9A9,
-            "NUT": 0x696969,
-            "ANCHORBOLT": 0x4F4F4F,
-        }
+        from geometry_converter import COMPONENT_COLORS, convert_assembly_to_meshes
 
         # Преобразуем assembly_name в строку Python
         if assembly_name and hasattr(assembly_name, "__str__"):
@@ -680,26 +625,38 @@ class InstanceFactory:
         }
 
         # Конвертация IFC геометрии в Three.js mesh
-        mesh_data = convert_assembly_to_meshes(self.ifc, components, color_map, assembly_info)
+        mesh_data = convert_assembly_to_meshes(
+            self.ifc,
+            components,
+            COMPONENT_COLORS,
+            assembly_info,
+            self.geom_threads,
+            batch,
+            binary=self.mesh_format == "binary",
+        )
 
-        if not mesh_data or not mesh_data.get("meshes"):
+        if not mesh_data["meshes"]:
             print(f"Warning: ifcopenshell.geom failed to generate mesh data")
-            return {"meshes": []}
 
         return mesh_data
 
     def _generate_mesh_data_with_assembly_id(
-        self, components, bolt_type, diameter, length, material, assembly, assembly_name=None
+        self,
+        components,
+        bolt_type,
+        diameter,
+        length,
+        material,
+        assembly,
+        assembly_name=None,
+        batch=None,
     ):
-        """Генерация mesh данных с GlobalId сборки"""
-        from geometry_converter import convert_assembly_to_meshes
-
-        color_map = {
-            "STUD": 0x8B8B8B,
-            "WASHER": 0xA9A9A9,
-            "NUT": 0x696969,
-            "ANCHORBOLT": 0x4F4F4F,
-        }
+        """
+        Генерация mesh данных с GlobalId сборки
+
+        batch — готовый результат convert_elements_batch (пакет всей ведомости)
+        """
+        from geometry_converter import COMPONENT_COLORS, convert_assembly_to_meshes
 
         if assembly_name and hasattr(assembly_name, "__str__"):
             assembly_name = str(assembly_name)
@@ -713,14 +670,75 @@ class InstanceFactory:
             "globalId": assembly.GlobalId,
         }
 
-        mesh_data = convert_assembly_to_meshes(self.ifc, components, color_map, assembly_info)
+        mesh_data = convert_assembly_to_meshes(
+            self.ifc,
+            components,
+            COMPONENT_COLORS,
+            assembly_info,
+            self.geom_threads,
+            batch,
+            binary=self.mesh_format == "binary",
+        )
 
-        if not mesh_data or not mesh_data.get("meshes"):
+        if not mesh_data["meshes"]:
             print(f"Warning: ifcopenshell.geom failed to generate mesh data")
-            return {"meshes": []}
 
         return mesh_data
 
+    def _generate_mesh_data_analytic(
+        self, components, geom_keys, bolt_type, diameter, length, material, assembly
+    ):
+        """Генерация mesh данных аналитической тесселяцией (без ifcopenshell.geom)"""
+        from geometry_converter import COMPONENT_COLORS, convert_assembly_to_meshes_analytic
+
+        assembly_info = {
+            "bolt_type": bolt_type,
+            "diameter": diameter,
+            "length": length,
+            "material": material,
+            "name": (
+                str(assembly.Name) if assembly.Name else f"bolt_{bolt_type}_M{diameter}x{length}"
+            ),
+            "globalId": assembly.GlobalId,
+        }
+
+        return convert_assembly_to_meshes_analytic(
+            self.ifc,
+            components,
+            geom_keys,
+            COMPONENT_COLORS,
+            assembly_info,
+            getattr(self.type_factory, "tessellation_segments", None),
+            binary=self.mesh_format == "binary",
+        )
+
+    def _generate_mesh_data_instanced(
+        self, components, geom_keys, bolt_type, diameter, length, material, assembly
+    ):
+        """Генерация инстансированных mesh данных: сетка на RepresentationMap типа"""
+        from geometry_converter import COMPONENT_COLORS, convert_assembly_to_instanced_meshes
+
+        assembly_info = {
+            "bolt_type": bolt_type,
+            "diameter": diameter,
+            "length": length,
+            "material": material,
+            "name": (
+                str(assembly.Name) if assembly.Name else f"bolt_{bolt_type}_M{diameter}x{length}"
+            ),
+            "globalId": assembly.GlobalId,
+        }
+
+        return convert_assembly_to_instanced_meshes(
+            self.ifc,
+            components,
+            COMPONENT_COLORS,
+            assembly_info,
+            geom_keys if self.tessellator == "analytic" else None,
+            getattr(self.type_factory, "tessellation_segments", None),
+            binary=self.mesh_format == "binary",
+        )
+
     def _apply_unified_mode(self, assembly, geometry_type, bolt_type, diameter, length):
         """Булево объединение геометрии через IfcCSGSolid"""
         from geometry_builder import GeometryBuilder
@@ -887,7 +905,8 @@ class InstanceFactory:
                     settings.set(settings.WELD_VERTICES, True)
                     settings.set(settings.USE_WORLD_COORDS, True)
 
-                    shape = ifcopenshell.geom.create_shape(settings, temp_product)
+                    with span("tessellation"):
+                        shape = ifcopenshell.geom.create_shape(settings, temp_product)
 
                     # Перед удалением temp_product, очищаем temp_shape_rep.Items
                     temp_shape_rep.Items = []
@@ -920,6 +939,7 @@ class InstanceFactory:
                         # Преобразуем в points и triangles
                         points = [tuple(verts_mm[i : i + 3]) for i in range(0, len(verts_mm), 3)]
                         triangles = [list(faces[i : i + 3]) for i in range(0, len(faces), 3)]
+                        count("tessellated_triangles", len(triangles))
 
                         # Создаём IfcFacetedBrep
                         faceted_brep = shape_builder.faceted_brep(points, triangles)
@@ -985,6 +1005,7 @@ class InstanceFactory:
     ):
         """Генерация mesh из IfcCSGSolid"""
         from geometry_converter import convert_ifc_to_mesh
+        from mesh_payload import pack_mesh_data
 
         # Цвет как у шпильки в separate режиме (STUD: 0x8B8B8B)
         color_map = {"ANCHORBOLT": 0x8B8B8B}
@@ -993,11 +1014,12 @@ class InstanceFactory:
         if assembly_name and hasattr(assembly_name, "__str__"):
             assembly_name = str(assembly_name)
 
-        mesh_data = convert_ifc_to_mesh(self.ifc, assembly)
+        binary = self.mesh_format == "binary"
+        mesh_data = convert_ifc_to_mesh(self.ifc, assembly, binary=binary)
         if not mesh_data:
-            return {"meshes": []}
+            return pack_mesh_data({"meshes": []}) if binary else {"meshes": []}
 
-        return {
+        result = {
             "meshes": [
                 {
                     "id": assembly.id(),
@@ -1022,6 +1044,33 @@ class InstanceFactory:
                 "globalId": assembly.GlobalId,
             },
         }
+        return pack_mesh_data(result) if binary else result
+
+
+def _leaves_orphans(assembly_mode: str, geometry_type: str) -> bool:
+    """
+    Может ли генерация оставить осиротевшие сущности
+
+    Faceted-геометрия и unified режим строят временные тела и удаляют их
+    через remove_deep2 — после них документ проверяется сборщиком мусора.
+    """
+    return geometry_type == "faceted" or assembly_mode == "unified"
+
+
+def _count_created_entities(ifc_doc, first_id: Optional[int]) -> None:
+    """Счётчик профилирования: сущности, созданные после first_id (включая удалённые)"""
+    last_id = max_entity_id(ifc_doc)
+    if first_id is not None and last_id is not None:
+        count("entities_created", last_id - first_id)
+
+
+def _property_table(ifc_doc, results: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Таблица свойств сборок и их компонентов (PropertyViews.table)"""
+    return get_property_views(ifc_doc).table(
+        product.GlobalId
+        for result in results
+        for product in (result["assembly"], *result["components"])
+    )
 
 
 def generate_bolt_assembly(
@@ -1031,6 +1080,11 @@ def generate_bolt_assembly(
     geometry_type="solid",
     add_standard_pset=True,
     pset_expertise="none",
+    tessellator="geom",
+    mesh_format="lists",
+    mesh_mode="world",
+    include_properties=False,
+    profile=False,
 ) -> Tuple[str, Dict[str, Any]]:
     """
     Главная функция для генерации болта
@@ -1043,53 +1097,275 @@ def generate_bolt_assembly(
             - material: Материал ('09Г2С', 'ВСт3пс2', '10Г2')
         assembly_class: Класс сборки ('IfcMechanicalFastener' или 'IfcElementAssembly')
         assembly_mode: Режим формирования ('separate' или 'unified')
-        geometry_type: Тип геометрии ('solid' или 'triangulated')
+        geometry_type: Тип геометрии ('solid', 'faceted' или 'triangulated')
         add_standard_pset: Добавлять стандартные PSet (True/False)
         pset_expertise: Добавлять PSet для экспертизы ('none', 'MGE', 'MOGE', 'SPB_GAU_CGE')
+        tessellator: Источник сеток ('geom' — ifcopenshell.geom, 'analytic' — NumPy)
+        mesh_format: Формат mesh данных ('lists' — списки Python,
+                     'binary' — буферы mesh_payload для передачи в JS)
+        mesh_mode: Раскладка mesh данных ('world' — сетка на компонент,
+                   'instanced' — сетка на RepresentationMap и матрицы экземпляров)
+        include_properties: Добавить в mesh_data['properties'] таблицу наборов
+                            свойств сборки и компонентов (PropertyViews.table),
+                            чтобы выбор элемента не требовал запроса к Python
+        profile: Профилировать этапы генерации и добавить отчёт
+                 (profiling.Profiler.report) в mesh_data['profile']
 
     Returns:
         Кортеж (ifc_string, mesh_data):
             - ifc_string: IFC файл в виде строки
             - mesh_data: Данные для 3D визуализации
     """
-    import tempfile
+    from main import collect_garbage, reset_ifc_document
 
-    from main import reset_ifc_document
+    with profiling(profile) as profiler:
+        # Сброс документа: удаление предыдущих болтов
+        with span("reset_document"):
+            ifc_doc = reset_ifc_document()
+        first_id = max_entity_id(ifc_doc)
 
-    # Сброс документа: удаление предыдущих болтов
-    ifc_doc = reset_ifc_document()
+        factory = InstanceFactory(
+            ifc_doc,
+            geometry_type=geometry_type,
+            add_standard_pset=add_standard_pset,
+            pset_expertise=pset_expertise,
+            tessellator=tessellator,
+            mesh_format=mesh_format,
+            mesh_mode=mesh_mode,
+        )
+        with span("assembly"):
+            result = factory.create_bolt_assembly(
+                bolt_type=params["bolt_type"],
+                diameter=params["diameter"],
+                length=params["length"],
+                material=params["material"],
+                assembly_class=assembly_class,
+                assembly_mode=assembly_mode,
+                geometry_type=geometry_type,
+                add_standard_pset=add_standard_pset,
+                pset_expertise=pset_expertise,
+            )
 
-    factory = InstanceFactory(
-        ifc_doc,
-        geometry_type=geometry_type,
-        add_standard_pset=add_standard_pset,
-        pset_expertise=pset_expertise,
-    )
-    result = factory.create_bolt_assembly(
-        bolt_type=params["bolt_type"],
-        diameter=params["diameter"],
-        length=params["length"],
-        material=params["material"],
-        assembly_class=assembly_class,
-        assembly_mode=assembly_mode,
-        geometry_type=geometry_type,
-        add_standard_pset=add_standard_pset,
-        pset_expertise=pset_expertise,
-    )
+        if _leaves_orphans(assembly_mode, geometry_type):
+            with span("garbage_collection"):
+                collect_garbage()
+
+        mesh_data = result["mesh_data"]
+        if include_properties:
+            with span("properties"):
+                mesh_data["properties"] = _property_table(ifc_doc, [result])
+        with span("export"):
+            ifc_str = ifc_io.to_string(ifc_doc)
+        _count_created_entities(ifc_doc, first_id)
+
+    if profiler is not None:
+        mesh_data["profile"] = profiler.report()
+    return (ifc_str, mesh_data)
+
+
+def generate_bolt_schedule(
+    rows: Sequence[Tuple[Dict[str, Any], Optional[Sequence[float]], Optional[str]]],
+    assembly_class="IfcMechanicalFastener",
+    assembly_mode="separate",
+    geometry_type="solid",
+    add_standard_pset=True,
+    pset_expertise="none",
+    include_mesh=True,
+    tessellator="geom",
+    geom_threads=None,
+    mesh_format="lists",
+    mesh_mode="world",
+    include_properties=False,
+    profile=False,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Генерация ведомости болтов в один IFC документ
+
+    В отличие от generate_bolt_assembly документ сбрасывается один раз,
+    все болты создаются одной фабрикой (кэши TypeFactory переиспользуются)
+    и экспорт в SPF выполняется один раз для всей ведомости. Сетки separate
+    режима через ifcopenshell.geom извлекаются одним пакетом для всех
+    компонентов ведомости (convert_elements_batch). В режиме mesh_mode='instanced'
+    для всей ведомости строится один набор инстансированных сеток: по одной
+    на RepresentationMap и матрицы всех экземпляров.
+
+    Args:
+        rows: Список строк ведомости (params, placement, tag):
+            - params: dict с bolt_type, diameter, length, material
+            - placement: (x, y, z) или (x, y, z, угол_поворота_град), None — начало координат
+            - tag: Марка болта (IfcElement.Tag) или None
+        assembly_class: Класс сборки ('IfcMechanicalFastener' или 'IfcElementAssembly')
+        assembly_mode: Режим формирования ('separate' или 'unified')
+        geometry_type: Тип геометрии ('solid', 'faceted' или 'triangulated')
+        add_standard_pset: Добавлять стандартные PSet (True/False)
+        pset_expertise: Добавлять PSet для экспертизы ('none', 'MGE', 'MOGE', 'SPB_GAU_CGE')
+        include_mesh: Генерировать mesh данные для каждого болта
+        tessellator: Источник сеток ('geom' — ifcopenshell.geom, 'analytic' — NumPy)
+        geom_threads: Потоков ifcopenshell.geom.iterator (None — по умолчанию)
+        mesh_format: Формат mesh данных каждого болта ('lists' или 'binary')
+        mesh_mode: 'world' — mesh_data у каждого болта, 'instanced' — общие
+                   инстансированные mesh_data ведомости (separate режим)
+        include_properties: Добавить в schedule_data['properties'] таблицу наборов
+                            свойств всех сборок и компонентов (PropertyViews.table);
+                            наборы свойств типа входят в неё один раз на тип
+        profile: Профилировать этапы генерации и добавить отчёт
+                 (profiling.Profiler.report) в schedule_data['profile']
 
-    # Экспорт во временный файл (для совместимости с ifcopenshell.write)
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ifc", delete=False) as tmp:
-        tmp_path = tmp.name
+    Returns:
+        Кортеж (ifc_string, schedule_data):
+            - ifc_string: IFC файл со всеми болтами ведомости
+            - schedule_data: {'bolts': [...], 'stats': {...}}, где bolts содержит
+              tag, globalId и mesh_data каждого болта (для mesh_mode='instanced' —
+              None, а общие сетки в schedule_data['mesh_data']), а stats — количество болтов,
+              время генерации и экспорта и пропускную способность (болтов/с);
+              для faceted/unified дополнительно entities_reclaimed и bytes_reclaimed
+              сборщика мусора, для пакетной конвертации — geom_time и geom_failures
+
+    Raises:
+        ValueError: Невалидные строки ведомости (проверяются до сброса документа)
+    """
+    from geometry_converter import convert_assembly_to_instanced_meshes, convert_elements_batch
+    from main import collect_garbage, reset_ifc_document
+
+    with profiling(profile) as profiler:
+        started = time.perf_counter()
+
+        # Все строки проверяются одним пакетом до сброса документа
+        with span("validation"):
+            report = validate_schedule([params for params, _, _ in rows])
+        if report["errors"]:
+            first = report["errors"][0]
+            tag = rows[first["row"]][2]
+            message = "\n".join(first["messages"])
+            if len(report["errors"]) > 1:
+                message += f"\nНевалидных строк в ведомости: {len(report['errors'])}"
+            raise ValueError(f"Строка ведомости {first['row']} ({tag or 'без марки'}): {message}")
+
+        # Один сброс документа на всю ведомость
+        with span("reset_document"):
+            ifc_doc = reset_ifc_document()
+        first_id = max_entity_id(ifc_doc)
+
+        factory = InstanceFactory(
+            ifc_doc,
+            geometry_type=geometry_type,
+            add_standard_pset=add_standard_pset,
+            pset_expertise=pset_expertise,
+            tessellator=tessellator,
+            geom_threads=geom_threads,
+            mesh_format=mesh_format,
+        )
 
-    ifc_doc.write(tmp_path)
+        # Общие инстансированные сетки или один проход ifcopenshell.geom по всем компонентам
+        instanced = include_mesh and mesh_mode == "instanced" and assembly_mode == "separate"
+        batch_mesh = (
+            include_mesh and not instanced and tessellator == "geom" and assembly_mode == "separate"
+        )
 
-    # Чтение файла и возврат строки
-    with open(tmp_path, "r") as f:
-        ifc_str = f.read()
+        bolts: List[Dict[str, Any]] = []
+        results: List[Dict[str, Any]] = []
+        # Отношения по типам, этажу и материалам накапливаются и создаются одним
+        # проходом после генерации всех болтов
+        with span("assemblies"), get_relationships(ifc_doc).deferring():
+            for index, (params, placement, tag) in enumerate(rows):
+                try:
+                    result = factory.create_bolt_assembly(
+                        bolt_type=params["bolt_type"],
+                        diameter=params["diameter"],
+                        length=params["length"],
+                        material=params["material"],
+                        assembly_class=assembly_class,
+                        assembly_mode=assembly_mode,
+                        geometry_type=geometry_type,
+                        add_standard_pset=add_standard_pset,
+                        pset_expertise=pset_expertise,
+                        placement=placement,
+                        tag=tag,
+                        include_mesh=include_mesh and not batch_mesh and not instanced,
+                    )
+                except ValueError as e:
+                    raise ValueError(f"Строка ведомости {index} ({tag or 'без марки'}): {e}") from e
+                results.append(result)
+
+                bolts.append(
+                    {
+                        "tag": tag,
+                        "globalId": result["assembly"].GlobalId,
+                        "mesh_data": result["mesh_data"],
+                    }
+                )
 
-    # Очистка временного файла
-    import os
+        batch = None
+        if batch_mesh:
+            with span("mesh"):
+                batch = convert_elements_batch(
+                    ifc_doc,
+                    [c for result in results for c in result["components"]],
+                    geom_threads,
+                    binary=mesh_format == "binary",
+                )
+                for bolt, result, (params, _, _) in zip(bolts, results, rows):
+                    assembly = result["assembly"]
+                    bolt["mesh_data"] = factory._generate_mesh_data_with_assembly_id(
+                        result["components"],
+                        params["bolt_type"],
+                        params["diameter"],
+                        params["length"],
+                        params["material"],
+                        assembly,
+                        assembly.Name,
+                        batch=batch,
+                    )
 
-    os.unlink(tmp_path)
+        schedule_mesh = None
+        if instanced:
+            with span("mesh"):
+                schedule_mesh = convert_assembly_to_instanced_meshes(
+                    ifc_doc,
+                    [c for result in results for c in result["components"]],
+                    geom_keys=(
+                        [key for result in results for key in result["geom_keys"]]
+                        if tessellator == "analytic"
+                        else None
+                    ),
+                    segments=getattr(factory.type_factory, "tessellation_segments", None),
+                    binary=mesh_format == "binary",
+                )
 
-    return (ifc_str, result["mesh_data"])
+        gc_stats = None
+        if _leaves_orphans(assembly_mode, geometry_type):
+            with span("garbage_collection"):
+                gc_stats = collect_garbage()
+
+        generated = time.perf_counter()
+        with span("export"):
+            ifc_str = ifc_io.to_string(ifc_doc)
+        finished = time.perf_counter()
+
+        total_time = finished - started
+        stats = {
+            "count": len(bolts),
+            "generation_time": generated - started,
+            "export_time": finished - generated,
+            "total_time": total_time,
+            "bolts_per_second": len(bolts) / total_time if total_time > 0 else 0.0,
+        }
+        if batch is not None:
+            stats["geom_time"] = batch["total_time"]
+            stats["geom_failures"] = len(batch["failures"])
+        if gc_stats is not None:
+            stats["entities_reclaimed"] = gc_stats["entities_removed"]
+            stats["bytes_reclaimed"] = gc_stats["bytes_reclaimed"]
+
+        schedule_data = {"bolts": bolts, "stats": stats}
+        if schedule_mesh is not None:
+            stats["unique_meshes"] = len(schedule_mesh["meshes"])
+            schedule_data["mesh_data"] = schedule_mesh
+        if include_properties:
+            with span("properties"):
+                schedule_data["properties"] = _property_table(ifc_doc, results)
+        _count_created_entities(ifc_doc, first_id)
+
+    if profiler is not None:
+        schedule_data["profile"] = profiler.report()
+    return (ifc_str, schedule_data)
@@ -7,7 +7,7 @@ main.py — Entry point для Pyodide
 - Улучшенная тестируемость
 """
 
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from document_manager import IFCDocumentManager, get_manager
 
@@ -143,6 +143,35 @@ def list_documents() -> list:
     return manager.list_documents()
 
 
+def collect_garbage(doc_id: Optional[str] = None, dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Удаление осиротевших сущностей документа
+
+    Args:
+        doc_id: Идентификатор документа (по умолчанию текущий)
+        dry_run: Только подсчитать, ничего не удалять
+
+    Returns:
+        Статистика сборки (удалено сущностей и байт)
+    """
+    manager = get_doc_manager()
+    return manager.collect_garbage(doc_id, dry_run=dry_run)
+
+
+def get_leak_metrics(doc_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Метрики утечек документа (рост количества сущностей, итоги сборок)
+
+    Args:
+        doc_id: Идентификатор документа (по умолчанию текущий)
+
+    Returns:
+        Словарь метрик
+    """
+    manager = get_doc_manager()
+    return manager.get_leak_metrics(doc_id)
+
+
 def clear_all_documents() -> None:
     """Очистка всех документов"""
     manager = get_doc_manager()
@@ -12,6 +12,7 @@ IfcMaterialProperties и ассоциаций через IfcRelAssociatesMateria
 from typing import Any, Dict, Optional
 
 from protocols import IfcDocumentProtocol
+from relationship_builder import get_relationships
 from utils import get_ifcopenshell
 
 
@@ -87,23 +88,18 @@ class MaterialManager:
         """
         Ассоциация материала с сущностью через IfcRelAssociatesMaterial
 
+        Все сущности одного материала попадают в одно отношение документа
+        (relationship_builder).
+
         Args:
             entity: IFC сущность (например, IfcMechanicalFastenerType)
             material: IfcMaterial или IfcMaterialList
 
         Returns:
-            IfcRelAssociatesMaterial сущность
+            IfcRelAssociatesMaterial сущность (None в отложенном режиме
+            relationship_builder — отношение создаётся при flush)
         """
-        ifc = get_ifcopenshell()
-        rel = self.ifc.create_entity(
-            "IfcRelAssociatesMaterial",
-            GlobalId=ifc.guid.new(),
-            OwnerHistory=self.owner_history,
-            Name=f"MaterialAssociation_{entity.Name}",
-            RelatedObjects=[entity],
-            RelatingMaterial=material,
-        )
-        return rel
+        return get_relationships(self.ifc).add_material(material, [entity])
 
     def create_material_properties(self, material, pset_name, properties_dict):
         """
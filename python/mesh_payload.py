@@ -0,0 +1,188 @@
+"""
+mesh_payload.py — Бинарный формат mesh данных для передачи в JavaScript
+
+Вместо списков Python (по одному PyProxy на элемент при конвертации в JS)
+сетки всех компонентов упаковываются в три непрерывных буфера:
+- positions: float32, x y z на вершину (метры, как у ifcopenshell.geom)
+- normals: float32, x y z на вершину
+- indices: uint16 (если у каждой сетки не больше 65536 вершин) или uint32,
+  индексы локальные в пределах сетки
+
+Инстансированные mesh данные (convert_assembly_to_instanced_meshes) дополнительно
+содержат буферы экземпляров:
+- transforms: float32, 16 чисел (матрица 4x4 по столбцам) на экземпляр
+- colors: uint32, цвет экземпляра
+
+Буферы отдаются как memoryview: в Pyodide они читаются через
+PyProxy.getBuffer() одним блоком памяти без поэлементной конвертации.
+Рядом лежит небольшой словарь метаданных: id, имя, цвет и смещения каждой сетки.
+
+Пример использования:
+    payload = pack_mesh_data(mesh_data)
+    positions = np.frombuffer(payload["positions"], dtype=np.float32)
+"""
+
+from typing import Any, Dict
+
+import numpy as np
+
+# Идентификатор формата (проверяется на стороне JS)
+PAYLOAD_FORMAT = "abg-mesh/1"
+
+# Максимальное количество вершин сетки для индексов uint16
+UINT16_VERTEX_LIMIT = 1 << 16
+
+# Ключи записи сетки, хранящиеся в буферах
+_BUFFER_KEYS = ("vertices", "indices", "normals", "transforms", "colors")
+
+# Буферы payload
+PAYLOAD_BUFFERS = ("positions", "normals", "indices", "transforms", "colors")
+
+# Ключи смещений в записи сетки payload
+_OFFSET_KEYS = (
+    "vertex_offset",
+    "vertex_count",
+    "index_offset",
+    "index_count",
+    "instance_offset",
+)
+
+
+def is_mesh_payload(data: Any) -> bool:
+    """Является ли data бинарным mesh payload"""
+    return isinstance(data, dict) and data.get("format") == PAYLOAD_FORMAT
+
+
+def pack_mesh_data(mesh_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Упаковка mesh данных в бинарный payload
+
+    Args:
+        mesh_data: {'meshes': [...], ...}; vertices/indices/normals каждой сетки —
+                   плоские списки или массивы NumPy
+
+    Returns:
+        dict:
+            - format: PAYLOAD_FORMAT
+            - positions / normals: memoryview float32
+            - indices: memoryview uint16 или uint32
+            - index_type: 'uint16' или 'uint32'
+            - transforms / colors: memoryview float32 / uint32 (только для
+              инстансированных данных)
+            - meshes: метаданные сеток со смещениями vertex_offset/vertex_count
+              (в вершинах), index_offset/index_count (в индексах) и
+              instance_offset (в экземплярах, для инстансированных данных)
+            - остальные ключи mesh_data (assembly_info, failures, ...) без изменений
+    """
+    if is_mesh_payload(mesh_data):
+        return mesh_data
+
+    positions, normals, indices, records = [], [], [], []
+    transforms, colors = [], []
+    vertex_offset = index_offset = instance_offset = max_vertices = 0
+    meshes = mesh_data.get("meshes", [])
+    instanced = any("transforms" in mesh for mesh in meshes)
+    for mesh in meshes:
+        mesh_positions = np.asarray(mesh["vertices"], dtype=np.float32).reshape(-1)
+        mesh_indices = np.asarray(mesh["indices"], dtype=np.uint32).reshape(-1)
+        mesh_normals = np.asarray(mesh.get("normals", ()), dtype=np.float32).reshape(-1)
+        if len(mesh_normals) != len(mesh_positions):
+            # Без нормалей: нули, JS вычислит нормали сам
+            mesh_normals = np.zeros_like(mesh_positions)
+
+        vertex_count = len(mesh_positions) // 3
+        records.append(
+            {
+                **{key: value for key, value in mesh.items() if key not in _BUFFER_KEYS},
+                "vertex_offset": vertex_offset,
+                "vertex_count": vertex_count,
+                "index_offset": index_offset,
+                "index_count": len(mesh_indices),
+            }
+        )
+        if instanced:
+            mesh_transforms = np.asarray(mesh.get("transforms", ()), dtype=np.float32)
+            records[-1]["instance_offset"] = instance_offset
+            records[-1]["instance_count"] = len(mesh_transforms) // 16
+            transforms.append(mesh_transforms.reshape(-1))
+            colors.append(np.asarray(mesh.get("colors", ()), dtype=np.uint32).reshape(-1))
+            instance_offset += len(mesh_transforms) // 16
+
+        positions.append(mesh_positions)
+        normals.append(mesh_normals)
+        indices.append(mesh_indices)
+        vertex_offset += vertex_count
+        index_offset += len(mesh_indices)
+        max_vertices = max(max_vertices, vertex_count)
+
+    index_dtype = np.uint16 if max_vertices <= UINT16_VERTEX_LIMIT else np.uint32
+    payload = {key: value for key, value in mesh_data.items() if key != "meshes"}
+    payload.update(
+        {
+            "format": PAYLOAD_FORMAT,
+            "positions": memoryview(_concatenate(positions, np.float32)),
+            "normals": memoryview(_concatenate(normals, np.float32)),
+            "indices": memoryview(_concatenate(indices, index_dtype)),
+            "index_type": np.dtype(index_dtype).name,
+            "meshes": records,
+        }
+    )
+    if instanced:
+        payload["transforms"] = memoryview(_concatenate(transforms, np.float32))
+        payload["colors"] = memoryview(_concatenate(colors, np.uint32))
+    return payload
+
+
+def _concatenate(arrays, dtype) -> np.ndarray:
+    if not arrays:
+        return np.zeros(0, dtype=dtype)
+    return np.concatenate(arrays).astype(dtype, copy=False)
+
+
+def unpack_mesh_data(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Обратное преобразование payload в mesh данные с массивами NumPy
+
+    Массивы — представления буферов payload (без копирования).
+
+    Returns:
+        {'meshes': [...], ...} с vertices/indices/normals в виде np.ndarray
+    """
+    positions = np.frombuffer(payload["positions"], dtype=np.float32)
+    normals = np.frombuffer(payload["normals"], dtype=np.float32)
+    indices = np.frombuffer(payload["indices"], dtype=payload["index_type"])
+
+    instanced = "transforms" in payload
+    if instanced:
+        transforms = np.frombuffer(payload["transforms"], dtype=np.float32)
+        colors = np.frombuffer(payload["colors"], dtype=np.uint32)
+
+    meshes = []
+    for record in payload["meshes"]:
+        start = record["vertex_offset"] * 3
+        end = start + record["vertex_count"] * 3
+        index_start = record["index_offset"]
+        index_end = index_start + record["index_count"]
+        mesh = {key: value for key, value in record.items() if key not in _OFFSET_KEYS}
+        mesh["vertices"] = positions[start:end]
+        mesh["normals"] = normals[start:end]
+        mesh["indices"] = indices[index_start:index_end]
+        if instanced:
+            first = record["instance_offset"]
+            last = first + record["instance_count"]
+            mesh["transforms"] = transforms[first * 16 : last * 16]
+            mesh["colors"] = colors[first:last]
+        meshes.append(mesh)
+
+    mesh_data = {
+        key: value
+        for key, value in payload.items()
+        if key not in PAYLOAD_BUFFERS and key not in ("format", "index_type", "meshes")
+    }
+    mesh_data["meshes"] = meshes
+    return mesh_data
+
+
+def payload_nbytes(payload: Dict[str, Any]) -> int:
+    """Суммарный размер буферов payload в байтах"""
+    return sum(payload[key].nbytes for key in PAYLOAD_BUFFERS if key in payload)
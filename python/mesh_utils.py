@@ -0,0 +1,411 @@
+"""
+mesh_utils.py — Векторизованные операции над треугольными сетками
+
+Используется при построении IfcFacetedBrep для unified режима:
+- weld_vertices: сварка близких вершин через пространственный хэш (BRP002)
+- orient_triangles: согласованная внешняя ориентация треугольников (GEM001)
+- split_vertex_normals: нормали для визуализации с разделением по острым рёбрам
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+# Смещения соседних ячеек пространственного хэша (3×3×3)
+_NEIGHBOR_OFFSETS = np.array(
+    [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)],
+    dtype=np.int64,
+)
+
+
+def _as_vertex_array(verts) -> np.ndarray:
+    """Плоский список координат или массив (N, 3) → float64 массив (N, 3)"""
+    return np.asarray(verts, dtype=np.float64).reshape(-1, 3)
+
+
+def _expand_ranges(starts: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Разворачивание диапазонов [start, start + count) в плоский массив
+
+    Returns:
+        Кортеж (owner, values): номер диапазона и значение для каждого элемента
+    """
+    total = int(counts.sum())
+    owner = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owner, starts[owner] + offsets
+
+
+def _find_close_pairs(points: np.ndarray, tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Поиск пар вершин (i, j), j < i, расстояние между которыми меньше допуска
+
+    Вершины раскладываются по ячейкам сетки с шагом tolerance, поэтому
+    кандидаты на сварку находятся только в 27 соседних ячейках.
+    Координаты ячеек сжимаются по рангу по каждой оси, чтобы ключ ячейки
+    помещался в int64 при любых размерах модели. Поиск соседних ячеек
+    выполняется по отсортированным ключам, что сохраняет локальность памяти.
+
+    Args:
+        points: Массив вершин (N, 3)
+        tolerance: Допуск сварки
+
+    Returns:
+        Кортеж массивов (i, j) индексов пар
+    """
+    cells = np.floor(points / tolerance).astype(np.int64)
+
+    axis_values = []
+    ranks = np.empty_like(cells)
+    for axis in range(3):
+        values, inverse = np.unique(cells[:, axis], return_inverse=True)
+        axis_values.append(values)
+        ranks[:, axis] = inverse.ravel()
+    sizes = [len(values) for values in axis_values]
+
+    def cell_key(r):
+        return (r[:, 0] * sizes[1] + r[:, 1]) * sizes[2] + r[:, 2]
+
+    # Вершины, отсортированные по ячейкам; уникальные ячейки и их диапазоны
+    keys = cell_key(ranks)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    cell_keys, cell_starts, cell_counts = np.unique(
+        sorted_keys, return_index=True, return_counts=True
+    )
+    cell_ranks = ranks[order[cell_starts]]
+
+    # Ранг соседнего значения (value + shift) по каждой оси, -1 если такой ячейки нет
+    shifted_ranks = {}
+    for axis in range(3):
+        values = axis_values[axis]
+        for shift in (-1, 1):
+            target = values + shift
+            rank = np.minimum(np.searchsorted(values, target), sizes[axis] - 1)
+            shifted_ranks[axis, shift] = np.where(values[rank] == target, rank, -1)
+
+    pairs_i = []
+    pairs_j = []
+    for offset in _NEIGHBOR_OFFSETS:
+        neighbor_ranks = cell_ranks.copy()
+        for axis in range(3):
+            if offset[axis] != 0:
+                neighbor_ranks[:, axis] = shifted_ranks[axis, int(offset[axis])][
+                    cell_ranks[:, axis]
+                ]
+        source = np.nonzero((neighbor_ranks >= 0).all(axis=1))[0]
+
+        # Ключи соседей монотонны вместе с cell_keys — searchsorted по возрастанию
+        neighbor_keys = cell_key(neighbor_ranks[source])
+        target = np.minimum(np.searchsorted(cell_keys, neighbor_keys), len(cell_keys) - 1)
+        found = cell_keys[target] == neighbor_keys
+        source, target = source[found], target[found]
+        if len(source) == 0:
+            continue
+
+        # Все пары вершин (ячейка source) × (ячейка target)
+        owner, slot_i = _expand_ranges(cell_starts[source], cell_counts[source])
+        inner, slot_j = _expand_ranges(cell_starts[target[owner]], cell_counts[target[owner]])
+        cand_i = order[slot_i[inner]]
+        cand_j = order[slot_j]
+
+        mask = cand_j < cand_i
+        cand_i, cand_j = cand_i[mask], cand_j[mask]
+        dist_sq = np.sum((points[cand_i] - points[cand_j]) ** 2, axis=1)
+        close = dist_sq < tolerance * tolerance
+        pairs_i.append(cand_i[close])
+        pairs_j.append(cand_j[close])
+
+    if not pairs_i:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+
+def _resolve_representatives(n: int, pairs_i: np.ndarray, pairs_j: np.ndarray) -> np.ndarray:
+    """
+    Выбор представительной вершины для каждой вершины
+
+    Повторяет семантику последовательного алгоритма: вершины просматриваются
+    по порядку, вершина привязывается к первой (по индексу) представительной
+    вершине ближе допуска, иначе сама становится представительной.
+    Решение принимается раундами: вершина решается, когда решены все её
+    более ранние соседи. Число раундов равно длине самой длинной цепочки
+    близких вершин (на практике 1–2).
+
+    Returns:
+        Массив rep (N,) — индекс представительной вершины для каждой вершины
+    """
+    rep = np.arange(n, dtype=np.int64)
+    if len(pairs_i) == 0:
+        return rep
+
+    # Сортировка пар по (i, j): первая пара с представительным j даёт минимальный j
+    order = np.lexsort((pairs_j, pairs_i))
+    pairs_i, pairs_j = pairs_i[order], pairs_j[order]
+
+    undecided = np.zeros(n, dtype=bool)
+    undecided[pairs_i] = True
+    is_rep = ~undecided
+
+    while undecided.any():
+        blocked = np.bincount(pairs_i[undecided[pairs_j]], minlength=n) > 0
+        ready = undecided & ~blocked
+
+        ready_pairs = ready[pairs_i] & is_rep[pairs_j]
+        cand_i, cand_j = pairs_i[ready_pairs], pairs_j[ready_pairs]
+        first = np.ones(len(cand_i), dtype=bool)
+        first[1:] = cand_i[1:] != cand_i[:-1]
+        rep[cand_i[first]] = cand_j[first]
+
+        merged = np.zeros(n, dtype=bool)
+        merged[cand_i[first]] = True
+        is_rep |= ready & ~merged
+        undecided &= ~ready
+
+    return rep
+
+
+def weld_vertices(verts, faces, tolerance: float = 0.01) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Сварка вершин, расстояние между которыми меньше допуска
+
+    Векторизованная замена попарного сравнения O(n²): кандидаты ищутся
+    через пространственный хэш с ячейкой размером tolerance, общая
+    сложность O(n log n). Семантика допуска совпадает с последовательным
+    алгоритмом: вершина привязывается к первой представительной вершине
+    с расстоянием строго меньше tolerance, координаты представительной
+    вершины сохраняются без усреднения.
+
+    Args:
+        verts: Плоский список координат [x1, y1, z1, ...] или массив (N, 3)
+        faces: Плоский список индексов [v0, v1, v2, ...] или массив (M, 3)
+        tolerance: Допуск сварки (в единицах координат)
+
+    Returns:
+        Кортеж (new_verts, new_faces): массив вершин (K, 3) float64
+        и массив треугольников (M, 3) int64
+    """
+    if tolerance <= 0:
+        raise ValueError(f"Допуск сварки должен быть положительным: {tolerance}")
+
+    points = _as_vertex_array(verts)
+    triangles = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    if len(points) == 0:
+        return points, triangles
+
+    pairs_i, pairs_j = _find_close_pairs(points, tolerance)
+    rep = _resolve_representatives(len(points), pairs_i, pairs_j)
+
+    is_rep = rep == np.arange(len(points))
+    new_index = np.cumsum(is_rep) - 1
+    return points[is_rep], new_index[rep][triangles]
+
+
+def to_flat_lists(verts: np.ndarray, faces: np.ndarray) -> Tuple[list, list]:
+    """Массивы вершин и граней → плоские списки Python (формат ifcopenshell.geom)"""
+    return np.asarray(verts).ravel().tolist(), np.asarray(faces).ravel().tolist()
+
+
+def _triangle_adjacency(triangles: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Смежность треугольников через общие рёбра
+
+    Учитываются только многообразные рёбра (ровно две грани). Для каждой пары
+    смежных граней вычисляется признак: нужно ли инвертировать одну грань
+    относительно другой, чтобы общее ребро обходилось в противоположных
+    направлениях.
+
+    Returns:
+        Кортеж (face_a, face_b, flip): массивы пар граней и признаков (bool)
+    """
+    face_count = len(triangles)
+    start = triangles.ravel()
+    end = triangles[:, [1, 2, 0]].ravel()
+    owner = np.repeat(np.arange(face_count), 3)
+
+    low = np.minimum(start, end)
+    high = np.maximum(start, end)
+    forward = start < end
+    edge_keys = low * (int(triangles.max()) + 1) + high
+
+    order = np.argsort(edge_keys, kind="stable")
+    sorted_keys = edge_keys[order]
+    group_start = np.ones(len(order), dtype=bool)
+    group_start[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    group_id = np.cumsum(group_start) - 1
+    group_size = np.bincount(group_id)
+
+    # Первая полурёберная запись каждой многообразной пары
+    first = np.nonzero(group_start & (group_size[group_id] == 2))[0]
+    a, b = order[first], order[first + 1]
+    # Одинаковое направление общего ребра → грани ориентированы несогласованно
+    return owner[a], owner[b], forward[a] == forward[b]
+
+
+def _propagate_orientation(
+    face_count: int, face_a: np.ndarray, face_b: np.ndarray, flip: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Обход в ширину по смежности граней с распространением инверсии
+
+    Каждый уровень BFS обрабатывается векторно (CSR-представление графа),
+    суммарная работа O(F). Для несогласуемых (неориентируемых) участков
+    побеждает первая достигнутая ориентация.
+
+    Returns:
+        Кортеж (flipped, component): признак инверсии грани и номер компоненты связности
+    """
+    # CSR: для каждой грани список (сосед, признак инверсии), рёбра в обе стороны
+    src = np.concatenate([face_a, face_b])
+    dst = np.concatenate([face_b, face_a])
+    rel = np.concatenate([flip, flip])
+    order = np.argsort(src, kind="stable")
+    dst, rel = dst[order], rel[order]
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(src, minlength=face_count))])
+
+    flipped = np.zeros(face_count, dtype=bool)
+    component = np.full(face_count, -1, dtype=np.int64)
+    next_seed = 0
+    label = 0
+
+    while True:
+        unvisited = np.nonzero(component[next_seed:] < 0)[0]
+        if len(unvisited) == 0:
+            break
+        seed = next_seed + int(unvisited[0])
+        next_seed = seed + 1
+        component[seed] = label
+        frontier = np.array([seed], dtype=np.int64)
+
+        while len(frontier):
+            counts = offsets[frontier + 1] - offsets[frontier]
+            owner, slots = _expand_ranges(offsets[frontier], counts)
+            neighbors = dst[slots]
+            parents = frontier[owner]
+
+            new = component[neighbors] < 0
+            neighbors, parents, slots = neighbors[new], parents[new], slots[new]
+            # Сосед может встретиться несколько раз за уровень — берём первое вхождение
+            neighbors, first = np.unique(neighbors, return_index=True)
+            flipped[neighbors] = flipped[parents[first]] ^ rel[slots[first]]
+            component[neighbors] = label
+            frontier = neighbors
+
+        label += 1
+
+    return flipped, component
+
+
+def orient_triangles(verts, faces) -> np.ndarray:
+    """
+    Согласованная внешняя ориентация треугольников замкнутых оболочек
+
+    1. Ориентация согласуется по общим рёбрам обходом в ширину:
+       каждое многообразное ребро обходится соседними гранями в
+       противоположных направлениях (GEM001).
+    2. Для каждой компоненты связности знак ориентированного объёма
+       определяет, направлены ли нормали наружу; при отрицательном
+       объёме компонента инвертируется целиком.
+
+    В отличие от сравнения с центром масс, корректно работает для
+    невыпуклых тел (крюк шпильки, отверстие гайки). Все вычисления
+    векторные. Обход в ширину — O(F), но сопоставление рёбер выполняется
+    сортировкой ключей (argsort), поэтому общая сложность O(F log F), а не
+    O(F): хеш-таблица рёбер требует цикла Python по граням, который на
+    сетках болтов медленнее векторной сортировки.
+
+    Args:
+        verts: Плоский список координат [x1, y1, z1, ...] или массив (N, 3)
+        faces: Плоский список индексов [v0, v1, v2, ...] или массив (M, 3)
+
+    Returns:
+        Массив треугольников (M, 3) int64 с исправленной ориентацией
+    """
+    points = _as_vertex_array(verts)
+    triangles = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    if len(triangles) == 0:
+        return triangles.copy()
+
+    face_a, face_b, flip = _triangle_adjacency(triangles)
+    flipped, component = _propagate_orientation(len(triangles), face_a, face_b, flip)
+
+    oriented = triangles.copy()
+    oriented[flipped] = oriented[flipped][:, [0, 2, 1]]
+
+    # Ориентированный объём компоненты: сумма p0 · (p1 × p2) / 6
+    p0, p1, p2 = (points[oriented[:, k]] for k in range(3))
+    signed = np.einsum("ij,ij->i", p0, np.cross(p1, p2))
+    volume = np.bincount(component, weights=signed)
+    inward = volume[component] < 0
+    oriented[inward] = oriented[inward][:, [0, 2, 1]]
+    return oriented
+
+
+def split_vertex_normals(
+    verts, faces, crease_angle: float = 30.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Вершинные нормали для визуализации с разделением вершин на острых рёбрах
+
+    Нормаль угла треугольника — сумма нормалей (с весом по площади) смежных
+    по вершине треугольников, отклоняющихся от него не более чем на crease_angle.
+    Вершины с разными нормалями дублируются: цилиндры остаются гладкими,
+    а рёбра граней гайки и края торцов — острыми.
+
+    Args:
+        verts: Вершины (N, 3) или плоский список
+        faces: Треугольники (M, 3) или плоский список индексов
+        crease_angle: Угол острого ребра (градусы)
+
+    Returns:
+        Кортеж (positions (K, 3), normals (K, 3), triangles (M, 3))
+    """
+    points = _as_vertex_array(verts)
+    triangles = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    if len(triangles) == 0:
+        return points[:0], points[:0], triangles
+
+    corners = points[triangles]
+    face_normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(face_normals, axis=1)
+    unit_normals = face_normals / np.where(lengths > 0, lengths, 1.0)[:, None]
+
+    # Углы треугольников, сгруппированные по вершине
+    corner_vertex = triangles.ravel()
+    corner_face = np.repeat(np.arange(len(triangles)), 3)
+    order = np.argsort(corner_vertex, kind="stable")
+    sorted_vertex = corner_vertex[order]
+    group_start = np.flatnonzero(np.r_[True, sorted_vertex[1:] != sorted_vertex[:-1]])
+    group_count = np.diff(np.r_[group_start, len(order)])
+    group = np.repeat(np.arange(len(group_start)), group_count)
+
+    # Все пары углов одной вершины
+    owner, partner = _expand_ranges(group_start[group], group_count[group])
+    owner_face = corner_face[order[owner]]
+    partner_face = corner_face[order[partner]]
+    cos_limit = math.cos(math.radians(crease_angle)) - 1e-9
+    smooth = (
+        np.einsum("ij,ij->i", unit_normals[owner_face], unit_normals[partner_face]) >= cos_limit
+    )
+
+    corner_normals = np.zeros((len(order), 3))
+    for axis in range(3):
+        corner_normals[:, axis] = np.bincount(
+            owner[smooth],
+            weights=face_normals[partner_face[smooth], axis],
+            minlength=len(order),
+        )
+    norms = np.linalg.norm(corner_normals, axis=1)
+    corner_normals /= np.where(norms > 0, norms, 1.0)[:, None]
+
+    # Дублирование вершин с разными нормалями
+    keys = np.column_stack([sorted_vertex, np.round(corner_normals * 1e6)])
+    unique_keys, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    new_index = np.empty(len(order), dtype=np.int64)
+    new_index[order] = inverse.ravel()
+
+    positions = points[unique_keys[:, 0].astype(np.int64)]
+    normals = corner_normals[first]
+    return positions, normals, new_index.reshape(-1, 3)
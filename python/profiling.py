@@ -0,0 +1,173 @@
+"""
+profiling.py — Профилирование этапов генерации
+
+Этапы конвейера (валидация, типы TypeFactory, геометрия GeometryBuilder,
+тесселяция, сетки geometry_converter, экспорт SPF) размечаются спанами —
+контекстными менеджерами с таймером perf_counter_ns, а события — счётчиками
+(созданные сущности, попадания в кэши, треугольники тесселяции).
+
+Пока профилирование не включено, span() возвращает общий пустой контекстный
+менеджер, а count() сразу возвращается — разметка в горячих путях почти
+ничего не стоит. Включается на время вызова через profiling():
+
+    with profiling() as profiler:
+        with span("export"):
+            ...
+        count("triangles", 128)
+    report = profiler.report()
+
+Вложенные спаны записываются путями через "/" ("assembly/types/geometry"),
+для каждого пути — количество вызовов, полное и собственное время (без
+вложенных спанов).
+"""
+
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Any, Dict, Iterator, List, Optional
+
+# Активный профилировщик (None — профилирование выключено)
+_active: Optional["Profiler"] = None
+
+
+class _NullSpan:
+    """Пустой спан при выключенном профилировании"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Спан этапа: замер времени и запись в профилировщик"""
+
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self._profiler = profiler
+        self._name = name
+        self._start = 0
+
+    def __enter__(self) -> "_Span":
+        profiler = self._profiler
+        profiler._stack.append(self._name)
+        profiler._children.append(0)
+        self._start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        elapsed = perf_counter_ns() - self._start
+        profiler = self._profiler
+        path = "/".join(profiler._stack)
+        profiler._stack.pop()
+        children = profiler._children.pop()
+        if profiler._children:
+            profiler._children[-1] += elapsed
+
+        record = profiler.stages.get(path)
+        if record is None:
+            profiler.stages[path] = [1, elapsed, elapsed - children]
+        else:
+            record[0] += 1
+            record[1] += elapsed
+            record[2] += elapsed - children
+
+
+class Profiler:
+    """Накопитель спанов и счётчиков одного профилируемого вызова"""
+
+    def __init__(self):
+        # путь спана -> [вызовы, полное время нс, собственное время нс]
+        self.stages: Dict[str, List[int]] = {}
+        self.counters: Dict[str, int] = {}
+        self._stack: List[str] = []
+        self._children: List[int] = []
+        self._started = perf_counter_ns()
+        self._finished: Optional[int] = None
+
+    def stop(self) -> None:
+        """Завершение замера общего времени"""
+        if self._finished is None:
+            self._finished = perf_counter_ns()
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Отчёт по этапам
+
+        Returns:
+            Словарь:
+                - total_ms: общее время профилируемого вызова
+                - stages: [{'name', 'calls', 'total_ms', 'self_ms', 'share'}]
+                  в порядке первого входа; share — доля полного времени этапа
+                  в общем времени
+                - counters: счётчики событий
+        """
+        finished = self._finished if self._finished is not None else perf_counter_ns()
+        total = finished - self._started
+        return {
+            "total_ms": total / 1e6,
+            "stages": [
+                {
+                    "name": name,
+                    "calls": calls,
+                    "total_ms": elapsed / 1e6,
+                    "self_ms": own / 1e6,
+                    "share": elapsed / total if total else 0.0,
+                }
+                for name, (calls, elapsed, own) in self.stages.items()
+            ],
+            "counters": dict(self.counters),
+        }
+
+
+def span(name: str) -> Any:
+    """Спан этапа (пустой, если профилирование выключено)"""
+    profiler = _active
+    if profiler is None:
+        return _NULL_SPAN
+    return _Span(profiler, name)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Увеличение счётчика события (ничего не делает без профилирования)"""
+    profiler = _active
+    if profiler is None:
+        return
+    profiler.counters[name] = profiler.counters.get(name, 0) + value
+
+
+def is_enabled() -> bool:
+    """Включено ли профилирование"""
+    return _active is not None
+
+
+@contextmanager
+def profiling(enabled: bool = True) -> Iterator[Optional[Profiler]]:
+    """
+    Профилирование на время блока
+
+    Args:
+        enabled: False — блок выполняется без профилирования (yield None)
+
+    Yields:
+        Profiler или None
+    """
+    global _active
+    if not enabled:
+        yield None
+        return
+
+    previous = _active
+    profiler = Profiler()
+    _active = profiler
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        _active = previous
@@ -0,0 +1,288 @@
+"""
+property_views.py — Кэш представлений наборов свойств элементов IFC
+
+Панель свойств запрашивает PropertySet элемента по GlobalId на каждый клик.
+Элемент находится через индекс GlobalId документа (by_guid, O(1)) вместо
+обхода всех сущностей, а извлечённое представление наборов свойств
+кэшируется:
+- наборы свойств типа (HasPropertySets) извлекаются и упорядочиваются один
+  раз на тип и используются всеми его экземплярами;
+- представление элемента хранится по GlobalId вместе с сигнатурой его
+  наборов свойств (отношения IsDefinedBy, тип и наборы типа). Изменение
+  состава наборов свойств или удаление элемента обнаруживается при
+  обращении, и представление строится заново.
+
+Изменение значений свойств в существующих наборах сигнатурой не
+отслеживается — после него вызывается invalidate_property_views(doc).
+
+Для передачи в JS вместе с результатом генерации представления собираются
+в компактную таблицу (table): наборы свойств типа сериализуются один раз на
+тип, а элементы ссылаются на свои типы по GlobalId. Представление элемента
+из таблицы восстанавливает resolve_property_table (в JS —
+js/utils/propertyTable.js).
+
+Пример использования:
+    views = get_property_views(ifc_doc)
+    view = views.get(global_id)  # None — элемент не найден
+    table = views.table([global_id])
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils import document_cache
+
+# Префиксы наборов свойств экспертиз (выводятся первыми)
+EXPERTISE_PREFIXES = ("МОГЭ_", "СПБ_ГАУ_", "ExpCheck_")
+
+
+def extract_properties(pset: Any) -> List[Dict[str, Any]]:
+    """Извлечение свойств из PropertySet"""
+    properties = []
+    has_properties = getattr(pset, "HasProperties", None)
+    if has_properties:
+        for prop in has_properties:
+            value = None
+            prop_type = None
+
+            # Проверяем IfcPropertyEnumeratedValue
+            if prop.is_a("IfcPropertyEnumeratedValue"):
+                enum_values = getattr(prop, "EnumerationValues", None)
+                if enum_values and len(enum_values) > 0:
+                    # Берём первое значение из enumeration
+                    first_val = enum_values[0]
+                    if hasattr(first_val, "value"):
+                        value = first_val.value
+                    elif hasattr(first_val, "wrappedValue"):
+                        value = first_val.wrappedValue
+                    else:
+                        value = str(first_val)
+                    prop_type = "IfcPropertyEnumeratedValue"
+            else:
+                # IfcPropertySingleValue и другие
+                prop_value = getattr(prop, "NominalValue", None)
+                if prop_value is not None:
+                    try:
+                        # Пытаемся получить .value для оберток
+                        value = prop_value.value
+                        prop_type = prop_value.is_a()
+                    except (AttributeError, TypeError):
+                        # Если это entity_instance (IfcLengthMeasure и т.д.)
+                        # Конвертируем в float через обёртку
+                        if hasattr(prop_value, "wrappedValue"):
+                            value = prop_value.wrappedValue
+                            prop_type = prop_value.is_a()
+                        else:
+                            # Для простых типов
+                            value = (
+                                float(prop_value)
+                                if isinstance(prop_value, (int, float))
+                                else str(prop_value)
+                            )
+                            prop_type = type(prop_value).__name__
+
+            properties.append(
+                {
+                    "name": prop.Name,
+                    "value": value,
+                    "type": prop_type,
+                }
+            )
+    return properties
+
+
+def _pset_view(pset: Any) -> Optional[Dict[str, Any]]:
+    properties = extract_properties(pset)
+    return {"name": pset.Name, "properties": properties} if properties else None
+
+
+def _instance_psets(element: Any) -> List[Any]:
+    """Наборы свойств экземпляра (IfcRelDefinesByProperties)"""
+    return [
+        rel.RelatingPropertyDefinition
+        for rel in getattr(element, "IsDefinedBy", None) or ()
+        if rel.is_a("IfcRelDefinesByProperties")
+    ]
+
+
+def _element_types(element: Any) -> List[Any]:
+    """Типы элемента (IfcRelDefinesByType)"""
+    return [
+        rel.RelatingType
+        for rel in getattr(element, "IsTypedBy", None) or ()
+        if rel.is_a("IfcRelDefinesByType")
+    ]
+
+
+def _type_psets(product_type: Any) -> Tuple[Any, ...]:
+    return tuple(getattr(product_type, "HasPropertySets", None) or ())
+
+
+class PropertyViews:
+    """Кэш представлений свойств элементов одного IFC документа"""
+
+    def __init__(self, ifc_doc: Any):
+        """
+        Args:
+            ifc_doc: IFC документ
+        """
+        self.ifc = ifc_doc
+        # GlobalId -> (id элемента, сигнатура наборов свойств, представление)
+        self._views: Dict[str, Tuple[int, Tuple, Dict[str, Any]]] = {}
+        # id типа -> (id наборов свойств типа, упорядоченные представления)
+        self._type_views: Dict[int, Tuple[Tuple[int, ...], List[Dict[str, Any]]]] = {}
+        self.stats = {"hits": 0, "misses": 0, "type_hits": 0, "type_misses": 0}
+
+    def element(self, global_id: str) -> Optional[Any]:
+        """Элемент по GlobalId (индекс документа) или None"""
+        try:
+            return self.ifc.by_guid(global_id)
+        except RuntimeError:
+            return None
+
+    def get(self, global_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Представление наборов свойств элемента
+
+        Returns:
+            {'name', 'ifc_type', 'property_sets': [{'name', 'properties'}]}
+            или None, если элемент не найден. Словарь общий для повторных
+            запросов и не должен изменяться вызывающим кодом.
+        """
+        element = self.element(global_id)
+        if element is None:
+            self._views.pop(global_id, None)
+            return None
+
+        instance_psets = _instance_psets(element)
+        types = _element_types(element)
+        signature = (
+            tuple(pset.id() for pset in instance_psets),
+            tuple((t.id(), tuple(p.id() for p in _type_psets(t))) for t in types),
+        )
+        cached = self._views.get(global_id)
+        if cached is not None and cached[0] == element.id() and cached[1] == signature:
+            self.stats["hits"] += 1
+            return cached[2]
+
+        self.stats["misses"] += 1
+        property_sets = [view for view in map(_pset_view, instance_psets) if view]
+        for product_type in types:
+            property_sets.extend(self.type_property_sets(product_type))
+
+        view = {
+            "name": element.Name or element.ObjectType or "Unnamed",
+            "ifc_type": str(element.is_a()),
+            "property_sets": property_sets,
+        }
+        self._views[global_id] = (element.id(), signature, view)
+        return view
+
+    def type_property_sets(self, product_type: Any) -> List[Dict[str, Any]]:
+        """
+        Представления наборов свойств типа (кэш по типу)
+
+        Порядок: наборы экспертиз, прочие, стандартные Pset_*.
+        """
+        psets = _type_psets(product_type)
+        pset_ids = tuple(pset.id() for pset in psets)
+        cached = self._type_views.get(product_type.id())
+        if cached is not None and cached[0] == pset_ids:
+            self.stats["type_hits"] += 1
+            return cached[1]
+
+        self.stats["type_misses"] += 1
+        expertise_psets = []
+        standard_psets = []
+        other_psets = []
+        for view in map(_pset_view, psets):
+            if view is None:
+                continue
+            if view["name"].startswith(EXPERTISE_PREFIXES):
+                expertise_psets.append(view)
+            elif view["name"].startswith("Pset_"):
+                standard_psets.append(view)
+            else:
+                other_psets.append(view)
+
+        # Порядок: экспертиза, другие, стандартные
+        ordered = expertise_psets + other_psets + standard_psets
+        self._type_views[product_type.id()] = (pset_ids, ordered)
+        return ordered
+
+    def table(self, global_ids: Iterable[str]) -> Dict[str, Any]:
+        """
+        Компактная таблица представлений свойств элементов
+
+        Args:
+            global_ids: GlobalId элементов; ненайденные пропускаются
+
+        Returns:
+            {
+                'types': {GlobalId типа: [наборы свойств типа]},
+                'elements': {
+                    GlobalId: {'name', 'ifc_type', 'property_sets', 'types'}
+                }
+            }
+            где property_sets элемента — только наборы экземпляра, а types —
+            GlobalId его типов в порядке IsTypedBy.
+        """
+        types: Dict[str, List[Dict[str, Any]]] = {}
+        elements: Dict[str, Dict[str, Any]] = {}
+        for global_id in global_ids:
+            element = self.element(global_id)
+            if element is None:
+                continue
+            type_ids = []
+            for product_type in _element_types(element):
+                if product_type.GlobalId not in types:
+                    types[product_type.GlobalId] = self.type_property_sets(product_type)
+                type_ids.append(product_type.GlobalId)
+            elements[global_id] = {
+                "name": element.Name or element.ObjectType or "Unnamed",
+                "ifc_type": str(element.is_a()),
+                "property_sets": [
+                    view for view in map(_pset_view, _instance_psets(element)) if view
+                ],
+                "types": type_ids,
+            }
+        return {"types": types, "elements": elements}
+
+    def invalidate(self) -> None:
+        """Сброс кэша (после изменения значений свойств)"""
+        self._views.clear()
+        self._type_views.clear()
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+
+def get_property_views(ifc_doc: Any) -> PropertyViews:
+    """Кэш представлений свойств документа (создаётся при первом обращении)"""
+    return document_cache(ifc_doc, "property_views", PropertyViews)
+
+
+def invalidate_property_views(ifc_doc: Any) -> None:
+    """Сброс кэша представлений свойств документа"""
+    views = getattr(ifc_doc, "property_views", None)
+    if views is not None:
+        views.invalidate()
+
+
+def resolve_property_table(table: Dict[str, Any], global_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Представление элемента из таблицы PropertyViews.table
+
+    Returns:
+        То же, что PropertyViews.get, или None, если элемента нет в таблице
+    """
+    entry = table["elements"].get(global_id)
+    if entry is None:
+        return None
+    property_sets = list(entry["property_sets"])
+    for type_id in entry["types"]:
+        property_sets.extend(table["types"][type_id])
+    return {
+        "name": entry["name"],
+        "ifc_type": entry["ifc_type"],
+        "property_sets": property_sets,
+    }
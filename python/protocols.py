@@ -7,7 +7,7 @@ protocols.py — Protocol интерфейсы для dependency injection
 - Устраняет необходимость в явных интерфейсах
 """
 
-from typing import Any, List, Optional, Protocol, runtime_checkable
+from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
 
 # =============================================================================
 # IFC Document Protocol
@@ -183,6 +183,10 @@ class TypeFactoryProtocol(Protocol):
         """Получение RepresentationMap для компонента"""
         ...
 
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Статистика попаданий/промахов кэшей типов и RepresentationMap"""
+        ...
+
 
 # =============================================================================
 # Instance Factory Protocol
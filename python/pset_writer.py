@@ -0,0 +1,171 @@
+"""
+pset_writer.py — Прямое создание наборов свойств IFC по шаблонам
+
+ifcopenshell.api pset.add_pset/pset.edit_pset на каждый набор выполняет
+диспетчеризацию API, поиск шаблона свойства в библиотеке Pset, проверку
+существующих свойств и создаёт отдельный IfcOwnerHistory. Наборы свойств
+болтов известны заранее, поэтому шаблоны (имя свойства → тип значения)
+компилируются один раз на схему: тип значения проверяется по схеме IFC и
+сопоставляется с типом Python для приведения значения. Запись набора — это
+только create_entity для значений, свойств и IfcPropertySet.
+
+Пример использования:
+    pset = write_pset(
+        ifc_doc, product_type, "Pset_MechanicalFastenerAnchorBolt",
+        {"AnchorBoltDiameter": 20.0, "AnchorBoltLength": 800.0, ...},
+    )
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from utils import get_ifcopenshell
+
+# Шаблоны наборов свойств: имя набора -> {имя свойства: тип значения}
+# Типы Pset_* совпадают с PrimaryMeasureType библиотеки Pset IFC4
+PSET_TEMPLATES: Dict[str, Dict[str, str]] = {
+    "Pset_MechanicalFastenerAnchorBolt": {
+        "AnchorBoltDiameter": "IfcPositiveLengthMeasure",
+        "AnchorBoltLength": "IfcPositiveLengthMeasure",
+        "AnchorBoltProtrusionLength": "IfcPositiveLengthMeasure",
+        "AnchorBoltThreadLength": "IfcPositiveLengthMeasure",
+    },
+    "МОГЭ_КСИ": {
+        "КСИ Код класса#XNKC0001": "IfcText",
+        "КСИ Наименование класса#XNKC0002": "IfcText",
+        "КСИ Класс строительной информации#XNKC0003": "IfcText",
+    },
+    "ExpCheck_MechanicalFastener": {
+        "MGE_ElementCode": "IfcText",
+    },
+    "Местоположение": {
+        "Номер корпуса": "IfcText",
+        "Номер секции": "IfcText",
+        "Этаж": "IfcText",
+    },
+    "Маркировка": {
+        "Позиция": "IfcText",
+        "Обозначение": "IfcText",
+        "Наименование": "IfcText",
+        "Профиль": "IfcText",
+    },
+    "Геометрические параметры": {
+        "Длина": "IfcLengthMeasure",
+    },
+}
+
+# Базовый тип схемы -> приведение значения Python
+_SIMPLE_TYPE_CASTS: Dict[str, Callable[[Any], Any]] = {
+    "real": float,
+    "number": float,
+    "integer": int,
+    "string": str,
+    "boolean": bool,
+    "logical": bool,
+}
+
+# Скомпилированный шаблон: имя набора и (имя свойства, тип значения, приведение)
+CompiledTemplate = Tuple[str, Tuple[Tuple[str, str, Callable[[Any], Any]], ...]]
+
+
+def _value_cast(schema: Any, measure_type: str) -> Callable[[Any], Any]:
+    """Приведение значения по базовому типу схемы (IfcPositiveLengthMeasure -> real -> float)"""
+    # type_declaration -> named_type -> ... -> simple_type -> 'real'
+    declared: Any = schema.declaration_by_name(measure_type)
+    while hasattr(declared, "declared_type"):
+        declared = declared.declared_type()
+    name = str(declared)
+    if name not in _SIMPLE_TYPE_CASTS:
+        raise ValueError(f"Тип {measure_type} не сводится к простому типу: {name}")
+    return _SIMPLE_TYPE_CASTS[name]
+
+
+@lru_cache(maxsize=None)
+def compile_template(name: str, schema_name: str = "IFC4") -> CompiledTemplate:
+    """
+    Компиляция шаблона набора свойств для схемы
+
+    Raises:
+        KeyError: Неизвестный набор свойств
+        ValueError: Тип значения отсутствует в схеме или не является простым
+    """
+    import ifcopenshell.ifcopenshell_wrapper as wrapper
+
+    schema = wrapper.schema_by_name(schema_name)
+    properties = []
+    for prop_name, measure_type in PSET_TEMPLATES[name].items():
+        try:
+            cast = _value_cast(schema, measure_type)
+        except RuntimeError as e:
+            raise ValueError(f"Тип {measure_type} отсутствует в схеме {schema_name}") from e
+        properties.append((prop_name, measure_type, cast))
+    return name, tuple(properties)
+
+
+def build_properties(
+    ifc_doc: Any, name: str, values: Mapping[str, Any], schema_name: Optional[str] = None
+) -> List[Any]:
+    """
+    IfcPropertySingleValue для значений набора свойств
+
+    Свойства создаются в порядке шаблона; свойства без значения пропускаются.
+
+    Raises:
+        KeyError: Свойство отсутствует в шаблоне
+    """
+    _, properties = compile_template(name, schema_name or _schema_name(ifc_doc))
+    unknown = set(values) - {prop_name for prop_name, _, _ in properties}
+    if unknown:
+        raise KeyError(f"Свойства {sorted(unknown)} отсутствуют в шаблоне {name}")
+    return [
+        ifc_doc.create_entity(
+            "IfcPropertySingleValue",
+            Name=prop_name,
+            NominalValue=ifc_doc.create_entity(measure_type, cast(values[prop_name])),
+        )
+        for prop_name, measure_type, cast in properties
+        if values.get(prop_name) is not None
+    ]
+
+
+def write_pset(
+    ifc_doc: Any,
+    product_type: Any,
+    name: str,
+    values: Mapping[str, Any],
+    owner_history: Optional[Any] = None,
+) -> Any:
+    """
+    Создание набора свойств по шаблону и назначение его типу (HasPropertySets)
+
+    Returns:
+        IfcPropertySet
+    """
+    ifc = get_ifcopenshell()
+    if owner_history is None:
+        owner_histories = ifc_doc.by_type("IfcOwnerHistory")
+        owner_history = owner_histories[0] if owner_histories else None
+    pset = ifc_doc.create_entity(
+        "IfcPropertySet",
+        GlobalId=ifc.guid.new(),
+        OwnerHistory=owner_history,
+        Name=name,
+        HasProperties=build_properties(ifc_doc, name, values),
+    )
+    attach_pset(product_type, pset)
+    return pset
+
+
+def attach_pset(product_type: Any, pset: Any) -> None:
+    """Назначение набора свойств типу через HasPropertySets"""
+    existing_psets = getattr(product_type, "HasPropertySets", None)
+    if existing_psets:
+        # Кортеж неизменяем, создаём новый
+        product_type.HasPropertySets = tuple(existing_psets) + (pset,)
+    else:
+        product_type.HasPropertySets = (pset,)
+
+
+def _schema_name(ifc_doc: Any) -> str:
+    schema = getattr(ifc_doc, "schema", "IFC4")
+    return schema if isinstance(schema, str) else "IFC4"
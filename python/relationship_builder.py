@@ -0,0 +1,158 @@
+"""
+relationship_builder.py — Сводные отношения IFC документа
+
+Вместо нового IfcRel* на каждый вызов документ содержит одно отношение на
+связующую сущность:
+- IfcRelDefinesByType — одно на тип (RelatingType)
+- IfcRelContainedInSpatialStructure — одно на этаж (RelatingStructure)
+- IfcRelAssociatesMaterial — одно на материал (RelatingMaterial)
+
+Два режима:
+- немедленный (по умолчанию): add_* сразу создаёт отношение или дополняет
+  RelatedObjects уже существующего — документ согласован после каждого вызова.
+  Агрегат RelatedObjects перезаписывается целиком, поэтому N вызовов для
+  одной связующей сущности стоят O(N²): массовое добавление (несколько
+  болтов в один документ) выполняется внутри deferring()
+- отложенный (with deferring()): add_* только накапливает объекты, отношения
+  создаются одним проходом в flush() — без копирования RelatedObjects
+  на каждый болт ведомости
+
+Накопитель один на документ (utils.document_cache), поэтому TypeFactory,
+MaterialManager и InstanceFactory одного документа дополняют одни и те же
+отношения.
+
+Пример использования:
+    relationships = get_relationships(ifc_doc)
+    with relationships.deferring():
+        for row in rows:
+            factory.create_bolt_assembly(...)
+"""
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from profiling import span
+from utils import document_cache, entity_by_id, get_ifcopenshell
+
+# Класс отношения -> (атрибут связующей сущности, атрибут связанных объектов)
+RELATIONSHIP_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "IfcRelDefinesByType": ("RelatingType", "RelatedObjects"),
+    "IfcRelContainedInSpatialStructure": ("RelatingStructure", "RelatedElements"),
+    "IfcRelAssociatesMaterial": ("RelatingMaterial", "RelatedObjects"),
+}
+
+Key = Tuple[str, int]
+
+
+class RelationshipBuilder:
+    """Накопитель сводных отношений одного IFC документа"""
+
+    def __init__(self, ifc_doc: Any):
+        """
+        Args:
+            ifc_doc: IFC документ
+        """
+        self.ifc = ifc_doc
+        owner_histories = self.ifc.by_type("IfcOwnerHistory")
+        self.owner_history = owner_histories[0] if owner_histories else None
+        self.deferred = False
+        # Созданные отношения по ключу (класс, id связующей сущности)
+        self._relationships: Dict[Key, int] = {}
+        # Отложенные объекты: ключ -> (связующая сущность, объекты)
+        self._pending: Dict[Key, Tuple[Any, List[Any]]] = {}
+        self.stats = {"created": 0, "extended": 0, "objects": 0}
+
+    def add_type(self, relating_type: Any, objects: Sequence[Any]) -> Optional[Any]:
+        """Связь экземпляров objects с типом (IfcRelDefinesByType)"""
+        return self._add("IfcRelDefinesByType", relating_type, objects)
+
+    def add_containment(self, structure: Any, elements: Sequence[Any]) -> Optional[Any]:
+        """Размещение элементов в пространственной структуре (IfcRelContainedInSpatialStructure)"""
+        return self._add("IfcRelContainedInSpatialStructure", structure, elements)
+
+    def add_material(self, material: Any, objects: Sequence[Any]) -> Optional[Any]:
+        """Ассоциация материала с объектами (IfcRelAssociatesMaterial)"""
+        return self._add("IfcRelAssociatesMaterial", material, objects)
+
+    def _add(self, rel_class: str, relating: Any, objects: Sequence[Any]) -> Optional[Any]:
+        """
+        Returns:
+            Отношение (немедленный режим) или None (отложенный режим)
+        """
+        if not objects:
+            return None
+        self.stats["objects"] += len(objects)
+        key = (rel_class, relating.id())
+        if self.deferred:
+            pending = self._pending.setdefault(key, (relating, []))
+            pending[1].extend(objects)
+            return None
+        return self._write(key, relating, list(objects))
+
+    def _write(self, key: Key, relating: Any, objects: List[Any]) -> Any:
+        """Создание отношения или дополнение существующего"""
+        rel_class = key[0]
+        relating_attr, related_attr = RELATIONSHIP_ATTRIBUTES[rel_class]
+        rel = self._existing(key)
+        if rel is not None:
+            setattr(rel, related_attr, list(getattr(rel, related_attr) or ()) + objects)
+            self.stats["extended"] += 1
+            return rel
+
+        attributes = {
+            "GlobalId": get_ifcopenshell().guid.new(),
+            "OwnerHistory": self.owner_history,
+            relating_attr: relating,
+            related_attr: objects,
+        }
+        if rel_class == "IfcRelAssociatesMaterial":
+            attributes["Name"] = f"MaterialAssociation_{relating.Name}"
+        rel = self.ifc.create_entity(rel_class, **attributes)
+        self._relationships[key] = rel.id()
+        self.stats["created"] += 1
+        return rel
+
+    def _existing(self, key: Key) -> Optional[Any]:
+        rel_id = self._relationships.get(key)
+        if rel_id is None:
+            return None
+        rel = entity_by_id(self.ifc, rel_id)
+        if rel is None:
+            # Отношение удалено из документа
+            del self._relationships[key]
+        return rel
+
+    def flush(self) -> int:
+        """
+        Запись отложенных объектов в отношения
+
+        Returns:
+            Количество записанных отношений
+        """
+        pending, self._pending = self._pending, {}
+        with span("relationships"):
+            for key, (relating, objects) in pending.items():
+                self._write(key, relating, objects)
+        return len(pending)
+
+    @contextmanager
+    def deferring(self) -> Iterator["RelationshipBuilder"]:
+        """Отложенный режим на время блока; при выходе — flush()"""
+        previous = self.deferred
+        self.deferred = True
+        try:
+            yield self
+        finally:
+            self.deferred = previous
+            if not previous:
+                self.flush()
+
+    @property
+    def pending_count(self) -> int:
+        """Количество отношений, ожидающих flush()"""
+        return len(self._pending)
+
+
+def get_relationships(ifc_doc: Any) -> RelationshipBuilder:
+    """Накопитель отношений документа (создаётся при первом обращении)"""
+    return document_cache(ifc_doc, "relationship_builder", RelationshipBuilder)
@@ -3,8 +3,10 @@ python/services/ — Сервисный слой бизнес-логики
 
 Содержит сервисы для работы с данными:
 - DimensionService: размеры болтов и компонентов
+- BomService: спецификация и масса стали для ведомости болтов
 """
 
+from .bom_service import BomService
 from .dimension_service import DimensionService
 
-__all__ = ["DimensionService"]
+__all__ = ["BomService", "DimensionService"]
@@ -0,0 +1,198 @@
+"""
+bom_service.py — Спецификация (ведомость материалов) для ведомости болтов
+
+Количество шпилек, гаек, шайб и анкерных плит по размерам и масса стали по
+материалам для всей ведомости считаются группировкой NumPy по столбцам
+каталога BOLT_CATALOG, без построчных вызовов get_bolt_mass.
+
+Массы компонентов:
+- шпилька — масса болта типа из каталога ГОСТ 24379.1-2012;
+- анкерная плита — PLATE_DIM_DATA;
+- гайка — шестигранная призма (размер под ключ s, высота h) без отверстия d,
+  без учёта фасок и резьбы;
+- шайба — кольцо (внутренний и наружный диаметры, толщина);
+  плотность гаек и шайб — плотность материала (MATERIALS).
+
+Состав сборки совпадает с InstanceFactory.create_bolt_assembly: шайба и
+две гайки сверху у всех типов, у типа 2.1 — ещё две нижние гайки и плита.
+"""
+
+from typing import Any, Dict, List, Mapping, Sequence
+
+import numpy as np
+from data.bolt_dimensions import AVAILABLE_DIAMETERS
+from data.catalog import BOLT_CATALOG, MASS_TYPES
+from data.fastener_dimensions import NUT_DIM_DATA, PLATE_DIM_DATA, WASHER_DIM_DATA
+from data.materials import MATERIALS
+from data.validation import validate_schedule
+
+# Компоненты сборки в порядке столбцов ASSEMBLY_COMPOSITION
+COMPONENTS = ("stud", "nut", "washer", "plate")
+
+# Количество компонентов в сборке по типу болта
+ASSEMBLY_COMPOSITION: Dict[str, Dict[str, int]] = {
+    "1.1": {"stud": 1, "nut": 2, "washer": 1, "plate": 0},
+    "1.2": {"stud": 1, "nut": 2, "washer": 1, "plate": 0},
+    "2.1": {"stud": 1, "nut": 4, "washer": 1, "plate": 1},
+    "5": {"stud": 1, "nut": 2, "washer": 1, "plate": 0},
+}
+
+# Состав по индексу типа (MASS_TYPES) и компоненту
+_COMPOSITION = np.array(
+    [[ASSEMBLY_COMPOSITION[t][c] for c in COMPONENTS] for t in MASS_TYPES], dtype=np.int64
+)
+
+_MATERIAL_NAMES: List[str] = list(MATERIALS)
+_DENSITY = np.array([MATERIALS[m]["density"] for m in _MATERIAL_NAMES], dtype=np.float64)
+_DIAMETERS = np.array(AVAILABLE_DIAMETERS, dtype=np.int64)
+
+# мм³ -> м³
+_MM3 = 1e-9
+
+
+def _nut_volume(diameter: int) -> float:
+    """Объём гайки (мм³): шестигранник под ключ s высотой h без отверстия d"""
+    d, s, h = NUT_DIM_DATA[str(diameter)]
+    return (np.sqrt(3) / 2 * s**2 - np.pi * d**2 / 4) * h
+
+
+def _washer_volume(diameter: int) -> float:
+    """Объём шайбы (мм³): кольцо d_внутр..d_наружн толщиной t"""
+    _, inner, outer, thickness = WASHER_DIM_DATA[str(diameter)]
+    return np.pi * (outer**2 - inner**2) / 4 * thickness
+
+
+# Объёмы гаек и шайб и массы плит по индексу диаметра (_DIAMETERS)
+_NUT_VOLUME = np.array([_nut_volume(d) for d in AVAILABLE_DIAMETERS])
+_WASHER_VOLUME = np.array([_washer_volume(d) for d in AVAILABLE_DIAMETERS])
+_PLATE_MASS = np.array(
+    [PLATE_DIM_DATA[d]["mass"] if d in PLATE_DIM_DATA else np.nan for d in AVAILABLE_DIAMETERS]
+)
+
+
+class BomService:
+    """
+    Сервис спецификации болтов
+
+    Предоставляет:
+    - Массы гаек и шайб по диаметру и материалу
+    - Спецификацию ведомости: количества компонентов по размерам и массы
+    """
+
+    @staticmethod
+    def get_nut_mass(diameter: int, material: str = "09Г2С") -> float:
+        """Масса гайки (кг)"""
+        density = MATERIALS[material]["density"]
+        return float(_nut_volume(diameter) * density * _MM3)
+
+    @staticmethod
+    def get_washer_mass(diameter: int, material: str = "09Г2С") -> float:
+        """Масса шайбы (кг)"""
+        density = MATERIALS[material]["density"]
+        return float(_washer_volume(diameter) * density * _MM3)
+
+    @staticmethod
+    def compute(rows: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+        """
+        Спецификация ведомости болтов
+
+        Невалидные строки (validate_schedule) в спецификацию не входят и
+        возвращаются в errors.
+
+        Args:
+            rows: Параметры болтов (dict с bolt_type, diameter, length, material)
+
+        Returns:
+            Словарь:
+                - count: количество болтов в спецификации
+                - items: позиции [{'component', 'bolt_type', 'diameter', 'length',
+                  'material', 'quantity', 'unit_mass', 'mass'}]; у шпилек заданы
+                  тип и длина, у гаек, шайб и плит — None
+                - totals: количество компонентов по виду
+                - mass_by_material: масса стали по материалам (кг)
+                - total_mass: общая масса (кг)
+                - errors: ошибки невалидных строк (формат validate_schedule)
+        """
+        report = validate_schedule(rows)
+        valid = report["valid"]
+        columns = report["columns"]
+        bolt_type = columns["bolt_type"][valid]
+        diameter = columns["diameter"][valid]
+        length = columns["length"][valid]
+        material = columns["material"][valid]
+        diameter_index = np.searchsorted(_DIAMETERS, diameter)
+
+        items: List[Dict[str, Any]] = []
+
+        # Шпильки: группировка по (тип, диаметр, длина, материал)
+        # Ключ по строке каталога (валидные строки всегда найдены): плотный и без
+        # упаковки значений диаметра и длины
+        catalog_row = BOLT_CATALOG.rows(diameter, length)
+        stud_mass = BOLT_CATALOG.mass[catalog_row, bolt_type]
+        bolt_key = bolt_type * len(BOLT_CATALOG) + catalog_row
+        stud_key = bolt_key * len(_MATERIAL_NAMES) + material
+        _, first, counts = np.unique(stud_key, return_index=True, return_counts=True)
+        for row, quantity in zip(first.tolist(), counts.tolist()):
+            unit_mass = float(stud_mass[row])
+            items.append(
+                {
+                    "component": "stud",
+                    "bolt_type": MASS_TYPES[bolt_type[row]],
+                    "diameter": int(diameter[row]),
+                    "length": int(length[row]),
+                    "material": _MATERIAL_NAMES[material[row]],
+                    "quantity": quantity,
+                    "unit_mass": unit_mass,
+                    "mass": unit_mass * quantity,
+                }
+            )
+
+        # Гайки, шайбы и плиты: количество по (диаметр, материал)
+        composition = _COMPOSITION[bolt_type]
+        component_key = diameter_index * len(_MATERIAL_NAMES) + material
+        groups = len(_DIAMETERS) * len(_MATERIAL_NAMES)
+        group_diameter = np.repeat(_DIAMETERS, len(_MATERIAL_NAMES))
+        group_material = np.tile(np.arange(len(_MATERIAL_NAMES)), len(_DIAMETERS))
+        group_density = _DENSITY[group_material]
+        unit_masses = {
+            "nut": np.repeat(_NUT_VOLUME, len(_MATERIAL_NAMES)) * group_density * _MM3,
+            "washer": np.repeat(_WASHER_VOLUME, len(_MATERIAL_NAMES)) * group_density * _MM3,
+            "plate": np.repeat(_PLATE_MASS, len(_MATERIAL_NAMES)),
+        }
+        for column, component in enumerate(COMPONENTS[1:], start=1):
+            quantities = np.bincount(
+                component_key, weights=composition[:, column], minlength=groups
+            ).astype(np.int64)
+            for group in np.flatnonzero(quantities).tolist():
+                unit_mass = float(unit_masses[component][group])
+                quantity = int(quantities[group])
+                items.append(
+                    {
+                        "component": component,
+                        "bolt_type": None,
+                        "diameter": int(group_diameter[group]),
+                        "length": None,
+                        "material": _MATERIAL_NAMES[group_material[group]],
+                        "quantity": quantity,
+                        "unit_mass": unit_mass,
+                        "mass": unit_mass * quantity,
+                    }
+                )
+
+        mass_by_material: Dict[str, float] = {}
+        for item in items:
+            mass_by_material[item["material"]] = (
+                mass_by_material.get(item["material"], 0.0) + item["mass"]
+            )
+
+        return {
+            "count": len(bolt_type),
+            "items": items,
+            "totals": {
+                component: int(composition[:, column].sum())
+                for column, component in enumerate(COMPONENTS)
+            },
+            "mass_by_material": mass_by_material,
+            "total_mass": sum(mass_by_material.values()),
+            "errors": report["errors"],
+        }
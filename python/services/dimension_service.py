@@ -6,15 +6,9 @@ dimension_service.py — Сервис для получения размеров
 
 from typing import Any, Dict, List, Literal, Optional
 
-from data.bolt_dimensions import get_bolt_dimensions
+from data.catalog import BOLT_CATALOG
 from data.fastener_dimensions import get_nut_dimensions, get_washer_dimensions
-from data.validation import (
-    AVAILABLE_LENGTHS,
-    get_bolt_bend_radius,
-    get_bolt_hook_length,
-    get_bolt_mass,
-    get_thread_length,
-)
+from data.validation import AVAILABLE_LENGTHS
 
 BoltType = Literal["1.1", "1.2", "2.1", "5"]
 
@@ -44,37 +38,41 @@ class DimensionService:
         Returns:
             Dict с размерами или None
         """
-        dims = get_bolt_dimensions(diameter, length)
-        if not dims:
+        record = BOLT_CATALOG.get(diameter, length)
+        if not record:
             return None
 
         return {
-            **dims,
+            **record.as_dict(),
             "diameter": diameter,
             "length": length,
             "bolt_type": bolt_type,
-            "mass": get_bolt_mass(diameter, length, bolt_type),
+            "mass": record.mass(bolt_type),
         }
 
     @staticmethod
     def get_hook_length(diameter: int, length: int) -> Optional[int]:
         """Получить вылет крюка"""
-        return get_bolt_hook_length(diameter, length)
+        record = BOLT_CATALOG.get(diameter, length)
+        return record.hook_length if record else None
 
     @staticmethod
     def get_bend_radius(diameter: int, length: int) -> int:
         """Получить радиус загиба"""
-        return get_bolt_bend_radius(diameter, length)
+        record = BOLT_CATALOG.get(diameter, length)
+        return record.bend_radius if record else diameter
 
     @staticmethod
     def get_thread_length(diameter: int, length: int) -> Optional[int]:
         """Получить длину резьбы"""
-        return get_thread_length(diameter, length)
+        record = BOLT_CATALOG.get(diameter, length)
+        return record.thread_length if record else None
 
     @staticmethod
     def get_mass(diameter: int, length: int, bolt_type: BoltType) -> Optional[float]:
         """Получить массу болта"""
-        return get_bolt_mass(diameter, length, bolt_type)
+        record = BOLT_CATALOG.get(diameter, length)
+        return record.mass(bolt_type) if record else None
 
     @staticmethod
     def get_nut_dimensions(diameter: int) -> Optional[Dict[str, Any]]:
@@ -114,5 +112,5 @@ class DimensionService:
         Returns:
             True если длина допустима
         """
-        lengths = DimensionService.get_available_lengths(bolt_type, diameter)
-        return length in lengths
+        record = BOLT_CATALOG.get(diameter, length)
+        return record is not None and record.mass(bolt_type) is not None
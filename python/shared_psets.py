@@ -0,0 +1,83 @@
+"""
+shared_psets.py — Общие наборы свойств типов IFC
+
+Pset_ElementComponentCommon и наборы свойств экспертиз, значения которых не
+зависят от типа, одинаковы у всех типов документа. Вместо нового
+IfcPropertySet (с перечислениями и значениями) на каждый тип набор строится
+один раз на документ и назначается всем типам через HasPropertySets
+(IFC4: IfcPropertySetDefinition.DefinesType — SET [0:?], набор может
+принадлежать нескольким типам).
+
+IfcRelDefinesByProperties для типов не используется: правило
+NoRelatedTypeObject IFC4 запрещает IfcTypeObject в его RelatedObjects.
+
+Пример использования:
+    shared = get_shared_psets(ifc_doc)
+    pset = shared.get(("МОГЭ_КСИ",), "МОГЭ_КСИ", build_properties)
+    shared.attach(product_type, pset)
+"""
+
+from typing import Any, Callable, Dict, Hashable, List
+
+from pset_writer import attach_pset
+from utils import document_cache, entity_by_id, get_ifcopenshell
+
+
+class SharedPsets:
+    """Кэш общих IfcPropertySet одного IFC документа"""
+
+    def __init__(self, ifc_doc: Any):
+        """
+        Args:
+            ifc_doc: IFC документ
+        """
+        self.ifc = ifc_doc
+        owner_histories = self.ifc.by_type("IfcOwnerHistory")
+        self.owner_history = owner_histories[0] if owner_histories else None
+        self._psets: Dict[Hashable, int] = {}
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, key: Hashable, name: str, build: Callable[[Any], List[Any]]) -> Any:
+        """
+        Общий набор свойств по ключу
+
+        Args:
+            key: Ключ набора (имя и значения, от которых зависят свойства)
+            name: Имя IfcPropertySet
+            build: Функция build(ifc_doc) -> список свойств (вызывается при промахе)
+
+        Returns:
+            IfcPropertySet
+        """
+        pset_id = self._psets.get(key)
+        if pset_id is not None:
+            pset = entity_by_id(self.ifc, pset_id)
+            if pset is not None:
+                self.stats["hits"] += 1
+                return pset
+            # Набор удалён из документа
+            del self._psets[key]
+
+        self.stats["misses"] += 1
+        pset = self.ifc.create_entity(
+            "IfcPropertySet",
+            GlobalId=get_ifcopenshell().guid.new(),
+            OwnerHistory=self.owner_history,
+            Name=name,
+            HasProperties=build(self.ifc),
+        )
+        self._psets[key] = pset.id()
+        return pset
+
+    @staticmethod
+    def attach(product: Any, pset: Any) -> None:
+        """Назначение набора свойств типу через HasPropertySets"""
+        attach_pset(product, pset)
+
+    def __len__(self) -> int:
+        return len(self._psets)
+
+
+def get_shared_psets(ifc_doc: Any) -> SharedPsets:
+    """Кэш общих наборов свойств документа (создаётся при первом обращении)"""
+    return document_cache(ifc_doc, "shared_psets", SharedPsets)
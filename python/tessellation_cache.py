@@ -0,0 +1,239 @@
+"""
+tessellation_cache.py — Кэш тесселяции faceted геометрии
+
+Тесселяция компонента через ifcopenshell.geom (OpenCascade) зависит только от
+геометрического ключа (компонент, тип болта, диаметр, длина), настроек
+тесселяции и версии ifcopenshell. Результат — массивы вершин (мм) и индексов
+треугольников — кэшируется по хэшу этих данных:
+- в памяти с вытеснением давно не использованных записей (LRU)
+- опционально на диске (один .npz файл на запись) для других процессов/сессий
+
+Пример использования:
+    cache = get_tessellation_cache()
+    mesh = cache.get(("nut", 20))
+    if mesh is None:
+        mesh = tessellate(...)
+        cache.put(("nut", 20), *mesh)
+"""
+
+import hashlib
+import os
+import tempfile
+import zipfile
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from profiling import count
+
+# Настройки тесселяции TypeFactory._create_faceted_representation
+DEFAULT_SETTINGS: Tuple[Tuple[str, Any], ...] = (
+    ("WELD_VERTICES", False),
+    ("USE_WORLD_COORDS", True),
+)
+
+# Максимальное количество записей в памяти по умолчанию
+DEFAULT_MAX_ENTRIES = 256
+
+Mesh = Tuple[np.ndarray, np.ndarray]
+
+
+def _ifcopenshell_version() -> str:
+    try:
+        import ifcopenshell
+
+        return str(getattr(ifcopenshell, "version", "unknown"))
+    except ImportError:
+        return "unavailable"
+
+
+class TessellationCache:
+    """
+    LRU кэш тесселяции с опциональным хранилищем на диске
+
+    Записи: (vertices (N, 3) float64 в мм, triangles (M, 3) int32).
+    Возвращаемые массивы доступны только для чтения — они общие для всех
+    потребителей кэша.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_dir: Optional[str] = None,
+        settings: Tuple[Tuple[str, Any], ...] = DEFAULT_SETTINGS,
+    ):
+        """
+        Args:
+            max_entries: Максимальное количество записей в памяти
+            cache_dir: Каталог дискового кэша (None — только память)
+            settings: Настройки тесселяции, входящие в ключ
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries должен быть положительным: {max_entries}")
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.settings = settings
+        self._version = _ifcopenshell_version()
+        self._entries: "OrderedDict[str, Mesh]" = OrderedDict()
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "disk_writes": 0}
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def make_key(self, geom_key: tuple) -> str:
+        """
+        Хэш записи: геометрический ключ + настройки + версия ifcopenshell
+
+        Args:
+            geom_key: Ключ геометрии (например ("stud", "1.1", 20, 800))
+
+        Returns:
+            Шестнадцатеричный SHA-1 дайджест
+        """
+        payload = repr((geom_key, self.settings, self._version))
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def _disk_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, f"{digest}.npz")
+
+    def get(self, geom_key: tuple) -> Optional[Mesh]:
+        """
+        Получение тесселяции из памяти или с диска
+
+        Returns:
+            Кортеж (vertices, triangles) или None при промахе
+        """
+        digest = self.make_key(geom_key)
+
+        mesh = self._entries.get(digest)
+        if mesh is not None:
+            self._entries.move_to_end(digest)
+            self.stats["hits"] += 1
+            count("tessellation_cache.hits")
+            return mesh
+
+        if self.cache_dir:
+            mesh = self._load(digest)
+            if mesh is not None:
+                self._store(digest, mesh)
+                self.stats["disk_hits"] += 1
+                count("tessellation_cache.hits")
+                return mesh
+
+        self.stats["misses"] += 1
+        count("tessellation_cache.misses")
+        return None
+
+    def put(self, geom_key: tuple, vertices: Any, triangles: Any) -> Mesh:
+        """
+        Сохранение тесселяции
+
+        Args:
+            geom_key: Ключ геометрии
+            vertices: Вершины в мм (плоский список или массив (N, 3))
+            triangles: Индексы треугольников (плоский список или массив (M, 3))
+
+        Returns:
+            Закэшированные массивы (vertices, triangles)
+        """
+        mesh = (
+            np.array(vertices, dtype=np.float64).reshape(-1, 3),
+            np.array(triangles, dtype=np.int32).reshape(-1, 3),
+        )
+        for array in mesh:
+            array.setflags(write=False)
+
+        digest = self.make_key(geom_key)
+        self._store(digest, mesh)
+        if self.cache_dir:
+            self._save(digest, mesh)
+        return mesh
+
+    def _store(self, digest: str, mesh: Mesh) -> None:
+        self._entries[digest] = mesh
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _load(self, digest: str) -> Optional[Mesh]:
+        path = self._disk_path(digest)
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                mesh = (data["vertices"], data["triangles"])
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            # Повреждённая запись: считаем промахом, она будет перезаписана
+            return None
+        for array in mesh:
+            array.setflags(write=False)
+        return mesh
+
+    def _save(self, digest: str, mesh: Mesh) -> None:
+        # Атомарная запись: параллельные процессы не увидят недописанный файл
+        fd, tmp_path = tempfile.mkstemp(suffix=".npz", dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, vertices=mesh[0], triangles=mesh[1])
+            os.replace(tmp_path, self._disk_path(digest))
+            self.stats["disk_writes"] += 1
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def clear(self) -> None:
+        """Очистка кэша в памяти (дисковое хранилище не затрагивается)"""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Статистика кэша
+
+        Returns:
+            Счётчики hits/disk_hits/misses/evictions/disk_writes,
+            количество записей и доля попаданий hit_rate
+        """
+        lookups = self.stats["hits"] + self.stats["disk_hits"] + self.stats["misses"]
+        hits = self.stats["hits"] + self.stats["disk_hits"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+
+# Глобальный кэш тесселяции (общий для всех документов процесса)
+_cache: Optional[TessellationCache] = None
+
+
+def get_tessellation_cache() -> TessellationCache:
+    """Получение глобального кэша тесселяции (создаётся при первом обращении)"""
+    global _cache
+    if _cache is None:
+        _cache = TessellationCache()
+    return _cache
+
+
+def configure_tessellation_cache(
+    max_entries: int = DEFAULT_MAX_ENTRIES, cache_dir: Optional[str] = None
+) -> TessellationCache:
+    """
+    Замена глобального кэша кэшем с заданными параметрами
+
+    Args:
+        max_entries: Максимальное количество записей в памяти
+        cache_dir: Каталог дискового кэша (None — только память)
+
+    Returns:
+        Новый глобальный TessellationCache
+    """
+    global _cache
+    _cache = TessellationCache(max_entries=max_entries, cache_dir=cache_dir)
+    return _cache
+
+
+def reset_tessellation_cache() -> None:
+    """Сброс глобального кэша тесселяции"""
+    global _cache
+    _cache = None
@@ -10,8 +10,7 @@ type_factory.py — Фабрика для создания и кэширован
 
 from typing import Any, Dict, Optional
 
-import ifcopenshell.api
-from geometry_builder import GeometryBuilder
+from geometry_builder import DEFAULT_CIRCLE_SEGMENTS, GeometryBuilder
 from gost_data import (
     get_material_name,
     get_nut_dimensions,
@@ -20,7 +19,11 @@ from gost_data import (
     validate_parameters,
 )
 from material_manager import MaterialManager
+from profiling import count, span
 from protocols import IfcDocumentProtocol
+from pset_writer import build_properties, write_pset
+from shared_psets import get_shared_psets
+from tessellation_cache import get_tessellation_cache
 from utils import get_ifcopenshell
 
 
@@ -40,13 +43,27 @@ class TypeFactory:
         geometry_type: str = "solid",
         add_standard_pset: bool = True,
         pset_expertise: str = "none",
+        tessellator: str = "geom",
+        tessellation_segments: int = DEFAULT_CIRCLE_SEGMENTS,
     ):
         self.ifc: IfcDocumentProtocol = ifc_doc
         self.types_cache: Dict[Any, Any] = {}
         self.representation_maps: Dict[tuple, Any] = {}  # Кэш RepresentationMap по ключу
+        # Счётчики попаданий/промахов кэшей типов и RepresentationMap
+        self.cache_stats: Dict[str, int] = {
+            "type_hits": 0,
+            "type_misses": 0,
+            "representation_map_hits": 0,
+            "representation_map_misses": 0,
+            "tessellation_hits": 0,
+            "tessellation_misses": 0,
+        }
         self.builder = GeometryBuilder(ifc_doc)
         self.material_manager = MaterialManager(ifc_doc)
-        self.geometry_type = geometry_type  # "solid" или "faceted"
+        self.geometry_type = geometry_type  # "solid", "faceted" или "triangulated"
+        # Источник сетки для faceted: "geom" (OpenCascade + кэш) или "analytic" (NumPy)
+        self.tessellator = tessellator
+        self.tessellation_segments = tessellation_segments
         self.add_standard_pset = add_standard_pset  # Добавлять стандартные PSet
         self.pset_expertise = (
             pset_expertise  # Режим экспертизы ('none', 'MGE', 'MOGE', 'SPB_GAU_CGE')
@@ -55,10 +72,19 @@ class TypeFactory:
         owner_histories = self.ifc.by_type("IfcOwnerHistory")
         self.owner_history = owner_histories[0] if owner_histories else None
 
+    def _attach_shared_pset(self, product, key, name, build) -> Any:
+        """Назначение типу общего набора свойств документа (shared_psets)"""
+        shared = get_shared_psets(self.ifc)
+        pset = shared.get(key, name, build)
+        shared.attach(product, pset)
+        return pset
+
     def _add_moge_ksi_pset(self, product):
         """
         Добавление PSet МОГЭ_КСИ для экспертизы МОГЭ
 
+        Значения не зависят от типа — набор общий для всех типов документа.
+
         Args:
             product: IfcType, для которого добавляется Pset
         """
@@ -66,35 +92,25 @@ class TypeFactory:
         if self.pset_expertise != "MOGE":
             return
 
-        ifc = get_ifcopenshell()
+        def build(ifc_doc):
+            return build_properties(
+                ifc_doc,
+                "МОГЭ_КСИ",
+                {
+                    "КСИ Код класса#XNKC0001": "UQA",
+                    "КСИ Наименование класса#XNKC0002": "крепежное изделие неразборное",
+                    "КСИ Класс строительной информации#XNKC0003": "Com",
+                },
+            )
 
-        # Создаём Pset МОГЭ_КСИ через ifcopenshell.api
-        pset = ifcopenshell.api.run(
-            "pset.add_pset",
-            self.ifc,
-            product=product,
-            name="МОГЭ_КСИ",
-        )
-        # Добавляем свойства с типом IfcText
-        ifcopenshell.api.run(
-            "pset.edit_pset",
-            self.ifc,
-            pset=pset,
-            properties={
-                "КСИ Код класса#XNKC0001": self.ifc.create_entity("IfcText", "UQA"),
-                "КСИ Наименование класса#XNKC0002": self.ifc.create_entity(
-                    "IfcText", "крепежное изделие неразборное"
-                ),
-                "КСИ Класс строительной информации#XNKC0003": self.ifc.create_entity(
-                    "IfcText", "Com"
-                ),
-            },
-        )
+        self._attach_shared_pset(product, ("МОГЭ_КСИ",), "МОГЭ_КСИ", build)
 
     def _add_mge_exp_check_pset(self, product):
         """
         Добавление PSet ExpCheck_MechanicalFastener для экспертизы МГЭ
 
+        Значения не зависят от типа — набор общий для всех типов документа.
+
         Args:
             product: IfcMechanicalFastenerType, для которого добавляется Pset
         """
@@ -106,29 +122,23 @@ class TypeFactory:
         if not product.is_a("IfcMechanicalFastenerType"):
             return
 
-        ifc = get_ifcopenshell()
+        def build(ifc_doc):
+            return build_properties(
+                ifc_doc, "ExpCheck_MechanicalFastener", {"MGE_ElementCode": "ЭЛ 40 45 20 20"}
+            )
 
-        # Создаём Pset ExpCheck_MechanicalFastener через ifcopenshell.api
-        pset = ifcopenshell.api.run(
-            "pset.add_pset",
-            self.ifc,
-            product=product,
-            name="ExpCheck_MechanicalFastener",
-        )
-        # Добавляем свойство с типом IfcText
-        ifcopenshell.api.run(
-            "pset.edit_pset",
-            self.ifc,
-            pset=pset,
-            properties={
-                "MGE_ElementCode": self.ifc.create_entity("IfcText", "ЭЛ 40 45 20 20"),
-            },
+        self._attach_shared_pset(
+            product, ("ExpCheck_MechanicalFastener",), "ExpCheck_MechanicalFastener", build
         )
 
     def _add_spb_gau_cge_psets(self, product, diameter: int, length: int, material: str, gost: str):
         """
         Добавление PSet для экспертизы СПб ГАУ ЦГЭ
 
+        «Местоположение» и «Строительные параметры» общие для всех типов,
+        «Геометрические параметры» — для типов одной длины. «Маркировка»
+        содержит имя типа и создаётся для каждого типа.
+
         Args:
             product: IfcMechanicalFastenerType, для которого добавляется Pset
             diameter: Диаметр болта (мм)
@@ -144,97 +154,64 @@ class TypeFactory:
         if not product.is_a("IfcMechanicalFastenerType"):
             return
 
-        ifc = get_ifcopenshell()
-
         # 1. Pset "Местоположение"
-        pset_location = ifcopenshell.api.run(
-            "pset.add_pset",
-            self.ifc,
-            product=product,
-            name="Местоположение",
-        )
-        ifcopenshell.api.run(
-            "pset.edit_pset",
-            self.ifc,
-            pset=pset_location,
-            properties={
-                "Номер корпуса": self.ifc.create_entity("IfcText", "-"),
-                "Номер секции": self.ifc.create_entity("IfcText", "-"),
-                "Этаж": self.ifc.create_entity("IfcText", "-"),
-            },
-        )
+        def build_location(ifc_doc):
+            return build_properties(
+                ifc_doc,
+                "Местоположение",
+                {"Номер корпуса": "-", "Номер секции": "-", "Этаж": "-"},
+            )
+
+        self._attach_shared_pset(product, ("Местоположение",), "Местоположение", build_location)
 
         # 2. Pset "Маркировка"
-        pset_marking = ifcopenshell.api.run(
-            "pset.add_pset",
-            self.ifc,
-            product=product,
-            name="Маркировка",
-        )
-        ifcopenshell.api.run(
-            "pset.edit_pset",
+        write_pset(
             self.ifc,
-            pset=pset_marking,
-            properties={
-                "Позиция": self.ifc.create_entity("IfcText", "-"),
-                "Обозначение": self.ifc.create_entity("IfcText", gost),
-                "Наименование": self.ifc.create_entity(
-                    "IfcText", str(getattr(product, "Name", ""))
-                ),
-                "Профиль": self.ifc.create_entity("IfcText", f"М{diameter}"),
+            product,
+            "Маркировка",
+            {
+                "Позиция": "-",
+                "Обозначение": gost,
+                "Наименование": str(getattr(product, "Name", "")),
+                "Профиль": f"М{diameter}",
             },
+            self.owner_history,
         )
 
         # 3. Pset "Геометрические параметры"
-        pset_geometry = ifcopenshell.api.run(
-            "pset.add_pset",
-            self.ifc,
-            product=product,
-            name="Геометрические параметры",
-        )
-        ifcopenshell.api.run(
-            "pset.edit_pset",
-            self.ifc,
-            pset=pset_geometry,
-            properties={
-                "Длина": self.ifc.create_entity("IfcLengthMeasure", float(length)),
-            },
+        def build_geometry(ifc_doc):
+            return build_properties(ifc_doc, "Геометрические параметры", {"Длина": length})
+
+        self._attach_shared_pset(
+            product,
+            ("Геометрические параметры", float(length)),
+            "Геометрические параметры",
+            build_geometry,
         )
 
         # 4. Pset "Строительные параметры"
-        pset_construction = ifcopenshell.api.run(
-            "pset.add_pset",
-            self.ifc,
-            product=product,
-            name="Строительные параметры",
-        )
-
-        # Создаём enumeration для материалов
-        enum_material_values = [
-            self.ifc.create_entity("IfcText", v) for v in ["Д", "С", "Б", "ЖБ", "К", "АрК"]
-        ]
-        enum_material = self.ifc.create_entity(
-            "IfcPropertyEnumeration",
-            Name="PEnum_MaterialType",
-            EnumerationValues=enum_material_values,
-        )
+        def build_construction(ifc_doc):
+            # Перечисление материалов
+            enum_material = ifc_doc.create_entity(
+                "IfcPropertyEnumeration",
+                Name="PEnum_MaterialType",
+                EnumerationValues=[
+                    ifc_doc.create_entity("IfcText", v) for v in ["Д", "С", "Б", "ЖБ", "К", "АрК"]
+                ],
+            )
+            return [
+                ifc_doc.create_entity(
+                    "IfcPropertyEnumeratedValue",
+                    Name="Материал",
+                    EnumerationValues=[ifc_doc.create_entity("IfcText", "С")],
+                    EnumerationReference=enum_material,
+                )
+            ]
 
-        # Создаём свойство как IfcPropertyEnumeratedValue
-        prop_material = self.ifc.create_entity(
-            "IfcPropertyEnumeratedValue",
-            Name="Материал",
-            EnumerationValues=[self.ifc.create_entity("IfcText", "С")],
-            EnumerationReference=enum_material,
+        self._attach_shared_pset(
+            product, ("Строительные параметры",), "Строительные параметры", build_construction
         )
 
-        # Добавляем свойство в Pset вручную
-        # HasProperties может быть None для нового Pset
-        existing_props = getattr(pset_construction, "HasProperties", None)
-        if existing_props:
-            pset_construction.HasProperties = tuple(existing_props) + (prop_material,)
-        else:
-            pset_construction.HasProperties = (prop_material,)
-
     def _add_element_component_common_pset(self, product):
         """
         Добавление Pset_ElementComponentCommon для IfcMechanicalFastenerType
@@ -244,6 +221,9 @@ class TypeFactory:
         - DeliveryType: IfcPropertyEnumeratedValue
         - CorrosionTreatment: IfcPropertyEnumeratedValue
 
+        Значения не зависят от типа — набор (вместе с PEnum_ElementStatus)
+        строится один раз на документ и назначается всем типам.
+
         Args:
             product: IfcMechanicalFastenerType, для которого добавляется Pset
         """
@@ -251,70 +231,47 @@ class TypeFactory:
         if not self.add_standard_pset:
             return
 
-        ifc = get_ifcopenshell()
-
-        # Создаём PEnum_ElementStatus enumeration
-        enum_status_values = [
-            self.ifc.create_entity("IfcLabel", v)
-            for v in ["NEW", "EXISTING", "DEMOLISH", "TEMPORARY", "OTHER", "NOTKNOWN", "UNSET"]
-        ]
-        enum_status = self.ifc.create_entity(
-            "IfcPropertyEnumeration",
-            Name="PEnum_ElementStatus",
-            EnumerationValues=enum_status_values,
-        )
-
-        # Создаём свойства как IfcPropertyEnumeratedValue
-        # Status
-        prop_status = self.ifc.create_entity(
-            "IfcPropertyEnumeratedValue",
-            Name="Status",
-            EnumerationValues=[self.ifc.create_entity("IfcLabel", "NEW")],
-            EnumerationReference=enum_status,
-        )
-
-        # DeliveryType
-        prop_delivery = self.ifc.create_entity(
-            "IfcPropertyEnumeratedValue",
-            Name="DeliveryType",
-            EnumerationValues=[self.ifc.create_entity("IfcLabel", "LOOSE")],
-        )
-
-        # CorrosionTreatment
-        prop_corrosion = self.ifc.create_entity(
-            "IfcPropertyEnumeratedValue",
-            Name="CorrosionTreatment",
-            EnumerationValues=[self.ifc.create_entity("IfcLabel", "GALVANISED")],
-        )
-
-        # Создаём Pset_ElementComponentCommon
-        pset_common = self.ifc.create_entity(
-            "IfcPropertySet",
-            GlobalId=ifc.guid.new(),
-            OwnerHistory=self.owner_history,
-            Name="Pset_ElementComponentCommon",
-            HasProperties=[prop_status, prop_delivery, prop_corrosion],
-        )
+        def build(ifc_doc):
+            # PEnum_ElementStatus
+            enum_status = ifc_doc.create_entity(
+                "IfcPropertyEnumeration",
+                Name="PEnum_ElementStatus",
+                EnumerationValues=[
+                    ifc_doc.create_entity("IfcLabel", v)
+                    for v in [
+                        "NEW",
+                        "EXISTING",
+                        "DEMOLISH",
+                        "TEMPORARY",
+                        "OTHER",
+                        "NOTKNOWN",
+                        "UNSET",
+                    ]
+                ],
+            )
+            return [
+                ifc_doc.create_entity(
+                    "IfcPropertyEnumeratedValue",
+                    Name="Status",
+                    EnumerationValues=[ifc_doc.create_entity("IfcLabel", "NEW")],
+                    EnumerationReference=enum_status,
+                ),
+                ifc_doc.create_entity(
+                    "IfcPropertyEnumeratedValue",
+                    Name="DeliveryType",
+                    EnumerationValues=[ifc_doc.create_entity("IfcLabel", "LOOSE")],
+                ),
+                ifc_doc.create_entity(
+                    "IfcPropertyEnumeratedValue",
+                    Name="CorrosionTreatment",
+                    EnumerationValues=[ifc_doc.create_entity("IfcLabel", "GALVANISED")],
+                ),
+            ]
 
-        # Связываем Pset с продуктом через IfcRelDefinesByProperties
-        self.ifc.create_entity(
-            "IfcRelDefinesByProperties",
-            GlobalId=ifc.guid.new(),
-            OwnerHistory=self.owner_history,
-            Name="Pset_ElementComponentCommon_Association",
-            RelatedObjects=[product],
-            RelatingPropertyDefinition=pset_common,
+        self._attach_shared_pset(
+            product, ("Pset_ElementComponentCommon",), "Pset_ElementComponentCommon", build
         )
 
-        # Вручную обновляем HasPropertySets на продукте
-        # ifcopenshell не делает это автоматически при создании IfcRelDefinesByProperties
-        existing_psets = getattr(product, "HasPropertySets", None)
-        if existing_psets:
-            # Добавляем новый Pset к существующим (кортеж неизменяем, создаём новый)
-            product.HasPropertySets = tuple(existing_psets) + (pset_common,)
-        else:
-            product.HasPropertySets = (pset_common,)
-
     def get_or_create_stud_type(self, bolt_type, diameter, length, material):
         """
         Создание/получение типа шпильки с RepresentationMap
@@ -329,8 +286,9 @@ class TypeFactory:
             IfcMechanicalFastenerType для шпильки
         """
         key = ("stud", bolt_type, diameter, length, material)
-        if key in self.types_cache:
-            return self.types_cache[key]
+        cached = self._get_cached_type(key)
+        if cached is not None:
+            return cached
 
         # Маппинг типа болта в позицию {t}
         type_map = {"1.1": "1", "1.2": "2", "2.1": "3", "5": "7"}
@@ -346,32 +304,20 @@ class TypeFactory:
             PredefinedType="USERDEFINED",
         )
 
-        # Делегируем построение геометрии в GeometryBuilder
-        if bolt_type in ["1.1", "1.2"]:
-            # Изогнутые шпильки: используем IfcSweptDiskSolid с составной кривой
-            shape_rep = self.builder.create_bent_stud_solid(bolt_type, diameter, length)
-        elif bolt_type in ["2.1", "5"]:
-            # Тип 2.1 и 5: прямая шпилька через экструзию
+        def build_shape():
+            # Делегируем построение геометрии в GeometryBuilder
+            if bolt_type in ["1.1", "1.2"]:
+                # Изогнутые шпильки: используем IfcSweptDiskSolid с составной кривой
+                return self.builder.create_bent_stud_solid(bolt_type, diameter, length)
+            # Тип 2.1 и 5 (и другие): прямая шпилька через экструзию
             # Геометрия: от Z=0 до Z=+length
             # Placement: Z=l0 с осью вниз → шпилька от Z=-(L-l0) до Z=+l0
-            shape_rep = self.builder.create_straight_stud_solid(diameter, length)
-        else:
-            # Другие типы
-            shape_rep = self.builder.create_straight_stud_solid(diameter, length)
-
-        # Конвертация в faceted если нужно
-        if self.geometry_type == "faceted":
-            shape_rep = self._create_faceted_representation(shape_rep)
-
-        # Ассоциируем RepresentationMap с типом
-        self.builder.associate_representation(stud_type, shape_rep)
+            return self.builder.create_straight_stud_solid(diameter, length)
 
-        # Кэшируем RepresentationMap для последующего использования
-        geom_key = ("stud", bolt_type, diameter, length)
-        if geom_key not in self.representation_maps:
-            rep_maps = stud_type.RepresentationMaps
-            if rep_maps:
-                self.representation_maps[geom_key] = rep_maps[0]
+        # RepresentationMap не зависит от материала — общий для всех вариантов
+        self._attach_representation_map(
+            stud_type, ("stud", bolt_type, diameter, length), build_shape
+        )
 
         # Создаём материал и ассоциируем с типом
         mat_name = get_material_name(material)
@@ -398,8 +344,9 @@ class TypeFactory:
             IfcMechanicalFastenerType для гайки
         """
         key = ("nut", diameter, material)
-        if key in self.types_cache:
-            return self.types_cache[key]
+        cached = self._get_cached_type(key)
+        if cached is not None:
+            return cached
 
         nut_dim = get_nut_dimensions(diameter)
         height = nut_dim["height"] if nut_dim else 10
@@ -415,21 +362,10 @@ class TypeFactory:
             PredefinedType="USERDEFINED",
         )
 
-        # Делегируем построение геометрии в GeometryBuilder
-        shape_rep = self.builder.create_nut_solid(diameter, height)
-
-        # Конвертация в faceted если нужно
-        if self.geometry_type == "faceted":
-            shape_rep = self._create_faceted_representation(shape_rep)
-
-        self.builder.associate_representation(nut_type, shape_rep)
-
-        # Кэшируем RepresentationMap
-        geom_key = ("nut", diameter)
-        if geom_key not in self.representation_maps:
-            rep_maps = nut_type.RepresentationMaps
-            if rep_maps:
-                self.representation_maps[geom_key] = rep_maps[0]
+        # RepresentationMap не зависит от материала — общий для всех вариантов
+        self._attach_representation_map(
+            nut_type, ("nut", diameter), lambda: self.builder.create_nut_solid(diameter, height)
+        )
 
         # Создаём материал и ассоциируем с типом
         mat_name = get_material_name(material)
@@ -456,8 +392,9 @@ class TypeFactory:
             IfcMechanicalFastenerType для шайбы
         """
         key = ("washer", diameter, material)
-        if key in self.types_cache:
-            return self.types_cache[key]
+        cached = self._get_cached_type(key)
+        if cached is not None:
+            return cached
 
         washer_dim = get_washer_dimensions(diameter)
         outer_d = washer_dim["outer_diameter"] if washer_dim else diameter + 10
@@ -474,14 +411,12 @@ class TypeFactory:
             PredefinedType="USERDEFINED",
         )
 
-        # Делегируем построение геометрии в GeometryBuilder
-        shape_rep = self.builder.create_washer_solid(diameter, outer_d, thickness)
-
-        # Конвертация в faceted если нужно
-        if self.geometry_type == "faceted":
-            shape_rep = self._create_faceted_representation(shape_rep)
-
-        self.builder.associate_representation(washer_type, shape_rep)
+        # RepresentationMap не зависит от материала — общий для всех вариантов
+        self._attach_representation_map(
+            washer_type,
+            ("washer", diameter),
+            lambda: self.builder.create_washer_solid(diameter, outer_d, thickness),
+        )
 
         # Создаём материал и ассоциируем с типом
         mat_name = get_material_name(material)
@@ -508,8 +443,9 @@ class TypeFactory:
             IfcMechanicalFastenerType для плиты
         """
         key = ("plate", diameter, material)
-        if key in self.types_cache:
-            return self.types_cache[key]
+        cached = self._get_cached_type(key)
+        if cached is not None:
+            return cached
 
         from data import get_plate_dimensions
 
@@ -533,14 +469,12 @@ class TypeFactory:
             PredefinedType="USERDEFINED",
         )
 
-        # Создание геометрии
-        shape_rep = self.builder.create_plate_solid(diameter, width, thickness, hole_d)
-
-        # Конвертация в faceted если нужно
-        if self.geometry_type == "faceted":
-            shape_rep = self._create_faceted_representation(shape_rep)
-
-        self.builder.associate_representation(plate_type, shape_rep)
+        # RepresentationMap не зависит от материала — общий для всех вариантов
+        self._attach_representation_map(
+            plate_type,
+            ("plate", diameter),
+            lambda: self.builder.create_plate_solid(diameter, width, thickness, hole_d),
+        )
 
         # Создание материала и ассоциация
         mat_name = get_material_name(material)
@@ -577,8 +511,9 @@ class TypeFactory:
             IfcMechanicalFastenerType или IfcElementAssemblyType
         """
         key = ("assembly", bolt_type, diameter, length, material, assembly_class)
-        if key in self.types_cache:
-            return self.types_cache[key]
+        cached = self._get_cached_type(key)
+        if cached is not None:
+            return cached
 
         type_name = f"Болт {bolt_type}.М{diameter}×{length} {material} ГОСТ 24379.1-2012"
         ifc = get_ifcopenshell()
@@ -615,24 +550,18 @@ class TypeFactory:
                 thread_length = get_thread_length(diameter, length) or 0
                 protrusion_length = thread_length  # AnchorBoltProtrusionLength = длине резьбы
 
-                # Создаём Pset_MechanicalFastenerAnchorBolt через ifcopenshell.api
-                pset = ifcopenshell.api.run(
-                    "pset.add_pset",
-                    self.ifc,
-                    product=assembly_type,
-                    name="Pset_MechanicalFastenerAnchorBolt",
-                )
-                # Добавляем свойства
-                ifcopenshell.api.run(
-                    "pset.edit_pset",
+                # Создаём Pset_MechanicalFastenerAnchorBolt по шаблону (pset_writer)
+                write_pset(
                     self.ifc,
-                    pset=pset,
-                    properties={
-                        "AnchorBoltDiameter": float(diameter),
-                        "AnchorBoltLength": float(length),
-                        "AnchorBoltProtrusionLength": float(protrusion_length),
-                        "AnchorBoltThreadLength": float(thread_length),
+                    assembly_type,
+                    "Pset_MechanicalFastenerAnchorBolt",
+                    {
+                        "AnchorBoltDiameter": diameter,
+                        "AnchorBoltLength": length,
+                        "AnchorBoltProtrusionLength": protrusion_length,
+                        "AnchorBoltThreadLength": thread_length,
                     },
+                    self.owner_history,
                 )
 
                 # Добавляем Pset_ElementComponentCommon для всех IfcMechanicalFastenerType
@@ -662,6 +591,93 @@ class TypeFactory:
         self.types_cache[key] = assembly_type
         return assembly_type
 
+    def _get_cached_type(self, key: tuple) -> Optional[Any]:
+        """Получение типа из кэша с учётом счётчиков попаданий/промахов"""
+        cached = self.types_cache.get(key)
+        if cached is not None:
+            self.cache_stats["type_hits"] += 1
+            count("type_cache.hits")
+        else:
+            self.cache_stats["type_misses"] += 1
+            count("type_cache.misses")
+        return cached
+
+    def _attach_representation_map(self, product_type, geom_key: tuple, build_shape) -> Any:
+        """
+        Назначение типу RepresentationMap из кэша или построение новой геометрии
+
+        Ключ геометрии не содержит материала, поэтому варианты одного
+        компонента из разных сталей ссылаются на один IfcRepresentationMap.
+
+        Args:
+            product_type: IfcMechanicalFastenerType
+            geom_key: Ключ геометрии без материала
+            build_shape: Функция построения IfcShapeRepresentation (вызывается при промахе)
+
+        Returns:
+            IfcRepresentationMap
+        """
+        rep_map = self.representation_maps.get(geom_key)
+        if rep_map is not None:
+            self.cache_stats["representation_map_hits"] += 1
+            count("representation_map_cache.hits")
+            product_type.RepresentationMaps = [rep_map]
+            return rep_map
+
+        self.cache_stats["representation_map_misses"] += 1
+        count("representation_map_cache.misses")
+
+        if self.geometry_type == "triangulated" or (
+            self.geometry_type == "faceted" and self.tessellator == "analytic"
+        ):
+            # Аналитическая сетка по размерам ГОСТ, без построения solid и OpenCascade
+            with span("tessellation"):
+                vertices, triangles = self.builder.tessellate_component(
+                    geom_key, self.tessellation_segments
+                )
+                count("tessellated_triangles", len(triangles))
+                shape_rep = self.builder.create_representation_from_mesh(
+                    vertices, triangles, self.geometry_type
+                )
+        elif self.geometry_type == "faceted":
+            # Faceted геометрия строится из закэшированной тесселяции без OpenCascade
+            mesh = get_tessellation_cache().get(geom_key)
+            if mesh is not None:
+                self.cache_stats["tessellation_hits"] += 1
+                shape_rep = self.builder.create_representation_from_mesh(*mesh)
+            else:
+                self.cache_stats["tessellation_misses"] += 1
+                with span("geometry"):
+                    solid_representation = build_shape()
+                with span("tessellation"):
+                    shape_rep = self._create_faceted_representation(solid_representation, geom_key)
+        else:
+            with span("geometry"):
+                shape_rep = build_shape()
+
+        # Ассоциируем RepresentationMap с типом
+        self.builder.associate_representation(product_type, shape_rep)
+
+        rep_maps = product_type.RepresentationMaps
+        if rep_maps:
+            rep_map = rep_maps[0]
+            self.representation_maps[geom_key] = rep_map
+        return rep_map
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """
+        Статистика кэшей фабрики типов
+
+        Returns:
+            Словарь счётчиков попаданий/промахов типов и RepresentationMap,
+            а также размеры кэшей
+        """
+        return {
+            **self.cache_stats,
+            "types_cached": len(self.types_cache),
+            "representation_maps_cached": len(self.representation_maps),
+        }
+
     def get_cached_types_count(self):
         """Количество закэшированных типов"""
         return len(self.types_cache)
@@ -681,7 +697,7 @@ class TypeFactory:
         Получение RepresentationMap для компонента
 
         Args:
-            component_type: Тип компонента ('stud', 'nut', 'washer')
+            component_type: Тип компонента ('stud', 'nut', 'washer', 'plate')
             diameter: Диаметр (мм)
             length: Длина (мм) - только для stud
             bolt_type: Тип болта - только для stud
@@ -697,7 +713,7 @@ class TypeFactory:
 
         return self.representation_maps.get(geom_key)
 
-    def _create_faceted_representation(self, solid_representation):
+    def _create_faceted_representation(self, solid_representation, geom_key=None):
         """
         Создание IfcFacetedBrep из solid representation
 
@@ -705,6 +721,7 @@ class TypeFactory:
 
         Args:
             solid_representation: IfcShapeRepresentation с solid геометрией
+            geom_key: Ключ геометрии для сохранения тесселяции в кэш (None — не сохранять)
 
         Returns:
             IfcShapeRepresentation с IfcFacetedBrep (тот же объект что и solid_representation)
@@ -766,8 +783,12 @@ class TypeFactory:
             # Масштабируем из метров в миллиметры
             verts_mm = [v * 1000.0 for v in verts]
 
+            if geom_key is not None:
+                get_tessellation_cache().put(geom_key, verts_mm, faces)
+
             points = [tuple(verts_mm[i : i + 3]) for i in range(0, len(verts_mm), 3)]
             triangles = [list(faces[i : i + 3]) for i in range(0, len(faces), 3)]
+            count("tessellated_triangles", len(triangles))
 
             faceted_brep = shape_builder.faceted_brep(points, triangles)
 
@@ -2,6 +2,10 @@
 utils.py — Общие утилиты для Python-модулей
 """
 
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
 # Ленивый импорт ifcopenshell
 _ifcopenshell_cache = None
 
@@ -22,3 +26,42 @@ def get_ifcopenshell():
         except ImportError:
             return None
     return _ifcopenshell_cache
+
+
+def document_cache(ifc_doc: Any, attr: str, factory: Callable[[Any], T]) -> T:
+    """
+    Объект, привязанный к IFC документу (создаётся при первом обращении)
+
+    Кэши уровня документа (интернирование ресурсов, сводные отношения, общие
+    наборы свойств, представления свойств, статистика) хранятся атрибутом
+    документа и помнят свой документ в атрибуте ifc. Время жизни объекта
+    совпадает с документом: новый документ после reset_document получает
+    новый пустой объект, а объект, созданный для другого документа, не
+    используется.
+
+    Args:
+        ifc_doc: IFC документ
+        attr: Имя атрибута документа
+        factory: Конструктор factory(ifc_doc) при первом обращении
+
+    Returns:
+        Объект документа
+    """
+    cached = getattr(ifc_doc, attr, None)
+    if cached is None or cached.ifc is not ifc_doc:
+        cached = factory(ifc_doc)
+        setattr(ifc_doc, attr, cached)
+    return cached
+
+
+def entity_by_id(ifc_doc: Any, entity_id: int) -> Optional[Any]:
+    """
+    Сущность по id или None, если она удалена из документа
+
+    Кэши документа хранят id сущностей; удаление (remove_deep2, сборщик
+    мусора) обнаруживается при следующем обращении.
+    """
+    try:
+        return ifc_doc.by_id(entity_id)
+    except RuntimeError:
+        return None
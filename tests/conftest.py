@@ -61,6 +61,10 @@ class MockIfcEntity:
             if not hasattr(self, "HasPropertySets"):
                 self.HasPropertySets = []
 
+    def id(self) -> int:
+        """Идентификатор сущности в документе (0 — вне документа)"""
+        return self.__dict__.get("_id", 0)
+
     def is_a(self, entity_type: Optional[str] = None) -> str:
         """Получение типа сущности или проверка типа"""
         if entity_type is None:
@@ -162,6 +166,7 @@ class MockIfcDoc:
             entity = MockIfcEntity(entity_type, *args, **kwargs)
 
         self.entities.append(entity)
+        entity._id = len(self.entities)
 
         if entity_type not in self._by_type:
             self._by_type[entity_type] = []
@@ -189,6 +194,17 @@ class MockIfcDoc:
             return create_method
         raise AttributeError(f"'MockIfcDoc' object has no attribute '{name}'")
 
+    def by_id(self, entity_id: int) -> MockIfcEntity:
+        """
+        Получение сущности по ID
+
+        Raises:
+            RuntimeError: Сущность не найдена (как в ifcopenshell)
+        """
+        if 0 < entity_id <= len(self.entities):
+            return self.entities[entity_id - 1]
+        raise RuntimeError(f"Instance #{entity_id} not found")
+
     def by_type(self, entity_type: str) -> List[MockIfcEntity]:
         """
         Получение сущностей по типу
@@ -259,6 +275,16 @@ def python_path() -> str:
     return os.path.join(os.path.dirname(__file__), "..", "python")
 
 
+@pytest.fixture(autouse=True)
+def clean_tessellation_cache():
+    """Изоляция тестов от глобального кэша тесселяции"""
+    from tessellation_cache import reset_tessellation_cache
+
+    reset_tessellation_cache()
+    yield
+    reset_tessellation_cache()
+
+
 @pytest.fixture(scope="function")
 def mock_ifc_doc() -> MockIfcDoc:
     """
@@ -270,6 +296,63 @@ def mock_ifc_doc() -> MockIfcDoc:
     return MockIfcDoc()
 
 
+@pytest.fixture(scope="function")
+def ifc_doc():
+    """
+    Реальный IFC документ с базовой структурой (Project/Site/Building/Storey)
+
+    Returns:
+        Новый ifcopenshell.file, не связанный с глобальным менеджером документов
+    """
+    from document_manager import IFCDocumentManager
+
+    return IFCDocumentManager().create_document("test_doc")
+
+
+@pytest.fixture(scope="function")
+def create_bolt(ifc_doc):
+    """
+    Создание сборки болта в документе ifc_doc
+
+    Returns:
+        Функция create_bolt(factory=None, **params) -> результат
+        InstanceFactory.create_bolt_assembly. По умолчанию болт 1.1 М20×800
+        из 09Г2С без mesh данных; params переопределяют аргументы, без factory
+        создаётся новая InstanceFactory(ifc_doc)
+    """
+    from instance_factory import InstanceFactory
+
+    def create(factory=None, **params):
+        arguments = {
+            "bolt_type": "1.1",
+            "diameter": 20,
+            "length": 800,
+            "material": "09Г2С",
+            "include_mesh": False,
+            **params,
+        }
+        return (factory or InstanceFactory(ifc_doc)).create_bolt_assembly(**arguments)
+
+    return create
+
+
+@pytest.fixture(scope="function")
+def base_document():
+    """
+    Базовый документ глобального менеджера для reset_ifc_document
+
+    Используется тестами точек входа main/instance_factory
+    (generate_bolt_assembly, generate_bolt_schedule):
+    @pytest.mark.usefixtures("base_document")
+    """
+    from main import initialize_base_document, reset_doc_manager
+
+    reset_doc_manager()
+    initialize_base_document("test")
+    yield
+    reset_doc_manager()
+
+
 @pytest.fixture(scope="function")
 def mock_ifc_api_run(monkeypatch):
     """
@@ -0,0 +1,127 @@
+"""
+Тесты для bom_service.py - спецификация ведомости болтов
+"""
+
+import pytest
+
+ROWS = [
+    {"bolt_type": "2.1", "diameter": 24, "length": 1000, "material": "09Г2С"},
+    {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"},
+    {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"},
+    {"bolt_type": "5", "diameter": 20, "length": 300, "material": "ВСт3пс2"},
+]
+
+
+def _items(bom, component):
+    return [item for item in bom["items"] if item["component"] == component]
+
+
+class TestBomService:
+    """Тесты BomService"""
+
+    def test_studs_grouped_with_catalog_mass(self):
+        """Шпильки сгруппированы по типу, размеру и материалу с массой из каталога"""
+        from gost_data import get_bolt_mass
+        from services.bom_service import BomService
+
+        bom = BomService.compute(ROWS)
+
+        studs = {
+            (s["bolt_type"], s["diameter"], s["length"], s["material"]): s
+            for s in _items(bom, "stud")
+        }
+        assert len(studs) == 3
+        stud = studs[("1.1", 20, 800, "09Г2С")]
+        assert stud["quantity"] == 2
+        assert stud["unit_mass"] == get_bolt_mass(20, 800, "1.1")
+        assert stud["mass"] == pytest.approx(2 * stud["unit_mass"])
+
+    def test_component_counts(self):
+        """Гайки, шайбы и плиты считаются по составу сборки"""
+        from services.bom_service import BomService
+
+        bom = BomService.compute(ROWS)
+
+        nuts = {(n["diameter"], n["material"]): n["quantity"] for n in _items(bom, "nut")}
+        assert nuts == {(20, "09Г2С"): 4, (20, "ВСт3пс2"): 2, (24, "09Г2С"): 4}
+        (plate,) = _items(bom, "plate")
+        assert (plate["diameter"], plate["quantity"], plate["unit_mass"]) == (24, 1, 1.30)
+        assert bom["totals"] == {"stud": 4, "nut": 10, "washer": 4, "plate": 1}
+
+    def test_mass_totals(self):
+        """Масса по материалам равна сумме позиций"""
+        from services.bom_service import BomService
+
+        bom = BomService.compute(ROWS)
+
+        for material, mass in bom["mass_by_material"].items():
+            items = [i for i in bom["items"] if i["material"] == material]
+            assert mass == pytest.approx(sum(i["mass"] for i in items))
+        assert bom["total_mass"] == pytest.approx(sum(bom["mass_by_material"].values()))
+
+    def test_analytic_masses(self):
+        """Массы гайки и шайбы М20 из размеров и плотности стали"""
+        from services.bom_service import BomService
+
+        # Гайка: s=30, h=16, d=20; шайба: 21..45, t=8
+        assert BomService.get_nut_mass(20) == pytest.approx(0.0584, abs=1e-4)
+        assert BomService.get_washer_mass(20) == pytest.approx(0.0781, abs=1e-4)
+
+    def test_invalid_rows_excluded(self):
+        """Невалидные строки не входят в спецификацию"""
+        from services.bom_service import BomService
+
+        rows = ROWS + [{"bolt_type": "1.1", "diameter": 999, "length": 800, "material": "09Г2С"}]
+
+        bom = BomService.compute(rows)
+
+        assert bom["count"] == len(ROWS)
+        assert [e["row"] for e in bom["errors"]] == [len(ROWS)]
+
+    def test_out_of_range_length_not_aliased(self):
+        """Длина вне диапазона ключа каталога — ошибка, а не чужая позиция (М20×800)"""
+        from services.bom_service import BomService
+
+        row = {"bolt_type": "1.1", "diameter": 16, "length": 40800, "material": "09Г2С"}
+
+        bom = BomService.compute([row])
+
+        assert [e["row"] for e in bom["errors"]] == [0]
+        assert bom["items"] == []
+        assert bom["count"] == 0
+
+    def test_empty_schedule(self):
+        """Пустая ведомость — пустая спецификация"""
+        from services.bom_service import BomService
+
+        bom = BomService.compute([])
+
+        assert (bom["count"], bom["items"], bom["total_mass"]) == (0, [], 0)
+
+
+@pytest.mark.usefixtures("base_document")
+class TestCompositionMatchesAssembly:
+    """Состав сборки совпадает с InstanceFactory"""
+
+    @pytest.mark.parametrize(
+        "bolt_type,diameter,length",
+        [("1.1", 20, 800), ("1.2", 20, 800), ("2.1", 24, 1000), ("5", 20, 300)],
+    )
+    def test_composition(self, bolt_type, diameter, length):
+        """Количество компонентов по видам совпадает с create_bolt_assembly"""
+        from instance_factory import InstanceFactory
+        from main import get_doc_manager
+        from services.bom_service import ASSEMBLY_COMPOSITION
+
+        factory = InstanceFactory(get_doc_manager().get_document())
+        result = factory.create_bolt_assembly(
+            bolt_type, diameter, length, "09Г2С", include_mesh=False
+        )
+
+        prefixes = {"stud": "Шпилька", "nut": "Гайка", "washer": "Шайба", "plate": "Плита"}
+        created = {
+            component: sum(1 for c in result["components"] if c.Name.startswith(prefix))
+            for component, prefix in prefixes.items()
+        }
+        assert len(result["components"]) == sum(created.values())
+        assert created == ASSEMBLY_COMPOSITION[bolt_type]
@@ -0,0 +1,92 @@
+"""
+Тесты для data/catalog.py — скомпилированный каталог болтов
+"""
+
+import numpy as np
+import pytest
+
+
+class TestBoltRecord:
+    """Записи каталога"""
+
+    def test_records_match_dim_data(self):
+        """Каждая строка BOLT_DIM_DATA скомпилирована в запись"""
+        from data import BOLT_CATALOG, BOLT_DIM_DATA, MASS_INDICES
+
+        assert len(BOLT_CATALOG) == len(BOLT_DIM_DATA)
+        for key, row in BOLT_DIM_DATA.items():
+            diameter, length = map(int, key.split("_"))
+            record = BOLT_CATALOG.get(diameter, length)
+            assert (record.length, record.hook_length, record.bend_radius) == tuple(row[:3])
+            assert record.thread_length == row[4]
+            assert (record.l1, record.l2, record.l3, record.r) == tuple(row[9:13])
+            for bolt_type, mass_idx in MASS_INDICES.items():
+                assert record.mass(bolt_type) == row[mass_idx]
+
+    def test_as_dict_format(self):
+        """as_dict совпадает с форматом get_bolt_dimensions"""
+        from data import BOLT_CATALOG
+
+        dims = BOLT_CATALOG.get(20, 800).as_dict()
+
+        assert set(dims) == {
+            "L", "l", "R", "d", "l0", "mass_1.1", "mass_1.2", "mass_2.1", "mass_5",
+            "l1", "l2", "l3", "r",
+        }  # fmt: skip
+        assert dims["L"] == 800
+
+    def test_missing(self):
+        """Отсутствующая пара и неизвестный тип — None"""
+        from data import BOLT_CATALOG
+
+        assert BOLT_CATALOG.get(20, 801) is None
+        assert BOLT_CATALOG.get(20, 800).mass("3") is None
+        assert not hasattr(BOLT_CATALOG.get(20, 800), "__dict__")
+
+
+class TestBoltCatalogColumns:
+    """Столбцы NumPy"""
+
+    def test_rows(self):
+        """Векторный поиск строк; -1 — нет в каталоге"""
+        from data import BOLT_CATALOG
+
+        rows = BOLT_CATALOG.rows([20, 20, 13, 48, 12], [800, 801, 150, 2800, 150])
+
+        assert rows[1] == rows[2] == -1
+        found = rows[rows >= 0]
+        assert BOLT_CATALOG.diameter[found].tolist() == [20, 48, 12]
+        assert BOLT_CATALOG.length[found].tolist() == [800, 2800, 150]
+
+    def test_rows_out_of_key_range(self):
+        """Значения вне диапазона ключа не совпадают с другими строками каталога"""
+        from data import BOLT_CATALOG
+
+        # 16 * KEY_BASE + 40800 == 20 * KEY_BASE + 800
+        rows = BOLT_CATALOG.rows([16, 20, -5, 20], [40800, -9200, 800, 800])
+
+        assert rows[:3].tolist() == [-1, -1, -1]
+        assert rows[3] >= 0
+
+    def test_columns_match_records(self):
+        """Столбцы совпадают с записями"""
+        from data.catalog import MASS_TYPES
+
+        from data import BOLT_CATALOG
+
+        records = list(BOLT_CATALOG.records.values())
+        assert BOLT_CATALOG.thread_length.tolist() == [r.thread_length for r in records]
+        for column, bolt_type in enumerate(MASS_TYPES):
+            masses = BOLT_CATALOG.mass[:, column]
+            expected = [r.mass(bolt_type) for r in records]
+            assert np.isnan(masses).tolist() == [m is None for m in expected]
+
+    def test_columns_read_only(self):
+        """Столбцы каталога неизменяемы"""
+        from data import BOLT_CATALOG
+
+        with pytest.raises(ValueError):
+            BOLT_CATALOG.mass[0, 0] = 1.0
+        for column in ("hook_length", "bend_radius", "thread_length", "l1", "l2", "l3"):
+            with pytest.raises(ValueError):
+                getattr(BOLT_CATALOG, column)[0] = 0
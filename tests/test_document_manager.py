@@ -122,6 +122,46 @@ class TestResetDocument:
 
         assert manager._current_id == "test_doc"
 
+    def test_reset_document_restores_base_snapshot(self):
+        """После сброса документ совпадает с базовым: без болтов и остатков геометрии"""
+        from document_manager import IFCDocumentManager
+        from instance_factory import InstanceFactory
+
+        manager = IFCDocumentManager()
+        doc = manager.create_document("test_doc")
+        base_count = len(list(doc))
+        factory = InstanceFactory(doc)
+        for i in range(3):
+            factory.create_bolt_assembly(
+                "2.1", 24, 600, "09Г2С", placement=(i * 500.0, 0.0, 0.0), include_mesh=False
+            )
+
+        new_doc = manager.reset_document("test_doc")
+
+        assert new_doc is manager.get_document("test_doc")
+        assert len(list(new_doc)) == base_count
+        assert not new_doc.by_type("IfcMechanicalFastener")
+        assert not new_doc.by_type("IfcMaterial")
+
+    def test_reset_document_replaces_material_manager(self):
+        """MaterialManager после сброса привязан к новому документу"""
+        from document_manager import IFCDocumentManager
+
+        manager = IFCDocumentManager()
+        doc = manager.create_document("test_doc")
+        manager.get_material_manager("test_doc").create_material("Сталь", material_key="09Г2С")
+
+        new_doc = manager.reset_document("test_doc")
+        material_manager = manager.get_material_manager("test_doc")
+
+        assert material_manager.ifc is new_doc
+        assert material_manager.get_cached_materials_count() == 0
+
+        # Материал создаётся заново вместе со стандартными PSet
+        material = material_manager.create_material("Сталь", material_key="09Г2С")
+        assert material in new_doc.by_type("IfcMaterial")
+        assert new_doc.by_type("IfcMaterialProperties")
+
 
 class TestDeleteDocument:
     """Тесты delete_document"""
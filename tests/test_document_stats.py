@@ -0,0 +1,125 @@
+"""
+Тесты для document_stats.py — инкрементальная статистика документа
+"""
+
+import pytest
+
+
+class TestDocumentStats:
+    """Тесты DocumentStats"""
+
+    def test_matches_full_count(self, ifc_doc, create_bolt):
+        """Счётчики совпадают с полным пересчётом документа"""
+        from document_stats import count_entities, get_document_stats
+        from instance_factory import InstanceFactory
+
+        factory = InstanceFactory(ifc_doc)
+        for bolt_type in ("1.1", "2.1", "5"):
+            create_bolt(factory, bolt_type=bolt_type)
+
+        stats = get_document_stats(ifc_doc)
+
+        assert stats.verify() == []
+        summary = stats.summary()
+        assert summary["entities_count"] == count_entities(ifc_doc)["entities_count"]
+        assert summary["mechanical_fasteners"]["total"] == len(
+            ifc_doc.by_type("IfcMechanicalFastener")
+        )
+        assert summary["materials"]["total"] == 1
+
+    def test_factory_syncs_after_assembly(self, ifc_doc, create_bolt):
+        """Фабрика учитывает сущности сборки — сводка не обходит документ"""
+        from document_stats import get_document_stats
+
+        create_bolt()
+
+        assert get_document_stats(ifc_doc).sync() == 0
+
+    def test_sync_counts_only_new_entities(self, ifc_doc):
+        """sync учитывает только сущности, созданные после предыдущей синхронизации"""
+        from document_stats import get_document_stats
+
+        stats = get_document_stats(ifc_doc)
+        stats.sync()
+        before = stats.summary()["entity_types"].get("IfcCartesianPoint", 0)
+
+        ifc_doc.createIfcCartesianPoint((1.0, 2.0, 3.0))
+        temporary = ifc_doc.createIfcCartesianPoint((4.0, 5.0, 6.0))
+        ifc_doc.remove(temporary)
+
+        assert stats.sync() == 1
+        assert stats.summary()["entity_types"]["IfcCartesianPoint"] == before + 1
+        assert stats.verify() == []
+
+    def test_garbage_collection_discards(self, ifc_doc, create_bolt):
+        """Удалённые сборщиком мусора сущности вычитаются из счётчиков"""
+        from document_stats import get_document_stats
+        from garbage_collector import collect_garbage
+        from instance_factory import InstanceFactory
+
+        factory = InstanceFactory(ifc_doc, geometry_type="faceted")
+        create_bolt(factory, geometry_type="faceted")
+        stats = get_document_stats(ifc_doc)
+        stats.sync()
+        orphan = ifc_doc.createIfcCartesianPoint((7.0, 8.0, 9.0))
+        stats.sync()
+
+        result = collect_garbage(ifc_doc)
+
+        assert result["entities_removed"] > 0
+        assert orphan.id() not in {e.id() for e in ifc_doc.by_type("IfcCartesianPoint")}
+        assert stats.verify() == []
+
+    def test_verify_reports_untracked_removal(self, ifc_doc):
+        """verify обнаруживает удаление в обход discard"""
+        from document_stats import get_document_stats
+
+        stats = get_document_stats(ifc_doc)
+        point = ifc_doc.createIfcCartesianPoint((1.0, 1.0, 1.0))
+        stats.sync()
+
+        ifc_doc.remove(point)
+
+        errors = stats.verify()
+        assert any(error.startswith("entities_count") for error in errors)
+
+    def test_new_document_gets_new_stats(self, ifc_doc):
+        """Статистика привязана к документу"""
+        from document_manager import IFCDocumentManager
+        from document_stats import get_document_stats
+
+        other = IFCDocumentManager().create_document("other_doc")
+
+        assert get_document_stats(ifc_doc) is get_document_stats(ifc_doc)
+        assert get_document_stats(other) is not get_document_stats(ifc_doc)
+
+
+class TestSummaryVerify:
+    """Отладочная сверка в IFCGenerator.get_summary"""
+
+    def test_verify_raises_on_mismatch(self, ifc_doc):
+        """get_summary(verify=True) сообщает о расхождении счётчиков"""
+        from document_stats import get_document_stats
+        from ifc_generator import IFCGenerator
+
+        point = ifc_doc.createIfcCartesianPoint((1.0, 1.0, 1.0))
+        get_document_stats(ifc_doc).sync()
+        ifc_doc.remove(point)
+        generator = IFCGenerator(ifc_doc)
+
+        generator.get_summary()
+        with pytest.raises(RuntimeError, match="entities_count"):
+            generator.get_summary(verify=True)
+
+    def test_verify_flag(self, ifc_doc, monkeypatch):
+        """VERIFY включает сверку по умолчанию"""
+        import document_stats
+        from ifc_generator import IFCGenerator
+
+        point = ifc_doc.createIfcCartesianPoint((1.0, 1.0, 1.0))
+        document_stats.get_document_stats(ifc_doc).sync()
+        ifc_doc.remove(point)
+        monkeypatch.setattr(document_stats, "VERIFY", True)
+
+        with pytest.raises(RuntimeError):
+            IFCGenerator(ifc_doc).get_summary()
@@ -0,0 +1,144 @@
+"""
+Тесты для document_template.py — кэш шаблонов базового документа
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clean_templates():
+    """Очистка глобального кэша шаблонов между тестами"""
+    from document_template import reset_document_templates
+
+    reset_document_templates()
+    yield
+    reset_document_templates()
+
+
+def _builder(schema):
+    from document_manager import IFCDocumentManager
+
+    return IFCDocumentManager()._build_base_document(schema)
+
+
+class TestDocumentTemplate:
+    """Тесты DocumentTemplate"""
+
+    def test_instantiate_has_base_structure(self):
+        """Документ из шаблона должен содержать полную базовую структуру"""
+        from document_template import DocumentTemplate
+
+        doc = DocumentTemplate.build("IFC4", _builder).instantiate()
+
+        assert doc.schema == "IFC4"
+        assert doc.owner_history == doc.by_id(1)
+        for entity_type in (
+            "IfcProject",
+            "IfcSite",
+            "IfcBuilding",
+            "IfcBuildingStorey",
+            "IfcProjectedCRS",
+            "IfcMapConversion",
+        ):
+            assert len(doc.by_type(entity_type)) == 1, entity_type
+        assert len(doc.by_type("IfcGeometricRepresentationSubContext")) >= 1
+
+    def test_fresh_global_ids(self):
+        """Каждый документ из шаблона получает свежие GlobalId"""
+        from document_template import DocumentTemplate
+
+        template = DocumentTemplate.build("IFC4", _builder)
+        first = template.instantiate()
+        second = template.instantiate()
+
+        first_ids = {e.GlobalId for e in first.by_type("IfcRoot")}
+        second_ids = {e.GlobalId for e in second.by_type("IfcRoot")}
+        assert len(first_ids) == len(first.by_type("IfcRoot"))
+        assert not first_ids & second_ids
+
+    def test_fresh_timestamps(self, monkeypatch):
+        """Временные метки OwnerHistory обновляются при создании документа"""
+        import document_template
+        from document_template import DocumentTemplate
+
+        template = DocumentTemplate.build("IFC4", _builder)
+        monkeypatch.setattr(document_template.time, "time", lambda: 2000000000.0)
+
+        doc = template.instantiate()
+
+        for history in doc.by_type("IfcOwnerHistory"):
+            assert history.CreationDate == 2000000000
+
+    def test_save_and_load(self, tmp_path):
+        """Шаблон сохраняется в файл и загружается в другом процессе"""
+        from document_template import DocumentTemplate
+
+        template = DocumentTemplate.build("IFC4", _builder)
+        path = template.save(str(tmp_path / "template.ifc"))
+
+        loaded = DocumentTemplate.load(path)
+
+        assert loaded.schema == "IFC4"
+        assert loaded.spf_content == template.spf_content
+        assert len(loaded.instantiate().by_type("IfcProject")) == 1
+
+    def test_from_string_without_schema(self):
+        """SPF без FILE_SCHEMA не является шаблоном"""
+        from document_template import DocumentTemplate
+
+        with pytest.raises(ValueError, match="FILE_SCHEMA"):
+            DocumentTemplate.from_string("ISO-10303-21;\nEND-ISO-10303-21;")
+
+
+class TestTemplateCache:
+    """Тесты глобального кэша шаблонов"""
+
+    def test_builder_called_once_per_schema(self):
+        """Базовая структура строится один раз на схему"""
+        from document_template import get_document_template
+
+        calls = []
+
+        def counting_builder(schema):
+            calls.append(schema)
+            return _builder(schema)
+
+        first = get_document_template("IFC4", counting_builder)
+        second = get_document_template("IFC4", counting_builder)
+
+        assert first is second
+        assert calls == ["IFC4"]
+
+    def test_missing_template_without_builder(self):
+        """Без builder отсутствующий шаблон вызывает KeyError"""
+        from document_template import get_document_template
+
+        with pytest.raises(KeyError):
+            get_document_template("IFC4")
+
+    def test_register_template(self):
+        """Зарегистрированный шаблон используется без построения"""
+        from document_template import (
+            DocumentTemplate,
+            get_document_template,
+            register_document_template,
+        )
+
+        template = DocumentTemplate.build("IFC4", _builder)
+        register_document_template(template)
+
+        assert get_document_template("IFC4") is template
+
+    def test_document_manager_uses_template(self):
+        """IFCDocumentManager создаёт документы из общего шаблона"""
+        from unittest.mock import patch
+
+        from document_manager import IFCDocumentManager
+
+        manager = IFCDocumentManager()
+        manager.create_document("first")
+
+        with patch.object(IFCDocumentManager, "_create_base_structure", side_effect=AssertionError):
+            second = IFCDocumentManager().create_document("second")
+
+        assert len(second.by_type("IfcBuildingStorey")) == 1
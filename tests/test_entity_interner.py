@@ -0,0 +1,103 @@
+"""
+Тесты для entity_interner.py — интернирование геометрических ресурсов
+"""
+
+
+class TestEntityInterner:
+    """Тесты EntityInterner"""
+
+    def test_same_value_same_entity(self, ifc_doc):
+        """Одинаковые значения возвращают одну сущность"""
+        from entity_interner import EntityInterner
+
+        interner = EntityInterner(ifc_doc)
+
+        assert interner.direction((0, 0, 1)) == interner.direction([0.0, 0.0, 1.0])
+        assert interner.point((1.0, 2.0, 3.0)) == interner.point((1.0, 2.0, 3.0 + 1e-12))
+        assert interner.direction((0.0, 0.0, 1.0)) != interner.direction((0.0, 0.0, -1.0))
+        assert interner.stats == {"hits": 3, "misses": 3}
+
+    def test_negative_zero(self, ifc_doc):
+        """-0.0 и 0.0 — одно значение"""
+        from entity_interner import EntityInterner
+
+        interner = EntityInterner(ifc_doc)
+
+        assert interner.point((-0.0, 0.0, 0.0)) == interner.point((0.0, 0.0, 0.0))
+
+    def test_placement_shares_resources(self, ifc_doc):
+        """IfcAxis2Placement3D переиспользует точки и направления"""
+        from entity_interner import EntityInterner
+
+        interner = EntityInterner(ifc_doc)
+        first = interner.axis2placement3d((0.0, 0.0, 10.0), axis=(0.0, 0.0, 1.0))
+        second = interner.axis2placement3d((0.0, 0.0, 20.0), axis=(0.0, 0.0, 1.0))
+
+        assert first != second
+        assert first.Axis == second.Axis
+        assert first.RefDirection is None
+        assert interner.axis2placement3d((0.0, 0.0, 10.0), axis=(0.0, 0.0, 1.0)) == first
+
+    def test_transformation_operator(self, ifc_doc):
+        """Единичный оператор создаётся один раз"""
+        from entity_interner import EntityInterner
+
+        interner = EntityInterner(ifc_doc)
+        operator = interner.transformation_operator()
+
+        assert operator.is_a("IfcCartesianTransformationOperator3D")
+        assert operator.Axis1.DirectionRatios == (1.0, 0.0, 0.0)
+        assert operator.Scale == 1.0
+        assert interner.transformation_operator() == operator
+
+    def test_removed_entity_recreated(self, ifc_doc):
+        """Удалённая из документа сущность создаётся заново"""
+        from entity_interner import EntityInterner
+
+        interner = EntityInterner(ifc_doc)
+        point = interner.point((5.0, 0.0, 0.0))
+        point_id = point.id()
+        ifc_doc.remove(point)
+
+        assert interner.point((5.0, 0.0, 0.0)).id() != point_id
+
+    def test_get_interner_per_document(self, ifc_doc):
+        """Кэш привязан к документу"""
+        from document_manager import IFCDocumentManager
+        from entity_interner import get_interner
+
+        other = IFCDocumentManager().create_document("other_doc")
+
+        assert get_interner(ifc_doc) is get_interner(ifc_doc)
+        assert get_interner(ifc_doc) is not get_interner(other)
+
+
+class TestInterningInAssemblies:
+    """Интернирование в InstanceFactory"""
+
+    def test_resources_shared_between_bolts(self, ifc_doc):
+        """Второй болт не добавляет новых направлений и операторов"""
+        from instance_factory import InstanceFactory
+
+        factory = InstanceFactory(ifc_doc)
+        factory.create_bolt_assembly("1.1", 20, 800, "09Г2С", include_mesh=False)
+        directions = len(ifc_doc.by_type("IfcDirection"))
+        operators = len(ifc_doc.by_type("IfcCartesianTransformationOperator3D"))
+
+        factory.create_bolt_assembly(
+            "1.1", 20, 800, "09Г2С", placement=(1000.0, 0.0, 0.0), include_mesh=False
+        )
+
+        assert len(ifc_doc.by_type("IfcDirection")) == directions
+        assert len(ifc_doc.by_type("IfcCartesianTransformationOperator3D")) == operators == 1
+
+    def test_no_orphans(self, ifc_doc):
+        """Общие ресурсы достижимы от корней документа"""
+        from garbage_collector import find_orphans
+        from instance_factory import InstanceFactory
+
+        factory = InstanceFactory(ifc_doc)
+        for bolt_type in ("1.1", "2.1", "5"):
+            factory.create_bolt_assembly(bolt_type, 24, 800, "09Г2С", include_mesh=False)
+
+        assert find_orphans(ifc_doc) == []
@@ -0,0 +1,166 @@
+"""
+Тесты для garbage_collector.py — сборка осиротевших сущностей
+"""
+
+
+def _add_orphans(doc):
+    """Осиротевшие точка+плейсмент и PropertySet без отношения"""
+    point = doc.create_entity("IfcCartesianPoint", (1.0, 2.0, 3.0))
+    placement = doc.create_entity("IfcAxis2Placement3D", point)
+    prop = doc.create_entity(
+        "IfcPropertySingleValue", Name="Orphan", NominalValue=doc.createIfcLabel("x")
+    )
+    pset = doc.create_entity(
+        "IfcPropertySet",
+        GlobalId="0000000000000000000001",
+        Name="Pset_Orphan",
+        HasProperties=[prop],
+    )
+    return [point, placement, prop, pset]
+
+
+class TestFindOrphans:
+    """Тесты поиска недостижимых сущностей"""
+
+    def test_base_document_has_no_orphans(self, ifc_doc):
+        """Базовый документ не содержит сирот"""
+        from garbage_collector import find_orphans
+
+        assert find_orphans(ifc_doc) == []
+
+    def test_finds_unreferenced_entities(self, ifc_doc):
+        """Недостижимые от корней сущности находятся"""
+        from garbage_collector import find_orphans
+
+        orphans = _add_orphans(ifc_doc)
+
+        assert {e.id() for e in find_orphans(ifc_doc)} == {e.id() for e in orphans}
+
+    def test_pset_with_relationship_is_kept(self, ifc_doc):
+        """PropertySet, связанный с продуктом через отношение, не считается сиротой"""
+        from garbage_collector import find_orphans
+
+        orphans = _add_orphans(ifc_doc)
+        pset = orphans[-1]
+        ifc_doc.create_entity(
+            "IfcRelDefinesByProperties",
+            GlobalId="0000000000000000000002",
+            RelatedObjects=[ifc_doc.by_type("IfcBuildingStorey")[0]],
+            RelatingPropertyDefinition=pset,
+        )
+
+        remaining = {e.id() for e in find_orphans(ifc_doc)}
+        assert remaining == {orphans[0].id(), orphans[1].id()}
+
+    def test_generated_bolts_leave_no_orphans(self, ifc_doc):
+        """Faceted генерация в unified режиме не оставляет сирот после очистки"""
+        from garbage_collector import collect_garbage, find_orphans
+        from instance_factory import InstanceFactory
+
+        factory = InstanceFactory(ifc_doc, geometry_type="faceted")
+        factory.create_bolt_assembly(
+            "1.1", 20, 800, "09Г2С", assembly_mode="unified", geometry_type="faceted"
+        )
+        collect_garbage(ifc_doc)
+
+        assert find_orphans(ifc_doc) == []
+        assert len(ifc_doc.by_type("IfcMechanicalFastener")) == 1
+
+
+class TestCollectGarbage:
+    """Тесты удаления сирот"""
+
+    def test_removes_orphans_and_reports(self, ifc_doc):
+        """Сироты удаляются, статистика содержит сущности и байты"""
+        from garbage_collector import collect_garbage
+
+        before = len(list(ifc_doc))
+        _add_orphans(ifc_doc)
+
+        stats = collect_garbage(ifc_doc)
+
+        assert stats["entities_removed"] == 4
+        assert stats["entities_after"] == before
+        assert len(list(ifc_doc)) == before
+        assert stats["bytes_reclaimed"] > 0
+        assert stats["removed_by_type"]["IfcCartesianPoint"] == 1
+        assert stats["removed_by_type"]["IfcPropertySet"] == 1
+
+    def test_dry_run_keeps_entities(self, ifc_doc):
+        """dry_run только считает сирот"""
+        from garbage_collector import collect_garbage
+
+        _add_orphans(ifc_doc)
+        count = len(list(ifc_doc))
+
+        stats = collect_garbage(ifc_doc, dry_run=True)
+
+        assert stats["entities_removed"] == 4
+        assert stats["dry_run"] is True
+        assert len(list(ifc_doc)) == count
+
+    def test_empty_collection(self, ifc_doc):
+        """Без сирот документ не меняется"""
+        from garbage_collector import collect_garbage
+
+        stats = collect_garbage(ifc_doc)
+
+        assert stats["entities_removed"] == 0
+        assert stats["bytes_reclaimed"] == 0
+        assert stats["entities_before"] == stats["entities_after"]
+
+
+class TestLeakMetrics:
+    """Тесты метрик утечек в IFCDocumentManager"""
+
+    def test_collect_accumulates_metrics(self):
+        """Сборки мусора накапливаются в метриках документа"""
+        from document_manager import IFCDocumentManager
+
+        manager = IFCDocumentManager()
+        doc = manager.create_document("test_doc")
+        _add_orphans(doc)
+
+        assert manager.get_leak_metrics("test_doc")["growth"] == 4
+
+        manager.collect_garbage("test_doc")
+        metrics = manager.get_leak_metrics("test_doc")
+
+        assert metrics["growth"] == 0
+        assert metrics["collections"] == 1
+        assert metrics["entities_reclaimed"] == 4
+        assert metrics["bytes_reclaimed"] > 0
+
+    def test_dry_run_not_counted(self):
+        """dry_run не влияет на накопленные метрики"""
+        from document_manager import IFCDocumentManager
+
+        manager = IFCDocumentManager()
+        _add_orphans(manager.create_document("test_doc"))
+
+        manager.collect_garbage("test_doc", dry_run=True)
+
+        assert manager.get_leak_metrics("test_doc")["collections"] == 0
+
+    def test_reset_counted_and_growth_cleared(self):
+        """Сброс возвращает документ к базовому размеру и учитывается в метриках"""
+        from document_manager import IFCDocumentManager
+
+        manager = IFCDocumentManager()
+        _add_orphans(manager.create_document("test_doc"))
+
+        manager.reset_document("test_doc")
+        metrics = manager.get_leak_metrics("test_doc")
+
+        assert metrics["resets"] == 1
+        assert metrics["growth"] == 0
+
+    def test_metrics_removed_with_document(self):
+        """Метрики удаляются вместе с документом"""
+        from document_manager import IFCDocumentManager
+
+        manager = IFCDocumentManager()
+        manager.create_document("test_doc")
+        manager.delete_document("test_doc")
+
+        assert "test_doc" not in manager._leak_metrics
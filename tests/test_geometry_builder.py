@@ -337,3 +337,133 @@ class TestAssociateRepresentation:
 
         # Проверим, что RepresentationMaps был добавлен
         assert len(product_type.RepresentationMaps) == 2
+
+    def test_associate_representation_reuses_existing_map(self, monkeypatch, ifc_doc):
+        """Уже отображённое представление не получает вторую карту и не сканирует документ"""
+        from geometry_builder import GeometryBuilder
+
+        builder = GeometryBuilder(ifc_doc)
+        shape_rep = builder.create_nut_solid(20, 16)
+        first = ifc_doc.create_entity("IfcMechanicalFastenerType", GlobalId="0" * 22)
+        second = ifc_doc.create_entity("IfcMechanicalFastenerType", GlobalId="1" * 22)
+        builder.associate_representation(first, shape_rep)
+
+        def by_type(*args, **kwargs):
+            raise AssertionError("by_type не должен вызываться")
+
+        monkeypatch.setattr(ifc_doc, "by_type", by_type)
+        builder.associate_representation(second, shape_rep)
+
+        assert len(first.RepresentationMaps) == 1
+        assert second.RepresentationMaps is None
+        assert len(shape_rep.RepresentationMap) == 1
+
+
+def _edge_balance(triangles):
+    """Каждое ориентированное ребро встречается один раз и обратное ему — один раз"""
+    from collections import Counter
+
+    edges = Counter((int(t[k]), int(t[(k + 1) % 3])) for t in triangles for k in range(3))
+    return all(count == 1 and edges[(b, a)] == 1 for (a, b), count in edges.items())
+
+
+def _volume(vertices, triangles):
+    import numpy as np
+
+    p0, p1, p2 = (vertices[triangles[:, k]] for k in range(3))
+    return float(np.einsum("ij,ij->i", p0, np.cross(p1, p2)).sum() / 6.0)
+
+
+class TestAnalyticTessellation:
+    """Тесты аналитической тесселяции компонентов"""
+
+    @pytest.mark.parametrize(
+        "geom_key",
+        [
+            ("nut", 12),
+            ("nut", 48),
+            ("washer", 20),
+            ("plate", 30),
+            ("stud", "1.1", 20, 800),
+            ("stud", "1.2", 48, 2000),
+            ("stud", "2.1", 24, 1000),
+            ("stud", "5", 12, 150),
+        ],
+    )
+    def test_watertight_and_outward(self, geom_key):
+        """Сетка замкнута, ориентирована наружу и без вырожденных треугольников"""
+        import numpy as np
+        from geometry_builder import GeometryBuilder
+
+        vertices, triangles = GeometryBuilder(MockIfcDoc()).tessellate_component(geom_key)
+
+        assert _edge_balance(triangles)
+        assert _volume(vertices, triangles) > 0
+        p0, p1, p2 = (vertices[triangles[:, k]] for k in range(3))
+        assert np.linalg.norm(np.cross(p1 - p0, p2 - p0), axis=1).min() > 1e-6
+
+    def test_nut_volume_matches_gost(self):
+        """Объём гайки близок к объёму шестигранной призмы с отверстием"""
+        import math
+
+        from geometry_builder import GeometryBuilder
+        from gost_data import get_nut_dimensions
+
+        dim = get_nut_dimensions(20)
+        vertices, triangles = GeometryBuilder(MockIfcDoc()).tessellate_nut(
+            20, dim["height"], segments=256
+        )
+
+        hexagon = math.sqrt(3) / 2 * dim["s_width"] ** 2
+        expected = dim["height"] * (hexagon - math.pi * 10.5**2)
+        assert _volume(vertices, triangles) == pytest.approx(expected, rel=1e-3)
+
+    def test_stud_follows_axis(self):
+        """Габариты изогнутой шпильки совпадают с осью create_composite_curve_stud"""
+        import numpy as np
+        from geometry_builder import GeometryBuilder
+
+        builder = GeometryBuilder(MockIfcDoc())
+        points, _ = builder.get_stud_axis_points("1.1", 20, 800)
+        vertices, _ = builder.tessellate_stud("1.1", 20, 800)
+
+        # Торцы перпендикулярны оси: вертикальный участок сверху, горизонтальный крюк снизу
+        axis = np.array(points)
+        np.testing.assert_allclose(
+            vertices.min(axis=0), [-10.0, -10.0, axis[:, 2].min() - 10.0], atol=1e-6
+        )
+        np.testing.assert_allclose(vertices.max(axis=0), [axis[:, 0].max(), 10.0, 0.0], atol=1e-6)
+
+    def test_segments_configurable(self):
+        """Количество сегментов окружности задаётся параметром"""
+        from geometry_builder import GeometryBuilder
+
+        builder = GeometryBuilder(MockIfcDoc())
+        coarse, _ = builder.tessellate_component(("washer", 20), segments=16)
+        fine, _ = builder.tessellate_component(("washer", 20), segments=64)
+
+        assert len(coarse) == 4 * 16
+        assert len(fine) == 4 * 64
+
+    def test_unknown_component(self):
+        """Неизвестный компонент — ValueError"""
+        from geometry_builder import GeometryBuilder
+
+        with pytest.raises(ValueError):
+            GeometryBuilder(MockIfcDoc()).tessellate_component(("bolt", 20))
+
+    @pytest.mark.parametrize(
+        "geometry_type,item_type",
+        [("faceted", "IfcFacetedBrep"), ("triangulated", "IfcTriangulatedFaceSet")],
+    )
+    def test_representation_from_mesh(self, geometry_type, item_type, ifc_doc):
+        """Сетка превращается в IfcFacetedBrep или IfcTriangulatedFaceSet"""
+        from geometry_builder import GeometryBuilder
+
+        builder = GeometryBuilder(ifc_doc)
+        vertices, triangles = builder.tessellate_component(("nut", 20))
+
+        shape_rep = builder.create_representation_from_mesh(vertices, triangles, geometry_type)
+
+        assert shape_rep.Items[0].is_a() == item_type
+        assert shape_rep.RepresentationIdentifier == "Body"
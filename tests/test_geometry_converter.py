@@ -0,0 +1,181 @@
+"""
+Тесты для geometry_converter.py — пакетная и инстансированная конвертация геометрии
+"""
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def bolt(ifc_doc):
+    """Сборка 1.1 M20x800 в реальном документе"""
+    from instance_factory import InstanceFactory
+
+    result = InstanceFactory(ifc_doc).create_bolt_assembly(
+        "1.1", 20, 800, "09Г2С", include_mesh=False
+    )
+    return ifc_doc, result["components"]
+
+
+class TestConvertElementsBatch:
+    """Тесты convert_elements_batch"""
+
+    def test_matches_serial_conversion(self, bolt):
+        """Пакет должен давать те же сетки, что и convert_ifc_to_mesh"""
+        from geometry_converter import convert_elements_batch, convert_ifc_to_mesh
+
+        ifc_doc, components = bolt
+        batch = convert_elements_batch(ifc_doc, components, num_threads=1)
+
+        assert batch["failures"] == []
+        assert set(batch["meshes"]) == {c.id() for c in components}
+        for component in components:
+            expected = convert_ifc_to_mesh(ifc_doc, component)
+            actual = batch["meshes"][component.id()]
+            assert len(actual["indices"]) == len(expected["indices"])
+            np.testing.assert_allclose(
+                np.array(actual["vertices"]).reshape(-1, 3).min(axis=0),
+                np.array(expected["vertices"]).reshape(-1, 3).min(axis=0),
+            )
+
+    def test_timings_per_element(self, bolt):
+        """Время должно фиксироваться для каждого элемента"""
+        from geometry_converter import convert_elements_batch
+
+        ifc_doc, components = bolt
+        batch = convert_elements_batch(ifc_doc, components, num_threads=2)
+
+        assert set(batch["timings"]) == {c.id() for c in components}
+        assert all(t >= 0 for t in batch["timings"].values())
+        assert batch["total_time"] >= max(batch["timings"].values())
+        assert batch["num_threads"] == 2
+
+    def test_partial_results(self, bolt):
+        """Элемент без геометрии попадает в failures, остальные конвертируются"""
+        from geometry_converter import convert_elements_batch
+
+        ifc_doc, components = bolt
+        broken = components[-1]
+        broken.Representation = None
+
+        batch = convert_elements_batch(ifc_doc, components)
+
+        assert [f["id"] for f in batch["failures"]] == [broken.id()]
+        assert batch["failures"][0]["GlobalId"] == broken.GlobalId
+        assert set(batch["meshes"]) == {c.id() for c in components[:-1]}
+
+    def test_empty_input(self, bolt):
+        """Пустой список не должен запускать iterator по всему документу"""
+        from geometry_converter import convert_elements_batch
+
+        ifc_doc, _ = bolt
+        batch = convert_elements_batch(ifc_doc, [])
+
+        assert batch["meshes"] == {}
+        assert batch["failures"] == []
+
+
+class TestConvertAssemblyToMeshes:
+    """Тесты convert_assembly_to_meshes"""
+
+    def test_partial_assembly(self, bolt):
+        """Ошибка одного компонента не должна отменять сетки остальных"""
+        from geometry_converter import convert_assembly_to_meshes
+
+        ifc_doc, components = bolt
+        components[0].Representation = None
+
+        result = convert_assembly_to_meshes(ifc_doc, components, assembly_info={"name": "Б1"})
+
+        assert [m["id"] for m in result["meshes"]] == [c.id() for c in components[1:]]
+        assert [f["id"] for f in result["failures"]] == [components[0].id()]
+        assert result["assembly_info"] == {"name": "Б1"}
+
+    def test_uses_precomputed_batch(self, bolt):
+        """Готовый пакет используется без повторной конвертации"""
+        from geometry_converter import convert_assembly_to_meshes, convert_elements_batch
+
+        ifc_doc, components = bolt
+        batch = convert_elements_batch(ifc_doc, components)
+
+        result = convert_assembly_to_meshes(ifc_doc, components[:2], batch=batch)
+
+        assert "failures" not in result
+        assert [m["vertices"] for m in result["meshes"]] == [
+            batch["meshes"][c.id()]["vertices"] for c in components[:2]
+        ]
+        assert set(result["timings"]) == {c.id() for c in components[:2]}
+
+
+def _world_vertices(mesh, index):
+    """Вершины экземпляра index инстансированной сетки в мировых координатах"""
+    vertices = np.asarray(mesh["vertices"]).reshape(-1, 3)
+    matrix = np.asarray(mesh["transforms"]).reshape(-1, 4, 4)[index].T
+    return vertices @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+class TestConvertAssemblyToInstancedMeshes:
+    """Тесты convert_assembly_to_instanced_meshes"""
+
+    @pytest.fixture
+    def bolt_2_1(self, ifc_doc):
+        """Сборка 2.1 с четырьмя одинаковыми гайками"""
+        from instance_factory import InstanceFactory
+
+        result = InstanceFactory(ifc_doc).create_bolt_assembly(
+            "2.1", 24, 1000, "09Г2С", placement=(100.0, 200.0, 300.0, 30.0)
+        )
+        return ifc_doc, result
+
+    def test_one_mesh_per_representation_map(self, bolt_2_1):
+        """Одинаковые компоненты — одна сетка с несколькими экземплярами"""
+        from geometry_converter import convert_assembly_to_instanced_meshes
+
+        ifc_doc, result = bolt_2_1
+        components = result["components"]
+        instanced = convert_assembly_to_instanced_meshes(ifc_doc, components)
+
+        assert instanced["instanced"] is True
+        assert instanced["instance_count"] == len(components)
+        assert len(instanced["meshes"]) < len(components)
+        for mesh in instanced["meshes"]:
+            assert len(mesh["transforms"]) == 16 * mesh["instance_count"]
+            assert len(mesh["colors"]) == mesh["instance_count"]
+            assert len(mesh["instances"]) == mesh["instance_count"]
+        assert max(m["instance_count"] for m in instanced["meshes"]) == 4
+
+    @pytest.mark.parametrize("analytic", [False, True])
+    def test_transforms_reproduce_world_meshes(self, bolt_2_1, analytic):
+        """Сетка × матрица экземпляра совпадает с мировой сеткой компонента"""
+        from geometry_converter import convert_assembly_to_instanced_meshes
+
+        ifc_doc, result = bolt_2_1
+        world = {m["id"]: m for m in result["mesh_data"]["meshes"]}
+        instanced = convert_assembly_to_instanced_meshes(
+            ifc_doc, result["components"], geom_keys=result["geom_keys"] if analytic else None
+        )
+
+        for mesh in instanced["meshes"]:
+            for index, instance in enumerate(mesh["instances"]):
+                actual = _world_vertices(mesh, index)
+                expected = np.asarray(world[instance["id"]]["vertices"]).reshape(-1, 3)
+                # Аналитическая сетка отличается хордами окружностей (< 0.2 мм)
+                atol = 2e-4 if analytic else 1e-9
+                np.testing.assert_allclose(actual.min(axis=0), expected.min(axis=0), atol=atol)
+                np.testing.assert_allclose(actual.max(axis=0), expected.max(axis=0), atol=atol)
+
+    def test_binary_payload(self, bolt_2_1):
+        """Бинарный payload содержит буферы матриц и цветов экземпляров"""
+        from geometry_converter import convert_assembly_to_instanced_meshes
+        from mesh_payload import unpack_mesh_data
+
+        ifc_doc, result = bolt_2_1
+        lists = convert_assembly_to_instanced_meshes(ifc_doc, result["components"])
+        payload = convert_assembly_to_instanced_meshes(ifc_doc, result["components"], binary=True)
+
+        assert len(payload["transforms"]) == 16 * len(result["components"])
+        assert len(payload["colors"]) == len(result["components"])
+        for expected, actual in zip(lists["meshes"], unpack_mesh_data(payload)["meshes"]):
+            np.testing.assert_allclose(actual["transforms"], expected["transforms"], atol=1e-6)
+            assert actual["colors"].tolist() == expected["colors"]
+            assert actual["instances"] == expected["instances"]
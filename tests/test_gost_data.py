@@ -304,3 +304,95 @@ class TestValidateParameters:
 
         errors = str(exc_info.value).split("\n")
         assert len(errors) >= 2  # Минимум 2 ошибки
+
+
+class TestValidateSchedule:
+    """Тесты пакетной валидации ведомости"""
+
+    def test_per_row_error_table(self):
+        """Ошибки возвращаются по строкам без исключения"""
+        from data.validation import (
+            ERROR_COMBINATION,
+            ERROR_DIAMETER_RANGE,
+            ERROR_LENGTH,
+            ERROR_MATERIAL,
+        )
+        from gost_data import validate_schedule
+
+        rows = [
+            {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"},
+            {"bolt_type": "2.1", "diameter": 12, "length": 800, "material": "09Г2С"},
+            {"bolt_type": "1.1", "diameter": 20, "length": 9999, "material": "Неизвестный"},
+            {"bolt_type": "1.1", "diameter": 20.0, "length": 800.0, "material": "09Г2С"},
+        ]
+
+        report = validate_schedule(rows)
+
+        assert report["valid"].tolist() == [True, False, False, True]
+        assert [e["row"] for e in report["errors"]] == [1, 2]
+        assert report["errors"][0]["flags"] == ERROR_DIAMETER_RANGE | ERROR_COMBINATION
+        assert report["errors"][1]["flags"] == ERROR_LENGTH | ERROR_MATERIAL
+        assert "недоступна" in report["errors"][1]["messages"][1]
+
+    def test_empty_schedule(self):
+        """Пустая ведомость валидна"""
+        from gost_data import validate_schedule
+
+        report = validate_schedule([])
+
+        assert len(report["valid"]) == 0
+        assert report["errors"] == []
+
+    def test_matches_validate_parameters(self):
+        """Результат совпадает с построчной validate_parameters"""
+        import itertools
+
+        from gost_data import validate_parameters, validate_schedule
+
+        rows = [
+            {"bolt_type": t, "diameter": d, "length": length, "material": m}
+            for t, d, length, m in itertools.product(
+                ["1.1", "1.2", "2.1", "5", "9.9", None],
+                [12, 16, 20, 20.5, 48, 999, "20", None],
+                [150, 300, 800, 800.5, 2800, 9999, None],
+                ["09Г2С", "Неизвестный"],
+            )
+        ]
+
+        report = validate_schedule(rows)
+        errors = {e["row"]: e for e in report["errors"]}
+
+        for index, row in enumerate(rows):
+            try:
+                validate_parameters(**row)
+            except ValueError as e:
+                messages = str(e).split("\n")
+                assert errors[index]["messages"] == messages
+                assert bin(errors[index]["flags"]).count("1") == len(messages)
+            else:
+                assert index not in errors
+
+    def test_out_of_key_range_matches_parameter_errors(self):
+        """Длины и диаметры вне диапазона ключей каталога не совпадают с другими болтами"""
+        import itertools
+
+        from data.validation import ERROR_COMBINATION, ERROR_LENGTH, _parameter_errors
+        from gost_data import validate_schedule
+
+        rows = [
+            {"bolt_type": t, "diameter": d, "length": length, "material": "09Г2С"}
+            for t, d, length in itertools.product(
+                ["1.1", "1.2", "2.1", "5"],
+                [12, 16, 20, 48, 10012, -9988],
+                [800, 0, -1, -9200, 10000, 10800, 40800, 20800],
+            )
+        ]
+
+        report = validate_schedule(rows)
+
+        for row, flags in zip(rows, report["flags"].tolist()):
+            messages = _parameter_errors(**row)
+            assert (flags != 0) == bool(messages), row
+            assert bin(flags).count("1") == len(messages), row
+            assert bool(flags & ERROR_COMBINATION) == any("Комбинация" in m for m in messages)
+            assert bool(flags & ERROR_LENGTH) == any("Длина" in m for m in messages)
@@ -89,6 +89,31 @@ class TestIFCGeneratorExport:
             assert "ISO-10303-21" in content
             assert "END-ISO-10303-21" in content
 
+    def test_export_to_string(self, tmp_path):
+        """export_to_string должен совпадать с содержимым export_to_file"""
+        from ifc_generator import IFCGenerator
+        from main import initialize_base_document
+
+        generator = IFCGenerator(initialize_base_document())
+
+        filepath = os.path.join(tmp_path, "test.ifc")
+        generator.export_to_file(filepath)
+        with open(filepath, "r") as f:
+            assert generator.export_to_string() == f.read()
+
+    def test_export_to_bytes_gzip(self):
+        """export_to_bytes должен поддерживать gzip"""
+        import gzip
+
+        from ifc_generator import IFCGenerator
+        from main import initialize_base_document
+
+        generator = IFCGenerator(initialize_base_document())
+
+        data = generator.export_to_bytes(compression="gzip")
+
+        assert gzip.decompress(data).decode("utf-8") == generator.export_to_string()
+
 
 class TestIFCGeneratorSummary:
     """Тесты get_summary"""
@@ -101,19 +126,13 @@ class TestIFCGeneratorSummary:
         ifc_doc = initialize_base_document()
         generator = IFCGenerator(ifc_doc)
 
-        # get_summary может вызывать TypeError для ifcopenshell.file
-        # т.к. len() не поддерживается напрямую
-        try:
-            summary = generator.get_summary()
-            assert isinstance(summary, dict)
-            assert "project" in summary
-            assert "entities_count" in summary
-            assert "entity_types" in summary
-            assert "mechanical_fasteners" in summary
-            assert "materials" in summary
-        except TypeError:
-            # Ожидаемое поведение для ifcopenshell.file без len()
-            pytest.skip("ifcopenshell.file не поддерживает len()")
+        summary = generator.get_summary(verify=True)
+        assert isinstance(summary, dict)
+        assert "project" in summary
+        assert summary["entities_count"] == sum(1 for _ in ifc_doc)
+        assert "entity_types" in summary
+        assert "mechanical_fasteners" in summary
+        assert "materials" in summary
 
     def test_get_project_info(self):
         """_get_project_info должен возвращать информацию о проекте"""
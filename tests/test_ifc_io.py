@@ -0,0 +1,103 @@
+"""
+Тесты для ifc_io.py — экспорт и импорт IFC в памяти
+"""
+
+import pytest
+
+
+class TestStringRoundTrip:
+    """Тесты to_string / from_string"""
+
+    def test_to_string_is_spf(self, ifc_doc):
+        """to_string должен возвращать полный SPF"""
+        from ifc_io import to_string
+
+        content = to_string(ifc_doc)
+
+        assert content.startswith("ISO-10303-21;")
+        assert "FILE_SCHEMA(('IFC4'));" in content
+        assert content.rstrip().endswith("END-ISO-10303-21;")
+
+    def test_round_trip_preserves_entities(self, ifc_doc):
+        """Документ после from_string(to_string()) содержит те же сущности"""
+        from ifc_io import from_string, to_string
+
+        restored = from_string(to_string(ifc_doc))
+
+        assert len(list(restored)) == len(list(ifc_doc))
+        assert restored.by_id(1).is_a("IfcOwnerHistory")
+        assert restored.by_type("IfcProject")[0].GlobalId == (
+            ifc_doc.by_type("IfcProject")[0].GlobalId
+        )
+
+    def test_to_string_without_native_support(self, ifc_doc):
+        """Для сборок без file.to_string используется временный файл"""
+        from ifc_io import to_string
+
+        class LegacyDoc:
+            def write(self, path):
+                ifc_doc.write(path)
+
+        assert to_string(LegacyDoc()) == ifc_doc.to_string()
+
+
+class TestBytesRoundTrip:
+    """Тесты to_bytes / from_bytes"""
+
+    @pytest.mark.parametrize("compression", [None, "gzip", "ifczip"])
+    def test_round_trip(self, ifc_doc, compression):
+        """Документ должен восстанавливаться из байтов любого формата"""
+        from ifc_io import from_bytes, to_bytes, to_string
+
+        data = to_bytes(ifc_doc, compression=compression)
+        restored = from_bytes(data)
+
+        assert to_string(restored) == to_string(ifc_doc)
+
+    def test_gzip_smaller_than_plain(self, ifc_doc):
+        """Сжатый поток должен быть меньше исходного SPF"""
+        from ifc_io import to_bytes
+
+        assert len(to_bytes(ifc_doc, "gzip")) < len(to_bytes(ifc_doc))
+
+    def test_ifczip_contains_ifc_member(self, ifc_doc):
+        """IFCZIP архив должен содержать один .ifc файл"""
+        import io
+        import zipfile
+
+        from ifc_io import to_bytes
+
+        with zipfile.ZipFile(io.BytesIO(to_bytes(ifc_doc, "ifczip"))) as archive:
+            names = archive.namelist()
+
+        assert len(names) == 1
+        assert names[0].endswith(".ifc")
+
+    def test_from_bytes_accepts_memoryview(self, ifc_doc):
+        """from_bytes должен принимать memoryview"""
+        from ifc_io import from_bytes, to_bytes
+
+        restored = from_bytes(memoryview(to_bytes(ifc_doc)))
+
+        assert len(list(restored)) == len(list(ifc_doc))
+
+    def test_unknown_compression(self, ifc_doc):
+        """Неизвестный режим сжатия должен вызывать ValueError"""
+        from ifc_io import to_bytes
+
+        with pytest.raises(ValueError, match="Неизвестный режим сжатия"):
+            to_bytes(ifc_doc, compression="bz2")
+
+    def test_ifczip_without_ifc_member(self):
+        """ZIP без .ifc файла должен вызывать ValueError"""
+        import io
+        import zipfile
+
+        from ifc_io import from_bytes
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("readme.txt", "empty")
+
+        with pytest.raises(ValueError, match="не содержит .ifc"):
+            from_bytes(buffer.getvalue())
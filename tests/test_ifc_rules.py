@@ -35,6 +35,23 @@ from instance_factory import InstanceFactory
 from main import initialize_base_document, reset_doc_manager
 
 
+def _signed_volume(polygons):
+    """Ориентированный объём оболочки: сумма p0 · (p1 × p2) / 6 по веерам граней"""
+    volume = 0.0
+    for polygon in polygons:
+        x0, y0, z0 = polygon[0]
+        for (x1, y1, z1), (x2, y2, z2) in zip(polygon[1:-1], polygon[2:]):
+            volume += x0 * (y1 * z2 - z1 * y2) - y0 * (x1 * z2 - z1 * x2) + z0 * (x1 * y2 - y1 * x2)
+    return volume / 6
+
+
+def _brep_polygons(brep):
+    """Контуры граней IfcFacetedBrep как списки координат"""
+    return [
+        [tuple(p.Coordinates) for p in face.Bounds[0].Bound.Polygon] for face in brep.Outer.CfsFaces
+    ]
+
+
 class TestIFCRules:
     """Тесты правил валидации IFC buildingsmart"""
 
@@ -1091,6 +1108,136 @@ class TestIFCRules:
                 faces = shell.CfsFaces or []
                 assert len(faces) > 0, f"IfcClosedShell не должен быть пустым (GEM001)"
 
+    @pytest.mark.parametrize(
+        "bolt_type,diameter,length",
+        [
+            ("1.1", 12, 300),
+            ("1.1", 48, 1900),
+            ("1.2", 20, 400),
+            ("1.2", 48, 2000),
+            ("2.1", 20, 600),
+            ("2.1", 48, 1700),
+            ("5", 12, 150),
+            ("5", 48, 1400),
+        ],
+    )
+    def test_gem001_unified_faceted_oriented_edges(self, factory, bolt_type, diameter, length):
+        """
+        GEM001: В unified faceted оболочке каждое ориентированное ребро
+        используется ровно один раз, а обратное ему — ровно один раз
+        (невыпуклые крюк и отверстия гаек не должны ломать ориентацию)
+        """
+        from collections import Counter
+
+        result = factory.create_bolt_assembly(
+            bolt_type=bolt_type,
+            diameter=diameter,
+            length=length,
+            material="09Г2С",
+            assembly_mode="unified",
+            geometry_type="faceted",
+            include_mesh=False,
+        )
+        closed_shells = result["ifc_doc"].by_type("IfcClosedShell")
+        assert closed_shells, "Unified faceted режим должен создавать IfcClosedShell"
+
+        for shell in closed_shells:
+            edges = Counter()
+            for face in shell.CfsFaces:
+                for bound in face.Bounds:
+                    points = [p.id() for p in bound.Bound.Polygon]
+                    for k, start in enumerate(points):
+                        edges[(start, points[(k + 1) % len(points)])] += 1
+
+            bad_edges = [
+                edge for edge, count in edges.items() if count != 1 or edges[edge[::-1]] != 1
+            ]
+            assert not bad_edges, f"GEM001: некорректное использование рёбер: {bad_edges[:5]}"
+
+        # Нормали направлены наружу: ориентированный объём положителен
+        for brep in result["ifc_doc"].by_type("IfcFacetedBrep"):
+            assert _signed_volume(_brep_polygons(brep)) > 0, "GEM001: оболочка вывернута"
+
+    @pytest.mark.parametrize("assembly_mode", ["separate", "unified"])
+    @pytest.mark.parametrize("bolt_type", ["1.1", "1.2", "2.1", "5"])
+    def test_gem001_faceted_shells_face_outward(self, ifc_doc, bolt_type, assembly_mode):
+        """
+        GEM001: Оболочки IfcFacetedBrep ориентированы наружу — ориентированный
+        объём каждой оболочки положителен (инверсия компоненты в orient_triangles)
+        """
+        factory = InstanceFactory(ifc_doc, geometry_type="faceted")
+        result = factory.create_bolt_assembly(
+            bolt_type=bolt_type,
+            diameter=20,
+            length=800 if bolt_type != "5" else 300,
+            material="09Г2С",
+            assembly_mode=assembly_mode,
+            geometry_type="faceted",
+            include_mesh=False,
+        )
+        breps = result["ifc_doc"].by_type("IfcFacetedBrep")
+        assert breps
+
+        for brep in breps:
+            assert _signed_volume(_brep_polygons(brep)) > 0, "GEM001: оболочка вывернута"
+
+    @pytest.mark.parametrize("geometry_type", ["faceted", "triangulated"])
+    @pytest.mark.parametrize(
+        "bolt_type,diameter,length", [("1.1", 12, 300), ("1.2", 48, 2000), ("2.1", 48, 1700)]
+    )
+    def test_gem001_analytic_tessellation_oriented_edges(
+        self, ifc_doc, geometry_type, bolt_type, diameter, length
+    ):
+        """
+        GEM001: Сетки аналитического тесселятора замкнуты — каждое ориентированное
+        ребро используется один раз, обратное ему — один раз
+        """
+        from collections import Counter
+
+        factory = InstanceFactory(ifc_doc, geometry_type=geometry_type, tessellator="analytic")
+        factory.create_bolt_assembly(
+            bolt_type=bolt_type,
+            diameter=diameter,
+            length=length,
+            material="09Г2С",
+            geometry_type=geometry_type,
+            include_mesh=False,
+        )
+
+        if geometry_type == "faceted":
+            loops = [
+                [[p.id() for p in face.Bounds[0].Bound.Polygon] for face in shell.CfsFaces]
+                for shell in ifc_doc.by_type("IfcClosedShell")
+            ]
+        else:
+            loops = [
+                list(face_set.CoordIndex) for face_set in ifc_doc.by_type("IfcTriangulatedFaceSet")
+            ]
+        assert loops
+
+        for faces in loops:
+            edges = Counter()
+            for points in faces:
+                for k, start in enumerate(points):
+                    edges[(start, points[(k + 1) % len(points)])] += 1
+            bad_edges = [
+                edge for edge, count in edges.items() if count != 1 or edges[edge[::-1]] != 1
+            ]
+            assert not bad_edges, f"GEM001: некорректное использование рёбер: {bad_edges[:5]}"
+
+        if geometry_type == "faceted":
+            shells = [_brep_polygons(brep) for brep in ifc_doc.by_type("IfcFacetedBrep")]
+        else:
+            shells = [
+                [
+                    [face_set.Coordinates.CoordList[i - 1] for i in triangle]
+                    for triangle in face_set.CoordIndex
+                ]
+                for face_set in ifc_doc.by_type("IfcTriangulatedFaceSet")
+            ]
+        for polygons in shells:
+            assert _signed_volume(polygons) > 0, "GEM001: оболочка вывернута"
+
     # =============================================================================
     # GEM002: Space representation - v2
     # =============================================================================
@@ -369,3 +369,226 @@ class TestCreateBoltAssembly:
         # Шпилька должна иметь NominalLength
         assert hasattr(stud, "NominalLength")
         assert stud.NominalLength == 800
+
+
+@pytest.mark.usefixtures("base_document")
+class TestGenerateBoltAssembly:
+    """Тесты generate_bolt_assembly — точка входа веб-интерфейса"""
+
+    @pytest.mark.parametrize("tessellator", ["geom", "analytic"])
+    def test_returns_ifc_and_mesh(self, tessellator):
+        """Должны возвращаться IFC строка и mesh данные выбранного тесселятора"""
+        from instance_factory import generate_bolt_assembly
+
+        params = {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"}
+        ifc_str, mesh_data = generate_bolt_assembly(params, tessellator=tessellator)
+
+        assert "IFCMECHANICALFASTENER" in ifc_str
+        assert len(mesh_data["meshes"]) == 4
+
+    @pytest.mark.parametrize("mesh_format", ["lists", "binary"])
+    def test_include_properties(self, mesh_format):
+        """Таблица свойств сборки и компонентов совпадает с get_element_properties"""
+        from ifc_generator import IFCGenerator
+        from instance_factory import generate_bolt_assembly
+        from main import get_ifc_document
+        from property_views import resolve_property_table
+
+        params = {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"}
+        _, mesh_data = generate_bolt_assembly(
+            params, mesh_format=mesh_format, include_properties=True
+        )
+
+        table = mesh_data["properties"]
+        generator = IFCGenerator(get_ifc_document())
+        assembly_id = mesh_data["assembly_info"]["globalId"]
+        assert len(table["elements"]) == 5
+        for global_id in table["elements"]:
+            expected = generator.get_element_properties(global_id)
+            assert resolve_property_table(table, global_id) == expected
+        assert any(
+            p["name"] == "Pset_MechanicalFastenerAnchorBolt"
+            for p in resolve_property_table(table, assembly_id)["property_sets"]
+        )
+
+    def test_properties_not_included_by_default(self):
+        """Без include_properties таблица свойств не строится"""
+        from instance_factory import generate_bolt_assembly
+
+        params = {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"}
+        _, mesh_data = generate_bolt_assembly(params)
+
+        assert "properties" not in mesh_data
+
+
+@pytest.mark.usefixtures("base_document")
+class TestGenerateBoltSchedule:
+    """Тесты generate_bolt_schedule — ведомость болтов в одном документе"""
+
+    def test_schedule_single_document(self):
+        """Все болты ведомости должны попасть в один IFC документ"""
+        import ifcopenshell
+        from instance_factory import generate_bolt_schedule
+
+        rows = [
+            ({"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"}, None, "Б1"),
+            (
+                {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"},
+                (1000.0, 0.0, 0.0),
+                "Б2",
+            ),
+            (
+                {"bolt_type": "2.1", "diameter": 24, "length": 500, "material": "ВСт3пс2"},
+                (0.0, 1500.0, 0.0, 90.0),
+                "Б3",
+            ),
+        ]
+
+        ifc_str, schedule = generate_bolt_schedule(rows, include_mesh=False)
+
+        doc = ifcopenshell.file.from_string(ifc_str)
+        assert len(doc.by_type("IfcProject")) == 1
+        assemblies = [f for f in doc.by_type("IfcMechanicalFastener") if f.Tag]
+        assert sorted(a.Tag for a in assemblies) == ["Б1", "Б2", "Б3"]
+
+        assert [b["tag"] for b in schedule["bolts"]] == ["Б1", "Б2", "Б3"]
+        assert schedule["stats"]["count"] == 3
+        assert schedule["stats"]["bolts_per_second"] > 0
+
+    def test_schedule_properties_shared_per_type(self):
+        """Наборы свойств типа входят в таблицу ведомости один раз на тип"""
+        from instance_factory import generate_bolt_schedule
+
+        params = {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"}
+        rows = [(params, (i * 500.0, 0.0, 0.0), f"Б{i}") for i in range(3)]
+
+        _, schedule = generate_bolt_schedule(rows, include_mesh=False, include_properties=True)
+
+        table = schedule["properties"]
+        # Сборка, шпилька, шайба и две гайки на болт
+        assert len(table["elements"]) == 3 * 5
+        # Тип сборки и типы шпильки, шайбы и гайки
+        assert len(table["types"]) == 4
+        bolts = [table["elements"][b["globalId"]] for b in schedule["bolts"]]
+        assert len({tuple(b["types"]) for b in bolts}) == 1
+
+    def test_schedule_reuses_types(self):
+        """Одинаковые болты должны ссылаться на один тип"""
+        import ifcopenshell
+        from instance_factory import generate_bolt_schedule
+
+        params = {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"}
+        rows = [(params, (i * 500.0, 0.0, 0.0), f"Б{i}") for i in range(4)]
+
+        ifc_str, _ = generate_bolt_schedule(rows, include_mesh=False)
+
+        doc = ifcopenshell.file.from_string(ifc_str)
+        anchor_types = [
+            t for t in doc.by_type("IfcMechanicalFastenerType") if t.PredefinedType == "ANCHORBOLT"
+        ]
+        assert len(anchor_types) == 1
+
+    def test_schedule_placement(self):
+        """Положение из ведомости должно попадать в размещение сборки"""
+        from instance_factory import generate_bolt_schedule
+        from main import get_ifc_document
+
+        params = {"bolt_type": "5", "diameter": 20, "length": 800, "material": "09Г2С"}
+        generate_bolt_schedule([(params, (250.0, -100.0, 50.0, 90.0), "Б1")], include_mesh=False)
+
+        doc = get_ifc_document()
+        assembly = [f for f in doc.by_type("IfcMechanicalFastener") if f.Tag == "Б1"][0]
+        relative = assembly.ObjectPlacement.RelativePlacement
+        assert tuple(relative.Location.Coordinates) == (250.0, -100.0, 50.0)
+        ref = relative.RefDirection.DirectionRatios
+        assert ref[0] == pytest.approx(0.0, abs=1e-9)
+        assert ref[1] == pytest.approx(1.0)
+
+    def test_schedule_mesh_data(self):
+        """mesh_data должен возвращаться для каждого болта"""
+        from instance_factory import generate_bolt_schedule
+
+        params = {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"}
+        _, schedule = generate_bolt_schedule([(params, None, "Б1"), (params, (500, 0, 0), "Б2")])
+
+        for bolt in schedule["bolts"]:
+            assert bolt["globalId"]
+            assert bolt["mesh_data"]["meshes"]
+
+    def test_schedule_batch_mesh(self):
+        """Сетки ведомости извлекаются одним пакетом и распределяются по болтам"""
+        from instance_factory import generate_bolt_schedule
+        from main import get_ifc_document
+
+        params = {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"}
+        rows = [(params, (i * 500.0, 0.0, 0.0), f"Б{i}") for i in range(3)]
+        _, schedule = generate_bolt_schedule(rows, geom_threads=2)
+
+        assert schedule["stats"]["geom_failures"] == 0
+        assert schedule["stats"]["geom_time"] > 0
+
+        doc = get_ifc_document()
+        for bolt in schedule["bolts"]:
+            mesh_data = bolt["mesh_data"]
+            assert mesh_data["assembly_info"]["globalId"] == bolt["globalId"]
+            assembly = doc.by_guid(bolt["globalId"])
+            component_ids = {c.id() for rel in assembly.IsDecomposedBy for c in rel.RelatedObjects}
+            assert {m["id"] for m in mesh_data["meshes"]} == component_ids
+
+    def test_schedule_instanced_mesh(self):
+        """Инстансированная ведомость: несколько уникальных сеток на все болты"""
+        from instance_factory import generate_bolt_schedule
+
+        params = {"bolt_type": "2.1", "diameter": 24, "length": 1000, "material": "09Г2С"}
+        rows = [(params, (i * 500.0, 0.0, 0.0), f"Б{i}") for i in range(10)]
+        _, schedule = generate_bolt_schedule(rows, mesh_mode="instanced")
+
+        mesh_data = schedule["mesh_data"]
+        assert all(bolt["mesh_data"] is None for bolt in schedule["bolts"])
+        assert schedule["stats"]["unique_meshes"] == len(mesh_data["meshes"]) == 4
+        assert mesh_data["instance_count"] == 10 * 7
+
+    def test_schedule_invalid_row(self):
+        """Ошибка валидации должна указывать строку ведомости"""
+        from instance_factory import generate_bolt_schedule
+
+        rows = [
+            ({"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"}, None, "Б1"),
+            ({"bolt_type": "1.1", "diameter": 999, "length": 800, "material": "09Г2С"}, None, "Б2"),
+        ]
+
+        with pytest.raises(ValueError, match="Строка ведомости 1"):
+            generate_bolt_schedule(rows, include_mesh=False)
+
+
+class TestAnalyticMeshData:
+    """Тесты mesh данных аналитического тесселятора"""
+
+    @pytest.mark.parametrize("bolt_type,diameter,length", [("1.2", 24, 1000), ("2.1", 30, 1250)])
+    def test_matches_ifcopenshell_geom(self, bolt_type, diameter, length, ifc_doc):
+        """Габариты компонентов совпадают с ifcopenshell.geom с точностью хорды"""
+        import numpy as np
+        from instance_factory import InstanceFactory
+
+        args = (bolt_type, diameter, length, "09Г2С")
+        placement = (100.0, 200.0, 300.0, 30.0)
+        geom = InstanceFactory(ifc_doc).create_bolt_assembly(*args, placement=placement)
+        analytic = InstanceFactory(ifc_doc, tessellator="analytic").create_bolt_assembly(
+            *args, placement=placement
+        )
+
+        geom_meshes = geom["mesh_data"]["meshes"]
+        analytic_meshes = analytic["mesh_data"]["meshes"]
+        assert len(analytic_meshes) == len(geom_meshes)
+        for expected, actual in zip(geom_meshes, analytic_meshes):
+            assert actual["name"] == expected["name"]
+            assert len(actual["normals"]) == len(actual["vertices"])
+            expected_verts = np.array(expected["vertices"]).reshape(-1, 3)
+            actual_verts = np.array(actual["vertices"]).reshape(-1, 3)
+            # Координаты в метрах; отклонение хорды окружности < 0.2 мм
+            np.testing.assert_allclose(
+                actual_verts.min(axis=0), expected_verts.min(axis=0), atol=2e-4
+            )
+            np.testing.assert_allclose(
+                actual_verts.max(axis=0), expected_verts.max(axis=0), atol=2e-4
+            )
@@ -0,0 +1,132 @@
+"""
+Тесты для mesh_payload.py — бинарный формат mesh данных
+"""
+
+import numpy as np
+import pytest
+from mesh_payload import (
+    PAYLOAD_FORMAT,
+    UINT16_VERTEX_LIMIT,
+    is_mesh_payload,
+    pack_mesh_data,
+    payload_nbytes,
+    unpack_mesh_data,
+)
+
+
+def make_mesh(mesh_id, vertex_count, with_normals=True):
+    vertices = np.arange(vertex_count * 3, dtype=np.float64) * 0.001
+    indices = np.arange(vertex_count - vertex_count % 3) % vertex_count
+    return {
+        "id": mesh_id,
+        "name": f"Mesh_{mesh_id}",
+        "vertices": vertices.tolist(),
+        "indices": indices.tolist(),
+        "normals": np.ones(vertex_count * 3).tolist() if with_normals else [],
+        "color": 0x8B8B8B,
+        "metadata": {"Type": "STUD", "GlobalId": f"guid{mesh_id}"},
+    }
+
+
+class TestPackMeshData:
+    """Тесты pack_mesh_data"""
+
+    def test_buffers_are_memoryviews(self):
+        """Буферы — непрерывные memoryview нужного типа"""
+        payload = pack_mesh_data({"meshes": [make_mesh(1, 6), make_mesh(2, 9)]})
+
+        assert is_mesh_payload(payload)
+        assert payload["format"] == PAYLOAD_FORMAT
+        assert payload["positions"].format == "f"
+        assert payload["positions"].c_contiguous
+        assert len(payload["positions"]) == (6 + 9) * 3
+        assert payload["index_type"] == "uint16"
+        assert payload_nbytes(payload) == (6 + 9) * 3 * 4 * 2 + (6 + 9) * 2
+
+    def test_offsets(self):
+        """Смещения сеток указывают на их данные в общих буферах"""
+        payload = pack_mesh_data({"meshes": [make_mesh(1, 6), make_mesh(2, 9)]})
+
+        first, second = payload["meshes"]
+        assert (first["vertex_offset"], first["vertex_count"]) == (0, 6)
+        assert (second["vertex_offset"], second["vertex_count"]) == (6, 9)
+        assert (second["index_offset"], second["index_count"]) == (6, 9)
+        assert "vertices" not in first
+        assert first["metadata"] == {"Type": "STUD", "GlobalId": "guid1"}
+
+    def test_uint32_for_large_meshes(self):
+        """Индексы uint32, если сетка не помещается в uint16"""
+        payload = pack_mesh_data({"meshes": [make_mesh(1, UINT16_VERTEX_LIMIT + 3)]})
+
+        assert payload["index_type"] == "uint32"
+        assert payload["indices"].format == "I"
+
+    def test_missing_normals(self):
+        """Отсутствующие нормали заменяются нулями той же длины"""
+        payload = pack_mesh_data({"meshes": [make_mesh(1, 6, with_normals=False)]})
+
+        assert len(payload["normals"]) == len(payload["positions"])
+
+    def test_extra_keys_preserved(self):
+        """assembly_info и failures передаются как есть"""
+        info = {"name": "bolt", "globalId": "abc"}
+        payload = pack_mesh_data({"meshes": [], "assembly_info": info, "failures": []})
+
+        assert payload["assembly_info"] == info
+        assert payload["failures"] == []
+        assert payload_nbytes(payload) == 0
+
+    def test_idempotent(self):
+        """Повторная упаковка payload возвращает его же"""
+        payload = pack_mesh_data({"meshes": [make_mesh(1, 6)]})
+
+        assert pack_mesh_data(payload) is payload
+
+
+class TestUnpackMeshData:
+    """Тесты unpack_mesh_data"""
+
+    def test_roundtrip(self):
+        """Распаковка восстанавливает сетки с точностью float32"""
+        meshes = [make_mesh(1, 6), make_mesh(2, 9)]
+        mesh_data = unpack_mesh_data(pack_mesh_data({"meshes": meshes, "assembly_info": {}}))
+
+        assert mesh_data["assembly_info"] == {}
+        for expected, actual in zip(meshes, mesh_data["meshes"]):
+            assert actual["id"] == expected["id"]
+            assert actual["name"] == expected["name"]
+            np.testing.assert_allclose(actual["vertices"], expected["vertices"], rtol=1e-6)
+            assert actual["indices"].tolist() == expected["indices"]
+
+    def test_views_share_buffer(self):
+        """Массивы сеток — представления буферов payload"""
+        payload = pack_mesh_data({"meshes": [make_mesh(1, 6)]})
+        mesh = unpack_mesh_data(payload)["meshes"][0]
+
+        assert not mesh["vertices"].flags.owndata
+
+
+@pytest.mark.usefixtures("base_document")
+class TestBinaryMeshFormat:
+    """Тесты mesh_format='binary' в генерации"""
+
+    @pytest.mark.parametrize(
+        "tessellator,assembly_mode",
+        [("geom", "separate"), ("analytic", "separate"), ("geom", "unified")],
+    )
+    def test_matches_lists(self, tessellator, assembly_mode):
+        """Бинарный payload содержит те же сетки, что и списочный формат"""
+        from instance_factory import generate_bolt_assembly
+
+        params = {"bolt_type": "2.1", "diameter": 24, "length": 1000, "material": "09Г2С"}
+        kwargs = {"assembly_mode": assembly_mode, "tessellator": tessellator}
+        _, lists = generate_bolt_assembly(params, **kwargs)
+        _, payload = generate_bolt_assembly(params, mesh_format="binary", **kwargs)
+
+        assert is_mesh_payload(payload)
+        assert payload["assembly_info"]["name"] == lists["assembly_info"]["name"]
+        unpacked = unpack_mesh_data(payload)["meshes"]
+        assert [m["name"] for m in unpacked] == [m["name"] for m in lists["meshes"]]
+        for expected, actual in zip(lists["meshes"], unpacked):
+            np.testing.assert_allclose(actual["vertices"], expected["vertices"], atol=1e-6)
+            assert actual["indices"].tolist() == expected["indices"]
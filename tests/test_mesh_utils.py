@@ -0,0 +1,280 @@
+"""
+Тесты для mesh_utils.py — векторизованные операции над сетками
+"""
+
+import numpy as np
+import pytest
+
+
+def _weld_reference(verts, faces, tolerance):
+    """Последовательный O(n²) алгоритм сварки — эталон семантики допуска"""
+    points = np.asarray(verts, dtype=float).reshape(-1, 3)
+    vertex_map = {}
+    unique = []
+    for i, vert in enumerate(points):
+        for j, unique_vert in enumerate(unique):
+            if np.linalg.norm(vert - unique_vert) < tolerance:
+                vertex_map[i] = j
+                break
+        else:
+            vertex_map[i] = len(unique)
+            unique.append(vert)
+    new_faces = np.array([vertex_map[int(f)] for f in np.ravel(faces)]).reshape(-1, 3)
+    return np.array(unique).reshape(-1, 3), new_faces
+
+
+class TestWeldVertices:
+    """Тесты weld_vertices"""
+
+    def test_merges_close_vertices(self):
+        """Вершины ближе допуска должны свариваться"""
+        from mesh_utils import weld_vertices
+
+        verts = [0, 0, 0, 1, 0, 0, 0, 1, 0, 1.005, 0, 0]
+        faces = [0, 1, 2, 3, 2, 0]
+
+        new_verts, new_faces = weld_vertices(verts, faces, tolerance=0.01)
+
+        assert new_verts.shape == (3, 3)
+        assert new_faces.tolist() == [[0, 1, 2], [1, 2, 0]]
+
+    def test_keeps_distant_vertices(self):
+        """Вершины на расстоянии не меньше допуска не свариваются"""
+        from mesh_utils import weld_vertices
+
+        verts = [0, 0, 0, 0.02, 0, 0, 0, 0.02, 0]
+        new_verts, new_faces = weld_vertices(verts, [0, 1, 2], tolerance=0.01)
+
+        assert len(new_verts) == 3
+        assert new_faces.tolist() == [[0, 1, 2]]
+
+    def test_keeps_representative_coordinates(self):
+        """Координаты первой вершины кластера сохраняются без усреднения"""
+        from mesh_utils import weld_vertices
+
+        verts = [0.004, 0, 0, 0, 0, 0]
+        new_verts, _ = weld_vertices(verts, [0, 1, 0], tolerance=0.01)
+
+        assert new_verts.tolist() == [[0.004, 0.0, 0.0]]
+
+    def test_cell_boundary(self):
+        """Близкие вершины в соседних ячейках хэша должны свариваться"""
+        from mesh_utils import weld_vertices
+
+        verts = [0.0099, 0.0099, 0.0099, 0.0101, 0.0101, 0.0101]
+        new_verts, _ = weld_vertices(verts, [0, 1, 0], tolerance=0.01)
+
+        assert len(new_verts) == 1
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_sequential_semantics(self, seed):
+        """Результат совпадает с последовательным алгоритмом, включая цепочки"""
+        from mesh_utils import weld_vertices
+
+        rng = np.random.default_rng(seed)
+        base = rng.uniform(-5, 5, (80, 3))
+        points = np.concatenate(
+            [
+                base,
+                base + rng.normal(0, 0.004, base.shape),
+                base[:30] + rng.normal(0, 0.008, (30, 3)),
+                # Цепочка вершин с шагом меньше допуска
+                np.array([[10 + i * 0.006, 0, 0] for i in range(8)]),
+            ]
+        )
+        rng.shuffle(points)
+        faces = rng.integers(0, len(points), 150)
+
+        new_verts, new_faces = weld_vertices(points.ravel(), faces, tolerance=0.01)
+        ref_verts, ref_faces = _weld_reference(points.ravel(), faces, 0.01)
+
+        np.testing.assert_array_equal(new_verts, ref_verts)
+        np.testing.assert_array_equal(new_faces, ref_faces)
+
+    def test_configurable_tolerance(self):
+        """Допуск должен настраиваться"""
+        from mesh_utils import weld_vertices
+
+        verts = [0, 0, 0, 0.5, 0, 0]
+        assert len(weld_vertices(verts, [0, 1, 0], tolerance=0.01)[0]) == 2
+        assert len(weld_vertices(verts, [0, 1, 0], tolerance=1.0)[0]) == 1
+
+    def test_invalid_tolerance(self):
+        """Неположительный допуск должен вызывать ValueError"""
+        from mesh_utils import weld_vertices
+
+        with pytest.raises(ValueError):
+            weld_vertices([0, 0, 0], [0, 0, 0], tolerance=0)
+
+    def test_instance_factory_wrapper_returns_flat_lists(self, ifc_doc):
+        """InstanceFactory._weld_nearby_vertices возвращает плоские списки"""
+        from instance_factory import InstanceFactory
+
+        factory = InstanceFactory(ifc_doc)
+        verts, faces = factory._weld_nearby_vertices(
+            [0, 0, 0, 1, 0, 0, 0, 1, 0, 1.005, 0, 0], [0, 1, 2, 3, 2, 0]
+        )
+
+        assert verts == [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+        assert faces == [0, 1, 2, 1, 2, 0]
+
+
+def _box(origin=(0.0, 0.0, 0.0), size=(1.0, 1.0, 1.0)):
+    """Параллелепипед с внешней ориентацией треугольников"""
+    ox, oy, oz = origin
+    sx, sy, sz = size
+    verts = np.array(
+        [
+            [ox, oy, oz],
+            [ox + sx, oy, oz],
+            [ox + sx, oy + sy, oz],
+            [ox, oy + sy, oz],
+            [ox, oy, oz + sz],
+            [ox + sx, oy, oz + sz],
+            [ox + sx, oy + sy, oz + sz],
+            [ox, oy + sy, oz + sz],
+        ]
+    )
+    faces = np.array(
+        [
+            [0, 2, 1],
+            [0, 3, 2],
+            [4, 5, 6],
+            [4, 6, 7],
+            [0, 1, 5],
+            [0, 5, 4],
+            [1, 2, 6],
+            [1, 6, 5],
+            [2, 3, 7],
+            [2, 7, 6],
+            [3, 0, 4],
+            [3, 4, 7],
+        ]
+    )
+    return verts, faces
+
+
+def _signed_volume(verts, faces):
+    p0, p1, p2 = (verts[faces[:, k]] for k in range(3))
+    return np.einsum("ij,ij->i", p0, np.cross(p1, p2)).sum() / 6.0
+
+
+def _flip(faces, mask):
+    flipped = faces.copy()
+    flipped[mask] = flipped[mask][:, [0, 2, 1]]
+    return flipped
+
+
+class TestOrientTriangles:
+    """Тесты orient_triangles"""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_restores_outward_orientation(self, seed):
+        """Случайно инвертированные грани куба должны смотреть наружу"""
+        from mesh_utils import orient_triangles
+
+        verts, faces = _box(origin=(5.0, -3.0, 2.0))
+        mask = np.random.default_rng(seed).random(len(faces)) < 0.5
+
+        oriented = orient_triangles(verts.ravel().tolist(), _flip(faces, mask).ravel().tolist())
+
+        np.testing.assert_array_equal(oriented, faces)
+
+    def test_fully_inverted_shell(self):
+        """Полностью вывернутая оболочка должна инвертироваться по знаку объёма"""
+        from mesh_utils import orient_triangles
+
+        verts, faces = _box()
+        oriented = orient_triangles(verts, faces[:, [0, 2, 1]])
+
+        assert _signed_volume(verts, oriented) == pytest.approx(1.0)
+
+    def test_non_convex_shape(self):
+        """
+        Невыпуклое тело (квадратное кольцо, как отверстие гайки): центр масс
+        лежит в отверстии, но грани отверстия должны смотреть в отверстие
+        """
+        from collections import Counter
+
+        from mesh_utils import orient_triangles
+
+        outer = [(0, 0), (3, 0), (3, 3), (0, 3)]
+        inner = [(1, 1), (2, 1), (2, 2), (1, 2)]
+        verts = np.array(
+            [(x, y, z) for z in (0.0, 1.0) for ring in (outer, inner) for x, y in ring],
+            dtype=float,
+        )
+        # Индексы: низ 0-3 внешний, 4-7 внутренний; верх 8-11 внешний, 12-15 внутренний
+        quads = []
+        for k in range(4):
+            n = (k + 1) % 4
+            quads.append((k, n, 4 + n, 4 + k))  # низ
+            quads.append((8 + k, 8 + n, 12 + n, 12 + k))  # верх
+            quads.append((k, n, 8 + n, 8 + k))  # внешняя стенка
+            quads.append((4 + k, 4 + n, 12 + n, 12 + k))  # стенка отверстия
+        faces = np.array([tri for a, b, c, d in quads for tri in ((a, b, c), (a, c, d))])
+        mask = np.random.default_rng(0).random(len(faces)) < 0.5
+
+        oriented = orient_triangles(verts, _flip(faces, mask))
+
+        edges = Counter((int(t[k]), int(t[(k + 1) % 3])) for t in oriented for k in range(3))
+        assert all(count == 1 and edges[(b, a)] == 1 for (a, b), count in edges.items())
+        assert _signed_volume(verts, oriented) == pytest.approx(8.0)
+
+        # Нормали стенок отверстия направлены к оси отверстия (к центру масс)
+        p0, p1, p2 = (verts[oriented[:, k]] for k in range(3))
+        normals = np.cross(p1 - p0, p2 - p0)
+        centers = (p0 + p1 + p2) / 3.0
+        hole_wall = np.all((centers[:, :2] >= 1.0) & (centers[:, :2] <= 2.0), axis=1)
+        to_axis = np.array([1.5, 1.5, 0.0]) - centers * np.array([1.0, 1.0, 0.0])
+        assert np.all(np.einsum("ij,ij->i", normals[hole_wall], to_axis[hole_wall]) > 0)
+
+    def test_components_oriented_independently(self):
+        """Вложенная компонента ориентируется по собственному объёму"""
+        from mesh_utils import orient_triangles
+
+        outer_verts, outer_faces = _box(size=(10.0, 10.0, 10.0))
+        inner_verts, inner_faces = _box(origin=(4.0, 4.0, 4.0))
+        verts = np.concatenate([outer_verts, inner_verts])
+        faces = np.concatenate([outer_faces, inner_faces[:, [0, 2, 1]] + len(outer_verts)])
+
+        oriented = orient_triangles(verts, faces)
+
+        assert _signed_volume(verts, oriented[:12]) == pytest.approx(1000.0)
+        assert _signed_volume(verts, oriented[12:]) == pytest.approx(1.0)
+
+    def test_empty(self):
+        """Пустой список граней возвращается без изменений"""
+        from mesh_utils import orient_triangles
+
+        assert orient_triangles([], []).shape == (0, 3)
+
+
+class TestSplitVertexNormals:
+    """Тесты split_vertex_normals"""
+
+    def test_box_corners_split(self):
+        """У куба каждая вершина делится на три с нормалями граней"""
+        from mesh_utils import split_vertex_normals
+
+        verts, faces = _box()
+        positions, normals, triangles = split_vertex_normals(verts, faces)
+
+        assert len(positions) == 24
+        assert triangles.shape == faces.shape
+        np.testing.assert_allclose(np.abs(normals).sum(axis=1), 1.0)
+        # Нормаль вершины совпадает с нормалью её грани
+        p0, p1, p2 = (positions[triangles[:, k]] for k in range(3))
+        face_normals = np.cross(p1 - p0, p2 - p0)
+        for k in range(3):
+            assert np.all(np.einsum("ij,ij->i", face_normals, normals[triangles[:, k]]) > 0)
+
+    def test_smooth_below_crease_angle(self):
+        """При угле острого ребра больше 90° вершины куба не дублируются"""
+        from mesh_utils import split_vertex_normals
+
+        verts, faces = _box()
+        positions, normals, _ = split_vertex_normals(verts, faces, crease_angle=100.0)
+
+        assert len(positions) == 8
+        np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1.0)
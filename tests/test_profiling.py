@@ -0,0 +1,126 @@
+"""
+Тесты для profiling.py — спаны и счётчики этапов генерации
+"""
+
+import pytest
+
+
+class TestProfiling:
+    """Тесты спанов и счётчиков"""
+
+    def test_disabled_is_noop(self):
+        """Без profiling() спаны пустые и счётчики не накапливаются"""
+        from profiling import count, is_enabled, span
+
+        first = span("stage")
+        with first:
+            count("events")
+
+        assert not is_enabled()
+        assert span("other") is first
+
+    def test_nested_spans(self):
+        """Вложенные спаны записываются путями с собственным временем"""
+        from profiling import profiling, span
+
+        with profiling() as profiler:
+            with span("outer"):
+                for _ in range(2):
+                    with span("inner"):
+                        pass
+
+        report = profiler.report()
+        stages = {stage["name"]: stage for stage in report["stages"]}
+        assert list(stages) == ["outer/inner", "outer"]
+        assert stages["outer/inner"]["calls"] == 2
+        outer = stages["outer"]
+        assert outer["self_ms"] == pytest.approx(
+            outer["total_ms"] - stages["outer/inner"]["total_ms"]
+        )
+        assert 0 <= outer["share"] <= 1
+        assert report["total_ms"] >= outer["total_ms"]
+
+    def test_counters(self):
+        """Счётчики суммируются за время профилирования"""
+        from profiling import count, profiling
+
+        with profiling() as profiler:
+            count("triangles", 12)
+            count("triangles", 4)
+            count("hits")
+        count("hits")
+
+        assert profiler.report()["counters"] == {"triangles": 16, "hits": 1}
+
+    def test_disabled_context(self):
+        """profiling(False) выполняет блок без профилировщика"""
+        from profiling import is_enabled, profiling
+
+        with profiling(False) as profiler:
+            assert not is_enabled()
+
+        assert profiler is None
+
+    def test_restored_after_error(self):
+        """После исключения профилирование выключается"""
+        from profiling import is_enabled, profiling, span
+
+        with pytest.raises(ValueError):
+            with profiling() as profiler:
+                with span("failing"):
+                    raise ValueError("ошибка")
+
+        assert not is_enabled()
+        assert profiler.report()["stages"][0]["name"] == "failing"
+
+
+@pytest.mark.usefixtures("base_document")
+class TestGenerationProfile:
+    """Отчёт профилирования в результатах генерации"""
+
+    def test_assembly_profile(self):
+        """generate_bolt_assembly(profile=True) возвращает разбивку по этапам"""
+        from instance_factory import generate_bolt_assembly
+
+        params = {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"}
+        _, mesh_data = generate_bolt_assembly(params, geometry_type="triangulated", profile=True)
+
+        profile = mesh_data["profile"]
+        names = {stage["name"] for stage in profile["stages"]}
+        assert {
+            "reset_document",
+            "assembly",
+            "assembly/validation",
+            "assembly/types",
+            "assembly/types/tessellation",
+            "assembly/mesh",
+            "export",
+        } <= names
+        counters = profile["counters"]
+        assert counters["entities_created"] > 0
+        assert counters["tessellated_triangles"] > 0
+        assert counters["mesh_triangles"] > 0
+        assert counters["type_cache.misses"] > 0
+
+    def test_no_profile_by_default(self):
+        """Без profile отчёт не добавляется"""
+        from instance_factory import generate_bolt_assembly
+
+        params = {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"}
+        _, mesh_data = generate_bolt_assembly(params)
+
+        assert "profile" not in mesh_data
+
+    def test_schedule_profile(self):
+        """Ведомость: этапы болтов вложены в assemblies, типы берутся из кэша"""
+        from instance_factory import generate_bolt_schedule
+
+        params = {"bolt_type": "1.1", "diameter": 20, "length": 800, "material": "09Г2С"}
+        rows = [(params, (i * 500.0, 0.0, 0.0), f"Б{i}") for i in range(3)]
+
+        _, schedule = generate_bolt_schedule(rows, include_mesh=False, profile=True)
+
+        stages = {stage["name"]: stage for stage in schedule["profile"]["stages"]}
+        assert stages["assemblies/types"]["calls"] == 3
+        assert "assemblies/relationships" in stages
+        assert schedule["profile"]["counters"]["type_cache.hits"] > 0
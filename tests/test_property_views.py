@@ -0,0 +1,133 @@
+"""
+Тесты для property_views.py — кэш представлений свойств элементов
+"""
+
+import ifcopenshell.api
+
+
+class TestPropertyViews:
+    """Тесты PropertyViews"""
+
+    def test_repeated_request_served_from_cache(self, ifc_doc, create_bolt):
+        """Повторный запрос возвращает закэшированное представление"""
+        from property_views import get_property_views
+
+        assembly = create_bolt()["assembly"]
+        views = get_property_views(ifc_doc)
+
+        first = views.get(assembly.GlobalId)
+        second = views.get(assembly.GlobalId)
+
+        assert second is first
+        assert views.stats["misses"] == 1
+        assert views.stats["hits"] == 1
+        assert get_property_views(ifc_doc) is views
+
+    def test_type_psets_shared_between_instances(self, ifc_doc, create_bolt):
+        """Наборы свойств типа извлекаются один раз на тип"""
+        from instance_factory import InstanceFactory
+        from property_views import get_property_views
+
+        factory = InstanceFactory(ifc_doc)
+        first = create_bolt(factory)["assembly"]
+        second = create_bolt(factory)["assembly"]
+        views = get_property_views(ifc_doc)
+
+        first_view = views.get(first.GlobalId)
+        second_view = views.get(second.GlobalId)
+
+        assert views.stats["type_misses"] == 1
+        assert views.stats["type_hits"] == 1
+        assert first_view["property_sets"] == second_view["property_sets"]
+
+    def test_matches_expertise_ordering(self, ifc_doc, create_bolt):
+        """Наборы экспертиз идут перед прочими, стандартные Pset_ — последними"""
+        from property_views import EXPERTISE_PREFIXES, get_property_views
+
+        assembly = create_bolt()["assembly"]
+
+        names = [
+            p["name"] for p in get_property_views(ifc_doc).get(assembly.GlobalId)["property_sets"]
+        ]
+
+        ranks = [
+            0 if name.startswith(EXPERTISE_PREFIXES) else 2 if name.startswith("Pset_") else 1
+            for name in names
+        ]
+        assert "Pset_MechanicalFastenerAnchorBolt" in names
+        assert ranks == sorted(ranks)
+
+    def test_new_pset_invalidates_view(self, ifc_doc, create_bolt):
+        """Добавление набора свойств к элементу обновляет представление"""
+        from property_views import get_property_views
+
+        assembly = create_bolt()["assembly"]
+        views = get_property_views(ifc_doc)
+        views.get(assembly.GlobalId)
+
+        pset = ifcopenshell.api.run("pset.add_pset", ifc_doc, product=assembly, name="Test_Pset")
+        ifcopenshell.api.run("pset.edit_pset", ifc_doc, pset=pset, properties={"Марка": "Ф1"})
+        view = views.get(assembly.GlobalId)
+
+        assert views.stats["misses"] == 2
+        assert view["property_sets"][0] == {
+            "name": "Test_Pset",
+            "properties": [{"name": "Марка", "value": "Ф1", "type": "IfcLabel"}],
+        }
+
+    def test_removed_element_not_found(self, ifc_doc, create_bolt):
+        """Удалённый элемент не возвращается из кэша"""
+        from property_views import get_property_views
+
+        assembly = create_bolt()["assembly"]
+        global_id = assembly.GlobalId
+        views = get_property_views(ifc_doc)
+        views.get(global_id)
+
+        ifcopenshell.api.run("root.remove_product", ifc_doc, product=assembly)
+
+        assert views.get(global_id) is None
+        assert len(views) == 0
+
+    def test_unknown_global_id(self, ifc_doc):
+        """Несуществующий GlobalId — None"""
+        from property_views import get_property_views
+
+        assert get_property_views(ifc_doc).get("nonexistent_global_id") is None
+
+    def test_invalidate(self, ifc_doc, create_bolt):
+        """invalidate_property_views сбрасывает кэш документа"""
+        from property_views import get_property_views, invalidate_property_views
+
+        assembly = create_bolt()["assembly"]
+        views = get_property_views(ifc_doc)
+        first = views.get(assembly.GlobalId)
+
+        invalidate_property_views(ifc_doc)
+
+        assert len(views) == 0
+        second = views.get(assembly.GlobalId)
+        assert second is not first
+        assert second == first
+
+    def test_table_resolves_to_views(self, ifc_doc, create_bolt):
+        """Представления из таблицы совпадают с get, наборы типа — один раз на тип"""
+        from instance_factory import InstanceFactory
+        from property_views import get_property_views, resolve_property_table
+
+        factory = InstanceFactory(ifc_doc)
+        results = [create_bolt(factory) for _ in range(2)]
+        global_ids = [
+            product.GlobalId
+            for result in results
+            for product in (result["assembly"], *result["components"])
+        ]
+        views = get_property_views(ifc_doc)
+
+        table = views.table(global_ids + ["nonexistent_global_id"])
+
+        assert list(table["elements"]) == global_ids
+        assert len(table["types"]) == 4
+        for global_id in global_ids:
+            assert resolve_property_table(table, global_id) == views.get(global_id)
+        assert resolve_property_table(table, "nonexistent_global_id") is None
@@ -0,0 +1,135 @@
+"""
+Тесты для pset_writer.py — наборы свойств по шаблонам
+"""
+
+import pytest
+
+ANCHOR_BOLT_VALUES = {
+    "AnchorBoltDiameter": 20,
+    "AnchorBoltLength": 800,
+    "AnchorBoltProtrusionLength": 60,
+    "AnchorBoltThreadLength": 60,
+}
+
+
+def _fastener_type(ifc_doc):
+    import ifcopenshell.guid
+
+    return ifc_doc.create_entity(
+        "IfcMechanicalFastenerType",
+        GlobalId=ifcopenshell.guid.new(),
+        Name="Болт",
+        PredefinedType="ANCHORBOLT",
+    )
+
+
+def _nominal_values(pset):
+    return {
+        p.Name: (p.NominalValue.is_a(), p.NominalValue.wrappedValue) for p in pset.HasProperties
+    }
+
+
+class TestCompileTemplate:
+    """Компиляция шаблонов"""
+
+    @pytest.mark.parametrize("schema_name", ["IFC4", "IFC2X3"])
+    def test_all_templates_compile(self, schema_name):
+        """Все шаблоны компилируются: типы значений есть в схеме"""
+        from pset_writer import PSET_TEMPLATES, compile_template
+
+        for name in PSET_TEMPLATES:
+            _, properties = compile_template(name, schema_name)
+            assert [p[0] for p in properties] == list(PSET_TEMPLATES[name])
+
+    def test_standard_psets_match_library(self):
+        """Типы значений Pset_* совпадают с библиотекой Pset IFC4"""
+        import ifcopenshell.util.pset
+        from pset_writer import PSET_TEMPLATES
+
+        library = ifcopenshell.util.pset.get_template("IFC4")
+        for name, template in PSET_TEMPLATES.items():
+            if not name.startswith("Pset_"):
+                continue
+            definition = library.get_by_name(name)
+            expected = {p.Name: p.PrimaryMeasureType for p in definition.HasPropertyTemplates}
+            assert template == expected
+
+    def test_unknown_measure_type(self, monkeypatch):
+        """Тип значения, которого нет в схеме, — ValueError"""
+        import pset_writer
+
+        monkeypatch.setitem(pset_writer.PSET_TEMPLATES, "Pset_Bad", {"Value": "IfcNoSuchMeasure"})
+        with pytest.raises(ValueError):
+            pset_writer.compile_template("Pset_Bad")
+
+
+class TestWritePset:
+    """Запись наборов свойств"""
+
+    def test_matches_api(self, ifc_doc):
+        """Набор совпадает с созданным через ifcopenshell.api"""
+        import ifcopenshell.api
+        from pset_writer import write_pset
+
+        api_type = _fastener_type(ifc_doc)
+        api_pset = ifcopenshell.api.run(
+            "pset.add_pset", ifc_doc, product=api_type, name="Pset_MechanicalFastenerAnchorBolt"
+        )
+        ifcopenshell.api.run(
+            "pset.edit_pset",
+            ifc_doc,
+            pset=api_pset,
+            properties={k: float(v) for k, v in ANCHOR_BOLT_VALUES.items()},
+        )
+
+        fast_type = _fastener_type(ifc_doc)
+        fast_pset = write_pset(
+            ifc_doc, fast_type, "Pset_MechanicalFastenerAnchorBolt", ANCHOR_BOLT_VALUES
+        )
+
+        assert _nominal_values(fast_pset) == _nominal_values(api_pset)
+        assert fast_type.HasPropertySets == (fast_pset,)
+        assert fast_pset.OwnerHistory == ifc_doc.by_type("IfcOwnerHistory")[0]
+
+    def test_values_cast_and_none_skipped(self, ifc_doc):
+        """Значения приводятся к типу схемы, None пропускается"""
+        from pset_writer import build_properties
+
+        properties = build_properties(
+            ifc_doc, "Маркировка", {"Позиция": "-", "Профиль": None, "Наименование": 42}
+        )
+
+        assert [(p.Name, p.NominalValue.wrappedValue) for p in properties] == [
+            ("Позиция", "-"),
+            ("Наименование", "42"),
+        ]
+
+    def test_unknown_property(self, ifc_doc):
+        """Свойство вне шаблона — KeyError"""
+        from pset_writer import build_properties
+
+        with pytest.raises(KeyError):
+            build_properties(ifc_doc, "Маркировка", {"Марка": "-"})
+
+    def test_appends_to_existing_psets(self, ifc_doc):
+        """Набор добавляется к уже назначенным типу"""
+        from pset_writer import write_pset
+
+        product_type = _fastener_type(ifc_doc)
+        first = write_pset(ifc_doc, product_type, "Геометрические параметры", {"Длина": 800})
+        second = write_pset(ifc_doc, product_type, "Маркировка", {"Позиция": "-"})
+
+        assert product_type.HasPropertySets == (first, second)
+
+    @pytest.mark.parametrize("pset_expertise", ["none", "SPB_GAU_CGE"])
+    def test_type_factory_psets_valid(self, ifc_doc, pset_expertise):
+        """Наборы свойств TypeFactory проходят проверку схемы"""
+        import ifcopenshell.validate
+        from type_factory import TypeFactory
+
+        factory = TypeFactory(ifc_doc, pset_expertise=pset_expertise)
+        factory.get_or_create_assembly_type("1.1", 20, 800, "09Г2С")
+
+        logger = ifcopenshell.validate.json_logger()
+        ifcopenshell.validate.validate(ifc_doc, logger, express_rules=True)
+        assert logger.statements == []
@@ -0,0 +1,136 @@
+"""
+Тесты для relationship_builder.py — сводные отношения документа
+"""
+
+import pytest
+
+
+def _proxy(ifc_doc, name):
+    import ifcopenshell.guid
+
+    return ifc_doc.create_entity(
+        "IfcBuildingElementProxy", GlobalId=ifcopenshell.guid.new(), Name=name
+    )
+
+
+class TestRelationshipBuilder:
+    """Тесты RelationshipBuilder"""
+
+    def test_immediate_extends_existing(self, ifc_doc):
+        """Немедленный режим дополняет отношение того же типа"""
+        from relationship_builder import RelationshipBuilder
+
+        builder = RelationshipBuilder(ifc_doc)
+        relating_type = ifc_doc.create_entity("IfcBuildingElementProxyType", GlobalId="0" * 22)
+        first, second = _proxy(ifc_doc, "A"), _proxy(ifc_doc, "B")
+
+        rel = builder.add_type(relating_type, [first])
+        assert builder.add_type(relating_type, [second]) == rel
+
+        assert rel.RelatedObjects == (first, second)
+        assert len(ifc_doc.by_type("IfcRelDefinesByType")) == 1
+        assert builder.stats == {"created": 1, "extended": 1, "objects": 2}
+
+    def test_deferred_flush(self, ifc_doc):
+        """Отложенный режим создаёт отношения только при выходе из блока"""
+        from relationship_builder import RelationshipBuilder
+
+        builder = RelationshipBuilder(ifc_doc)
+        storey = ifc_doc.by_type("IfcBuildingStorey")[0]
+        material = ifc_doc.create_entity("IfcMaterial", Name="Steel")
+        elements = [_proxy(ifc_doc, str(i)) for i in range(3)]
+
+        with builder.deferring():
+            for element in elements:
+                assert builder.add_containment(storey, [element]) is None
+                builder.add_material(material, [element])
+            assert builder.pending_count == 2
+            assert not ifc_doc.by_type("IfcRelContainedInSpatialStructure")
+
+        assert builder.pending_count == 0
+        (contained,) = ifc_doc.by_type("IfcRelContainedInSpatialStructure")
+        (associated,) = ifc_doc.by_type("IfcRelAssociatesMaterial")
+        assert contained.RelatedElements == tuple(elements)
+        assert associated.RelatedObjects == tuple(elements)
+        assert associated.Name == "MaterialAssociation_Steel"
+
+    def test_empty_objects_ignored(self, ifc_doc):
+        """Пустой список и тип None не создают отношений"""
+        from relationship_builder import RelationshipBuilder
+
+        builder = RelationshipBuilder(ifc_doc)
+
+        assert builder.add_type(None, []) is None
+        assert not ifc_doc.by_type("IfcRelDefinesByType")
+
+    def test_removed_relationship_recreated(self, ifc_doc):
+        """Удалённое из документа отношение создаётся заново"""
+        from relationship_builder import RelationshipBuilder
+
+        builder = RelationshipBuilder(ifc_doc)
+        material = ifc_doc.create_entity("IfcMaterial", Name="Steel")
+        rel = builder.add_material(material, [_proxy(ifc_doc, "A")])
+        ifc_doc.remove(rel)
+
+        element = _proxy(ifc_doc, "B")
+        assert builder.add_material(material, [element]).RelatedObjects == (element,)
+
+    def test_get_relationships_per_document(self, ifc_doc):
+        """Накопитель привязан к документу"""
+        from document_manager import IFCDocumentManager
+        from relationship_builder import get_relationships
+
+        other = IFCDocumentManager().create_document("other_doc")
+
+        assert get_relationships(ifc_doc) is get_relationships(ifc_doc)
+        assert get_relationships(ifc_doc) is not get_relationships(other)
+
+
+class TestImmediateRelationships:
+    """Немедленный режим при создании нескольких болтов без deferring()"""
+
+    def test_two_bolts_extend_one_type_relationship(self, ifc_doc):
+        """Второй болт того же типа дополняет отношение, а не создаёт новое"""
+        from instance_factory import InstanceFactory
+
+        factory = InstanceFactory(ifc_doc)
+        assemblies = [
+            factory.create_bolt_assembly(
+                bolt_type="1.1", diameter=20, length=800, material="09Г2С", include_mesh=False
+            )["assembly"]
+            for _ in range(2)
+        ]
+
+        (rel,) = [
+            rel
+            for rel in ifc_doc.by_type("IfcRelDefinesByType")
+            if rel.RelatingType == assemblies[0].IsTypedBy[0].RelatingType
+        ]
+        assert rel.RelatedObjects == tuple(assemblies)
+        types = ifc_doc.by_type("IfcMechanicalFastenerType")
+        assert len(ifc_doc.by_type("IfcRelDefinesByType")) == len(types)
+
+
+@pytest.mark.usefixtures("base_document")
+class TestScheduleRelationships:
+    """Сводные отношения в ведомости"""
+
+    def test_one_relationship_per_type_storey_material(self):
+        """Ведомость содержит по одному отношению на тип, этаж и материал"""
+        from instance_factory import generate_bolt_schedule
+        from main import get_doc_manager
+
+        params = {"bolt_type": "2.1", "diameter": 24, "length": 1000, "material": "09Г2С"}
+        rows = [(params, (1000.0 * i, 0.0, 0.0), f"Б{i + 1}") for i in range(5)]
+        generate_bolt_schedule(rows, include_mesh=False)
+        ifc_doc = get_doc_manager().get_document()
+
+        types = ifc_doc.by_type("IfcMechanicalFastenerType")
+        defines = ifc_doc.by_type("IfcRelDefinesByType")
+        assert len(defines) == len({rel.RelatingType for rel in defines}) == len(types)
+        (contained,) = ifc_doc.by_type("IfcRelContainedInSpatialStructure")
+        assert len(contained.RelatedElements) == 5
+        (associated,) = ifc_doc.by_type("IfcRelAssociatesMaterial")
+        assert set(associated.RelatedObjects) == set(types)
+        for assembly in ifc_doc.by_type("IfcMechanicalFastener"):
+            assert len(assembly.IsTypedBy) == 1
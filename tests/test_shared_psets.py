@@ -0,0 +1,118 @@
+"""
+Тесты для shared_psets.py — общие наборы свойств типов
+"""
+
+import pytest
+
+
+def _label_property(ifc_doc):
+    return [
+        ifc_doc.create_entity(
+            "IfcPropertySingleValue",
+            Name="Status",
+            NominalValue=ifc_doc.create_entity("IfcLabel", "NEW"),
+        )
+    ]
+
+
+class TestSharedPsets:
+    """Тесты SharedPsets"""
+
+    def test_built_once_per_key(self, ifc_doc):
+        """Набор строится один раз на ключ"""
+        from shared_psets import SharedPsets
+
+        shared = SharedPsets(ifc_doc)
+        calls = []
+
+        def build(doc):
+            calls.append(doc)
+            return _label_property(doc)
+
+        first = shared.get(("Pset_Test",), "Pset_Test", build)
+        assert shared.get(("Pset_Test",), "Pset_Test", build) == first
+        assert shared.get(("Pset_Test", 1.0), "Pset_Test", build) != first
+
+        assert len(calls) == 2
+        assert first.Name == "Pset_Test"
+        assert first.OwnerHistory == ifc_doc.by_type("IfcOwnerHistory")[0]
+        assert shared.stats == {"hits": 1, "misses": 2}
+
+    def test_attach_to_many_types(self, ifc_doc):
+        """Один набор назначается нескольким типам через HasPropertySets"""
+        from shared_psets import SharedPsets
+
+        shared = SharedPsets(ifc_doc)
+        pset = shared.get(("Pset_Test",), "Pset_Test", _label_property)
+        types = [
+            ifc_doc.create_entity("IfcMechanicalFastenerType", GlobalId=str(i) * 22)
+            for i in range(3)
+        ]
+        for product_type in types:
+            shared.attach(product_type, pset)
+
+        assert set(pset.DefinesType) == set(types)
+        assert all(t.HasPropertySets == (pset,) for t in types)
+
+    def test_removed_pset_rebuilt(self, ifc_doc):
+        """Удалённый из документа набор строится заново"""
+        from shared_psets import SharedPsets
+
+        shared = SharedPsets(ifc_doc)
+        pset = shared.get(("Pset_Test",), "Pset_Test", _label_property)
+        pset_id = pset.id()
+        ifc_doc.remove(pset)
+
+        assert shared.get(("Pset_Test",), "Pset_Test", _label_property).id() != pset_id
+
+
+class TestTypeFactorySharedPsets:
+    """Общие наборы свойств в TypeFactory"""
+
+    @pytest.mark.parametrize(
+        "pset_expertise,shared_names",
+        [
+            ("none", {"Pset_ElementComponentCommon"}),
+            ("MGE", {"Pset_ElementComponentCommon", "ExpCheck_MechanicalFastener"}),
+            ("MOGE", {"Pset_ElementComponentCommon", "МОГЭ_КСИ"}),
+            (
+                "SPB_GAU_CGE",
+                {
+                    "Pset_ElementComponentCommon",
+                    "Местоположение",
+                    "Геометрические параметры",
+                    "Строительные параметры",
+                },
+            ),
+        ],
+    )
+    def test_psets_shared_between_types(self, ifc_doc, pset_expertise, shared_names):
+        """Наборы, не зависящие от типа, существуют в одном экземпляре"""
+        from type_factory import TypeFactory
+
+        factory = TypeFactory(ifc_doc, pset_expertise=pset_expertise)
+        first = factory.get_or_create_assembly_type("1.1", 20, 800, "09Г2С")
+        second = factory.get_or_create_assembly_type("1.2", 24, 800, "09Г2С")
+
+        shared = {p for p in first.HasPropertySets if p in second.HasPropertySets}
+        assert {p.Name for p in shared} == shared_names
+        for name in shared_names:
+            assert len([p for p in ifc_doc.by_type("IfcPropertySet") if p.Name == name]) == 1
+        assert len(ifc_doc.by_type("IfcPropertyEnumeration")) == (
+            2 if pset_expertise == "SPB_GAU_CGE" else 1
+        )
+
+    def test_component_types_share_common_pset(self, ifc_doc):
+        """Типы гайки, шайбы и плиты ссылаются на один Pset_ElementComponentCommon"""
+        from type_factory import TypeFactory
+
+        factory = TypeFactory(ifc_doc)
+        types = [
+            factory.get_or_create_nut_type(20, "09Г2С"),
+            factory.get_or_create_washer_type(20, "09Г2С"),
+            factory.get_or_create_plate_type(20, "09Г2С"),
+        ]
+
+        (pset,) = ifc_doc.by_type("IfcPropertySet")
+        assert set(pset.DefinesType) == set(types)
+        assert not ifc_doc.by_type("IfcRelDefinesByProperties")
@@ -0,0 +1,110 @@
+"""
+Тесты для tessellation_cache.py — кэш тесселяции faceted геометрии
+"""
+
+import numpy as np
+import pytest
+
+VERTICES = [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+TRIANGLES = [0, 2, 1, 0, 1, 3, 1, 2, 3, 0, 3, 2]
+
+
+class TestTessellationCache:
+    """Тесты TessellationCache"""
+
+    def test_miss_then_hit(self):
+        """Промах до put, попадание после"""
+        from tessellation_cache import TessellationCache
+
+        cache = TessellationCache()
+        assert cache.get(("nut", 20)) is None
+
+        cache.put(("nut", 20), VERTICES, TRIANGLES)
+        vertices, triangles = cache.get(("nut", 20))
+
+        assert vertices.shape == (4, 3)
+        assert triangles.shape == (4, 3)
+        np.testing.assert_array_equal(vertices.ravel(), VERTICES)
+        np.testing.assert_array_equal(triangles.ravel(), TRIANGLES)
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_cached_arrays_are_read_only(self):
+        """Закэшированные массивы общие, поэтому защищены от изменения"""
+        from tessellation_cache import TessellationCache
+
+        cache = TessellationCache()
+        vertices, _ = cache.put(("nut", 20), VERTICES, TRIANGLES)
+
+        with pytest.raises(ValueError):
+            vertices[0, 0] = 5.0
+
+    def test_lru_eviction(self):
+        """При переполнении вытесняется давно не использованная запись"""
+        from tessellation_cache import TessellationCache
+
+        cache = TessellationCache(max_entries=2)
+        cache.put(("nut", 12), VERTICES, TRIANGLES)
+        cache.put(("nut", 16), VERTICES, TRIANGLES)
+        cache.get(("nut", 12))
+        cache.put(("nut", 20), VERTICES, TRIANGLES)
+
+        assert cache.get(("nut", 16)) is None
+        assert cache.get(("nut", 12)) is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_key_depends_on_settings(self):
+        """Разные настройки тесселяции дают разные ключи"""
+        from tessellation_cache import TessellationCache
+
+        default = TessellationCache()
+        welded = TessellationCache(settings=(("WELD_VERTICES", True),))
+
+        assert default.make_key(("nut", 20)) != welded.make_key(("nut", 20))
+        assert default.make_key(("nut", 20)) != default.make_key(("nut", 24))
+
+    def test_disk_store_shared_between_instances(self, tmp_path):
+        """Записи на диске доступны новому экземпляру кэша (другой сессии)"""
+        from tessellation_cache import TessellationCache
+
+        TessellationCache(cache_dir=str(tmp_path)).put(("washer", 20), VERTICES, TRIANGLES)
+
+        cache = TessellationCache(cache_dir=str(tmp_path))
+        vertices, triangles = cache.get(("washer", 20))
+
+        np.testing.assert_array_equal(vertices.ravel(), VERTICES)
+        np.testing.assert_array_equal(triangles.ravel(), TRIANGLES)
+        assert cache.get_stats()["disk_hits"] == 1
+
+    def test_corrupted_disk_entry_is_miss(self, tmp_path):
+        """Повреждённый файл на диске считается промахом"""
+        from tessellation_cache import TessellationCache
+
+        cache = TessellationCache(cache_dir=str(tmp_path))
+        digest = cache.make_key(("washer", 20))
+        (tmp_path / f"{digest}.npz").write_bytes(b"not a npz")
+
+        assert cache.get(("washer", 20)) is None
+
+    def test_invalid_max_entries(self):
+        """max_entries должен быть положительным"""
+        from tessellation_cache import TessellationCache
+
+        with pytest.raises(ValueError):
+            TessellationCache(max_entries=0)
+
+
+class TestGlobalCache:
+    """Тесты глобального кэша"""
+
+    def test_configure_replaces_cache(self, tmp_path):
+        """configure_tessellation_cache заменяет глобальный кэш"""
+        from tessellation_cache import configure_tessellation_cache, get_tessellation_cache
+
+        cache = configure_tessellation_cache(max_entries=8, cache_dir=str(tmp_path))
+
+        assert get_tessellation_cache() is cache
+        assert cache.max_entries == 8
@@ -687,3 +687,119 @@ class TestMaterialAssociation:
         # Должны быть созданы два разных материала
         materials = mock_ifc.by_type("IfcMaterial")
         assert len(materials) == 2
+
+
+class TestRepresentationMapSharing:
+    """Тесты переиспользования RepresentationMap между материалами"""
+
+    @pytest.fixture
+    def factory(self, ifc_doc):
+        from type_factory import TypeFactory
+
+        return TypeFactory(ifc_doc)
+
+    def test_nut_shares_representation_map_across_materials(self, factory):
+        """Гайки одного диаметра из разных сталей должны ссылаться на один RepresentationMap"""
+        nut_a = factory.get_or_create_nut_type(24, "09Г2С")
+        nut_b = factory.get_or_create_nut_type(24, "ВСт3пс2")
+
+        assert nut_a is not nut_b
+        assert nut_a.RepresentationMaps[0] == nut_b.RepresentationMaps[0]
+        assert len(factory.ifc.by_type("IfcRepresentationMap")) == 1
+
+    def test_all_components_share_geometry(self, factory):
+        """Шпилька, шайба и плита также должны переиспользовать геометрию"""
+        for material in ("09Г2С", "ВСт3пс2"):
+            factory.get_or_create_stud_type("2.1", 24, 500, material)
+            factory.get_or_create_washer_type(24, material)
+            factory.get_or_create_plate_type(24, material)
+
+        assert len(factory.ifc.by_type("IfcRepresentationMap")) == 3
+        assert factory.get_representation_map("plate", 24) is not None
+        assert factory.get_representation_map("washer", 24) is not None
+
+    def test_geometry_builder_not_called_on_hit(self, factory):
+        """При попадании в кэш геометрия не должна строиться повторно"""
+        factory.get_or_create_nut_type(20, "09Г2С")
+
+        with patch.object(factory.builder, "create_nut_solid") as create_nut_solid:
+            factory.get_or_create_nut_type(20, "ВСт3пс2")
+
+        create_nut_solid.assert_not_called()
+
+    def test_cache_stats(self, factory):
+        """Счётчики попаданий/промахов должны отражать переиспользование"""
+        factory.get_or_create_nut_type(20, "09Г2С")
+        factory.get_or_create_nut_type(20, "09Г2С")
+        factory.get_or_create_nut_type(20, "ВСт3пс2")
+
+        stats = factory.get_cache_stats()
+        assert stats["type_hits"] == 1
+        assert stats["type_misses"] == 2
+        assert stats["representation_map_hits"] == 1
+        assert stats["representation_map_misses"] == 1
+        assert stats["types_cached"] == 2
+        assert stats["representation_maps_cached"] == 1
+
+    def test_faceted_shares_representation_map(self, ifc_doc):
+        """В faceted режиме тесселяция выполняется один раз на геометрию"""
+        from type_factory import TypeFactory
+
+        factory = TypeFactory(ifc_doc, geometry_type="faceted")
+
+        with patch.object(
+            factory,
+            "_create_faceted_representation",
+            wraps=factory._create_faceted_representation,
+        ) as faceted:
+            factory.get_or_create_washer_type(20, "09Г2С")
+            factory.get_or_create_washer_type(20, "ВСт3пс2")
+
+        assert faceted.call_count == 1
+        assert len(ifc_doc.by_type("IfcFacetedBrep")) == 1
+
+    def test_faceted_reuses_tessellation_across_documents(self):
+        """Второй документ строит faceted геометрию из кэша тесселяции без OpenCascade"""
+        from document_manager import IFCDocumentManager
+        from type_factory import TypeFactory
+
+        manager = IFCDocumentManager()
+        first_doc = manager.create_document("first")
+        TypeFactory(first_doc, geometry_type="faceted").get_or_create_nut_type(20, "09Г2С")
+
+        second_doc = manager.create_document("second")
+        factory = TypeFactory(second_doc, geometry_type="faceted")
+        with patch.object(
+            factory,
+            "_create_faceted_representation",
+            wraps=factory._create_faceted_representation,
+        ) as faceted:
+            factory.get_or_create_nut_type(20, "09Г2С")
+
+        assert faceted.call_count == 0
+        assert factory.get_cache_stats()["tessellation_hits"] == 1
+
+        first_points = sorted(p.Coordinates for p in first_doc.by_type("IfcCartesianPoint"))
+        second_points = sorted(p.Coordinates for p in second_doc.by_type("IfcCartesianPoint"))
+        assert first_points == second_points
+        assert len(second_doc.by_type("IfcFacetedBrep")) == 1
+
+    @pytest.mark.parametrize(
+        "geometry_type,item_type",
+        [("faceted", "IfcFacetedBrep"), ("triangulated", "IfcTriangulatedFaceSet")],
+    )
+    def test_analytic_tessellator_bypasses_opencascade(self, geometry_type, item_type, ifc_doc):
+        """Аналитический тесселятор строит сетку типа без solid геометрии и OpenCascade"""
+        from type_factory import TypeFactory
+
+        factory = TypeFactory(ifc_doc, geometry_type=geometry_type, tessellator="analytic")
+
+        with patch.object(factory, "_create_faceted_representation") as faceted:
+            stud_type = factory.get_or_create_stud_type("1.1", 20, 800, "09Г2С")
+            factory.get_or_create_nut_type(20, "09Г2С")
+
+        assert faceted.call_count == 0
+        shape_rep = stud_type.RepresentationMaps[0].MappedRepresentation
+        assert shape_rep.Items[0].is_a() == item_type
+        assert not ifc_doc.by_type("IfcSweptDiskSolid")
+        assert not ifc_doc.by_type("IfcExtrudedAreaSolid")
@@ -27,3 +27,30 @@ class TestUtils:
 
         # Результаты должны быть одинаковыми (кэширование)
         assert result1 is result2
+
+    def test_document_cache_per_document(self, ifc_doc):
+        """document_cache создаёт объект один раз на документ"""
+        from document_manager import IFCDocumentManager
+        from utils import document_cache
+
+        class Cache:
+            def __init__(self, doc):
+                self.ifc = doc
+
+        first = document_cache(ifc_doc, "test_cache", Cache)
+        other_doc = IFCDocumentManager().create_document("other_doc")
+
+        assert document_cache(ifc_doc, "test_cache", Cache) is first
+        assert document_cache(other_doc, "test_cache", Cache).ifc is other_doc
+
+    def test_entity_by_id_removed(self, ifc_doc):
+        """entity_by_id возвращает None для удалённой сущности"""
+        from utils import entity_by_id
+
+        point = ifc_doc.createIfcCartesianPoint((1.0, 2.0, 3.0))
+        point_id = point.id()
+        assert entity_by_id(ifc_doc, point_id) == point
+
+        ifc_doc.remove(point)
+
+        assert entity_by_id(ifc_doc, point_id) is None